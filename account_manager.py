@@ -6,8 +6,8 @@
 """
 
 import os
-import pandas as pd
 import logging
+from core.utils.workbook_cache import workbook_cache
 
 class AccountManager:
     """퍼센티 계정 관리 클래스"""
@@ -41,7 +41,7 @@ class AccountManager:
                 return False
                 
             # Excel 파일 읽기
-            df = pd.read_excel(self.excel_path, sheet_name=self.sheet_name)
+            df = workbook_cache.read_sheet(self.excel_path, self.sheet_name)
             
             # 필수 열 확인
             required_columns = ['id', 'password']
@@ -7,6 +7,7 @@
 
 import os
 import sys
+import copy
 import time
 import logging
 import threading
@@ -29,6 +30,13 @@ from core.steps.step5_1_core import Step5_1Core
 from core.steps.step5_2_core import Step5_2Core
 from core.steps.step5_3_core import Step5_3Core
 from core.browser.browser_manager import CoreBrowserManager
+from core.utils.ocr_service import ocr_service
+from core.utils.workbook_cache import workbook_cache
+from core.utils.task_index import get_task_index
+from core.utils.progress_journal import get_progress_journal
+from core.utils.wait_profiler import wait_profiler, is_enabled_by_env as wait_profiler_enabled_by_env
+from core.browser.launch_profile import launch_stats
+from core.utils.log_pipeline import log_pipeline, set_log_context
 from core.account.account_manager import CoreAccountManager
 from product_editor_screen import open_product_editor_screen
 
@@ -45,9 +53,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-# 계정 매핑 캐시
+# 계정 매핑 캐시 (워크북 파일 버전 기준)
 _account_mapping_cache = None
-_account_mapping_cache_time = None
+_account_mapping_cache_version = None
 _cache_lock = threading.Lock()
 
 def load_account_mapping_from_excel(excel_path: str = "percenty_id.xlsx") -> Dict[str, str]:
@@ -60,22 +68,21 @@ def load_account_mapping_from_excel(excel_path: str = "percenty_id.xlsx") -> Dic
     Returns:
         Dict[str, str]: 가상 ID -> 실제 이메일 매핑
     """
-    global _account_mapping_cache, _account_mapping_cache_time
+    global _account_mapping_cache, _account_mapping_cache_version
     
     with _cache_lock:
-        # 캐시가 있고 5분 이내라면 캐시 사용
-        if (_account_mapping_cache is not None and 
-            _account_mapping_cache_time is not None and 
-            (datetime.now() - _account_mapping_cache_time).seconds < 300):
-            return _account_mapping_cache.copy()
-        
         try:
             # Excel 파일에서 login_id 시트 읽기
             if not os.path.exists(excel_path):
                 logger.warning(f"Excel 파일을 찾을 수 없습니다: {excel_path}")
                 return {}
             
-            df = pd.read_excel(excel_path, sheet_name='login_id')
+            # 워크북이 바뀌지 않았으면 캐시 사용
+            version = workbook_cache.get_version(excel_path)
+            if _account_mapping_cache is not None and _account_mapping_cache_version == version:
+                return _account_mapping_cache.copy()
+            
+            df = workbook_cache.read_sheet(excel_path, 'login_id')
             
             # A열(첫 번째 컬럼)이 이메일 주소라고 가정
             mapping = {}
@@ -88,7 +95,7 @@ def load_account_mapping_from_excel(excel_path: str = "percenty_id.xlsx") -> Dic
             
             # 캐시 업데이트
             _account_mapping_cache = mapping
-            _account_mapping_cache_time = datetime.now()
+            _account_mapping_cache_version = version
             
             logger.info(f"Excel에서 계정 매핑 로드 완료: {len(mapping)}개 계정")
             return mapping.copy()
@@ -134,51 +141,46 @@ class AccountLogger:
         self.account_log_dir.mkdir(parents=True, exist_ok=True)
         self.error_log_dir.mkdir(parents=True, exist_ok=True)
         
-        # 로거 설정
+        # 로거 설정 (파일 기록은 log_pipeline의 기록 스레드에서 수행)
         self.logger = logging.getLogger(f"account_{account_id}_{start_time}")
-        self.logger.setLevel(logging.INFO)
-        
-        # 기존 핸들러 제거
-        for handler in self.logger.handlers[:]:
-            self.logger.removeHandler(handler)
+        self.logger.setLevel(log_pipeline.profile.level)
+        self._extra = {'account': account_id}
         
         # 계정별 로그 파일 핸들러
         account_log_file = self.account_log_dir / f"{account_id}.log"
         account_handler = logging.FileHandler(account_log_file, encoding='utf-8')
         account_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s'
+            '%(asctime)s - %(levelname)s - [%(account)s] %(message)s'
         )
         account_handler.setFormatter(account_formatter)
-        self.logger.addHandler(account_handler)
         
         # 에러 전용 로그 파일 핸들러
         error_log_file = self.error_log_dir / f"{account_id}_errors.log"
         error_handler = logging.FileHandler(error_log_file, encoding='utf-8')
         error_handler.setLevel(logging.ERROR)
         error_formatter = logging.Formatter(
-            '%(asctime)s - ERROR - %(message)s'
+            '%(asctime)s - ERROR - [%(account)s] %(message)s'
         )
         error_handler.setFormatter(error_formatter)
-        self.logger.addHandler(error_handler)
         
-        # 전파 방지 (중복 로그 방지)
-        self.logger.propagate = False
+        # 큐 기반 파이프라인에 연결 (기존 핸들러 제거, 전파 방지)
+        log_pipeline.attach(self.logger, [account_handler, error_handler])
     
-    def info(self, message: str):
-        """정보 로그"""
-        self.logger.info(f"[{self.account_id}] {message}")
+    def info(self, message: str, *args):
+        """정보 로그 (%-스타일 인자는 기록 스레드에서 포맷)"""
+        self.logger.info(message, *args, extra=self._extra)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """에러 로그"""
-        self.logger.error(f"[{self.account_id}] {message}")
+        self.logger.error(message, *args, extra=self._extra)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """경고 로그"""
-        self.logger.warning(f"[{self.account_id}] {message}")
+        self.logger.warning(message, *args, extra=self._extra)
     
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """디버그 로그"""
-        self.logger.debug(f"[{self.account_id}] {message}")
+        self.logger.debug(message, *args, extra=self._extra)
 
 class BatchReportGenerator:
     """배치 결과 보고서 생성 클래스"""
@@ -341,16 +343,21 @@ class BatchManager:
         self.account_manager = CoreAccountManager()
         # 설정에서 헤드리스 모드 확인 (기본값: True - 안정성을 위해)
         browser_headless = self.config.get('browser', {}).get('headless', True)
-        self.browser_manager = CoreBrowserManager(headless=browser_headless)
-        
-        # 브라우저 생성 락 (동시 생성 방지)
-        self.browser_creation_lock = threading.Lock()
+        self.browser_manager = CoreBrowserManager(
+            headless=browser_headless,
+            use_session_cache=self.config.get('browser', {}).get('session_cache', True),
+            use_profile_templates=self.config.get('browser', {}).get('profile_templates', True),
+            max_concurrent_launches=self.config.get('browser', {}).get('max_concurrent_launches')
+        )
         
         # 실행 상태
         self.running_tasks = {}
         self.task_results = {}
         self.is_running = False
         
+        # 작업 중단 요청 (청크 루프와 브라우저 재시작에서 확인, 워커 데몬의 타임아웃/취소 시 설정)
+        self.stop_batch_splitting = False
+        
         # 스레드 풀
         self.executor = None
         self.max_workers = 4
@@ -367,6 +374,10 @@ class BatchManager:
         # 배치 결과 저장 (보고서용)
         self.batch_results = []
         
+        # 대기 시간 프로파일러 (설정 또는 환경변수로 활성화)
+        if self.config.get('profiling', {}).get('wait_profiler', False) or wait_profiler_enabled_by_env():
+            wait_profiler.install()
+        
         # 텔레그램 알림 설정
         self.telegram_notifier = None
         self._setup_telegram_notifier()
@@ -455,12 +466,19 @@ class BatchManager:
             'browser': {
                 'headless': False,
                 'window_size': [1920, 1080],
-                'timeout': 30
+                'timeout': 30,
+                'warm_pool': True,
+                'session_cache': True,
+                'profile_templates': True,
+                'max_concurrent_launches': None
             },
             'logging': {
                 'level': 'INFO',
                 'file': 'logs/batch_manager.log'
             },
+            'profiling': {
+                'wait_profiler': False
+            },
             'telegram': {
                 'enabled': True,
                 'bot_token': '${TELEGRAM_BOT_TOKEN}',
@@ -614,9 +632,9 @@ class BatchManager:
         
         try:
             logger.info(f"=== execute_single_step 시작: account_id={account_id}, step={step}, quantity={quantity} ===")
-            logger.info(f"브라우저 매니저 상태: {type(self.browser_manager)}")
-            logger.info(f"계정 매니저 상태: {type(self.account_manager)}")
-            logger.info(f"설정 상태: {type(self.config)}")
+            logger.debug("브라우저 매니저 상태: %s", type(self.browser_manager))
+            logger.debug("계정 매니저 상태: %s", type(self.account_manager))
+            logger.debug("설정 상태: %s", type(self.config))
             
             # step을 숫자로 변환 (문자열 또는 숫자 모두 처리)
             if isinstance(step, str):
@@ -635,7 +653,7 @@ class BatchManager:
             
             result = self.run_single_step(step_num, [account_id], quantity, concurrent=False)
             
-            logger.info(f"run_single_step 호출 후: 결과={result}")
+            logger.debug("run_single_step 호출 후: 결과=%s", result)
             logger.info(f"완료 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}")
             
             success = result.get('success', False)
@@ -649,10 +667,34 @@ class BatchManager:
             logger.error(f"=== execute_single_step 실패 ===")
             return False
     
+    def create_job_manager(self, headless: bool = None) -> 'BatchManager':
+        """
+        작업 전용 BatchManager 생성 (상주 워커 데몬용)
+        
+        브라우저/계정 관리자와 보고서 생성기는 공유하고, 설정과 실행 상태
+        (계정 로거, 실행 결과, 중단 플래그)는 작업마다 따로 둡니다.
+        
+        Args:
+            headless: 헤드리스 모드 (None이면 설정값 사용)
+            
+        Returns:
+            BatchManager: 작업 전용 인스턴스
+        """
+        job_manager = copy.copy(self)
+        job_manager.config = copy.deepcopy(self.config)
+        if headless is not None:
+            job_manager.config.setdefault('browser', {})['headless'] = bool(headless)
+        job_manager.running_tasks = {}
+        job_manager.task_results = {}
+        job_manager.account_loggers = {}
+        job_manager.batch_results = []
+        job_manager.stop_batch_splitting = False
+        return job_manager
+    
     def run_single_step(self, step: int, accounts: List[str], quantity: int,
                         concurrent: bool = True, interval: int = None, chunk_size: int = 20,
                         step3_product_limit: int = None, step3_image_limit: int = None,
-                        reset_progress: bool = True) -> Dict:
+                        reset_progress: bool = True, task_id: str = None) -> Dict:
         """
         단일 단계 배치 실행
         
@@ -666,12 +708,14 @@ class BatchManager:
             step3_product_limit: 3단계 상품 수량 제한
             step3_image_limit: 3단계 이미지 번역 수량 제한
             reset_progress: 진행 상황 파일 초기화 여부
+            task_id: 작업 ID (None이면 단계와 시작 시간으로 생성, 보고서 파일명에 사용)
             
         Returns:
             Dict: 실행 결과
         """
         import time
-        task_id = f"single_step_{step}_{self.start_time}"
+        if task_id is None:
+            task_id = f"single_step_{step}_{self.start_time}"
         
         logger.info(f"단일 단계 배치 시작 - 단계: {step}, 계정: {len(accounts)}개, 수량: {quantity}")
         logger.info(f"시작 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -695,6 +739,9 @@ class BatchManager:
         else:
             logger.info(f"🔄 진행 상황 파일 초기화 비활성화 (reset_progress={reset_progress})")
         
+        if step in [31, 32, 33, 311, 312, 313, 321, 322, 323, 331, 332, 333]:
+            self._report_invalid_action_cells(accounts)
+        
         # 계정별 로거 초기화
         for account_id in accounts:
             if account_id not in self.account_loggers:
@@ -721,11 +768,13 @@ class BatchManager:
                 logger.info(f"보고서 생성 시작 - task_id: {task_id}")
                 logger.info(f"보고서 생성기 상태: {self.report_generator}")
                 logger.info(f"보고서 디렉토리: {self.report_generator.report_dir}")
-                logger.info(f"보고서 생성에 전달되는 result 데이터: {result}")
-                logger.info(f"result 타입: {type(result)}")
-                logger.info(f"result.get('results'): {result.get('results', {})}")
+                logger.debug("보고서 생성에 전달되는 result 데이터: %s", result)
+                logger.debug("result 타입: %s", type(result))
+                logger.debug("result.get('results'): %s", result.get('results', {}))
                 report_file = self.report_generator.generate_batch_report(task_id, result)
                 logger.info(f"배치 보고서 생성 완료: {report_file}")
+                self._write_wait_profile(task_id)
+                logger.info(launch_stats.format_summary())
             except Exception as report_error:
                 logger.error(f"보고서 생성 중 오류: {report_error}")
                 logger.error(f"보고서 생성 오류 상세: {str(report_error)}")
@@ -751,6 +800,23 @@ class BatchManager:
             
             return error_result
     
+    def _report_invalid_action_cells(self, accounts: List[str]):
+        """
+        브라우저 시작 전에 계정 작업 시트의 잘못된 H~O열 명령어를 로그로 보고
+        
+        Args:
+            accounts: 계정 ID 목록
+        """
+        try:
+            index = get_task_index()
+            for account_id in accounts:
+                real_account_id = get_real_account_id(account_id)
+                for cell in index.get_invalid_cells(real_account_id):
+                    logger.warning(f"⚠️ 잘못된 액션 명령어 [{cell['sheet']}] {cell['column']}{cell['row']} "
+                                   f"'{cell['value']}': {cell['error']}")
+        except Exception as e:
+            logger.warning(f"액션 명령어 검사 실패: {e}")
+    
     def _log_detailed_results(self, result: Dict):
         """상세 실행 결과를 로그로 출력"""
         logger = logging.getLogger(__name__)
@@ -818,6 +884,22 @@ class BatchManager:
         logger.info("📊 === 배치 실행 결과 상세 정보 완료 ===")
         logger.info("")
     
+    @staticmethod
+    def _find_progress_journals(pattern: str) -> List[str]:
+        """
+        진행 상황 저널 경로 검색 (이전 형식 .json 파일만 남은 경우 포함)
+        
+        Args:
+            pattern: 확장자를 제외한 glob 패턴
+            
+        Returns:
+            List[str]: 중복 없는 저널 경로 목록
+        """
+        import glob
+        
+        found = glob.glob(f"{pattern}.journal") + glob.glob(f"{pattern}.json")
+        return sorted({os.path.splitext(path)[0] + ".journal" for path in found})
+    
     def _reset_step3_progress_files(self, accounts: List[str], step: int = None):
         """
         3단계 진행 상황 파일들을 초기화
@@ -827,7 +909,6 @@ class BatchManager:
             step: 단계 번호 (특정 단계의 파일만 삭제하려는 경우)
         """
         import os
-        import glob
         
         logger.info("🔄 3단계 진행 상황 파일 초기화 시작")
         
@@ -863,25 +944,25 @@ class BatchManager:
                 
                 core_name = step_core_mapping.get(step)
                 if core_name:
-                    pattern = os.path.join(project_root, f"progress_{real_account_id}_{core_name}.json")
+                    pattern = os.path.join(project_root, f"progress_{real_account_id}_{core_name}")
                     logger.info(f"🔄 특정 단계({step}) 검색 패턴: {pattern}")
                 else:
                     logger.warning(f"⚠️ 알 수 없는 단계: {step}")
                     continue
             else:
                 # 모든 3단계 파일 삭제 (기존 동작)
-                pattern = os.path.join(project_root, f"progress_{real_account_id}_step3_*.json")
+                pattern = os.path.join(project_root, f"progress_{real_account_id}_step3_*_core")
                 logger.info(f"🔄 전체 3단계 검색 패턴: {pattern}")
             
             logger.info(f"🔄 프로젝트 루트: {project_root}")
             
-            matching_files = glob.glob(pattern)
+            matching_files = self._find_progress_journals(pattern)
             logger.info(f"🔄 검색된 파일 수: {len(matching_files)}")
             
             for progress_file in matching_files:
                 logger.info(f"🔄 삭제 대상 파일: {progress_file}")
                 try:
-                    os.remove(progress_file)
+                    get_progress_journal(progress_file).truncate()
                     account_deleted += 1
                     total_deleted += 1
                     logger.info(f"✅ 삭제 성공: {progress_file}")
@@ -908,8 +989,6 @@ class BatchManager:
         
         logger.info(f"🔄 계정 '{account_id}'의 3단계 진행 상황 파일 초기화 시작")
         
-        import glob
-        
         deleted_files = []
         
         # 프로젝트 루트 디렉토리에서 진행 상황 파일 검색
@@ -935,25 +1014,25 @@ class BatchManager:
             
             core_name = step_core_mapping.get(step)
             if core_name:
-                pattern = os.path.join(project_root, f"progress_{account_id}_{core_name}.json")
+                pattern = os.path.join(project_root, f"progress_{account_id}_{core_name}")
                 logger.info(f"🔄 특정 단계({step}) 검색 패턴: {pattern}")
             else:
                 logger.warning(f"⚠️ 알 수 없는 단계: {step}")
                 return
         else:
             # 모든 3단계 파일 삭제 (기존 동작)
-            pattern = os.path.join(project_root, f"progress_{account_id}_step3_*.json")
+            pattern = os.path.join(project_root, f"progress_{account_id}_step3_*_core")
             logger.info(f"🔄 전체 3단계 검색 패턴: {pattern}")
         
         logger.info(f"🔄 프로젝트 루트: {project_root}")
         
-        matching_files = glob.glob(pattern)
+        matching_files = self._find_progress_journals(pattern)
         logger.info(f"🔄 검색된 파일 수: {len(matching_files)}")
         
         for progress_file in matching_files:
             logger.info(f"🔄 삭제 대상 파일: {progress_file}")
             try:
-                os.remove(progress_file)
+                get_progress_journal(progress_file).truncate()
                 deleted_files.append(progress_file)
                 logger.info(f"✅ 삭제 성공: {progress_file}")
             except Exception as e:
@@ -964,6 +1043,24 @@ class BatchManager:
         else:
             logger.info(f"🔄 계정 '{account_id}': 삭제할 진행 상황 파일이 없습니다.")
     
+    def _write_wait_profile(self, task_id: str):
+        """
+        대기 시간 프로파일 보고서를 배치 보고서 옆에 저장하고 집계 초기화
+        
+        Args:
+            task_id: 작업 ID
+        """
+        if not wait_profiler.installed:
+            return
+        try:
+            profile_file = wait_profiler.write_report(self.report_generator.report_dir, task_id)
+            if profile_file:
+                logger.info(f"대기 시간 프로파일 보고서 생성 완료: {profile_file}")
+        except Exception as e:
+            logger.error(f"대기 시간 프로파일 보고서 생성 중 오류: {e}")
+        finally:
+            wait_profiler.reset()
+    
     def _run_concurrent_single_step(self, task_id: str, step: int,
                                      accounts: List[str], quantity: int, chunk_size: int = 20,
                                      step3_product_limit: int = None, step3_image_limit: int = None,
@@ -1068,12 +1165,17 @@ class BatchManager:
             logger.info(f"계정 목록 순회 시작: {len(accounts)}개 계정")
             
             for i, account_id in enumerate(accounts):
+                if self.stop_batch_splitting:
+                    logger.warning(f"작업 중단 요청으로 남은 계정 {len(accounts) - i}개를 실행하지 않습니다")
+                    results['success'] = False
+                    break
+                
                 logger.info(f"=== 계정 {i+1}/{len(accounts)} 처리 시작: '{account_id}' ===")
                 logger.info(f"계정 {account_id} 처리 시작 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}")
                 
                 logger.info(f"_execute_step_for_account 호출 전: step={step}, account_id={account_id}, quantity={quantity}, chunk_size={chunk_size}")
                 result = self._execute_step_for_account(step, account_id, quantity, chunk_size, step3_product_limit, step3_image_limit, reset_progress)
-                logger.info(f"_execute_step_for_account 호출 후: result={result}")
+                logger.debug("_execute_step_for_account 호출 후: result=%s", result)
                 
                 results['results'][account_id] = result
                 logger.info(f"결과 저장 완료: account_id={account_id}")
@@ -1145,9 +1247,16 @@ class BatchManager:
             except Exception as reset_error:
                 account_logger.warning(f"진행 상황 파일 초기화 중 오류: {reset_error}")
         
+        # 3단계는 이미지 번역에 OCR을 사용하므로 브라우저 생성/로그인 동안 모델을 미리 로딩
+        if step in [31, 32, 33, 311, 312, 313, 321, 322, 323, 331, 332, 333]:
+            if ocr_service.warm_up(background=True):
+                account_logger.info("OCR 모델 백그라운드 로딩 요청")
+        
         # 텔레그램 시작 알림
         start_time = datetime.now()
         real_account_id = get_real_account_id(account_id)
+        wait_profiler.set_context(step=step, account=real_account_id, product=None)
+        set_log_context(step=step, account=real_account_id, chunk=None, product=None)
         self._send_telegram_notification(
             'start',
             account_id=real_account_id,
@@ -1162,7 +1271,7 @@ class BatchManager:
             'errors': []
         }
         
-        account_logger.info(f"결과 딕셔너리 초기화: {result}")
+        account_logger.debug("결과 딕셔너리 초기화: %s", result)
         
         browser_id = None
         
@@ -1170,37 +1279,31 @@ class BatchManager:
             account_logger.info(f"=== {step}단계 실행 시작 ===")
             
             # 브라우저 생성 전 상태 확인
-            account_logger.info(f"브라우저 매니저 상태: {type(self.browser_manager)}")
+            account_logger.debug("브라우저 매니저 상태: %s", type(self.browser_manager))
             account_logger.info(f"설정 정보: headless={self.config.get('browser', {}).get('headless', False)}")
             time.sleep(0.05)  # UI 응답성을 위한 지연
             
-            # 브라우저 생성 (락 사용하여 동시 생성 방지)
+            # 브라우저 생성 (동시 실행 수/메모리/포트는 browser_manager.launch_scheduler가 조절)
             account_logger.info(f"브라우저 생성 시작: {account_id}_browser")
             account_logger.info(f"브라우저 생성 시작 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}")
             
-            with self.browser_creation_lock:
-                account_logger.info(f"브라우저 생성 락 획득 완료")
-                time.sleep(2.5)  # 브라우저 생성 전 지연 (안정성을 위해 2.5초로 증가)
-                
-                try:
-                    account_logger.info(f"browser_manager.create_browser 호출 직전")
-                    account_logger.info(f"browser_manager 타입: {type(self.browser_manager)}")
-                    account_logger.info(f"browser_manager 메서드 확인: {hasattr(self.browser_manager, 'create_browser')}")
-                    account_logger.info(f"호출 파라미터: browser_id={account_id}_browser, headless={self.config.get('browser', {}).get('headless', False)}")
-                    
-                    browser_id = self.browser_manager.create_browser(
-                        browser_id=f"{account_id}_browser",
-                        headless=self.config.get('browser', {}).get('headless', False)
-                    )
-                    account_logger.info(f"create_browser 호출 완료, 반환값: {browser_id}")
-                    account_logger.info(f"브라우저 생성 완료 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-                except Exception as browser_create_error:
-                    account_logger.error(f"브라우저 생성 중 예외 발생: {browser_create_error}")
-                    account_logger.error(f"브라우저 생성 예외 상세: {traceback.format_exc()}")
-                    account_logger.error(f"브라우저 생성 실패 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-                    raise
+            try:
+                account_logger.debug("browser_manager.create_browser 호출 직전")
+                account_logger.debug("browser_manager 타입: %s", type(self.browser_manager))
+                account_logger.debug("browser_manager 메서드 확인: %s", hasattr(self.browser_manager, 'create_browser'))
+                account_logger.info(f"호출 파라미터: browser_id={account_id}_browser, headless={self.config.get('browser', {}).get('headless', False)}")
                 
-                account_logger.info(f"브라우저 생성 락 해제")
+                browser_id = self.browser_manager.create_browser(
+                    browser_id=f"{account_id}_browser",
+                    headless=self.config.get('browser', {}).get('headless', False)
+                )
+                account_logger.info(f"create_browser 호출 완료, 반환값: {browser_id}")
+                account_logger.info(f"브라우저 생성 완료 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+            except Exception as browser_create_error:
+                account_logger.error(f"브라우저 생성 중 예외 발생: {browser_create_error}")
+                account_logger.error(f"브라우저 생성 예외 상세: {traceback.format_exc()}")
+                account_logger.error(f"브라우저 생성 실패 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+                raise
             
             if not browser_id:
                 raise Exception(f"브라우저 생성 실패: {account_id}_browser (반환값이 None 또는 False)")
@@ -1211,7 +1314,7 @@ class BatchManager:
             # 브라우저 상태 확인
             try:
                 driver = self.browser_manager.get_driver(browser_id)
-                account_logger.info(f"드라이버 획득 성공: {type(driver)}")
+                account_logger.debug("드라이버 획득 성공: %s", type(driver))
             except Exception as driver_error:
                 account_logger.warning(f"드라이버 획득 실패: {driver_error}")
             
@@ -1253,7 +1356,7 @@ class BatchManager:
                         account_logger.info(f"기존 방식으로 1단계 실행 (수량: {quantity})")
                         step_result = step_core.execute_step1(quantity)
                     
-                    account_logger.info(f"Step1Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step1Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     # step_result에서 success 값을 명시적으로 설정
@@ -1270,7 +1373,7 @@ class BatchManager:
                 try:
                     account_logger.info(f"브라우저 드라이버 가져오기 시작: {browser_id}")
                     driver = self.browser_manager.get_driver(browser_id)
-                    account_logger.info(f"브라우저 드라이버 가져오기 완료: {type(driver)}")
+                    account_logger.debug("브라우저 드라이버 가져오기 완료: %s", type(driver))
                     
                     account_logger.info(f"Step5_1Core 인스턴스 생성 시작")
                     step_core = Step5_1Core(driver)
@@ -1289,7 +1392,7 @@ class BatchManager:
                         account_logger.info(f"기존 방식으로 51단계 실행 (수량: {quantity})")
                         step_result = step_core.execute_step5_1(quantity, account_info)
                     
-                    account_logger.info(f"Step5_1Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step5_1Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1320,7 +1423,7 @@ class BatchManager:
                         account_logger.info(f"기존 방식으로 52단계 실행 (수량: {quantity})")
                         step_result = step_core.execute_step5_2(quantity, account_info)
                     
-                    account_logger.info(f"Step5_2Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step5_2Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1351,7 +1454,7 @@ class BatchManager:
                         account_logger.info(f"기존 방식으로 53단계 실행 (수량: {quantity})")
                         step_result = step_core.execute_step5_3(quantity, account_info)
                     
-                    account_logger.info(f"Step5_3Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step5_3Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1383,7 +1486,7 @@ class BatchManager:
                         driver=driver  # 기존 드라이버 전달
                     )
                     
-                    account_logger.info(f"Step6_1Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step6_1Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1415,7 +1518,7 @@ class BatchManager:
                         driver=driver  # 기존 드라이버 전달
                     )
                     
-                    account_logger.info(f"Step6_2Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step6_2Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1447,7 +1550,7 @@ class BatchManager:
                         driver=driver  # 기존 드라이버 전달
                     )
                     
-                    account_logger.info(f"Step6_3Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step6_3Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1483,7 +1586,7 @@ class BatchManager:
                             driver=driver  # 기존 드라이버 전달
                         )
                     
-                    account_logger.info(f"Step4Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step4Core 실행 완료, 결과: %s", step_result)
                     
                     # 결과 변환 (step4_core의 결과 형식을 batch_manager 형식으로 변환)
                     if step_result.get('success', False):
@@ -1558,7 +1661,7 @@ class BatchManager:
                             account_logger.warning(f"기존 브라우저 종료 중 오류: {e}")
                         
                         # 새 브라우저 생성
-                        new_driver = self.browser_manager.create_browser(account_id)
+                        new_driver = self.browser_manager.create_browser(account_id, account_id=account_id)
                         if new_driver:
                             account_logger.info("브라우저 재시작 성공")
                             return new_driver
@@ -1601,7 +1704,7 @@ class BatchManager:
                         # Step2_1Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step2_1(provider_codes, account_info)
                     
-                    account_logger.info(f"Step2_1Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step2_1Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1654,7 +1757,7 @@ class BatchManager:
                         # Step2_2Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step2_2(provider_codes, account_info)
                     
-                    account_logger.info(f"Step2_2Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step2_2Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1707,7 +1810,7 @@ class BatchManager:
                         # Step2_3Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step2_3(provider_codes, account_info)
                     
-                    account_logger.info(f"Step2_3Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step2_3Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1763,7 +1866,7 @@ class BatchManager:
                         # Step3_1Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step3_1(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_1Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_1Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1819,7 +1922,7 @@ class BatchManager:
                         # Step3_2Core 실행
                         step_result = step_core.execute_step3_2(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_2Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_2Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1875,7 +1978,7 @@ class BatchManager:
                         # Step3_3Core 실행
                         step_result = step_core.execute_step3_3(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_3Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_3Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1932,7 +2035,7 @@ class BatchManager:
                         # Step3_1_1Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step3_1_1(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_1_1Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_1_1Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -1988,7 +2091,7 @@ class BatchManager:
                         # Step3_1_2Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step3_1_2(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_1_2Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_1_2Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -2044,7 +2147,7 @@ class BatchManager:
                         # Step3_1_3Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step3_1_3(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_1_3Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_1_3Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -2100,7 +2203,7 @@ class BatchManager:
                         # Step3_2_1Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step3_2_1(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_2_1Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_2_1Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -2156,7 +2259,7 @@ class BatchManager:
                         # Step3_2_2Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step3_2_2(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_2_2Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_2_2Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -2212,7 +2315,7 @@ class BatchManager:
                         # Step3_2_3Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step3_2_3(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_2_3Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_2_3Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -2268,7 +2371,7 @@ class BatchManager:
                         # Step3_3_1Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step3_3_1(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_3_1Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_3_1Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -2324,7 +2427,7 @@ class BatchManager:
                         # Step3_1_2Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step3_3_2(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_3_2Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_3_2Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -2380,7 +2483,7 @@ class BatchManager:
                         # Step3_1_3Core 실행 (등록상품관리 화면 열기는 내부에서 처리)
                         step_result = step_core.execute_step3_3_3(provider_codes, account_info)
                     
-                    account_logger.info(f"Step3_3_3Core 실행 완료, 결과: {step_result}")
+                    account_logger.debug("Step3_3_3Core 실행 완료, 결과: %s", step_result)
                     
                     result.update(step_result)
                     if 'success' in step_result:
@@ -2432,6 +2535,9 @@ class BatchManager:
                     duration_minutes=duration_minutes
                 )
             # 오류 알림은 except 블록에서 이미 전송됨
+            
+            # 대기 프로파일러 컨텍스트 초기화 (같은 스레드의 다음 작업 대기 시간이 이 단계/계정으로 집계되지 않도록)
+            wait_profiler.clear_context()
         
         account_logger.info(f"=== {step}단계 실행 완료 ===")
         return result
@@ -2474,12 +2580,23 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, quantity)
                 current_chunk_size = end_idx - start_idx
                 
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (상품 {start_idx + 1}-{end_idx}) =====")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -2520,29 +2637,16 @@ class BatchManager:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
                         # 현재 브라우저 종료
-                        self.browser_manager.close_browser(current_browser_id)
-                        
-                        # 새 브라우저 생성 및 로그인
-                        import time
-                        time.sleep(2)  # 브라우저 종료 대기
-                        
-                        new_browser_id = self.browser_manager.create_browser(account_id)
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        login_success = self.browser_manager.login_browser(new_browser_id, email, password)
-                        
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 1} 후 재로그인 실패")
-                        
-                        current_browser_id = new_browser_id
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, account_id, account_logger
+                        )
                         account_logger.info(f"브라우저 재시작 및 로그인 완료: {current_browser_id}")
-                        
-                        time.sleep(3)  # 재시작 후 초기화 대기
                     else:
                         # 마지막 청크인 경우 브라우저 종료
                         self.browser_manager.close_browser(current_browser_id)
                         
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     
                     # 청크별 재시도 로직
@@ -2560,34 +2664,14 @@ class BatchManager:
                         total_result['failed'] += current_chunk_size
                         total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
                     
-                # 오류 발생 시에도 브라우저 재시작 시도
-                if chunk_idx < total_chunks - 1:
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
                     try:
                         account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
-                        
-                        # 현재 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                        except:
-                            pass
-                        
-                        # 새 브라우저 생성 및 로그인
-                        import time
-                        time.sleep(2)
-                        
-                        new_browser_id = self.browser_manager.create_browser(account_id)
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        login_success = self.browser_manager.login_browser(new_browser_id, email, password)
-                        
-                        if login_success:
-                            current_browser_id = new_browser_id
-                            account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
-                            time.sleep(3)
-                        else:
-                            account_logger.error(f"오류 후 재로그인 실패")
-                            break
-                            
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, account_id, account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
                     except Exception as restart_error:
                         account_logger.error(f"브라우저 재시작 실패: {restart_error}")
                         break
@@ -2606,6 +2690,92 @@ class BatchManager:
             account_logger.error(f"브라우저 재시작 방식 작업 중 전체 오류: {e}")
             total_result['errors'].append(f"전체 작업 오류: {str(e)}")
             return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
+    
+    def _prewarm_chunk_browser(self, account_id: str, account_logger):
+        """
+        다음 청크용 브라우저를 백그라운드에서 미리 실행 및 로그인 (웜 풀)
+        
+        browser.warm_pool 설정이 켜져 있을 때만 동작합니다.
+        
+        Args:
+            account_id: 계정 ID
+            account_logger: 계정 로거
+        """
+        if self.stop_batch_splitting or not self.config.get('browser', {}).get('warm_pool', False):
+            return
+        
+        try:
+            real_account_id = get_real_account_id(account_id)
+            email, password = self.account_manager.get_account_credentials(real_account_id)
+            if self.browser_manager.prewarm_browser(
+                account_id, email, password,
+                headless=self.config.get('browser', {}).get('headless', False)
+            ):
+                account_logger.info(f"다음 청크용 웜 브라우저 준비 시작")
+        except Exception as warm_error:
+            account_logger.warning(f"웜 브라우저 준비 요청 실패 (기존 방식으로 재시작): {warm_error}")
+    
+    def _restart_browser_for_chunk(self, account_id: str, current_browser_id: str, new_browser_id: str, account_logger) -> str:
+        """
+        청크 전환용 브라우저 재시작
+        
+        웜 풀에 준비된 브라우저가 있으면 즉시 교체하고,
+        없으면 기존 방식(종료 → 생성 → 로그인)으로 재시작합니다.
+        
+        Args:
+            account_id: 계정 ID
+            current_browser_id: 종료할 현재 브라우저 ID
+            new_browser_id: 새 브라우저 ID
+            account_logger: 계정 로거
+            
+        Returns:
+            str: 새 브라우저 ID
+        """
+        if self.stop_batch_splitting:
+            raise RuntimeError("작업 중단 요청으로 브라우저를 재시작하지 않습니다")
+        
+        # 기존 브라우저 종료
+        try:
+            self.browser_manager.close_browser(current_browser_id)
+            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
+        except Exception as close_error:
+            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
+        
+        # 웜 브라우저로 즉시 교체
+        warm_browser_id = self.browser_manager.acquire_warm_browser(account_id, new_browser_id)
+        if warm_browser_id:
+            account_logger.info(f"웜 브라우저로 교체 완료 (로그인 상태): {warm_browser_id}")
+            return warm_browser_id
+        
+        # 새 브라우저 생성
+        time.sleep(3)  # 브라우저 종료 후 대기
+        
+        browser_id = self.browser_manager.create_browser(
+            browser_id=new_browser_id,
+            headless=self.config.get('browser', {}).get('headless', False),
+            account_id=account_id
+        )
+        
+        if not browser_id:
+            raise Exception(f"브라우저 생성 실패: {new_browser_id}")
+        
+        account_logger.info(f"새 브라우저 생성 완료: {browser_id}")
+        
+        # 새 브라우저에서 로그인
+        real_account_id = get_real_account_id(account_id)
+        email, password = self.account_manager.get_account_credentials(real_account_id)
+        
+        login_success = self.browser_manager.login_browser(browser_id, email, password)
+        if not login_success:
+            raise Exception(f"브라우저 로그인 실패: {browser_id}")
+        
+        account_logger.info(f"새 브라우저 로그인 완료")
+        time.sleep(2)  # 로그인 후 안정화 대기
+        
+        return browser_id
     
     def _retry_failed_chunk(self, account_id: str, chunk_number: int, chunk_size: int, 
                            browser_id: str, account_logger) -> bool:
@@ -2695,7 +2865,7 @@ class BatchManager:
             import time
             time.sleep(3)
             
-            new_browser_id = self.browser_manager.create_browser(account_id)
+            new_browser_id = self.browser_manager.create_browser(account_id, account_id=account_id)
             real_account_id = get_real_account_id(account_id)
             email, password = self.account_manager.get_account_credentials(real_account_id)
             login_success = self.browser_manager.login_browser(new_browser_id, email, password)
@@ -2820,6 +2990,12 @@ class BatchManager:
             account_logger.info(f"기존 브라우저 재사용: {initial_browser_id}")
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, quantity)
                 current_chunk_size = end_idx - start_idx
@@ -2950,12 +3126,23 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, quantity)
                 current_chunk_size = end_idx - start_idx
                 
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (상품 {start_idx + 1}-{end_idx}) =====")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     driver = self.browser_manager.get_driver(current_browser_id)
                     step_core = Step5_1Core(driver)
@@ -2990,29 +3177,29 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        self.browser_manager.close_browser(current_browser_id)
-                        
-                        import time
-                        time.sleep(2)
-                        
-                        new_browser_id = self.browser_manager.create_browser(account_id)
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        login_success = self.browser_manager.login_browser(new_browser_id, email, password)
-                        
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 1} 후 재로그인 실패")
-                        
-                        current_browser_id = new_browser_id
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, account_id, account_logger
+                        )
                         account_logger.info(f"브라우저 재시작 및 로그인 완료: {current_browser_id}")
-                        
-                        time.sleep(3)
                     else:
                         self.browser_manager.close_browser(current_browser_id)
                         
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, account_id, account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             if total_result['processed'] > 0:
                 total_result['success'] = True
@@ -3027,6 +3214,9 @@ class BatchManager:
             account_logger.error(f"브라우저 재시작 방식 5_1단계 작업 중 전체 오류: {e}")
             total_result['errors'].append(f"전체 작업 오류: {str(e)}")
             return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
     
     def _execute_step5_2_with_browser_restart(self, account_id: str, initial_browser_id: str, quantity: int, chunk_size: int = 20, account_info: Dict = None) -> Dict:
         """브라우저 재시작 방식으로 5_2단계 실행"""
@@ -3054,12 +3244,23 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, quantity)
                 current_chunk_size = end_idx - start_idx
                 
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (상품 {start_idx + 1}-{end_idx}) =====")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     driver = self.browser_manager.get_driver(current_browser_id)
                     step_core = Step5_2Core(driver)
@@ -3094,29 +3295,29 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        self.browser_manager.close_browser(current_browser_id)
-                        
-                        import time
-                        time.sleep(2)
-                        
-                        new_browser_id = self.browser_manager.create_browser(account_id)
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        login_success = self.browser_manager.login_browser(new_browser_id, email, password)
-                        
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 1} 후 재로그인 실패")
-                        
-                        current_browser_id = new_browser_id
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, account_id, account_logger
+                        )
                         account_logger.info(f"브라우저 재시작 및 로그인 완료: {current_browser_id}")
-                        
-                        time.sleep(3)
                     else:
                         self.browser_manager.close_browser(current_browser_id)
                         
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, account_id, account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             if total_result['processed'] > 0:
                 total_result['success'] = True
@@ -3131,6 +3332,9 @@ class BatchManager:
             account_logger.error(f"브라우저 재시작 방식 5_2단계 작업 중 전체 오류: {e}")
             total_result['errors'].append(f"전체 작업 오류: {str(e)}")
             return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
     
     def _execute_step5_3_with_browser_restart(self, account_id: str, initial_browser_id: str, quantity: int, chunk_size: int = 20, account_info: Dict = None) -> Dict:
         """브라우저 재시작 방식으로 5_3단계 실행"""
@@ -3158,12 +3362,23 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, quantity)
                 current_chunk_size = end_idx - start_idx
                 
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (상품 {start_idx + 1}-{end_idx}) =====")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     driver = self.browser_manager.get_driver(current_browser_id)
                     step_core = Step5_3Core(driver)
@@ -3198,29 +3413,29 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        self.browser_manager.close_browser(current_browser_id)
-                        
-                        import time
-                        time.sleep(2)
-                        
-                        new_browser_id = self.browser_manager.create_browser(account_id)
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        login_success = self.browser_manager.login_browser(new_browser_id, email, password)
-                        
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 1} 후 재로그인 실패")
-                        
-                        current_browser_id = new_browser_id
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, account_id, account_logger
+                        )
                         account_logger.info(f"브라우저 재시작 및 로그인 완료: {current_browser_id}")
-                        
-                        time.sleep(3)
                     else:
                         self.browser_manager.close_browser(current_browser_id)
                         
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, account_id, account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             if total_result['processed'] > 0:
                 total_result['success'] = True
@@ -3235,6 +3450,9 @@ class BatchManager:
             account_logger.error(f"브라우저 재시작 방식 5_3단계 작업 중 전체 오류: {e}")
             total_result['errors'].append(f"전체 작업 오류: {str(e)}")
             return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
     
     def run_multi_step(self, account: str, steps: List[int], 
                       quantities: List[int], concurrent: bool = False) -> Dict:
@@ -3372,6 +3590,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -3379,6 +3603,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -3420,44 +3649,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -3487,6 +3699,9 @@ class BatchManager:
             total_result['success'] = False
             total_result['errors'].append(str(e))
             return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
     
     def _save_chunk_progress(self, step_core, completed_keywords: List[str], total_products_processed: int, total_images_translated: int, account_info: Dict, account_logger, chunk_idx: int):
         """
@@ -3527,27 +3742,18 @@ class BatchManager:
             step_name: 단계 이름 (로그용)
         """
         try:
-            progress_file = step_core._get_progress_file_path(account_info)
-            if os.path.exists(progress_file):
-                # progress 파일을 삭제하지 않고 완료 상태로 마킹
+            progress_journal = get_progress_journal(step_core._get_progress_file_path(account_info))
+            if progress_journal.exists():
+                # 저널을 삭제하지 않고 완료 상태로 마킹
                 try:
-                    with open(progress_file, 'r', encoding='utf-8') as f:
-                        progress_data = json.load(f)
-                    
-                    # 완료 상태 추가
-                    progress_data['batch_completed'] = True
-                    progress_data['completion_time'] = time.strftime("%Y-%m-%dT%H:%M:%S")
-                    
-                    with open(progress_file, 'w', encoding='utf-8') as f:
-                        json.dump(progress_data, f, ensure_ascii=False, indent=2)
-                    
-                    account_logger.info(f"{step_name} 배치 작업 완료 - progress 파일에 완료 상태 기록: {progress_file}")
+                    progress_journal.mark_batch_completed()
+                    account_logger.info(f"{step_name} 배치 작업 완료 - 진행 상황 저널에 완료 상태 기록: {progress_journal.path}")
                 except Exception as mark_error:
-                    account_logger.warning(f"{step_name} progress 파일 완료 상태 마킹 실패: {mark_error}")
-                    # 마킹 실패 시에도 파일은 보존
-                    account_logger.info(f"{step_name} 배치 작업 완료 - progress 파일 보존됨: {progress_file}")
+                    account_logger.warning(f"{step_name} 진행 상황 저널 완료 상태 마킹 실패: {mark_error}")
+                    # 마킹 실패 시에도 저널은 보존
+                    account_logger.info(f"{step_name} 배치 작업 완료 - 진행 상황 저널 보존됨: {progress_journal.path}")
             else:
-                account_logger.debug(f"{step_name} progress 파일이 존재하지 않음: {progress_file}")
+                account_logger.debug(f"{step_name} 진행 상황 저널이 존재하지 않음: {progress_journal.path}")
         except Exception as cleanup_error:
             account_logger.warning(f"{step_name} progress 파일 처리 중 오류: {cleanup_error}")
 
@@ -3593,6 +3799,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -3600,6 +3812,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -3641,44 +3858,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -3707,8 +3907,11 @@ class BatchManager:
             account_logger.error(f"311단계 브라우저 재시작 방식 실행 중 오류: {e}")
             total_result['success'] = False
             total_result['errors'].append(str(e))
-            return total_result    
-
+            return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
+    
     def _execute_step312_with_browser_restart(self, account_id: str, initial_browser_id: str, provider_codes: List[str], chunk_size: int = 2, account_info: Dict = None, step3_product_limit: int = None, step3_image_limit: int = None) -> Dict:
         """
         브라우저 재시작 방식으로 312단계 실행
@@ -3751,6 +3954,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -3758,6 +3967,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -3799,44 +4013,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -3865,8 +4062,11 @@ class BatchManager:
             account_logger.error(f"312단계 브라우저 재시작 방식 실행 중 오류: {e}")
             total_result['success'] = False
             total_result['errors'].append(str(e))
-            return total_result    
-
+            return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
+    
     def _execute_step313_with_browser_restart(self, account_id: str, initial_browser_id: str, provider_codes: List[str], chunk_size: int = 2, account_info: Dict = None, step3_product_limit: int = None, step3_image_limit: int = None) -> Dict:
         """
         브라우저 재시작 방식으로 313단계 실행
@@ -3909,6 +4109,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -3916,6 +4122,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -3957,44 +4168,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -4023,8 +4217,11 @@ class BatchManager:
             account_logger.error(f"313단계 브라우저 재시작 방식 실행 중 오류: {e}")
             total_result['success'] = False
             total_result['errors'].append(str(e))
-            return total_result    
-
+            return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
+    
     def _execute_step32_with_browser_restart(self, account_id: str, initial_browser_id: str, provider_codes: List[str], chunk_size: int = 2, account_info: Dict = None, step3_product_limit: int = None, step3_image_limit: int = None) -> Dict:
         """
         브라우저 재시작 방식으로 32단계 실행
@@ -4067,6 +4264,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -4074,6 +4277,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -4115,44 +4323,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -4182,7 +4373,10 @@ class BatchManager:
             total_result['success'] = False
             total_result['errors'].append(str(e))
             return total_result
-
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
+    
     def _execute_step321_with_browser_restart(self, account_id: str, initial_browser_id: str, provider_codes: List[str], chunk_size: int = 2, account_info: Dict = None, step3_product_limit: int = None, step3_image_limit: int = None) -> Dict:
         """
         브라우저 재시작 방식으로 321단계 실행
@@ -4225,6 +4419,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -4232,6 +4432,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -4273,44 +4478,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -4339,7 +4527,10 @@ class BatchManager:
             account_logger.error(f"321단계 브라우저 재시작 방식 실행 중 오류: {e}")
             total_result['success'] = False
             total_result['errors'].append(str(e))
-            return total_result    
+            return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
     
     def _execute_step322_with_browser_restart(self, account_id: str, initial_browser_id: str, provider_codes: List[str], chunk_size: int = 2, account_info: Dict = None, step3_product_limit: int = None, step3_image_limit: int = None) -> Dict:
         """
@@ -4383,6 +4574,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -4390,6 +4587,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -4431,44 +4633,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -4497,8 +4682,11 @@ class BatchManager:
             account_logger.error(f"322단계 브라우저 재시작 방식 실행 중 오류: {e}")
             total_result['success'] = False
             total_result['errors'].append(str(e))
-            return total_result    
-
+            return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
+    
     def _execute_step323_with_browser_restart(self, account_id: str, initial_browser_id: str, provider_codes: List[str], chunk_size: int = 2, account_info: Dict = None, step3_product_limit: int = None, step3_image_limit: int = None) -> Dict:
         """
         브라우저 재시작 방식으로 321단계 실행
@@ -4541,6 +4729,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -4548,6 +4742,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -4589,44 +4788,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -4655,8 +4837,10 @@ class BatchManager:
             account_logger.error(f"323단계 브라우저 재시작 방식 실행 중 오류: {e}")
             total_result['success'] = False
             total_result['errors'].append(str(e))
-            return total_result                    
-
+            return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
     
     def _execute_step33_with_browser_restart(self, account_id: str, initial_browser_id: str, provider_codes: List[str], chunk_size: int = 2, account_info: Dict = None, step3_product_limit: int = None, step3_image_limit: int = None) -> Dict:
         """
@@ -4700,6 +4884,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -4707,6 +4897,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -4748,44 +4943,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -4815,7 +4993,9 @@ class BatchManager:
             total_result['success'] = False
             total_result['errors'].append(str(e))
             return total_result
-    
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
     
     def _execute_step331_with_browser_restart(self, account_id: str, initial_browser_id: str, provider_codes: List[str], chunk_size: int = 2, account_info: Dict = None, step3_product_limit: int = None, step3_image_limit: int = None) -> Dict:
         """
@@ -4859,6 +5039,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -4866,6 +5052,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -4907,44 +5098,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -4973,7 +5147,10 @@ class BatchManager:
             account_logger.error(f"331단계 브라우저 재시작 방식 실행 중 오류: {e}")
             total_result['success'] = False
             total_result['errors'].append(str(e))
-            return total_result    
+            return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
     
     def _execute_step332_with_browser_restart(self, account_id: str, initial_browser_id: str, provider_codes: List[str], chunk_size: int = 2, account_info: Dict = None, step3_product_limit: int = None, step3_image_limit: int = None) -> Dict:
         """
@@ -5017,6 +5194,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -5024,6 +5207,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -5065,44 +5253,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -5131,9 +5302,11 @@ class BatchManager:
             account_logger.error(f"332단계 브라우저 재시작 방식 실행 중 오류: {e}")
             total_result['success'] = False
             total_result['errors'].append(str(e))
-            return total_result    
-
-
+            return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
+    
     def _execute_step333_with_browser_restart(self, account_id: str, initial_browser_id: str, provider_codes: List[str], chunk_size: int = 2, account_info: Dict = None, step3_product_limit: int = None, step3_image_limit: int = None) -> Dict:
         """
         브라우저 재시작 방식으로 333단계 실행
@@ -5176,6 +5349,12 @@ class BatchManager:
             current_browser_id = initial_browser_id
             
             for chunk_idx in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_idx + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                set_log_context(chunk=chunk_idx + 1)
                 start_idx = chunk_idx * chunk_size
                 end_idx = min(start_idx + chunk_size, len(provider_codes))
                 chunk_provider_codes = provider_codes[start_idx:end_idx]
@@ -5183,6 +5362,11 @@ class BatchManager:
                 account_logger.info(f"===== 청크 {chunk_idx + 1}/{total_chunks} 시작 (키워드 {start_idx + 1}-{end_idx}) =====")
                 account_logger.info(f"처리할 키워드: {chunk_provider_codes}")
                 
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_idx < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+                
+                chunk_failed = False
                 try:
                     # 현재 청크 실행
                     driver = self.browser_manager.get_driver(current_browser_id)
@@ -5224,44 +5408,27 @@ class BatchManager:
                     if chunk_idx < total_chunks - 1:
                         account_logger.info(f"청크 {chunk_idx + 1} 완료 후 브라우저 재시작")
                         
-                        # 기존 브라우저 종료
-                        try:
-                            self.browser_manager.close_browser(current_browser_id)
-                            account_logger.info(f"기존 브라우저 {current_browser_id} 종료 완료")
-                        except Exception as close_error:
-                            account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_idx + 2}"
-                        current_browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, new_browser_id, account_logger
                         )
-                        
-                        if not current_browser_id:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 생성 실패")
-                        
-                        account_logger.info(f"새 브라우저 생성 완료: {current_browser_id}")
-                        
-                        # 새 브라우저에서 로그인
-                        real_account_id = get_real_account_id(account_id)
-                        email, password = self.account_manager.get_account_credentials(real_account_id)
-                        
-                        login_success = self.browser_manager.login_browser(current_browser_id, email, password)
-                        if not login_success:
-                            raise Exception(f"청크 {chunk_idx + 2}용 브라우저 로그인 실패")
-                        
-                        account_logger.info(f"새 브라우저 로그인 완료")
-                        time.sleep(2)  # 로그인 후 안정화 대기
                 
                 except Exception as chunk_error:
+                    chunk_failed = True
                     account_logger.error(f"청크 {chunk_idx + 1} 실행 중 오류: {chunk_error}")
                     total_result['errors'].append(f"청크 {chunk_idx + 1}: {str(chunk_error)}")
-                    # 청크 실패 시에도 다음 청크 계속 진행
-                    continue
+
+                # 청크 오류 시에도 다음 청크를 위해 브라우저 재시작 시도 (정상 완료 시에는 위에서 재시작됨)
+                if chunk_failed and chunk_idx < total_chunks - 1:
+                    try:
+                        account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                        current_browser_id = self._restart_browser_for_chunk(
+                            account_id, current_browser_id, f"{account_id}_browser_chunk_{chunk_idx + 2}", account_logger
+                        )
+                        account_logger.info(f"오류 후 브라우저 재시작 성공: {current_browser_id}")
+                    except Exception as restart_error:
+                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                        break
             
             # 전체 성공 여부 결정
             total_result['success'] = total_result['chunks_completed'] > 0
@@ -5290,7 +5457,10 @@ class BatchManager:
             account_logger.error(f"333단계 브라우저 재시작 방식 실행 중 오류: {e}")
             total_result['success'] = False
             total_result['errors'].append(str(e))
-            return total_result    
+            return total_result
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
     
     def _execute_step21_with_browser_restart(self, account_id, browser_id, provider_codes, chunk_size, account_info):
         """21단계를 청크 단위로 브라우저 재시작하며 실행"""
@@ -5310,115 +5480,79 @@ class BatchManager:
             'errors': []
         }
         
-        for chunk_index in range(total_chunks):
-            start_idx = chunk_index * chunk_size
-            end_idx = min(start_idx + chunk_size, len(provider_codes))
-            current_chunk = provider_codes[start_idx:end_idx]
+        try:
+            for chunk_index in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_index + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                start_idx = chunk_index * chunk_size
+                end_idx = min(start_idx + chunk_size, len(provider_codes))
+                current_chunk = provider_codes[start_idx:end_idx]
             
-            account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 처리 시작 (키워드 {len(current_chunk)}개)")
+                account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 처리 시작 (키워드 {len(current_chunk)}개)")
             
-            try:
-                # 브라우저 드라이버 가져오기
-                driver = self.browser_manager.get_driver(browser_id)
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_index < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+            
+                try:
+                    # 브라우저 드라이버 가져오기
+                    driver = self.browser_manager.get_driver(browser_id)
                 
-                # Step2_1Core 동적 임포트 및 실행
-                from core.steps.step2_1_core import Step2_1Core
-                step_core = Step2_1Core(driver)
+                    # Step2_1Core 동적 임포트 및 실행
+                    from core.steps.step2_1_core import Step2_1Core
+                    step_core = Step2_1Core(driver)
                 
-                # 현재 청크 실행
-                chunk_result = step_core.execute_step2_1(current_chunk, account_info)
+                    # 현재 청크 실행
+                    chunk_result = step_core.execute_step2_1(current_chunk, account_info)
                 
-                # 결과 누적
-                if chunk_result.get('success', False):
-                    accumulated_result['processed'] += chunk_result.get('processed', 0)
-                    accumulated_result['failed'] += chunk_result.get('failed', 0)
-                else:
-                    accumulated_result['success'] = False
-                    if 'error' in chunk_result:
-                        accumulated_result['errors'].append(chunk_result['error'])
+                    # 결과 누적
+                    if chunk_result.get('success', False):
+                        accumulated_result['processed'] += chunk_result.get('processed', 0)
+                        accumulated_result['failed'] += chunk_result.get('failed', 0)
+                    else:
+                        accumulated_result['success'] = False
+                        if 'error' in chunk_result:
+                            accumulated_result['errors'].append(chunk_result['error'])
                 
-                account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 완료 - 처리: {chunk_result.get('processed', 0)}, 실패: {chunk_result.get('failed', 0)}")
+                    account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 완료 - 처리: {chunk_result.get('processed', 0)}, 실패: {chunk_result.get('failed', 0)}")
                 
-                # 배치 분할 중단 플래그 확인
-                if hasattr(self, 'stop_batch_splitting') and self.stop_batch_splitting:
-                    account_logger.warning(f"배치 분할 중단 플래그가 설정되어 청크 {chunk_index + 1}에서 중단합니다")
-                    break
+                    # 배치 분할 중단 플래그 확인
+                    if hasattr(self, 'stop_batch_splitting') and self.stop_batch_splitting:
+                        account_logger.warning(f"배치 분할 중단 플래그가 설정되어 청크 {chunk_index + 1}에서 중단합니다")
+                        break
                 
-                # 마지막 청크가 아니면 브라우저 재시작
-                if chunk_index < total_chunks - 1:
-                    account_logger.info(f"청크 {chunk_index + 1} 완료 후 브라우저 재시작")
-                    
-                    # 기존 브라우저 종료
-                    try:
-                        self.browser_manager.close_browser(browser_id)
-                        account_logger.info(f"기존 브라우저 {browser_id} 종료 완료")
-                    except Exception as close_error:
-                        account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                    
-                    # 새 브라우저 생성
-                    import time
-                    time.sleep(3)  # 브라우저 종료 후 대기
-                    
-                    new_browser_id = f"{account_id}_browser_chunk_{chunk_index + 2}"
-                    browser_id = self.browser_manager.create_browser(
-                        browser_id=new_browser_id,
-                        headless=self.config.get('browser', {}).get('headless', False)
-                    )
-                    
-                    if not browser_id:
-                        raise Exception(f"청크 {chunk_index + 2}용 브라우저 생성 실패")
-                    
-                    account_logger.info(f"새 브라우저 생성 완료: {browser_id}")
-                    
-                    # 새 브라우저에서 로그인
-                    real_account_id = get_real_account_id(account_id)
-                    email, password = self.account_manager.get_account_credentials(real_account_id)
-                    
-                    login_success = self.browser_manager.login_browser(browser_id, email, password)
-                    if not login_success:
-                        raise Exception(f"청크 {chunk_index + 2}용 브라우저 로그인 실패")
-                    
-                    account_logger.info(f"새 브라우저 로그인 완료")
-                    time.sleep(2)  # 로그인 후 안정화 대기
+                    # 마지막 청크가 아니면 브라우저 재시작
+                    if chunk_index < total_chunks - 1:
+                        account_logger.info(f"청크 {chunk_index + 1} 완료 후 브라우저 재시작")
                     
-            except Exception as e:
-                account_logger.error(f"청크 {chunk_index + 1} 처리 중 오류: {e}")
-                accumulated_result['success'] = False
-                accumulated_result['errors'].append(str(e))
-                
-                # 오류 발생 시에도 브라우저 재시작 시도
-                if chunk_index < total_chunks - 1:
-                    try:
-                        # 기존 브라우저 종료
-                        self.browser_manager.close_browser(browser_id)
-                        account_logger.info(f"오류 후 기존 브라우저 {browser_id} 종료 완료")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_index + 2}"
-                        browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        browser_id = self._restart_browser_for_chunk(
+                            account_id, browser_id, new_browser_id, account_logger
                         )
-                        
-                        if browser_id:
-                            # 새 브라우저에서 로그인
-                            real_account_id = get_real_account_id(account_id)
-                            email, password = self.account_manager.get_account_credentials(real_account_id)
-                            
-                            login_success = self.browser_manager.login_browser(browser_id, email, password)
-                            if login_success:
-                                account_logger.info(f"오류 후 새 브라우저 로그인 완료")
-                                time.sleep(2)
-                            else:
-                                account_logger.error(f"오류 후 새 브라우저 로그인 실패")
-                        else:
-                            account_logger.error(f"오류 후 새 브라우저 생성 실패")
-                            
-                    except Exception as restart_error:
-                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                    
+                except Exception as e:
+                    account_logger.error(f"청크 {chunk_index + 1} 처리 중 오류: {e}")
+                    accumulated_result['success'] = False
+                    accumulated_result['errors'].append(str(e))
+                
+                    # 오류 발생 시에도 다음 청크를 위해 브라우저 재시작 시도
+                    if chunk_index < total_chunks - 1:
+                        try:
+                            account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                            new_browser_id = f"{account_id}_browser_chunk_{chunk_index + 2}"
+                            browser_id = self._restart_browser_for_chunk(
+                                account_id, browser_id, new_browser_id, account_logger
+                            )
+                            account_logger.info(f"오류 후 브라우저 재시작 성공: {browser_id}")
+                        except Exception as restart_error:
+                            account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                            break
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
         
         account_logger.info(f"21단계 청크 처리 완료 - 총 처리: {accumulated_result['processed']}, 총 실패: {accumulated_result['failed']}")
         return accumulated_result
@@ -5441,115 +5575,79 @@ class BatchManager:
             'errors': []
         }
         
-        for chunk_index in range(total_chunks):
-            start_idx = chunk_index * chunk_size
-            end_idx = min(start_idx + chunk_size, len(provider_codes))
-            current_chunk = provider_codes[start_idx:end_idx]
+        try:
+            for chunk_index in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_index + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                start_idx = chunk_index * chunk_size
+                end_idx = min(start_idx + chunk_size, len(provider_codes))
+                current_chunk = provider_codes[start_idx:end_idx]
             
-            account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 처리 시작 (키워드 {len(current_chunk)}개)")
+                account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 처리 시작 (키워드 {len(current_chunk)}개)")
             
-            try:
-                # 브라우저 드라이버 가져오기
-                driver = self.browser_manager.get_driver(browser_id)
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_index < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+            
+                try:
+                    # 브라우저 드라이버 가져오기
+                    driver = self.browser_manager.get_driver(browser_id)
                 
-                # Step2_2Core 동적 임포트 및 실행
-                from core.steps.step2_2_core import Step2_2Core
-                step_core = Step2_2Core(driver)
+                    # Step2_2Core 동적 임포트 및 실행
+                    from core.steps.step2_2_core import Step2_2Core
+                    step_core = Step2_2Core(driver)
                 
-                # 현재 청크 실행
-                chunk_result = step_core.execute_step2_2(current_chunk, account_info)
+                    # 현재 청크 실행
+                    chunk_result = step_core.execute_step2_2(current_chunk, account_info)
                 
-                # 결과 누적
-                if chunk_result.get('success', False):
-                    accumulated_result['processed'] += chunk_result.get('processed', 0)
-                    accumulated_result['failed'] += chunk_result.get('failed', 0)
-                else:
-                    accumulated_result['success'] = False
-                    if 'error' in chunk_result:
-                        accumulated_result['errors'].append(chunk_result['error'])
+                    # 결과 누적
+                    if chunk_result.get('success', False):
+                        accumulated_result['processed'] += chunk_result.get('processed', 0)
+                        accumulated_result['failed'] += chunk_result.get('failed', 0)
+                    else:
+                        accumulated_result['success'] = False
+                        if 'error' in chunk_result:
+                            accumulated_result['errors'].append(chunk_result['error'])
                 
-                account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 완료 - 처리: {chunk_result.get('processed', 0)}, 실패: {chunk_result.get('failed', 0)}")
+                    account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 완료 - 처리: {chunk_result.get('processed', 0)}, 실패: {chunk_result.get('failed', 0)}")
                 
-                # 배치 분할 중단 플래그 확인
-                if hasattr(self, 'stop_batch_splitting') and self.stop_batch_splitting:
-                    account_logger.warning(f"배치 분할 중단 플래그가 설정되어 청크 {chunk_index + 1}에서 중단합니다")
-                    break
+                    # 배치 분할 중단 플래그 확인
+                    if hasattr(self, 'stop_batch_splitting') and self.stop_batch_splitting:
+                        account_logger.warning(f"배치 분할 중단 플래그가 설정되어 청크 {chunk_index + 1}에서 중단합니다")
+                        break
                 
-                # 마지막 청크가 아니면 브라우저 재시작
-                if chunk_index < total_chunks - 1:
-                    account_logger.info(f"청크 {chunk_index + 1} 완료 후 브라우저 재시작")
-                    
-                    # 기존 브라우저 종료
-                    try:
-                        self.browser_manager.close_browser(browser_id)
-                        account_logger.info(f"기존 브라우저 {browser_id} 종료 완료")
-                    except Exception as close_error:
-                        account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                    
-                    # 새 브라우저 생성
-                    import time
-                    time.sleep(3)  # 브라우저 종료 후 대기
-                    
-                    new_browser_id = f"{account_id}_browser_chunk_{chunk_index + 2}"
-                    browser_id = self.browser_manager.create_browser(
-                        browser_id=new_browser_id,
-                        headless=self.config.get('browser', {}).get('headless', False)
-                    )
-                    
-                    if not browser_id:
-                        raise Exception(f"청크 {chunk_index + 2}용 브라우저 생성 실패")
-                    
-                    account_logger.info(f"새 브라우저 생성 완료: {browser_id}")
-                    
-                    # 새 브라우저에서 로그인
-                    real_account_id = get_real_account_id(account_id)
-                    email, password = self.account_manager.get_account_credentials(real_account_id)
-                    
-                    login_success = self.browser_manager.login_browser(browser_id, email, password)
-                    if not login_success:
-                        raise Exception(f"청크 {chunk_index + 2}용 브라우저 로그인 실패")
-                    
-                    account_logger.info(f"새 브라우저 로그인 완료")
-                    time.sleep(2)  # 로그인 후 안정화 대기
+                    # 마지막 청크가 아니면 브라우저 재시작
+                    if chunk_index < total_chunks - 1:
+                        account_logger.info(f"청크 {chunk_index + 1} 완료 후 브라우저 재시작")
                     
-            except Exception as e:
-                account_logger.error(f"청크 {chunk_index + 1} 처리 중 오류: {e}")
-                accumulated_result['success'] = False
-                accumulated_result['errors'].append(str(e))
-                
-                # 오류 발생 시에도 브라우저 재시작 시도
-                if chunk_index < total_chunks - 1:
-                    try:
-                        # 기존 브라우저 종료
-                        self.browser_manager.close_browser(browser_id)
-                        account_logger.info(f"오류 후 기존 브라우저 {browser_id} 종료 완료")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_index + 2}"
-                        browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        browser_id = self._restart_browser_for_chunk(
+                            account_id, browser_id, new_browser_id, account_logger
                         )
-                        
-                        if browser_id:
-                            # 새 브라우저에서 로그인
-                            real_account_id = get_real_account_id(account_id)
-                            email, password = self.account_manager.get_account_credentials(real_account_id)
-                            
-                            login_success = self.browser_manager.login_browser(browser_id, email, password)
-                            if login_success:
-                                account_logger.info(f"오류 후 새 브라우저 로그인 완료")
-                                time.sleep(2)
-                            else:
-                                account_logger.error(f"오류 후 새 브라우저 로그인 실패")
-                        else:
-                            account_logger.error(f"오류 후 새 브라우저 생성 실패")
-                            
-                    except Exception as restart_error:
-                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                    
+                except Exception as e:
+                    account_logger.error(f"청크 {chunk_index + 1} 처리 중 오류: {e}")
+                    accumulated_result['success'] = False
+                    accumulated_result['errors'].append(str(e))
+                
+                    # 오류 발생 시에도 다음 청크를 위해 브라우저 재시작 시도
+                    if chunk_index < total_chunks - 1:
+                        try:
+                            account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                            new_browser_id = f"{account_id}_browser_chunk_{chunk_index + 2}"
+                            browser_id = self._restart_browser_for_chunk(
+                                account_id, browser_id, new_browser_id, account_logger
+                            )
+                            account_logger.info(f"오류 후 브라우저 재시작 성공: {browser_id}")
+                        except Exception as restart_error:
+                            account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                            break
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
         
         account_logger.info(f"22단계 청크 처리 완료 - 총 처리: {accumulated_result['processed']}, 총 실패: {accumulated_result['failed']}")
         return accumulated_result
@@ -5572,115 +5670,79 @@ class BatchManager:
             'errors': []
         }
         
-        for chunk_index in range(total_chunks):
-            start_idx = chunk_index * chunk_size
-            end_idx = min(start_idx + chunk_size, len(provider_codes))
-            current_chunk = provider_codes[start_idx:end_idx]
+        try:
+            for chunk_index in range(total_chunks):
+                # 작업 중단 요청 확인 (워커 데몬 타임아웃/취소)
+                if self.stop_batch_splitting:
+                    account_logger.warning(f"작업 중단 요청으로 청크 {chunk_index + 1}/{total_chunks}부터 실행하지 않습니다")
+                    break
+                
+                start_idx = chunk_index * chunk_size
+                end_idx = min(start_idx + chunk_size, len(provider_codes))
+                current_chunk = provider_codes[start_idx:end_idx]
             
-            account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 처리 시작 (키워드 {len(current_chunk)}개)")
+                account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 처리 시작 (키워드 {len(current_chunk)}개)")
             
-            try:
-                # 브라우저 드라이버 가져오기
-                driver = self.browser_manager.get_driver(browser_id)
+                # 다음 청크용 브라우저 미리 준비
+                if chunk_index < total_chunks - 1:
+                    self._prewarm_chunk_browser(account_id, account_logger)
+            
+                try:
+                    # 브라우저 드라이버 가져오기
+                    driver = self.browser_manager.get_driver(browser_id)
                 
-                # Step2_3Core 동적 임포트 및 실행
-                from core.steps.step2_3_core import Step2_3Core
-                step_core = Step2_3Core(driver)
+                    # Step2_3Core 동적 임포트 및 실행
+                    from core.steps.step2_3_core import Step2_3Core
+                    step_core = Step2_3Core(driver)
                 
-                # 현재 청크 실행
-                chunk_result = step_core.execute_step2_3(current_chunk, account_info)
+                    # 현재 청크 실행
+                    chunk_result = step_core.execute_step2_3(current_chunk, account_info)
                 
-                # 결과 누적
-                if chunk_result.get('success', False):
-                    accumulated_result['processed'] += chunk_result.get('processed', 0)
-                    accumulated_result['failed'] += chunk_result.get('failed', 0)
-                else:
-                    accumulated_result['success'] = False
-                    if 'error' in chunk_result:
-                        accumulated_result['errors'].append(chunk_result['error'])
+                    # 결과 누적
+                    if chunk_result.get('success', False):
+                        accumulated_result['processed'] += chunk_result.get('processed', 0)
+                        accumulated_result['failed'] += chunk_result.get('failed', 0)
+                    else:
+                        accumulated_result['success'] = False
+                        if 'error' in chunk_result:
+                            accumulated_result['errors'].append(chunk_result['error'])
                 
-                account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 완료 - 처리: {chunk_result.get('processed', 0)}, 실패: {chunk_result.get('failed', 0)}")
+                    account_logger.info(f"청크 {chunk_index + 1}/{total_chunks} 완료 - 처리: {chunk_result.get('processed', 0)}, 실패: {chunk_result.get('failed', 0)}")
                 
-                # 배치 분할 중단 플래그 확인
-                if hasattr(self, 'stop_batch_splitting') and self.stop_batch_splitting:
-                    account_logger.warning(f"배치 분할 중단 플래그가 설정되어 청크 {chunk_index + 1}에서 중단합니다")
-                    break
+                    # 배치 분할 중단 플래그 확인
+                    if hasattr(self, 'stop_batch_splitting') and self.stop_batch_splitting:
+                        account_logger.warning(f"배치 분할 중단 플래그가 설정되어 청크 {chunk_index + 1}에서 중단합니다")
+                        break
                 
-                # 마지막 청크가 아니면 브라우저 재시작
-                if chunk_index < total_chunks - 1:
-                    account_logger.info(f"청크 {chunk_index + 1} 완료 후 브라우저 재시작")
-                    
-                    # 기존 브라우저 종료
-                    try:
-                        self.browser_manager.close_browser(browser_id)
-                        account_logger.info(f"기존 브라우저 {browser_id} 종료 완료")
-                    except Exception as close_error:
-                        account_logger.warning(f"기존 브라우저 종료 중 오류: {close_error}")
-                    
-                    # 새 브라우저 생성
-                    import time
-                    time.sleep(3)  # 브라우저 종료 후 대기
-                    
-                    new_browser_id = f"{account_id}_browser_chunk_{chunk_index + 2}"
-                    browser_id = self.browser_manager.create_browser(
-                        browser_id=new_browser_id,
-                        headless=self.config.get('browser', {}).get('headless', False)
-                    )
-                    
-                    if not browser_id:
-                        raise Exception(f"청크 {chunk_index + 2}용 브라우저 생성 실패")
-                    
-                    account_logger.info(f"새 브라우저 생성 완료: {browser_id}")
-                    
-                    # 새 브라우저에서 로그인
-                    real_account_id = get_real_account_id(account_id)
-                    email, password = self.account_manager.get_account_credentials(real_account_id)
-                    
-                    login_success = self.browser_manager.login_browser(browser_id, email, password)
-                    if not login_success:
-                        raise Exception(f"청크 {chunk_index + 2}용 브라우저 로그인 실패")
-                    
-                    account_logger.info(f"새 브라우저 로그인 완료")
-                    time.sleep(2)  # 로그인 후 안정화 대기
+                    # 마지막 청크가 아니면 브라우저 재시작
+                    if chunk_index < total_chunks - 1:
+                        account_logger.info(f"청크 {chunk_index + 1} 완료 후 브라우저 재시작")
                     
-            except Exception as e:
-                account_logger.error(f"청크 {chunk_index + 1} 처리 중 오류: {e}")
-                accumulated_result['success'] = False
-                accumulated_result['errors'].append(str(e))
-                
-                # 오류 발생 시에도 브라우저 재시작 시도
-                if chunk_index < total_chunks - 1:
-                    try:
-                        # 기존 브라우저 종료
-                        self.browser_manager.close_browser(browser_id)
-                        account_logger.info(f"오류 후 기존 브라우저 {browser_id} 종료 완료")
-                        
-                        # 새 브라우저 생성
-                        import time
-                        time.sleep(3)  # 브라우저 종료 후 대기
-                        
                         new_browser_id = f"{account_id}_browser_chunk_{chunk_index + 2}"
-                        browser_id = self.browser_manager.create_browser(
-                            browser_id=new_browser_id,
-                            headless=self.config.get('browser', {}).get('headless', False)
+                        browser_id = self._restart_browser_for_chunk(
+                            account_id, browser_id, new_browser_id, account_logger
                         )
-                        
-                        if browser_id:
-                            # 새 브라우저에서 로그인
-                            real_account_id = get_real_account_id(account_id)
-                            email, password = self.account_manager.get_account_credentials(real_account_id)
-                            
-                            login_success = self.browser_manager.login_browser(browser_id, email, password)
-                            if login_success:
-                                account_logger.info(f"오류 후 새 브라우저 로그인 완료")
-                                time.sleep(2)
-                            else:
-                                account_logger.error(f"오류 후 새 브라우저 로그인 실패")
-                        else:
-                            account_logger.error(f"오류 후 새 브라우저 생성 실패")
-                            
-                    except Exception as restart_error:
-                        account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                    
+                except Exception as e:
+                    account_logger.error(f"청크 {chunk_index + 1} 처리 중 오류: {e}")
+                    accumulated_result['success'] = False
+                    accumulated_result['errors'].append(str(e))
+                
+                    # 오류 발생 시에도 다음 청크를 위해 브라우저 재시작 시도
+                    if chunk_index < total_chunks - 1:
+                        try:
+                            account_logger.info(f"오류 발생 후 브라우저 재시작 시도")
+                            new_browser_id = f"{account_id}_browser_chunk_{chunk_index + 2}"
+                            browser_id = self._restart_browser_for_chunk(
+                                account_id, browser_id, new_browser_id, account_logger
+                            )
+                            account_logger.info(f"오류 후 브라우저 재시작 성공: {browser_id}")
+                        except Exception as restart_error:
+                            account_logger.error(f"브라우저 재시작 실패: {restart_error}")
+                            break
+        finally:
+            # 사용하지 않은 웜 브라우저 정리 (중단/오류 시 포함)
+            self.browser_manager.discard_warm_browser(account_id)
         
         account_logger.info(f"23단계 청크 처리 완료 - 총 처리: {accumulated_result['processed']}, 총 실패: {accumulated_result['failed']}")
         return accumulated_result
@@ -5747,6 +5809,7 @@ class BatchManager:
                 self.executor.shutdown(wait=True)
             
             self.browser_manager.cleanup()
+            ocr_service.release()
             
             logger.info("배치 관리자 정리 완료")
         except Exception as e:
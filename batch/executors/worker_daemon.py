@@ -0,0 +1,521 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+배치 워커 데몬
+단계 실행마다 새 Python 프로세스를 띄우는 대신, BatchManager(브라우저/OCR 모델 포함)를
+상주시켜 두고 로컬 소켓으로 단계 작업을 받아 실행합니다.
+
+- 서버: BatchWorkerDaemon (cli/batch_cli.py daemon 으로 실행)
+- 클라이언트: BatchWorkerClient (주기적 실행 관리자, GUI에서 사용)
+- 작업 핸들: WorkerJob (subprocess.Popen과 같은 poll/wait/terminate 인터페이스)
+- 인증: 처음 실행할 때 만든 무작위 키 파일(cache/auth/batch_worker.key, 0600)을 서버와 클라이언트가 공유
+"""
+
+import os
+import re
+import sys
+import time
+import uuid
+import logging
+import threading
+import subprocess
+from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Listener, Client
+
+# 루트 디렉토리를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.utils.local_auth import load_authkey
+
+logger = logging.getLogger(__name__)
+
+# 기본 접속 정보 (로컬 전용)
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = int(os.getenv("PERCENTY_WORKER_PORT", "47531"))
+
+# 인증 키 (cache/auth/batch_worker.key, 환경 변수로 직접 지정 가능)
+AUTHKEY_NAME = "batch_worker"
+AUTHKEY_ENV = "PERCENTY_WORKER_AUTHKEY"
+
+# 결과를 읽어 가지 않은 완료 작업 보관 시간(초)
+FINISHED_JOB_RETENTION = 3600
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCESS = "success"
+JOB_FAILED = "failed"
+JOB_TIMEOUT = "timeout"
+JOB_CANCELLED = "cancelled"
+
+FINISHED_STATES = (JOB_SUCCESS, JOB_FAILED, JOB_TIMEOUT, JOB_CANCELLED)
+
+
+class BatchWorkerDaemon:
+    """
+    상주 배치 워커
+
+    브라우저/계정 관리자는 공유하되 작업마다 실행 상태를 분리한 BatchManager
+    (BatchManager.create_job_manager)로 실행하며, 계정별로 작업을 직렬화(계정 격리)하고
+    서로 다른 계정의 작업은 스레드 풀에서 동시에 실행합니다.
+    """
+
+    def __init__(self, batch_manager=None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 authkey: bytes = None, max_workers: int = 4):
+        """
+        초기화
+
+        Args:
+            batch_manager: 공유할 BatchManager (None이면 새로 생성)
+            host: 바인드 주소 (로컬 전용)
+            port: 바인드 포트
+            authkey: 클라이언트 인증 키 (None이면 키 파일, 없으면 생성)
+            max_workers: 동시에 실행할 최대 작업 수
+
+        Raises:
+            RuntimeError: 인증 키를 읽거나 만들 수 없는 경우
+        """
+        authkey = authkey or load_authkey(AUTHKEY_NAME, AUTHKEY_ENV, create=True)
+        if not authkey:
+            raise RuntimeError("배치 워커 인증 키가 없어 데몬을 시작하지 않습니다")
+
+        if batch_manager is None:
+            from batch.batch_manager import BatchManager
+            batch_manager = BatchManager()
+
+        self.batch_manager = batch_manager
+        self.address = (host, port)
+        self.authkey = authkey
+        self.max_workers = max_workers
+
+        self.jobs: Dict[str, Dict] = {}
+        self.jobs_lock = threading.Lock()
+        self.job_managers: Dict[str, object] = {}  # 실행 중인 작업 ID -> 작업 전용 BatchManager
+        self.account_locks: Dict[str, threading.Lock] = {}
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-worker")
+        self._running = False
+        self._watchdog_thread: Optional[threading.Thread] = None
+
+    def serve_forever(self):
+        """작업 요청 수신 루프 (shutdown 요청 시 종료)"""
+        self._running = True
+        self._watchdog_thread = threading.Thread(target=self._watchdog_loop, name="batch-worker-watchdog", daemon=True)
+        self._watchdog_thread.start()
+
+        logger.info(f"배치 워커 데몬 시작: {self.address[0]}:{self.address[1]} (최대 동시 작업: {self.max_workers})")
+
+        with Listener(self.address, authkey=self.authkey) as listener:
+            while self._running:
+                try:
+                    conn = listener.accept()
+                except Exception as e:
+                    if self._running:
+                        logger.warning(f"클라이언트 연결 수락 실패: {e}")
+                    continue
+
+                threading.Thread(target=self._handle_connection, args=(conn,), daemon=True).start()
+
+        logger.info("배치 워커 데몬 요청 수신 종료")
+        self._shutdown_workers()
+
+    def _handle_connection(self, conn):
+        """클라이언트 연결 처리 (요청 1건 = 응답 1건)"""
+        try:
+            while True:
+                try:
+                    request = conn.recv()
+                except EOFError:
+                    break
+
+                try:
+                    response = self._dispatch(request)
+                except Exception as e:
+                    logger.error(f"요청 처리 중 오류: {e}")
+                    response = {'ok': False, 'error': str(e)}
+
+                conn.send(response)
+
+                if request.get('action') == 'shutdown':
+                    break
+        finally:
+            conn.close()
+
+    def _dispatch(self, request: Dict) -> Dict:
+        """요청 종류별 처리"""
+        action = request.get('action')
+
+        if action == 'ping':
+            return {'ok': True, 'pid': os.getpid(), 'jobs': len(self.jobs)}
+        if action == 'submit':
+            return {'ok': True, 'job_id': self.submit_job(request.get('job', {}))}
+        if action == 'status':
+            return {'ok': True, 'job': self._release_if_finished(self.get_job_status(request['job_id']))}
+        if action == 'wait':
+            return {'ok': True, 'job': self._release_if_finished(self.wait_job(request['job_id'], request.get('timeout')))}
+        if action == 'cancel':
+            return {'ok': True, 'cancelled': self.cancel_job(request['job_id'])}
+        if action == 'shutdown':
+            self._request_shutdown()
+            return {'ok': True}
+
+        return {'ok': False, 'error': f"알 수 없는 요청: {action}"}
+
+    def submit_job(self, spec: Dict) -> str:
+        """
+        단계 작업 등록
+
+        Args:
+            spec: {'step', 'account', 'quantity', 'chunk_size', 'step3_product_limit',
+                   'step3_image_limit', 'reset_progress', 'headless', 'interval', 'timeout'}
+
+        Returns:
+            str: 작업 ID
+        """
+        if 'step' not in spec or 'account' not in spec:
+            raise ValueError("step과 account는 필수입니다")
+
+        # CLI와 같은 방식으로 계정 ID 변환 (숫자 -> account_숫자 -> 실제 이메일)
+        from batch.batch_manager import get_real_account_id
+        spec = dict(spec)
+        account = str(spec['account'])
+        if account.isdigit():
+            account = f"account_{account}"
+        spec['account'] = get_real_account_id(account)
+
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            'job_id': job_id,
+            'spec': spec,
+            'state': JOB_QUEUED,
+            'returncode': None,
+            'result': None,
+            'error': None,
+            'submitted_at': time.time(),
+            'started_at': None,
+            'finished_at': None,
+            'deadline': None,
+            'stop_reason': None,  # 타임아웃/취소 요청 (작업 스레드가 끝나야 최종 상태가 됨)
+            'done': threading.Event()
+        }
+
+        with self.jobs_lock:
+            self.jobs[job_id] = job
+            self.account_locks.setdefault(spec['account'], threading.Lock())
+
+        self.executor.submit(self._run_job, job)
+        logger.info(f"작업 등록: {job_id} (계정 {spec['account']}, 단계 {spec['step']}, 수량 {spec.get('quantity')})")
+        return job_id
+
+    def _run_job(self, job: Dict):
+        """
+        작업 실행 (같은 계정의 작업은 순서대로 하나씩)
+
+        타임아웃/취소는 stop_reason으로만 요청되고, 작업 스레드가 끝나 계정 잠금을
+        놓은 뒤에 최종 상태로 바뀝니다.
+        """
+        spec = job['spec']
+        account = spec['account']
+
+        with self.account_locks[account]:
+            if job['state'] == JOB_CANCELLED:
+                job['finished_at'] = time.time()
+                job['done'].set()
+                return
+
+            job['state'] = JOB_RUNNING
+            job['started_at'] = time.time()
+            if spec.get('timeout'):
+                job['deadline'] = job['started_at'] + spec['timeout']
+
+            logger.info(f"작업 시작: {job['job_id']} (계정 {account}, 단계 {spec['step']})")
+
+            # 작업마다 실행 상태(결과, 계정 로거, 중단 플래그)와 헤드리스 설정을 분리
+            job_manager = self.batch_manager.create_job_manager(headless=spec.get('headless'))
+            with self.jobs_lock:
+                self.job_managers[job['job_id']] = job_manager
+
+            state, returncode = JOB_FAILED, 1
+            try:
+                result = job_manager.run_single_step(
+                    step=int(spec['step']),
+                    accounts=[account],
+                    quantity=int(spec.get('quantity', 100)),
+                    concurrent=False,
+                    interval=spec.get('interval'),
+                    chunk_size=int(spec.get('chunk_size', 20)),
+                    step3_product_limit=spec.get('step3_product_limit'),
+                    step3_image_limit=spec.get('step3_image_limit'),
+                    reset_progress=spec.get('reset_progress', True),
+                    task_id=f"single_step_{spec['step']}_{job_manager.start_time}_{job['job_id']}"
+                )
+                success = bool(result.get('success', False))
+                state, returncode = (JOB_SUCCESS, 0) if success else (JOB_FAILED, 1)
+                job['result'] = self._summarize_result(result)
+
+            except Exception as e:
+                logger.error(f"작업 실행 중 오류: {job['job_id']} - {e}")
+                job['error'] = str(e)
+
+            finally:
+                with self.jobs_lock:
+                    self.job_managers.pop(job['job_id'], None)
+                if job['stop_reason']:
+                    state, returncode = job['stop_reason'], -1
+                job['state'] = state
+                job['returncode'] = returncode
+                job['finished_at'] = time.time()
+
+        # 계정 잠금을 놓은 뒤 완료 알림 (같은 계정의 다음 작업이 바로 시작할 수 있는 시점)
+        job['done'].set()
+        logger.info(f"작업 종료: {job['job_id']} ({job['state']}, 소요시간: {job['finished_at'] - job['started_at']:.1f}초)")
+
+    def _summarize_result(self, result: Dict) -> Dict:
+        """연결로 돌려보낼 수 있는 요약 결과"""
+        account_results = result.get('results', {}) or {}
+        return {
+            'success': bool(result.get('success', False)),
+            'processed': sum(r.get('processed', 0) for r in account_results.values() if isinstance(r, dict)),
+            'failed': sum(r.get('failed', 0) for r in account_results.values() if isinstance(r, dict)),
+            'error': result.get('error')
+        }
+
+    def _stop_running_job(self, job: Dict, reason: str):
+        """
+        실행 중인 작업 중단 요청
+
+        작업 전용 BatchManager의 중단 플래그를 세워 남은 청크/계정을 실행하지 않게 하고,
+        계정 브라우저를 닫아 진행 중인 청크도 빠르게 끝나게 합니다.
+        """
+        job['stop_reason'] = reason
+        job_manager = self.job_managers.get(job['job_id'])
+        if job_manager is not None:
+            job_manager.stop_batch_splitting = True
+        self._close_account_browsers(job['spec']['account'])
+
+    def _watchdog_loop(self):
+        """
+        타임아웃된 작업을 중단시키고,
+        결과를 읽어 가지 않은 오래된 완료 작업을 정리
+        """
+        while self._running:
+            now = time.time()
+            with self.jobs_lock:
+                expired = [job for job in self.jobs.values()
+                           if job['state'] == JOB_RUNNING and not job['stop_reason']
+                           and job['deadline'] and now > job['deadline']]
+                stale = [job_id for job_id, job in self.jobs.items()
+                         if job['state'] in FINISHED_STATES and job['finished_at']
+                         and now - job['finished_at'] > FINISHED_JOB_RETENTION]
+                for job_id in stale:
+                    del self.jobs[job_id]
+
+            for job in expired:
+                logger.warning(f"작업 타임아웃: {job['job_id']} (계정 {job['spec']['account']}) - 작업 스레드 종료 대기")
+                self._stop_running_job(job, JOB_TIMEOUT)
+
+            if stale:
+                logger.info(f"결과를 읽지 않은 완료 작업 {len(stale)}개 정리")
+
+            time.sleep(5)
+
+    def _close_account_browsers(self, account: str):
+        """계정의 브라우저(웜 브라우저 포함) 종료"""
+        browser_manager = self.batch_manager.browser_manager
+        # 계정 ID 자체 또는 '{계정}_browser', '{계정}_browser_chunk_N' 형식만 (다른 계정의 접두어 일치 제외)
+        pattern = re.compile(re.escape(account) + r"(?:_browser(?:_chunk_\d+)?)?")
+        try:
+            browser_manager.discard_warm_browser(account)
+            for browser_id in browser_manager.get_browser_list():
+                if pattern.fullmatch(browser_id):
+                    browser_manager.close_browser(browser_id)
+        except Exception as e:
+            logger.warning(f"계정 {account} 브라우저 종료 중 오류: {e}")
+
+    def get_job_status(self, job_id: str) -> Dict:
+        """작업 상태 반환 (직렬화 가능한 값만)"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise KeyError(f"작업을 찾을 수 없습니다: {job_id}")
+
+        return {key: value for key, value in job.items() if key != 'done'}
+
+    def _release_if_finished(self, status: Dict) -> Dict:
+        """결과를 돌려준 완료 작업은 작업 목록에서 제거"""
+        if status['state'] in FINISHED_STATES:
+            with self.jobs_lock:
+                self.jobs.pop(status['job_id'], None)
+        return status
+
+    def wait_job(self, job_id: str, timeout: float = None) -> Dict:
+        """작업 완료 대기 후 상태 반환"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise KeyError(f"작업을 찾을 수 없습니다: {job_id}")
+
+        job['done'].wait(timeout)
+        return self.get_job_status(job_id)
+
+    def cancel_job(self, job_id: str) -> bool:
+        """
+        작업 취소
+
+        대기 중인 작업은 바로 취소되고, 실행 중인 작업은 중단 요청 후
+        작업 스레드가 끝나면 취소 상태가 됩니다.
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job['state'] in FINISHED_STATES or job['stop_reason']:
+            return False
+
+        if job['state'] == JOB_RUNNING:
+            self._stop_running_job(job, JOB_CANCELLED)
+        else:
+            job['state'] = JOB_CANCELLED
+            job['returncode'] = -1
+
+        logger.info(f"작업 취소: {job_id}")
+        return True
+
+    def _request_shutdown(self):
+        """수신 루프 종료 요청 (대기 중인 accept를 깨우기 위해 자기 자신에게 접속)"""
+        self._running = False
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except Exception:
+            pass
+
+    def _shutdown_workers(self):
+        """실행 중인 작업 취소 및 리소스 정리"""
+        for job_id in list(self.jobs.keys()):
+            self.cancel_job(job_id)
+
+        self.executor.shutdown(wait=False)
+        self.batch_manager.cleanup()
+        logger.info("배치 워커 데몬 종료 완료")
+
+
+class WorkerJob:
+    """
+    데몬 작업 핸들
+
+    subprocess.Popen과 같은 poll()/wait()/terminate()/kill()/returncode/pid를 제공하여
+    기존 프로세스 관리 코드에서 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, client: 'BatchWorkerClient', job_id: str):
+        self.client = client
+        self.job_id = job_id
+        self.pid = f"worker:{job_id}"
+        self.returncode = None
+        self.state = JOB_QUEUED
+
+    def _update(self, status: Dict):
+        self.state = status.get('state', self.state)
+        if self.state in FINISHED_STATES:
+            self.returncode = status.get('returncode')
+            if self.returncode is None:
+                self.returncode = 1
+
+    def poll(self):
+        """완료되었으면 반환 코드, 실행 중이면 None"""
+        if self.returncode is None:
+            self._update(self.client.status(self.job_id))
+        return self.returncode
+
+    def wait(self, timeout: float = None):
+        """완료 대기 (시간 초과 시 subprocess.TimeoutExpired)"""
+        if self.returncode is not None:
+            return self.returncode
+
+        self._update(self.client.wait(self.job_id, timeout))
+        if self.returncode is None:
+            raise subprocess.TimeoutExpired(self.pid, timeout)
+        return self.returncode
+
+    def terminate(self):
+        """작업 취소"""
+        self.client.cancel(self.job_id)
+
+    def kill(self):
+        """작업 취소 (terminate와 동일)"""
+        self.terminate()
+
+
+class BatchWorkerClient:
+    """배치 워커 데몬 클라이언트"""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, authkey: bytes = None):
+        self.address = (host, port)
+        self.authkey = authkey or load_authkey(AUTHKEY_NAME, AUTHKEY_ENV)
+
+    def _request(self, action: str, **kwargs) -> Dict:
+        """요청 1건 전송 및 응답 수신"""
+        if not self.authkey:
+            raise RuntimeError("배치 워커 인증 키가 없습니다 (데몬이 실행된 적 없음)")
+
+        conn = Client(self.address, authkey=self.authkey)
+        try:
+            request = {'action': action}
+            request.update(kwargs)
+            conn.send(request)
+            response = conn.recv()
+        finally:
+            conn.close()
+
+        if not response.get('ok'):
+            raise RuntimeError(response.get('error', '워커 데몬 요청 실패'))
+        return response
+
+    def is_available(self) -> bool:
+        """데몬 실행 여부"""
+        try:
+            self._request('ping')
+            return True
+        except Exception:
+            return False
+
+    def submit(self, step, account: str, quantity: int, chunk_size: int = 20,
+               step3_product_limit: int = None, step3_image_limit: int = None,
+               reset_progress: bool = True, headless: bool = None, interval: int = None,
+               timeout: float = None) -> WorkerJob:
+        """
+        단계 작업 등록
+
+        Args:
+            headless: 헤드리스 모드 (None이면 데몬 설정값 사용)
+            interval: 계정 간 실행 간격(초, None이면 데몬 설정값 사용)
+
+        Returns:
+            WorkerJob: 작업 핸들
+        """
+        job_spec = {
+            'step': int(step),
+            'account': account,
+            'quantity': int(quantity),
+            'chunk_size': int(chunk_size),
+            'step3_product_limit': step3_product_limit,
+            'step3_image_limit': step3_image_limit,
+            'reset_progress': reset_progress,
+            'headless': headless,
+            'interval': interval,
+            'timeout': timeout
+        }
+        response = self._request('submit', job=job_spec)
+        return WorkerJob(self, response['job_id'])
+
+    def status(self, job_id: str) -> Dict:
+        """작업 상태 조회"""
+        return self._request('status', job_id=job_id)['job']
+
+    def wait(self, job_id: str, timeout: float = None) -> Dict:
+        """작업 완료 대기"""
+        return self._request('wait', job_id=job_id, timeout=timeout)['job']
+
+    def cancel(self, job_id: str) -> bool:
+        """작업 취소"""
+        return self._request('cancel', job_id=job_id)['cancelled']
+
+    def shutdown(self):
+        """데몬 종료"""
+        self._request('shutdown')
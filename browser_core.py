@@ -27,6 +27,11 @@ from selenium.common.exceptions import (
     StaleElementReferenceException
 )
 
+from core.browser.launch_profile import (
+    PROFILE_PREFS, apply_launch_arguments, driver_path_cache, profile_templates,
+    launch_stats, release_profile_dir
+)
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -37,7 +42,7 @@ ORIGINAL_HEIGHT = 1080
 class BrowserCore:
     """브라우저 핵심 기능 클래스"""
     
-    def __init__(self, window_width=None, window_height=None, window_x=None, window_y=None):
+    def __init__(self, window_width=None, window_height=None, window_x=None, window_y=None, profile_key=None, driver_port=None):
         """
         초기화
         
@@ -46,6 +51,8 @@ class BrowserCore:
             window_height (int): 브라우저 창 높이 (기본값: 화면 높이)
             window_x (int): 브라우저 창 X 위치 (기본값: 화면 오른쪽 절반)
             window_y (int): 브라우저 창 Y 위치 (기본값: 0)
+            profile_key (str): 프로필 템플릿 키 (계정 ID, None이면 chromedriver 기본 임시 프로필)
+            driver_port (int): chromedriver 포트 (동시 실행 시 스케줄러가 예약한 포트, None이면 자동)
         """
         self.window_width = window_width
         self.window_height = window_height
@@ -54,6 +61,9 @@ class BrowserCore:
         self.driver = None
         self.inner_width = None
         self.inner_height = None
+        self.profile_key = profile_key
+        self.profile_dir = None
+        self.driver_port = driver_port
         
     def setup_driver(self, headless=False):
         """
@@ -66,6 +76,8 @@ class BrowserCore:
             bool: 설정 성공 여부
         """
         logging.info("===== 브라우저 설정 시작 =====")
+        launch_start = time.perf_counter()
+        profile_time = 0.0
         try:
             # Chrome 옵션 설정
             chrome_options = Options()
@@ -128,14 +140,22 @@ class BrowserCore:
             logging.info("퍼센티 확장 프로그램 자동 로드가 비활성화되었습니다. 수동 설치를 사용합니다.")
             
             # 기본 설정
-            chrome_options.add_experimental_option("prefs", {
-                "credentials_enable_service": False,
-                "profile.password_manager_enabled": False,
-                "profile.default_content_setting_values.notifications": 2
-            })
+            chrome_options.add_experimental_option("prefs", dict(PROFILE_PREFS))
+            
+            # 계정별 프로필 템플릿을 임시 디렉토리로 복제하여 사용 (확장 프로그램/설정 유지)
+            if self.profile_key and profile_templates.enabled():
+                profile_start = time.perf_counter()
+                try:
+                    self.profile_dir = profile_templates.clone(self.profile_key)
+                    chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+                except Exception as e:
+                    logging.warning(f"프로필 템플릿 복제 실패, 기본 임시 프로필 사용: {e}")
+                    self.profile_dir = None
+                profile_time = time.perf_counter() - profile_start
             
-            # Chrome 137+ 확장 프로그램 로드 지원을 위한 플래그 추가
-            chrome_options.add_argument("--disable-features=DisableLoadExtensionCommandLineSwitch")
+            # 배치 처리량용 플래그 (--disable-features는 하나로 합쳐서 추가)
+            # Chrome 137+ 확장 프로그램 로드 지원을 위한 DisableLoadExtensionCommandLineSwitch 포함
+            disabled_features = ["DisableLoadExtensionCommandLineSwitch"]
             
             # GUI 안정성을 위한 옵션 추가
             if not headless:
@@ -145,23 +165,16 @@ class BrowserCore:
                 chrome_options.add_experimental_option("detach", True)  # GUI 모드에서 프로세스 분리
                 chrome_options.add_argument("--disable-web-security")
                 chrome_options.add_argument("--allow-running-insecure-content")
-                chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+                disabled_features.append("VizDisplayCompositor")
                 logging.info("GUI 모드: Windows 호환성 Chrome 옵션 적용")
             
-            # Selenium 4.6+ 자동 드라이버 관리 사용
-            # Selenium Manager가 자동으로 chromedriver를 다운로드하고 관리함
+            apply_launch_arguments(chrome_options, disabled_features)
+            
+            # 호스트별로 고정된 chromedriver 경로 사용 (없으면 Selenium 4.6+ Selenium Manager가 찾음)
+            driver_start = time.perf_counter()
+            service_options = {'port': self.driver_port} if self.driver_port else {}
             try:
-                logging.info("Selenium Manager를 사용하여 Chrome 드라이버 자동 설정 시작")
-                import time
-                import signal
-                
                 start_time = time.time()
-                
-                # 타임아웃 설정 (30초)
-                def timeout_handler(signum, frame):
-                    raise TimeoutError("Chrome 드라이버 생성 타임아웃 (30초)")
-                
-                # Windows에서는 signal.alarm이 지원되지 않으므로 다른 방법 사용
                 logging.info("Chrome 드라이버 생성 시도 중...")
                 
                 # Chrome 드라이버 생성 시도 (threading을 사용한 타임아웃)
@@ -173,8 +186,23 @@ class BrowserCore:
                 
                 def create_driver():
                     try:
-                        logging.info("webdriver.Chrome() 호출 시작")
-                        driver = webdriver.Chrome(options=chrome_options)
+                        driver = None
+                        cached_path = driver_path_cache.get()
+                        if cached_path:
+                            try:
+                                logging.info(f"고정된 chromedriver로 webdriver.Chrome() 호출: {cached_path}")
+                                driver = webdriver.Chrome(service=Service(cached_path, **service_options), options=chrome_options)
+                            except Exception as cached_error:
+                                # Chrome 업데이트 등으로 버전이 맞지 않으면 캐시를 지우고 다시 찾음
+                                logging.warning(f"고정된 chromedriver 실행 실패, Selenium Manager로 재시도: {cached_error}")
+                                driver_path_cache.invalidate()
+                        if driver is None:
+                            logging.info("Selenium Manager로 webdriver.Chrome() 호출 시작")
+                            if service_options:
+                                driver = webdriver.Chrome(service=Service(**service_options), options=chrome_options)
+                            else:
+                                driver = webdriver.Chrome(options=chrome_options)
+                            driver_path_cache.remember(getattr(getattr(driver, 'service', None), 'path', None))
                         logging.info("webdriver.Chrome() 호출 완료")
                         result_queue.put(driver)
                         logging.info("result_queue에 driver 저장 완료")
@@ -211,8 +239,9 @@ class BrowserCore:
                 chromedriver_path = shutil.which('chromedriver')
                 if chromedriver_path:
                     logging.info(f"시스템 PATH에서 chromedriver 발견: {chromedriver_path}")
-                    service = Service(chromedriver_path)
+                    service = Service(chromedriver_path, **service_options)
                     self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                    driver_path_cache.remember(chromedriver_path)
                 else:
                     # 일반적인 설치 경로들 시도
                     possible_paths = [
@@ -227,8 +256,9 @@ class BrowserCore:
                         try:
                             if os.path.exists(path):
                                 logging.info(f"chromedriver 경로 시도: {path}")
-                                service = Service(path)
+                                service = Service(path, **service_options)
                                 self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                                driver_path_cache.remember(os.path.abspath(path))
                                 driver_found = True
                                 break
                         except Exception as path_error:
@@ -247,54 +277,46 @@ class BrowserCore:
                         logging.error(error_msg)
                         raise Exception(error_msg)
             
-            # 초기 창 크기 및 위치 로깅
-            logging.info("브라우저 창 크기 및 위치 정보 수집 시작")
+            driver_time = time.perf_counter() - driver_start
+            self.driver._profile_dir = self.profile_dir
+            
+            # 창 크기/위치와 내부 크기를 스크립트 한 번으로 측정
+            window_start = time.perf_counter()
             try:
-                window_size = self.driver.get_window_size()
-                window_position = self.driver.get_window_position()
-                logging.info(f"초기 창 크기: {window_size['width']}x{window_size['height']}")
-                logging.info(f"초기 창 위치: x={window_position['x']}, y={window_position['y']}")
+                metrics = self._measure_window()
+                logging.info(f"초기 창 크기: {metrics['outerWidth']}x{metrics['outerHeight']}, "
+                             f"위치: x={metrics['screenX']}, y={metrics['screenY']}")
             except Exception as e:
-                logging.error(f"창 크기/위치 정보 수집 실패: {e}")
+                logging.error(f"창 크기/내부 크기 측정 실패: {e}")
                 raise
             
-            # 브라우저 전체화면으로 전환 (헤드리스 모드 제외)
+            # 브라우저 전체화면으로 전환 (헤드리스 모드 제외, --start-maximized로 이미 최대화된 경우 생략)
             if not headless:
-                logging.info("브라우저 전체화면으로 전환 시도")
-                try:
-                    self.driver.maximize_window()
-                    logging.info("maximize_window() 호출 완료")
-                    time.sleep(1)  # 전체화면 전환 대기 (2초에서 1초로 단축)
-                    logging.info("전체화면 전환 대기 완료")
-                    
-                    # 전체화면 후 창 크기 및 위치 로깅
-                    window_size = self.driver.get_window_size()
-                    window_position = self.driver.get_window_position()
-                    logging.info(f"전체화면 후 창 크기: {window_size['width']}x{window_size['height']}")
-                    logging.info(f"전체화면 후 창 위치: x={window_position['x']}, y={window_position['y']}")
-                except Exception as e:
-                    logging.warning(f"전체화면 전환 실패 (계속 진행): {e}")
-                    # 전체화면 전환 실패해도 브라우저는 사용 가능하므로 계속 진행
+                if metrics['outerWidth'] < metrics['availWidth'] - 16 or metrics['outerHeight'] < metrics['availHeight'] - 16:
+                    logging.info("브라우저 전체화면으로 전환 시도")
+                    try:
+                        # chromedriver는 창 상태 변경이 끝난 뒤 반환하므로 별도 대기 없음
+                        self.driver.maximize_window()
+                        metrics = self._measure_window()
+                        logging.info(f"전체화면 후 창 크기: {metrics['outerWidth']}x{metrics['outerHeight']}, "
+                                     f"위치: x={metrics['screenX']}, y={metrics['screenY']}")
+                    except Exception as e:
+                        logging.warning(f"전체화면 전환 실패 (계속 진행): {e}")
+                        # 전체화면 전환 실패해도 브라우저는 사용 가능하므로 계속 진행
+                else:
+                    logging.info("이미 최대화된 창: maximize_window() 건너뛰기")
             else:
                 logging.info("헤드리스 모드: maximize_window() 건너뛰기 (설정된 크기 유지)")
             
-            # JavaScript로 브라우저 내부 크기 가져오기
-            logging.info("JavaScript를 사용하여 브라우저 내부 크기 측정 시작")
-            try:
-                self.inner_width = self.driver.execute_script("return window.innerWidth")
-                logging.info(f"innerWidth 측정 완료: {self.inner_width}")
-                
-                self.inner_height = self.driver.execute_script("return window.innerHeight")
-                logging.info(f"innerHeight 측정 완료: {self.inner_height}")
-                
-                logging.info(f"브라우저 내부 크기: {self.inner_width}x{self.inner_height}")
-                
-                # JavaScript 실행 가능 여부 확인
-                js_enabled = self.driver.execute_script("return true")
-                logging.info(f"JavaScript 실행 가능: {js_enabled}")
-            except Exception as e:
-                logging.error(f"JavaScript 실행 실패: {e}")
-                raise
+            self.inner_width = metrics['innerWidth']
+            self.inner_height = metrics['innerHeight']
+            logging.info(f"브라우저 내부 크기: {self.inner_width}x{self.inner_height}")
+            window_time = time.perf_counter() - window_start
+            
+            total_time = time.perf_counter() - launch_start
+            launch_stats.record(total_time, profile=profile_time, driver=driver_time, window=window_time)
+            logging.info(f"브라우저 생성 소요시간: {total_time:.2f}초 (프로필 {profile_time:.2f} / "
+                         f"드라이버 {driver_time:.2f} / 창 {window_time:.2f}) - {launch_stats.format_summary()}")
             
             logging.info("===== 브라우저 설정 완료 =====")
             return True
@@ -305,7 +327,20 @@ class BrowserCore:
             if self.driver:
                 self.driver.quit()
                 self.driver = None
+            profile_templates.release(self.profile_dir)
+            self.profile_dir = None
             return False
+    
+    def _measure_window(self):
+        """창 위치/크기, 화면 가용 크기, 내부 크기를 한 번의 스크립트 실행으로 측정"""
+        return self.driver.execute_script("""
+            return {
+                outerWidth: window.outerWidth, outerHeight: window.outerHeight,
+                screenX: window.screenX, screenY: window.screenY,
+                availWidth: screen.availWidth, availHeight: screen.availHeight,
+                innerWidth: window.innerWidth, innerHeight: window.innerHeight
+            };
+        """)
             
     def convert_to_relative_coordinates(self, absolute_x, absolute_y):
         """
@@ -422,6 +457,7 @@ class BrowserCore:
         if self.driver:
             try:
                 self.driver.quit()
+                release_profile_dir(self.driver)
                 logging.info("웹드라이버가 종료되었습니다.")
             except Exception as e:
                 logging.error(f"웹드라이버 종료 중 오류 발생: {e}")
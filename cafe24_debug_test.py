@@ -1063,6 +1063,128 @@ class Cafe24DebugTester:
                 self.logger.info("브라우저 종료")
                 self.driver.quit()
 
+    def test_disconnect_pipeline_mock(self, disconnect_tabs=3, total_products=500):
+        """
+        연동해제 파이프라인(여러 탭 미리 열기) 모의 페이지 테스트
+        
+        로컬 HTTP 서버로 상품 관리 목록/전송 팝업을 흉내 내고, 페이지가 5→1 순서로
+        모두 연동해제되는지와 소요 시간을 확인합니다 (카페24 로그인 불필요).
+        """
+        import threading
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+        from urllib.parse import urlparse, parse_qs
+        
+        disconnected_pages = []
+        
+        list_template = """<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>
+<div class="top-txt-inline"><span class="txt-inline">총 <strong>{total}</strong>개</span></div>
+<button type="button" onclick="document.getElementById('menu').style.display='block'">판매관리</button>
+<ul id="menu" style="display:none"><li data-cmd="saleDelete"><a href="#" onclick="disconnect(); return false;">연동해제</a></li></ul>
+<table class="table-list"><thead><tr><th><input type="checkbox" class="allCk"
+ onclick="document.querySelectorAll('input.rowCk').forEach(function (c) {{ c.checked = this.checked; }}, this)"></th><th>상품</th></tr></thead>
+<tbody id="rows"></tbody></table>
+<script>
+// 목록은 XHR로 늦게 채워지는 실제 화면처럼 지연 렌더링
+setTimeout(function () {{
+    var xhr = new XMLHttpRequest();
+    xhr.open('GET', '/api/list?page={page}');
+    xhr.onload = function () {{
+        var html = '';
+        for (var i = 1; i <= 100; i++) html += '<tr><td><input type="checkbox" class="rowCk"></td><td>상품 {page}-' + i + '</td></tr>';
+        document.getElementById('rows').innerHTML = html;
+    }};
+    xhr.send();
+}}, 300);
+function disconnect() {{
+    if (confirm('선택한 상품을 연동해제 하시겠습니까?')) {{
+        window.open('/sendRequest?page={page}', 'sendRequest', 'width=600,height=400');
+    }}
+}}
+</script></body></html>"""
+        
+        popup_template = """<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>
+<button type="button" class="btn btn-lg btn-point sendRequestSubmit" onclick="send()">전송</button>
+<script>
+function send() {{
+    var xhr = new XMLHttpRequest();
+    xhr.open('POST', '/disconnect?page={page}', false);
+    xhr.send();
+    alert('연동해제 요청이 완료되었습니다.');
+    window.close();
+}}
+</script></body></html>"""
+        
+        class MockHandler(BaseHTTPRequestHandler):
+            def _respond(self, body, content_type='text/html; charset=utf-8', delay=0):
+                time.sleep(delay)
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def do_GET(self):
+                url = urlparse(self.path)
+                page = parse_qs(url.query).get('page', ['1'])[0]
+                if url.path == '/manageList':
+                    self._respond(list_template.format(total=total_products, page=page), delay=1.5)
+                elif url.path == '/api/list':
+                    self._respond('{"page": %s}' % page, 'application/json', delay=1.0)
+                elif url.path == '/sendRequest':
+                    self._respond(popup_template.format(page=page))
+                else:
+                    self.send_error(404)
+            
+            def do_POST(self):
+                url = urlparse(self.path)
+                if url.path == '/disconnect':
+                    disconnected_pages.append(int(parse_qs(url.query).get('page', ['0'])[0]))
+                    self._respond('{"result": "ok"}', 'application/json')
+                else:
+                    self.send_error(404)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        server = ThreadingHTTPServer(('127.0.0.1', 0), MockHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        manage_list_url = f"http://127.0.0.1:{server.server_port}/manageList"
+        self.logger.info(f"모의 상품 관리 페이지: {manage_list_url}")
+        
+        try:
+            if not self.setup_browser():
+                return False
+            
+            self.market_manager = MarketManagerCafe24(
+                self.driver, disconnect_tabs=disconnect_tabs, manage_list_url=manage_list_url
+            )
+            
+            start_time = time.time()
+            success = self.market_manager._disconnect_11st_products('mockstore')
+            elapsed = time.time() - start_time
+            
+            expected_pages = list(range(min(5, (total_products + 99) // 100), 0, -1))
+            self.logger.info(f"연동해제 결과: {success}, 소요 시간: {elapsed:.1f}초 (탭 {disconnect_tabs}개)")
+            self.logger.info(f"연동해제된 페이지 순서: {disconnected_pages} (기대: {expected_pages})")
+            self.logger.info(f"남은 창 수: {len(self.driver.window_handles)}")
+            
+            if success and disconnected_pages == expected_pages:
+                self.logger.info("✓ 연동해제 파이프라인 모의 테스트 성공")
+                return True
+            self.logger.error("✗ 연동해제 파이프라인 모의 테스트 실패")
+            return False
+            
+        except Exception as e:
+            self.logger.error(f"연동해제 파이프라인 모의 테스트 중 오류 발생: {e}")
+            return False
+            
+        finally:
+            server.shutdown()
+            if self.driver:
+                self.logger.info("브라우저 종료")
+                self.driver.quit()
+
 
 def main():
     """메인 함수"""
@@ -1074,8 +1196,9 @@ def main():
     print("5. 개별 모달창 처리 방법 테스트 (테스트용 모달창)")
     print("6. 실제 카페24 모달창 고급 처리 테스트 (12가지 방법)")
     print("7. 페이지 번호 검증 기능 테스트")
+    print("8. 연동해제 파이프라인 모의 페이지 테스트 (로컬 서버)")
     
-    choice = input("선택하세요 (1-7): ")
+    choice = input("선택하세요 (1-8): ")
     
     tester = Cafe24DebugTester()
     
@@ -1099,6 +1222,9 @@ def main():
         tester.test_real_cafe24_modal_advanced()
     elif choice == "7":
         tester.test_page_navigation_verification()
+    elif choice == "8":
+        tabs = input("미리 열 탭 수 (기본 3, 1이면 순차 처리): ").strip()
+        tester.test_disconnect_pipeline_mock(disconnect_tabs=int(tabs) if tabs else 3)
     else:
         print("잘못된 선택입니다.")
 
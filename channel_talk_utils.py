@@ -8,13 +8,19 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, JavascriptException
-
-# 채널톡 닫기 상태 플래그
-channel_talk_hidden = False
+from core.browser.overlay_suppression import is_overlay_suppressed
 
 # 마지막 채널톡 닫기 시도 시간 기록
 last_channel_talk_attempt = 0
 
+
+def _mark_channel_talk_hidden(driver):
+    """채널톡 닫기 완료 표시 (드라이버별 - 한 프로세스에서 여러 브라우저를 실행하므로 전역 플래그를 쓰지 않음)"""
+    try:
+        driver._channel_talk_hidden = True
+    except Exception:
+        pass
+
 def is_channel_talk_visible(driver, timeout=1):
     """
     채널톡 메신저가 현재 화면에 보이는지 확인합니다.
@@ -85,13 +91,13 @@ def check_and_hide_channel_talk(driver, timeout=5):
     Returns:
         bool: 채널톡 닫기 시도 성공 여부
     """
-    global channel_talk_hidden, last_channel_talk_attempt
+    global last_channel_talk_attempt
     
     # 초기화
     success = False
     
-    # 이미 채널톡을 닫았다면 다시 시도하지 않음
-    if channel_talk_hidden:
+    # 이미 채널톡을 닫았거나 브라우저 생성 시 차단 스크립트가 등록되었다면 다시 시도하지 않음
+    if getattr(driver, '_channel_talk_hidden', False) or is_overlay_suppressed(driver):
         logging.info("채널톡이 이미 닫혀 있습니다. 추가 닫기 시도를 건너뜁니다.")
         return True
     
@@ -144,13 +150,13 @@ def check_and_hide_channel_talk(driver, timeout=5):
         logging.info(f"채널톡 강제 숨김 결과: {json.dumps(result, ensure_ascii=False)}")
         
         # 성공 여부와 상관없이 항상 성공으로 처리
-        channel_talk_hidden = True
+        _mark_channel_talk_hidden(driver)
         logging.info("채널톡 닫기 성공! 이후 닫기 시도는 무시됩니다.")
         return True
     except Exception as e:
         logging.warning(f"채널톡 강제 숨김 실패: {e}")
         # 예외 발생해도 계속 진행
-        channel_talk_hidden = True
+        _mark_channel_talk_hidden(driver)
         return True
         
     # 여기까지 실행되지 않음 - 파일 끝까지 요청이 오면 실패로 처리
@@ -641,7 +647,7 @@ def check_and_hide_channel_talk(driver, timeout=5):
         success = True
     
     # 채널톡 닫기 성공 여부와 관계없이 플래그 설정 (중복 시도 방지)
-    channel_talk_hidden = True
+    _mark_channel_talk_hidden(driver)
     
     # 채널톡 닫기 성공 여부 반환
     if success:
@@ -22,6 +22,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # 배치 관리자 임포트
 from batch.batch_manager import BatchManager, run_step1_for_accounts, run_all_steps_for_account, get_real_account_id
 from core.account.account_manager import CoreAccountManager
+from core.utils.wait_profiler import wait_profiler
+from core.utils.log_pipeline import log_pipeline, configure_logging, LOG_PROFILES
 
 # 로깅 설정
 logging.basicConfig(
@@ -56,27 +58,22 @@ class BatchCLI:
         self.unified_logger = logging.getLogger(f"unified_batch_{self.unified_log_session}")
         self.unified_logger.setLevel(logging.INFO)
         
-        # 기존 핸들러 제거
-        for handler in self.unified_logger.handlers[:]:
-            self.unified_logger.removeHandler(handler)
-        
-        # 파일 핸들러 추가
+        # 파일 핸들러
         file_handler = logging.FileHandler(self.unified_log_file, encoding='utf-8')
         file_formatter = logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s'
         )
         file_handler.setFormatter(file_formatter)
-        self.unified_logger.addHandler(file_handler)
         
-        # 콘솔 핸들러 추가
+        # 콘솔 핸들러
         console_handler = logging.StreamHandler()
         console_formatter = logging.Formatter(
             '%(asctime)s - %(message)s'
         )
         console_handler.setFormatter(console_formatter)
-        self.unified_logger.addHandler(console_handler)
         
-        self.unified_logger.propagate = False
+        # 큐 기반 파이프라인에 연결 (기존 핸들러 제거, 전파 방지)
+        log_pipeline.attach(self.unified_logger, [file_handler, console_handler])
         
         # 세션 시작 로그
         self._log_unified(f"🚀 통합 배치 세션 시작: {self.unified_log_session}")
@@ -207,6 +204,10 @@ class BatchCLI:
             # 진행 상황 초기화 옵션 추가
             reset_progress = getattr(args, 'reset_progress', True)
             
+            # 대기 시간 프로파일링 (보고서 디렉토리에 wait_profile_*.md 생성)
+            if getattr(args, 'profile_waits', False) and wait_profiler.install():
+                self._log_unified("⏱️ 대기 시간 프로파일러 활성화")
+            
             result = self.batch_manager.run_single_step(
                 step=args.step,
                 accounts=real_accounts,  # 실제 이메일 주소 사용
@@ -256,6 +257,81 @@ class BatchCLI:
             self.batch_manager.cleanup()
             self._log_unified(f"🏁 배치 세션 종료: {self.unified_log_session}")
     
+    def run_daemon(self, args):
+        """
+        배치 워커 데몬 실행 (브라우저/모델을 상주시킨 채 단계 작업 수신)
+        
+        Args:
+            args: 명령줄 인수
+        """
+        from batch.executors.worker_daemon import BatchWorkerDaemon
+        
+        daemon = BatchWorkerDaemon(
+            batch_manager=self.batch_manager,
+            host=args.host,
+            port=args.port,
+            max_workers=args.max_workers
+        )
+        
+        self._log_unified(f"🛰️ 배치 워커 데몬 시작: {args.host}:{args.port} (최대 동시 작업: {args.max_workers})")
+        print(f"배치 워커 데몬 실행 중: {args.host}:{args.port} (Ctrl+C로 종료)")
+        
+        try:
+            daemon.serve_forever()
+        finally:
+            self._log_unified(f"🏁 배치 워커 데몬 종료: {self.unified_log_session}")
+    
+    def compile_workbook(self, args):
+        """
+        작업 시트를 (계정, 단계, 서버, 키워드) 인덱스로 컴파일하여 저장
+        
+        Args:
+            args: 명령줄 인수
+        """
+        from core.utils.task_index import compile_task_index, save_task_index, DEFAULT_INDEX_FILE
+        
+        try:
+            start_time = time.time()
+            index = compile_task_index(args.excel)
+            output_file = args.output or DEFAULT_INDEX_FILE
+            save_task_index(index, output_file)
+            
+            print(f"\n=== 작업 인덱스 컴파일 완료 ({time.time() - start_time:.2f}초) ===")
+            for (account_id, step, server_name), count in sorted(index.summary().items(), key=lambda item: str(item[0])):
+                if server_name is not None:
+                    print(f"  {account_id} / {step} / {server_name}: {count}개")
+            
+            invalid_cells = index.get_invalid_cells()
+            if invalid_cells:
+                print(f"\n=== 잘못된 액션 명령어 {len(invalid_cells)}개 ===")
+                for cell in invalid_cells:
+                    print(f"  [{cell['sheet']}] {cell['column']}{cell['row']} '{cell['value']}': {cell['error']}")
+            print(f"저장 위치: {output_file}")
+            
+        except Exception as e:
+            print(f"작업 인덱스 컴파일 중 오류: {e}")
+            logger.error(f"작업 인덱스 컴파일 중 오류: {e}")
+    
+    def seed_profile(self, args):
+        """
+        계정별 Chrome 프로필 템플릿을 열어 확장 프로그램 설치 등 수동 준비
+        
+        Args:
+            args: 명령줄 인수
+        """
+        from core.browser.launch_profile import profile_templates
+        
+        try:
+            driver = profile_templates.open_for_seeding(args.account, args.url)
+            print(f"\n프로필 템플릿: {profile_templates.template_dir(args.account)}")
+            print("확장 프로그램 설치/설정을 마친 뒤 Enter를 누르면 브라우저를 닫고 템플릿에 저장합니다.")
+            input()
+            driver.quit()
+            print("프로필 템플릿 저장 완료")
+        except Exception as e:
+            print(f"프로필 템플릿 준비 중 오류: {e}")
+            logger.error(f"프로필 템플릿 준비 중 오류: {e}")
+    
     def run_multi_step(self, args):
         """
         다중 단계 실행 (통합 로그 기능 포함)
@@ -842,9 +918,24 @@ def create_parser():
   
   # 계정 목록 조회
   python batch_cli.py accounts
+  
+  # 상주 배치 워커 데몬 실행 (주기적 실행/GUI가 작업을 전달)
+  python batch_cli.py daemon --port 47531
+  
+  # 운영 실행 (헬퍼 모듈 진행 로그 생략, 모듈별 속도 제한)
+  python batch_cli.py --log-profile production single --step 1 --accounts account1
+  
+  # 엑셀 작업 시트를 인덱스로 미리 컴파일
+  python batch_cli.py compile --excel percenty_id.xlsx
+  
+  # 모든 계정 공통 Chrome 프로필 템플릿 준비 (확장 프로그램 한 번만 설치)
+  python batch_cli.py seed-profile --account _base
         """
     )
     
+    parser.add_argument('--log-profile', choices=list(LOG_PROFILES), default='default',
+                       help='로그 프로필 (production: 헬퍼 모듈 진행 로그 생략 및 모듈별 속도 제한, debug: 디버그 로그 포함)')
+    
     subparsers = parser.add_subparsers(dest='command', help='사용 가능한 명령어')
     
     # 단일 단계 실행
@@ -871,6 +962,8 @@ def create_parser():
                               help='3단계 진행 상황 파일 초기화 (기본값: True, 새로운 배치 작업 시작 시 사용)')
     single_parser.add_argument('--no-reset-progress', action='store_false', dest='reset_progress',
                               help='3단계 진행 상황 파일 초기화 비활성화')
+    single_parser.add_argument('--profile-waits', action='store_true',
+                              help='time.sleep/WebDriverWait 대기 시간을 호출 위치별로 집계하여 보고서 생성')
     
     # 다중 단계 실행
     multi_parser = subparsers.add_parser('multi', help='다중 단계 배치 실행')
@@ -911,6 +1004,29 @@ def create_parser():
     scenario_parser.add_argument('-o', '--output',
                                 help='결과 저장 파일 경로')
     
+    # 배치 워커 데몬
+    daemon_parser = subparsers.add_parser('daemon', help='상주 배치 워커 데몬 실행')
+    daemon_parser.add_argument('--host', type=str, default='127.0.0.1',
+                              help='바인드 주소 (기본값: 127.0.0.1)')
+    daemon_parser.add_argument('--port', type=int, default=int(os.getenv('PERCENTY_WORKER_PORT', '47531')),
+                              help='바인드 포트 (기본값: 47531)')
+    daemon_parser.add_argument('--max-workers', type=int, default=4,
+                              help='동시에 실행할 최대 작업 수 (기본값: 4)')
+    
+    # 작업 인덱스 컴파일
+    compile_parser = subparsers.add_parser('compile', help='엑셀 작업 시트를 작업 인덱스로 컴파일')
+    compile_parser.add_argument('--excel', type=str, default='percenty_id.xlsx',
+                               help='엑셀 파일 경로 (기본값: percenty_id.xlsx)')
+    compile_parser.add_argument('-o', '--output', type=str,
+                               help='인덱스 저장 경로 (기본값: cache/task_index.pkl)')
+    
+    # 프로필 템플릿 준비
+    seed_parser = subparsers.add_parser('seed-profile', help='계정별 Chrome 프로필 템플릿 준비 (확장 프로그램 설치 등)')
+    seed_parser.add_argument('--account', type=str, default='_base',
+                            help='계정 ID (기본값: _base - 템플릿이 없는 모든 계정에 복제됨)')
+    seed_parser.add_argument('--url', type=str, default='https://chromewebstore.google.com/',
+                            help='처음 열 주소 (기본값: Chrome 웹 스토어)')
+    
     # 계정 목록
     subparsers.add_parser('accounts', help='등록된 계정 목록 조회')
     
@@ -935,6 +1051,10 @@ def main():
         parser.print_help()
         return
     
+    # 비동기 로그 파이프라인 (JSON lines 구조화 로그: logs/structured/)
+    structured_log = configure_logging(profile=args.log_profile)
+    logger.info(f"로그 프로필: {args.log_profile}, 구조화 로그: {structured_log}")
+    
     cli = BatchCLI()
     
     try:
@@ -946,6 +1066,12 @@ def main():
             cli.run_multi_batch(args)
         elif args.command == 'scenario':
             cli.run_scenario(args)
+        elif args.command == 'daemon':
+            cli.run_daemon(args)
+        elif args.command == 'compile':
+            cli.compile_workbook(args)
+        elif args.command == 'seed-profile':
+            cli.seed_profile(args)
         elif args.command == 'accounts':
             cli.list_accounts(args)
         elif args.command == 'scenarios':
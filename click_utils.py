@@ -7,9 +7,10 @@ import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementNotInteractableException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementNotInteractableException, StaleElementReferenceException
 from coordinates.coordinates_all import get_converted_coordinates
 from timesleep import sleep_with_logging
+from core.utils.selector_race import selector_race
 
 # 로그 레벨 설정 - DOM 선택자 시도 로그가 항상 기록되도록 INFO 레벨로 설정
 
@@ -322,52 +323,18 @@ def smart_click(driver, ui_element, delay=2.0, max_retries=2):
             # 스테일 요소 재시도 로직 추가
             for retry in range(max_retries + 1):  # 원래 시도 + 재시도 횟수
                 try:
-                    # JavaScript로 요소 존재 여부 먼저 검사
-                    try:
-                        js_check = """
-                        var xpath_result = [];
-                        if (arguments[0].startsWith('//')) {
-                            // XPath 처리
-                            var xpathResult = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
-                            var exists = xpathResult.snapshotLength > 0;
-                            var count = xpathResult.snapshotLength;
-                            var tag = exists ? xpathResult.snapshotItem(0).tagName : 'None';
-                            return {exists: exists, count: count, tagName: tag};
-                        } else {
-                            // CSS 선택자 처리
-                            var elements = document.querySelectorAll(arguments[0]);
-                            var exists = elements.length > 0;
-                            var count = elements.length;
-                            var tag = exists ? elements[0].tagName : 'None';
-                            return {exists: exists, count: count, tagName: tag};
-                        }
-                        """
-                        js_result = driver.execute_script(js_check, dom_selector)
-                        js_exists = js_result.get('exists', False)
-                        js_count = js_result.get('count', 0)
-                        js_tag = js_result.get('tagName', 'Unknown')
-                        logger.info(f"[JS 확인] DOM 요소 존재: {js_exists}, 개수: {js_count}, 태그: {js_tag}")
-                        
-                        # JS로 요소가 없다고 판단되면 재시도 중단
-                        if not js_exists and retry < max_retries:
-                            logger.warning(f"[재시도 {retry+1}/{max_retries}] 요소가 DOM에 없음. 잠시 대기 후 재시도...")
-                            time.sleep(0.5)  # 짧은 대기 후 재시도
-                            continue
-                        elif not js_exists:
-                            # 모든 재시도 실패 시 다음 방법으로
-                            logger.warning("모든 JS 확인 재시도 실패. 다음 방법으로 진행")
-                            break
-                    except Exception as js_error:
-                        logger.warning(f"JavaScript 요소 확인 중 오류: {js_error}")
+                    # 요소가 표시되고 활성화될 때까지 페이지 안에서 대기 (존재 확인 + 클릭 가능 대기를 한 번의 호출로)
+                    # 대기는 첫 시도에서만 - 스테일 재시도는 바로 다시 찾음
+                    match = selector_race.resolve(driver, [(selector_type, dom_selector)], key=element_name,
+                                                  enabled=True, timeout=2 if retry == 0 else 0)
+                    if not match:
+                        # 대기 후에도 없으면 재시도하지 않고 다음 방법으로
+                        logger.warning("클릭 가능한 요소가 없음. 다음 방법으로 진행")
+                        break
+                    element = match.element
                     
                     # 요소 존재 확인 및 클릭 시도
                     try:
-                        # 요소가 클릭 가능할 때까지 명시적 대기 (탭 변경 시 안정성 향상)
-                        wait = WebDriverWait(driver, 2)
-                        element = wait.until(EC.element_to_be_clickable((selector_type, dom_selector)))
-                        
-                        logger.info(f"DOM 선택자 요소 발견: tag={element.tag_name}, displayed={element.is_displayed()}, enabled={element.is_enabled()}")
-                        
                         # JavaScript로 클릭 시도 (더 안정적인 방법)
                         logger.info(f"[Selenium] JavaScript로 DOM 요소 클릭 시도...")
                         driver.execute_script("arguments[0].click();", element)
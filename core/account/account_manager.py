@@ -16,6 +16,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 # 기존 모듈들 임포트
 from account_manager import AccountManager as LegacyAccountManager
+from core.utils.workbook_cache import workbook_cache
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +55,7 @@ class CoreAccountManager:
             self.legacy_manager = LegacyAccountManager(self.excel_file)
             
             # 엑셀 파일 직접 읽기
-            df = pd.read_excel(self.excel_file)
+            df = workbook_cache.read_sheet(self.excel_file)
             
             # 컬럼명 매핑 (다양한 컬럼명 지원)
             column_mapping = {
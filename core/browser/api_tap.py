@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+API 응답 탭 모듈
+퍼센티 웹앱이 직접 받아오는 XHR/fetch JSON 응답을 페이지 안에 보관하여
+상품 수/검색 결과를 DOM 선택자 탐색 없이 바로 읽을 수 있게 합니다.
+
+- CDP Page.addScriptToEvaluateOnNewDocument로 모든 문서 시작 시점에 XHR/fetch 후킹 스크립트를 등록
+  (드라이버당 한 번, driver._api_tap). URL이 탭 패턴과 일치하는 JSON 응답만 최근 MAX_ENTRIES개 보관합니다.
+- 조회는 페이지 안에서 바로 수행하고 필요한 값(총 개수, 목록 길이)만 반환하므로 큰 응답을 전송하지 않습니다.
+- 일치하는 요청이 진행 중이면 응답이 도착할 때까지(최대 timeout) 기다린 뒤 읽습니다.
+- 응답이 없거나 개수 필드를 찾지 못하면 None을 반환하며, 호출하는 쪽은 기존 DOM 확인으로 진행합니다.
+- 그룹/페이지 전환 직후에는 가장 최근 응답이 이전 목록의 응답일 수 있으므로, 목록 요청을 일으키는 동작 전에
+  api_tap_mark()로 순번을 기록하고 since로 넘겨 그 이후 응답만 사용합니다.
+  개수는 목록 API(PRODUCT_LIST_PATTERN) 응답에서만 읽습니다.
+- 응답 형식(엔드포인트와 총 개수 필드)은 확정된 것이 아니므로, api_total_count는 화면의 "총 N개 상품"
+  표시와 일치할 때만 총 개수를 반환합니다 (다르면 None - 호출하는 쪽의 DOM 확인으로 진행).
+- 탭 패턴(정규식, 대소문자 무시)은 PERCENTY_API_TAP_PATTERNS 환경 변수(쉼표 구분)로 바꿀 수 있습니다.
+
+사용 예:
+    install_api_tap(driver)
+    mark = api_tap_mark(driver)        # 동작 전 순번 기록
+    ...검색/필터/그룹 변경...
+    counts = api_result_counts(driver, PRODUCT_LIST_PATTERN, since=mark)   # {'total': 4253, 'items': 100, ...}
+"""
+
+import os
+import json
+import logging
+from typing import Dict, List, Optional
+
+from core.utils.dom_ready import ensure_script_timeout, SCRIPT_TIMEOUT_MARGIN
+
+logger = logging.getLogger(__name__)
+
+# 보관할 상품 목록 API 응답 URL 패턴 (정규식)
+DEFAULT_TAP_PATTERNS = [
+    r"percenty\.co\.kr/.*product",
+]
+
+TAP_PATTERNS_ENV = 'PERCENTY_API_TAP_PATTERNS'
+
+# 상품 목록(검색/그룹 목록) API 응답 URL 패턴 - 상세(/products/<id>)나 일괄 수정 응답은 제외
+PRODUCT_LIST_PATTERN = os.environ.get(
+    'PERCENTY_API_LIST_PATTERN',
+    r"percenty\.co\.kr/(?:.*/)?products?(?:/(?:list|search|page))?/?(?:\?|$)"
+)
+
+# 페이지 안에 보관할 최근 응답 수
+MAX_ENTRIES = 20
+
+# 응답에서 총 개수로 인식하는 필드 (앞에 있을수록 우선, 중첩 객체에서도 찾음)
+TOTAL_KEYS = ['totalElements', 'totalCount', 'total_count', 'totalItems']
+
+# 최상위 객체에서만 총 개수로 인식하는 일반 필드
+# (count는 페이지 크기/현재 목록 길이인 응답이 있어 제외 - 비어 있지 않은 그룹을 비었다고 판단할 수 있음)
+TOP_LEVEL_TOTAL_KEYS = ['total']
+
+# 응답에서 목록으로 인식하는 필드
+LIST_KEYS = ['content', 'items', 'list', 'products', 'rows', 'results', 'data']
+
+# 목록 항목에서 상품 ID로 인식하는 필드 (앞에 있을수록 우선)
+ID_KEYS = ['id', 'productId', 'product_id', '_id', 'productNo', 'goodsNo']
+
+# 문서 시작 시점 XHR/fetch 응답 보관 스크립트 (__PATTERNS__, __LIMIT__ 치환)
+_HOOK_TEMPLATE = r"""
+(function (patterns, limit) {
+    if (window.__percentyApi) return;
+    var regexps = patterns.map(function (p) { return new RegExp(p, 'i'); });
+    var tap = window.__percentyApi = {seq: 0, pending: 0, entries: []};
+
+    function absolute(url) {
+        try { return new URL(url, location.href).href; } catch (e) { return String(url); }
+    }
+    function matches(url) {
+        for (var i = 0; i < regexps.length; i++) {
+            if (regexps[i].test(url)) return true;
+        }
+        return false;
+    }
+    function record(url, status, body) {
+        if (typeof body === 'string') {
+            try { body = JSON.parse(body); } catch (e) { return; }
+        }
+        if (body === null || typeof body !== 'object') return;
+        tap.seq++;
+        tap.entries.push({seq: tap.seq, url: url, status: status, time: Date.now(), body: body});
+        if (tap.entries.length > limit) tap.entries.shift();
+    }
+
+    var open = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__percentyTapUrl = absolute(url);
+        return open.apply(this, arguments);
+    };
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var xhr = this, url = xhr.__percentyTapUrl;
+        if (url && matches(url)) {
+            tap.pending++;
+            xhr.addEventListener('loadend', function () {
+                tap.pending--;
+                try {
+                    if (xhr.responseType === '' || xhr.responseType === 'text') {
+                        record(url, xhr.status, xhr.responseText);
+                    } else if (xhr.responseType === 'json') {
+                        record(url, xhr.status, xhr.response);
+                    }
+                } catch (e) {}
+            });
+        }
+        return send.apply(this, arguments);
+    };
+
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function (input) {
+            var promise = fetch.apply(this, arguments);
+            var url = absolute(typeof input === 'string' ? input : (input && input.url) || '');
+            if (!matches(url)) return promise;
+            tap.pending++;
+            promise.then(function (response) {
+                return response.clone().text().then(function (text) {
+                    record(url, response.status, text);
+                });
+            }).catch(function () {}).then(function () { tap.pending--; });
+            return promise;
+        };
+    }
+})(__PATTERNS__, __LIMIT__);
+"""
+
+# arguments: url_pattern, since, timeout_ms, total_keys, top_level_total_keys, list_keys, callback
+_COUNTS_SCRIPT = r"""
+var urlPattern = arguments[0] ? new RegExp(arguments[0], 'i') : null, since = arguments[1],
+    timeoutMs = arguments[2], totalKeys = arguments[3], topLevelKeys = arguments[4], listKeys = arguments[5],
+    idKeys = arguments[6], done = arguments[arguments.length - 1];
+var start = Date.now();
+
+function findTotal(node, depth) {
+    if (!node || typeof node !== 'object' || Array.isArray(node) || depth > 3) return null;
+    var keys = depth === 0 ? totalKeys.concat(topLevelKeys) : totalKeys;
+    for (var i = 0; i < keys.length; i++) {
+        var value = node[keys[i]];
+        if (typeof value === 'number' && isFinite(value)) return value;
+    }
+    for (var key in node) {
+        var found = findTotal(node[key], depth + 1);
+        if (found !== null) return found;
+    }
+    return null;
+}
+function findList(node, depth) {
+    if (Array.isArray(node)) return node;
+    if (!node || typeof node !== 'object' || depth > 3) return null;
+    for (var i = 0; i < listKeys.length; i++) {
+        if (Array.isArray(node[listKeys[i]])) return node[listKeys[i]];
+    }
+    for (var key in node) {
+        var found = findList(node[key], depth + 1);
+        if (found) return found;
+    }
+    return null;
+}
+function firstId(list) {
+    var item = list && list.length ? list[0] : null;
+    if (!item || typeof item !== 'object') return null;
+    for (var i = 0; i < idKeys.length; i++) {
+        var value = item[idKeys[i]];
+        if ((typeof value === 'number' && isFinite(value)) || (typeof value === 'string' && value)) return String(value);
+    }
+    return null;
+}
+function latest(tap) {
+    for (var i = tap.entries.length - 1; i >= 0; i--) {
+        var entry = tap.entries[i];
+        if (since !== null && entry.seq <= since) break;
+        if (entry.status >= 200 && entry.status < 300 && (!urlPattern || urlPattern.test(entry.url))) return entry;
+    }
+    return null;
+}
+function check() {
+    var tap = window.__percentyApi;
+    if (!tap) { done(null); return; }
+    // 일치하는 요청이 진행 중이면 응답 도착까지 대기
+    if (tap.pending > 0 && Date.now() - start < timeoutMs) { setTimeout(check, 50); return; }
+    var entry = latest(tap);
+    if (!entry) {
+        // 동작 이후 응답을 기다리는 중이면 도착할 때까지 대기
+        if (Date.now() - start < timeoutMs && since !== null) { setTimeout(check, 50); return; }
+        done({installed: true, seq: tap.seq});
+        return;
+    }
+    var list = findList(entry.body, 0);
+    done({
+        installed: true, seq: entry.seq, url: entry.url, age_ms: Date.now() - entry.time,
+        total: findTotal(entry.body, 0), items: list ? list.length : null, first_id: firstId(list)
+    });
+}
+check();
+"""
+
+# 화면의 "총 N개 상품" 표시에서 총 개수 (API 총 개수 검증용, 표시가 없으면 null)
+_DOM_TOTAL_SCRIPT = r"""
+var spans = document.querySelectorAll('span');
+for (var i = 0; i < spans.length; i++) {
+    var text = spans[i].textContent || '';
+    if (text.indexOf('총') !== -1 && text.indexOf('개 상품') !== -1) {
+        var match = text.replace(/,/g, '').match(/\d+/);
+        if (match) return parseInt(match[0], 10);
+    }
+}
+return null;
+"""
+
+# arguments: url_pattern, since
+_LATEST_SCRIPT = r"""
+var tap = window.__percentyApi, urlPattern = arguments[0] ? new RegExp(arguments[0], 'i') : null,
+    since = arguments[1];
+if (!tap) return null;
+for (var i = tap.entries.length - 1; i >= 0; i--) {
+    var entry = tap.entries[i];
+    if (since !== null && entry.seq <= since) break;
+    if (!urlPattern || urlPattern.test(entry.url)) return entry;
+}
+return null;
+"""
+
+
+def tap_patterns() -> List[str]:
+    """탭 URL 패턴 (PERCENTY_API_TAP_PATTERNS 환경 변수 우선)"""
+    value = os.environ.get(TAP_PATTERNS_ENV, '').strip()
+    if value:
+        return [pattern.strip() for pattern in value.split(',') if pattern.strip()]
+    return list(DEFAULT_TAP_PATTERNS)
+
+
+def install_api_tap(driver, patterns: Optional[List[str]] = None) -> bool:
+    """
+    드라이버에 API 응답 보관 스크립트 등록 (드라이버당 한 번)
+
+    Args:
+        driver: Selenium WebDriver (Chrome/CDP 지원)
+        patterns: 보관할 응답 URL 정규식 목록 (None이면 tap_patterns())
+
+    Returns:
+        bool: 문서 시작 스크립트 등록 여부 (CDP를 지원하지 않으면 False)
+    """
+    if driver is None:
+        return False
+    if getattr(driver, '_api_tap', None):
+        return True
+
+    source = (_HOOK_TEMPLATE
+              .replace('__PATTERNS__', json.dumps(patterns or tap_patterns()))
+              .replace('__LIMIT__', str(MAX_ENTRIES)))
+    try:
+        result = driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': source})
+    except Exception as e:
+        logger.warning(f"API 응답 탭 등록 실패 (DOM 확인 사용): {e}")
+        return False
+
+    driver._api_tap = result.get('identifier') if isinstance(result, dict) else True
+
+    # 이미 열려 있는 문서에도 적용 (이후 요청부터 보관)
+    try:
+        driver.execute_script(source)
+    except Exception as e:
+        logger.debug(f"현재 문서 API 응답 탭 적용 실패: {e}")
+    return True
+
+
+def api_tap_mark(driver) -> int:
+    """
+    현재까지 보관된 응답 순번 (동작 전에 기록해 두고 since로 전달하면 이후 응답만 사용)
+
+    아직 응답이 없으면 0 - since=0도 "이후 응답만, 도착할 때까지 대기"로 동작합니다.
+    """
+    try:
+        return int(driver.execute_script("return window.__percentyApi ? window.__percentyApi.seq : 0;") or 0)
+    except Exception:
+        return 0
+
+
+def latest_api_response(driver, url_pattern: str = None, since: Optional[int] = None) -> Optional[Dict]:
+    """
+    URL 패턴과 일치하는 가장 최근 응답 (본문 전체 포함)
+
+    Returns:
+        dict: seq, url, status, time, body (없으면 None)
+    """
+    if not install_api_tap(driver):
+        return None
+    try:
+        return driver.execute_script(_LATEST_SCRIPT, url_pattern, since)
+    except Exception as e:
+        logger.debug(f"API 응답 조회 실패: {e}")
+        return None
+
+
+def api_result_counts(driver, url_pattern: str = None, since: Optional[int] = None,
+                      timeout: float = 2.0) -> Optional[Dict]:
+    """
+    가장 최근 목록 API 응답의 총 개수와 목록 길이
+
+    Args:
+        driver: Selenium WebDriver
+        url_pattern: 응답 URL 정규식 (None이면 보관된 모든 응답)
+        since: 이 순번 이후의 응답만 사용 (api_tap_mark 값, None이면 제한 없음 - 이전 목록의 응답일 수 있음)
+        timeout: 진행 중인 요청/새 응답 최대 대기 시간(초)
+
+    Returns:
+        dict: total(총 개수, 없으면 None), items(목록 길이, 없으면 None),
+            first_id(첫 번째 항목의 상품 ID, 없으면 None), url, seq, age_ms
+            (탭이 없거나 일치하는 응답이 없으면 None)
+    """
+    if not install_api_tap(driver):
+        return None
+    try:
+        ensure_script_timeout(driver, timeout + SCRIPT_TIMEOUT_MARGIN)
+        result = driver.execute_async_script(
+            _COUNTS_SCRIPT, url_pattern, None if since is None else int(since), int(timeout * 1000),
+            TOTAL_KEYS, TOP_LEVEL_TOTAL_KEYS, LIST_KEYS, ID_KEYS
+        )
+    except Exception as e:
+        logger.debug(f"API 응답 개수 조회 실패: {e}")
+        return None
+    if not result or 'url' not in result:
+        return None
+    return result
+
+
+def dom_total_count(driver) -> Optional[int]:
+    """화면의 "총 N개 상품" 표시에서 읽은 총 개수 (표시가 없거나 읽지 못하면 None)"""
+    try:
+        value = driver.execute_script(_DOM_TOTAL_SCRIPT)
+    except Exception as e:
+        logger.debug(f"화면 총 개수 조회 실패: {e}")
+        return None
+    return None if value is None else int(value)
+
+
+def api_total_count(driver, url_pattern: str = None, since: Optional[int] = None,
+                    timeout: float = 2.0, confirm_dom: bool = True) -> Optional[int]:
+    """
+    가장 최근 목록 API 응답의 총 개수 (응답이나 개수 필드가 없으면 None - DOM 확인으로 진행)
+
+    confirm_dom이면 화면의 "총 N개 상품" 표시와 일치할 때만 반환합니다.
+    표시가 없거나 값이 다르면 None을 반환하여 호출하는 쪽의 DOM 확인으로 진행합니다.
+    """
+    counts = api_result_counts(driver, url_pattern, since, timeout)
+    if not counts or counts.get('total') is None:
+        return None
+    total = int(counts['total'])
+    if confirm_dom:
+        dom_total = dom_total_count(driver)
+        if dom_total != total:
+            logger.debug("API 응답 총 개수(%s)가 화면 표시(%s)와 달라 사용하지 않음 (%s)", total, dom_total, counts.get('url'))
+            return None
+    logger.debug("API 응답 총 개수: %s (%s, %sms 전)", total, counts.get('url'), counts.get('age_ms'))
+    return total
+
+
+def api_first_item_id(driver, url_pattern: str = None, since: Optional[int] = None,
+                      timeout: float = 2.0) -> Optional[str]:
+    """
+    가장 최근 목록 API 응답의 첫 번째 항목 상품 ID (응답이나 ID 필드가 없으면 None)
+    """
+    counts = api_result_counts(driver, url_pattern, since, timeout)
+    if not counts or not counts.get('first_id'):
+        return None
+    return str(counts['first_id'])
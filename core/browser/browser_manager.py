@@ -6,8 +6,11 @@
 """
 
 import os
+import re
 import sys
+import time
 import logging
+import threading
 from typing import Dict, List, Optional, Union
 
 # 루트 디렉토리를 경로에 추가
@@ -18,59 +21,89 @@ from browser_core import BrowserCore
 from login_percenty import PercentyLogin
 from percenty_utils import hide_channel_talk_and_modals
 from modal_blocker import close_modal_dialog, block_modals_on_page
+from core.browser.session_cache import session_cache
+from core.browser.overlay_suppression import install_overlay_suppression
+from core.browser.api_tap import install_api_tap
+from core.browser.launch_profile import release_profile_dir
+from core.browser.launch_scheduler import LaunchScheduler
 
 logger = logging.getLogger(__name__)
 
+# 계정 브라우저 ID 형식: '{계정}_browser', '{계정}_browser_chunk_{n}'
+_ACCOUNT_BROWSER_ID = re.compile(r'^(?P<account>.+?)_browser(?:_chunk_\d+)?$')
+
 class CoreBrowserManager:
     """
     통합 브라우저 관리자
     기존 BrowserCore의 기능을 확장하여 다중 브라우저 관리 지원
     """
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, use_session_cache: bool = True, use_profile_templates: bool = True,
+                 max_concurrent_launches: int = None):
         """
         초기화
         
         Args:
             headless: 기본 헤드리스 모드 설정
+            use_session_cache: 세션 스냅샷 복원으로 재로그인 생략 여부
+            use_profile_templates: 계정별 프로필 템플릿 복제본으로 실행 여부
+            max_concurrent_launches: 동시에 실행할 수 있는 브라우저 수 (None이면 CPU/메모리로 계산)
         """
         self.browsers = {}  # 브라우저 인스턴스들
         self.active_browser = None
         self.browser_count = 0
         self.headless = headless  # 헤드리스 모드 설정
+        self.use_session_cache = use_session_cache  # 세션 스냅샷 사용 여부
+        self.use_profile_templates = use_profile_templates  # 프로필 템플릿 사용 여부
+        
+        # 웜 풀 (다음 청크용으로 미리 실행 및 로그인해 둔 브라우저)
+        self._lock = threading.RLock()
+        self._warm_pool = {}  # pool_key -> 웜 브라우저 항목
+        self.warm_pool_wait_timeout = 90  # 웜 브라우저 준비 대기 최대 시간(초)
+        
+        # 브라우저 실행 스케줄러 (동시 실행 제한 + 메모리 승인 + 포트 분리)
+        self.launch_scheduler = LaunchScheduler(max_concurrent=max_concurrent_launches)
         
-    def create_browser(self, browser_id: str = None, headless: bool = None) -> str:
+    def _profile_key(self, browser_id: str = None, account_id: str = None) -> Optional[str]:
         """
-        새 브라우저 인스턴스 생성
+        프로필 템플릿 키(계정 ID) 결정
+        
+        account_id가 주어지면 그대로 사용하고, 없으면 계정 브라우저 ID 형식
+        ('{계정}_browser', '{계정}_browser_chunk_{n}')에서 계정 ID를 추출합니다.
+        형식을 알 수 없는 ID는 템플릿을 만들지 않습니다 (None - 기본 임시 프로필).
+        """
+        if not self.use_profile_templates:
+            return None
+        if account_id:
+            return account_id
+        match = _ACCOUNT_BROWSER_ID.match(browser_id or '')
+        if not match:
+            logger.debug(f"계정을 알 수 없는 브라우저 ID - 프로필 템플릿 미사용: {browser_id}")
+            return None
+        return match.group('account')
+    
+    @staticmethod
+    def _quit_driver(driver):
+        """드라이버 종료 후 임시 프로필 삭제"""
+        try:
+            driver.quit()
+        finally:
+            release_profile_dir(driver)
+    
+    def _launch_driver(self, headless: bool, profile_key: str = None):
+        """
+        브라우저 드라이버 실행 (관리 목록에 등록하지 않음)
         
         Args:
-            browser_id: 브라우저 식별자 (None이면 자동 생성)
-            headless: 헤드리스 모드 여부 (None이면 인스턴스 기본값 사용)
+            headless: 헤드리스 모드 여부
+            profile_key: 프로필 템플릿 키 (계정 ID, None이면 기본 임시 프로필)
             
         Returns:
-            str: 생성된 브라우저 ID
+            Dict: 'core', 'driver', 'login_manager' 키를 갖는 브라우저 정보
         """
-        import traceback
-        import time
-        
-        try:
-            # headless 파라미터가 None이면 인스턴스 기본값 사용
-            if headless is None:
-                headless = self.headless
-            
-            logger.info(f"=== create_browser 시작: browser_id={browser_id}, headless={headless} (인스턴스 기본값: {self.headless}) ===")
-            
-            if browser_id is None:
-                browser_id = f"browser_{self.browser_count + 1}"
-                logger.info(f"브라우저 ID 자동 생성: {browser_id}")
-            
-            if browser_id in self.browsers:
-                logger.warning(f"브라우저 ID '{browser_id}'가 이미 존재합니다.")
-                return browser_id
-            
-            # 기존 BrowserCore 사용
+        with self.launch_scheduler.slot(profile_key or 'browser') as driver_port:
             logger.info(f"BrowserCore 인스턴스 생성 시작")
-            browser_core = BrowserCore()
+            browser_core = BrowserCore(profile_key=profile_key, driver_port=driver_port)
             logger.info(f"BrowserCore 인스턴스 생성 완료")
             
             logger.info(f"브라우저 드라이버 생성 시작 (headless={headless})")
@@ -87,23 +120,71 @@ class CoreBrowserManager:
                 logger.error(f"browser_core.create_browser 호출 실패 (소요시간: {end_time - start_time:.2f}초)")
                 logger.error(f"create_browser 오류: {create_error}")
                 raise
-            
-            if not driver:
-                raise Exception("브라우저 드라이버 생성 실패: None 반환")
-            
-            logger.info(f"PercentyLogin 인스턴스 생성 시작")
-            login_manager = PercentyLogin(driver)
-            logger.info(f"PercentyLogin 인스턴스 생성 완료")
-            
+        
+        if not driver:
+            raise Exception("브라우저 드라이버 생성 실패: None 반환")
+        
+        # 채널톡/마케팅 모달 차단을 문서 시작 스크립트로 한 번만 등록
+        install_overlay_suppression(driver)
+        
+        # 상품 목록 API 응답 보관 (상품 수를 DOM 대신 응답 JSON에서 확인)
+        install_api_tap(driver)
+        
+        logger.info(f"PercentyLogin 인스턴스 생성 시작")
+        login_manager = PercentyLogin(driver)
+        logger.info(f"PercentyLogin 인스턴스 생성 완료")
+        
+        return {
+            'core': browser_core,
+            'driver': driver,
+            'login_manager': login_manager
+        }
+    
+    def _register_browser(self, browser_id: str, browser_info: Dict):
+        """실행된 브라우저를 관리 목록에 등록하고 활성 브라우저로 설정"""
+        with self._lock:
             self.browsers[browser_id] = {
-                'core': browser_core,
-                'driver': driver,
-                'login_manager': login_manager,
+                'core': browser_info['core'],
+                'driver': browser_info['driver'],
+                'login_manager': browser_info['login_manager'],
                 'active': True
             }
             
             self.browser_count += 1
             self.active_browser = browser_id
+        
+    def create_browser(self, browser_id: str = None, headless: bool = None, account_id: str = None) -> str:
+        """
+        새 브라우저 인스턴스 생성
+        
+        Args:
+            browser_id: 브라우저 식별자 (None이면 자동 생성)
+            headless: 헤드리스 모드 여부 (None이면 인스턴스 기본값 사용)
+            account_id: 프로필 템플릿 계정 ID (None이면 browser_id 형식에서 추출)
+            
+        Returns:
+            str: 생성된 브라우저 ID
+        """
+        import traceback
+        
+        try:
+            # headless 파라미터가 None이면 인스턴스 기본값 사용
+            if headless is None:
+                headless = self.headless
+            
+            logger.info(f"=== create_browser 시작: browser_id={browser_id}, headless={headless} (인스턴스 기본값: {self.headless}) ===")
+            
+            if browser_id is None:
+                browser_id = f"browser_{self.browser_count + 1}"
+                logger.info(f"브라우저 ID 자동 생성: {browser_id}")
+            
+            if browser_id in self.browsers:
+                logger.warning(f"브라우저 ID '{browser_id}'가 이미 존재합니다.")
+                return browser_id
+            
+            # 기존 BrowserCore 사용
+            browser_info = self._launch_driver(headless, profile_key=self._profile_key(browser_id, account_id))
+            self._register_browser(browser_id, browser_info)
             
             logger.info(f"브라우저 '{browser_id}' 생성 완료")
             return browser_id
@@ -163,51 +244,231 @@ class CoreBrowserManager:
             return False
         
         try:
-            from dom_selectors import LOGIN_SELECTORS
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            import time
-            
-            # 로그인 페이지로 이동
-            logger.info(f"퍼센티 로그인 페이지 열기: https://www.percenty.co.kr/signin")
-            driver.get("https://www.percenty.co.kr/signin")
-            time.sleep(2)  # 페이지 로딩 대기
-            
-            # 아이디 입력
-            logger.info("아이디 입력 중...")
-            email_field = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, LOGIN_SELECTORS["USERNAME_FIELD"]))
-            )
-            email_field.clear()
-            email_field.send_keys(email)
-            time.sleep(0.5)
+            return self._login_driver(driver, email, password)
+        except Exception as e:
+            logger.error(f"브라우저 '{browser_id}' 로그인 중 오류: {e}")
+            return False
+    
+    def _login_driver(self, driver, email: str, password: str) -> bool:
+        """
+        저장된 세션 복원을 먼저 시도하고, 거부되면 폼 로그인 수행
+        
+        폼 로그인에 성공하면 다음 브라우저를 위해 세션 스냅샷을 저장합니다.
+        """
+        if self.use_session_cache and session_cache.restore(driver, email):
+            return True
+        
+        self._perform_login(driver, email, password)
+        
+        if self.use_session_cache:
+            session_cache.capture(driver, email)
+        
+        return True
+    
+    def _perform_login(self, driver, email: str, password: str) -> bool:
+        """
+        퍼센티 로그인 폼 입력 및 로그인 완료 확인
+        
+        Args:
+            driver: 로그인할 WebDriver 인스턴스
+            email: 로그인 이메일
+            password: 로그인 비밀번호
             
-            # 비밀번호 입력
-            logger.info("비밀번호 입력 중...")
-            password_field = driver.find_element(By.XPATH, LOGIN_SELECTORS["PASSWORD_FIELD"])
-            password_field.clear()
-            password_field.send_keys(password)
-            time.sleep(0.5)
+        Returns:
+            bool: 로그인 성공 여부 (실패 시 예외 발생)
+        """
+        from dom_selectors import LOGIN_SELECTORS
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        # 로그인 페이지로 이동
+        logger.info(f"퍼센티 로그인 페이지 열기: https://www.percenty.co.kr/signin")
+        driver.get("https://www.percenty.co.kr/signin")
+        time.sleep(2)  # 페이지 로딩 대기
+        
+        # 아이디 입력
+        logger.info("아이디 입력 중...")
+        email_field = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.XPATH, LOGIN_SELECTORS["USERNAME_FIELD"]))
+        )
+        email_field.clear()
+        email_field.send_keys(email)
+        time.sleep(0.5)
+        
+        # 비밀번호 입력
+        logger.info("비밀번호 입력 중...")
+        password_field = driver.find_element(By.XPATH, LOGIN_SELECTORS["PASSWORD_FIELD"])
+        password_field.clear()
+        password_field.send_keys(password)
+        time.sleep(0.5)
+        
+        # 로그인 버튼 클릭
+        logger.info("로그인 버튼 클릭 중...")
+        login_button = driver.find_element(By.XPATH, LOGIN_SELECTORS["LOGIN_BUTTON"])
+        login_button.click()
+        
+        # 로그인 성공 확인 (URL 변경 확인)
+        logger.info("로그인 완료 확인 중...")
+        WebDriverWait(driver, 30).until(
+            lambda d: "/signin" not in d.current_url
+        )
+        logger.info(f"로그인 성공! 현재 URL: {driver.current_url}")
+        time.sleep(2)  # 로그인 후 화면 로딩 대기
+        
+        return True
+    
+    def prewarm_browser(self, pool_key: str, email: str, password: str, headless: bool = None) -> bool:
+        """
+        다음 청크용 브라우저를 백그라운드에서 미리 실행하고 로그인
+        
+        현재 청크가 실행되는 동안 새 Chrome 실행과 로그인을 끝내 두어
+        청크 전환 시 acquire_warm_browser()로 즉시 교체할 수 있게 합니다.
+        
+        Args:
+            pool_key: 웜 풀 키 (일반적으로 계정 ID)
+            email: 로그인 이메일
+            password: 로그인 비밀번호
+            headless: 헤드리스 모드 여부 (None이면 인스턴스 기본값 사용)
             
-            # 로그인 버튼 클릭
-            logger.info("로그인 버튼 클릭 중...")
-            login_button = driver.find_element(By.XPATH, LOGIN_SELECTORS["LOGIN_BUTTON"])
-            login_button.click()
+        Returns:
+            bool: 백그라운드 준비 시작 여부 (이미 준비 중이면 False)
+        """
+        if headless is None:
+            headless = self.headless
+        
+        with self._lock:
+            if pool_key in self._warm_pool:
+                logger.debug(f"웜 브라우저가 이미 준비 중입니다: {pool_key}")
+                return False
             
-            # 로그인 성공 확인 (URL 변경 확인)
-            logger.info("로그인 완료 확인 중...")
-            WebDriverWait(driver, 30).until(
-                lambda d: "/signin" not in d.current_url
-            )
-            logger.info(f"로그인 성공! 현재 URL: {driver.current_url}")
-            time.sleep(2)  # 로그인 후 화면 로딩 대기
+            entry = {
+                'ready': threading.Event(),
+                'browser': None,
+                'error': None,
+                'discarded': False,
+                'started_at': time.time()
+            }
+            self._warm_pool[pool_key] = entry
+        
+        worker = threading.Thread(
+            target=self._warm_worker,
+            args=(pool_key, entry, email, password, headless),
+            name=f"warm-browser-{pool_key}",
+            daemon=True
+        )
+        entry['thread'] = worker
+        worker.start()
+        logger.info(f"웜 브라우저 백그라운드 준비 시작: {pool_key}")
+        return True
+    
+    def _warm_worker(self, pool_key: str, entry: Dict, email: str, password: str, headless: bool):
+        """웜 브라우저 실행 및 로그인 (백그라운드 스레드)"""
+        browser_info = None
+        try:
+            browser_info = self._launch_driver(headless, profile_key=self._profile_key(account_id=pool_key))
+            self._login_driver(browser_info['driver'], email, password)
             
-            return True
+            with self._lock:
+                if entry['discarded']:
+                    logger.info(f"폐기된 웜 브라우저 종료: {pool_key}")
+                else:
+                    entry['browser'] = browser_info
+                    browser_info = None
+                    elapsed = time.time() - entry['started_at']
+                    logger.info(f"웜 브라우저 준비 완료: {pool_key} (소요시간: {elapsed:.2f}초)")
+        except Exception as e:
+            entry['error'] = e
+            logger.warning(f"웜 브라우저 준비 실패: {pool_key} - {e}")
+        finally:
+            # 풀에 넘기지 못한 드라이버는 정리
+            if browser_info and browser_info.get('driver'):
+                try:
+                    self._quit_driver(browser_info['driver'])
+                except Exception:
+                    pass
+            entry['ready'].set()
+    
+    def acquire_warm_browser(self, pool_key: str, browser_id: str, timeout: float = None) -> Optional[str]:
+        """
+        준비된 웜 브라우저를 꺼내 지정한 ID로 등록
+        
+        Args:
+            pool_key: 웜 풀 키
+            browser_id: 등록할 브라우저 ID
+            timeout: 준비 완료 대기 최대 시간(초, None이면 warm_pool_wait_timeout)
             
+        Returns:
+            Optional[str]: 등록된 브라우저 ID (웜 브라우저가 없거나 실패하면 None)
+        """
+        with self._lock:
+            entry = self._warm_pool.get(pool_key)
+        
+        if entry is None:
+            return None
+        
+        if timeout is None:
+            timeout = self.warm_pool_wait_timeout
+        
+        if not entry['ready'].wait(timeout):
+            logger.warning(f"웜 브라우저 준비 대기 시간 초과 ({timeout}초): {pool_key}")
+            self.discard_warm_browser(pool_key)
+            return None
+        
+        with self._lock:
+            self._warm_pool.pop(pool_key, None)
+            browser_info = entry['browser']
+        
+        if browser_info is None:
+            logger.warning(f"웜 브라우저 사용 불가: {pool_key} - {entry['error']}")
+            return None
+        
+        # 대기 중 브라우저가 죽었는지 확인
+        try:
+            _ = browser_info['driver'].current_url
         except Exception as e:
-            logger.error(f"브라우저 '{browser_id}' 로그인 중 오류: {e}")
-            return False
+            logger.warning(f"웜 브라우저 응답 없음, 폐기: {pool_key} - {e}")
+            try:
+                self._quit_driver(browser_info['driver'])
+            except Exception:
+                pass
+            return None
+        
+        if browser_id in self.browsers:
+            logger.warning(f"브라우저 ID '{browser_id}'가 이미 존재하여 기존 브라우저를 종료합니다.")
+            self.close_browser(browser_id)
+        
+        self._register_browser(browser_id, browser_info)
+        logger.info(f"웜 브라우저로 즉시 교체: {pool_key} -> '{browser_id}'")
+        return browser_id
+    
+    def discard_warm_browser(self, pool_key: str):
+        """
+        웜 브라우저 폐기 (준비 중이면 완료 후 자동 종료)
+        
+        Args:
+            pool_key: 웜 풀 키
+        """
+        with self._lock:
+            entry = self._warm_pool.pop(pool_key, None)
+            if entry is None:
+                return
+            entry['discarded'] = True
+            browser_info = entry['browser']
+            entry['browser'] = None
+        
+        if browser_info and browser_info.get('driver'):
+            try:
+                self._quit_driver(browser_info['driver'])
+            except Exception as e:
+                logger.warning(f"웜 브라우저 종료 중 오류: {pool_key} - {e}")
+        
+        logger.info(f"웜 브라우저 폐기: {pool_key}")
+    
+    def has_warm_browser(self, pool_key: str) -> bool:
+        """웜 브라우저 준비(또는 준비 중) 여부"""
+        with self._lock:
+            return pool_key in self._warm_pool
     
     def close_browser(self, browser_id: str):
         """
@@ -225,15 +486,16 @@ class CoreBrowserManager:
             driver = browser_info['driver']
             
             if driver:
-                driver.quit()
+                self._quit_driver(driver)
             
-            del self.browsers[browser_id]
-            
-            if self.active_browser == browser_id:
-                self.active_browser = None
-                # 다른 활성 브라우저가 있으면 설정
-                if self.browsers:
-                    self.active_browser = list(self.browsers.keys())[0]
+            with self._lock:
+                del self.browsers[browser_id]
+                
+                if self.active_browser == browser_id:
+                    self.active_browser = None
+                    # 다른 활성 브라우저가 있으면 설정
+                    if self.browsers:
+                        self.active_browser = list(self.browsers.keys())[0]
             
             logger.info(f"브라우저 '{browser_id}' 종료 완료")
             
@@ -245,6 +507,11 @@ class CoreBrowserManager:
         모든 브라우저 종료
         """
         try:
+            with self._lock:
+                pool_keys = list(self._warm_pool.keys())
+            for pool_key in pool_keys:
+                self.discard_warm_browser(pool_key)
+            
             browser_ids = list(self.browsers.keys())
             for browser_id in browser_ids:
                 self.close_browser(browser_id)
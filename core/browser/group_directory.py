@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+그룹 디렉터리 모듈
+계정의 그룹 목록을 세션(드라이버)당 한 번 읽어 이름→위치를 캐시하고,
+가상 스크롤 드롭다운을 여러 번 스크롤하며 찾는 대신 해당 위치로 바로 이동합니다.
+
+- 드롭다운(ant-select 가상 목록): 열린 목록을 페이지 안에서 한 번 훑어 이름 순서와 항목 높이를 기록하고,
+  이후에는 scrollTop = 위치 × 항목 높이로 한 번에 이동한 뒤 렌더링을 확인합니다.
+- 라디오 그룹(그룹상품관리 화면, 그룹 이동 모달): 캐시된 위치의 라벨이 그룹명과 같으면 바로 클릭하고,
+  다르면 목록을 다시 읽어 위치를 갱신합니다 (모두 한 번의 스크립트 호출).
+- 캐시는 드라이버 속성(driver._group_directory)에 목록 종류별로 보관합니다.
+  찾지 못하거나 위치가 맞지 않으면 해당 목록을 다시 읽고, 그룹을 새로 만든 경우 invalidate()로 비웁니다.
+
+사용 예:
+    if group_directory.scroll_to_option(driver, "신규수집"):
+        ...렌더링된 옵션 클릭...
+    group_directory.click_radio(driver, "신규수집", kind='management')
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+from core.utils.dom_ready import ensure_script_timeout, SCRIPT_TIMEOUT_MARGIN
+
+logger = logging.getLogger(__name__)
+
+# 목록 종류별 라디오 그룹 루트 선택자
+RADIO_ROOTS = {
+    'management': '.ant-radio-group',
+    'modal': '.ant-modal-body',
+}
+
+# 드롭다운 목록 전체 읽기 최대 시간(초)
+ENUMERATE_TIMEOUT = 10
+
+# 위치 이동 후 렌더링 확인 최대 시간(초, 두 프레임 대기)
+JUMP_TIMEOUT = 2
+
+# 열린 드롭다운의 가상 목록 스크롤 컨테이너 찾기 (공통)
+_HOLDER_FUNCTION = r"""
+function findHolder() {
+    var dropdowns = document.querySelectorAll('.ant-select-dropdown:not(.ant-select-dropdown-hidden)');
+    for (var i = dropdowns.length - 1; i >= 0; i--) {
+        var holder = dropdowns[i].querySelector('.rc-virtual-list-holder');
+        if (holder && holder.getClientRects().length > 0) return holder;
+    }
+    return null;
+}
+function optionName(item) {
+    return (item.getAttribute('title') || item.textContent || '').trim();
+}
+function nextFrame(callback) {
+    requestAnimationFrame(function () { requestAnimationFrame(callback); });
+}
+"""
+
+# 드롭다운 목록을 처음부터 끝까지 훑어 이름 순서 수집 (arguments: callback)
+_ENUMERATE_SCRIPT = _HOLDER_FUNCTION + r"""
+var done = arguments[arguments.length - 1];
+var holder = findHolder();
+if (!holder) { done(null); return; }
+var original = holder.scrollTop, names = [], itemHeight = 0;
+
+function collect() {
+    var holderTop = holder.getBoundingClientRect().top;
+    var items = holder.querySelectorAll('.ant-select-item-option');
+    for (var i = 0; i < items.length; i++) {
+        var rect = items[i].getBoundingClientRect();
+        if (!itemHeight && rect.height > 0) itemHeight = rect.height;
+        if (!itemHeight) continue;
+        var index = Math.round((rect.top - holderTop + holder.scrollTop) / itemHeight);
+        if (index >= 0) names[index] = optionName(items[i]);
+    }
+}
+function step() {
+    collect();
+    if (holder.scrollTop + holder.clientHeight >= holder.scrollHeight - 1) {
+        holder.scrollTop = original;
+        for (var i = 0; i < names.length; i++) { if (names[i] === undefined) names[i] = null; }
+        done({names: names, item_height: itemHeight});
+        return;
+    }
+    holder.scrollTop += holder.clientHeight;
+    nextFrame(step);
+}
+holder.scrollTop = 0;
+nextFrame(step);
+"""
+
+# 위치로 바로 이동 후 옵션 렌더링 확인 (arguments: index, item_height, name, callback)
+_JUMP_SCRIPT = _HOLDER_FUNCTION + r"""
+var index = arguments[0], itemHeight = arguments[1], name = arguments[2], done = arguments[arguments.length - 1];
+var holder = findHolder();
+if (!holder) { done({found: false, holder: false}); return; }
+if (!itemHeight) {
+    var sample = holder.querySelector('.ant-select-item-option');
+    itemHeight = sample ? sample.getBoundingClientRect().height : 32;
+}
+holder.scrollTop = Math.max(0, index * itemHeight - itemHeight);
+nextFrame(function () {
+    if (!name) { done({found: true, holder: true}); return; }
+    var items = holder.querySelectorAll('.ant-select-item-option');
+    for (var i = 0; i < items.length; i++) {
+        if (optionName(items[i]) === name) { done({found: true, holder: true}); return; }
+    }
+    done({found: false, holder: true});
+});
+"""
+
+# 라디오 그룹에서 그룹 선택 (arguments: root_selector, name, cached_index)
+_RADIO_CLICK_SCRIPT = r"""
+var roots = document.querySelectorAll(arguments[0]), name = arguments[1], cached = arguments[2];
+var root = null;
+for (var r = roots.length - 1; r >= 0; r--) {
+    if (roots[r].getClientRects().length > 0 && roots[r].querySelector('label.ant-radio-wrapper')) { root = roots[r]; break; }
+}
+if (!root) return {clicked: false, names: null};
+var labels = root.querySelectorAll('label.ant-radio-wrapper');
+function labelName(label) { return (label.textContent || '').trim(); }
+function click(label) {
+    var input = label.querySelector('input[type="radio"]');
+    (input || label).click();
+}
+if (cached !== null && cached < labels.length && labelName(labels[cached]) === name) {
+    click(labels[cached]);
+    return {clicked: true, index: cached, names: null};
+}
+var names = [];
+for (var i = 0; i < labels.length; i++) names.push(labelName(labels[i]));
+var index = names.indexOf(name);
+if (index === -1) return {clicked: false, names: names};
+click(labels[index]);
+return {clicked: true, index: index, names: names};
+"""
+
+
+class GroupDirectory:
+    """그룹 이름→위치 캐시 (드라이버별, 목록 종류별)"""
+
+    def _cache(self, driver) -> Dict[str, Dict]:
+        cache = getattr(driver, '_group_directory', None)
+        if cache is None:
+            cache = {}
+            driver._group_directory = cache
+        return cache
+
+    def invalidate(self, driver, kind: str = None):
+        """캐시 비우기 (그룹 생성/이름 변경 후 호출, kind가 None이면 모든 목록)"""
+        cache = getattr(driver, '_group_directory', None)
+        if not cache:
+            return
+        if kind is None:
+            cache.clear()
+        else:
+            cache.pop(kind, None)
+        logger.debug("그룹 디렉터리 캐시 초기화: %s", kind or '전체')
+
+    def names(self, driver, kind: str = 'dropdown') -> Optional[List[str]]:
+        """캐시된 그룹명 목록 (없으면 None)"""
+        entry = self._cache(driver).get(kind)
+        return list(entry['names']) if entry else None
+
+    def enumerate_dropdown(self, driver) -> Optional[List[str]]:
+        """
+        열린 드롭다운의 그룹 목록을 한 번 훑어 캐시 (스크롤 위치는 원래대로 복원)
+
+        Returns:
+            list: 목록 순서의 그룹명 (열린 드롭다운이 없으면 None)
+        """
+        try:
+            ensure_script_timeout(driver, ENUMERATE_TIMEOUT + SCRIPT_TIMEOUT_MARGIN)
+            result = driver.execute_async_script(_ENUMERATE_SCRIPT)
+        except Exception as e:
+            logger.debug(f"드롭다운 그룹 목록 읽기 실패: {e}")
+            return None
+        if not result:
+            return None
+
+        names = result.get('names') or []
+        self._cache(driver)['dropdown'] = {
+            'names': names,
+            'index': {name: i for i, name in enumerate(names) if name},
+            'item_height': result.get('item_height') or 0,
+        }
+        logger.info(f"그룹 디렉터리: 드롭다운 그룹 {len(names)}개 캐시")
+        return names
+
+    def scroll_to_index(self, driver, index: int) -> bool:
+        """열린 드롭다운을 지정 위치로 한 번에 스크롤"""
+        entry = self._cache(driver).get('dropdown') or {}
+        try:
+            ensure_script_timeout(driver, JUMP_TIMEOUT + SCRIPT_TIMEOUT_MARGIN)
+            result = driver.execute_async_script(_JUMP_SCRIPT, int(index), entry.get('item_height', 0), None)
+        except Exception as e:
+            logger.debug(f"드롭다운 위치 이동 실패: {e}")
+            return False
+        return bool(result and result.get('holder'))
+
+    def scroll_to_option(self, driver, name: str) -> bool:
+        """
+        열린 드롭다운에서 그룹명 위치로 바로 스크롤하여 옵션이 렌더링되게 함
+        (캐시가 없거나 위치가 맞지 않으면 목록을 다시 읽고 한 번 더 시도, 목록 읽기는 최대 한 번)
+
+        Returns:
+            bool: 옵션 렌더링 확인 여부
+        """
+        enumerated = False
+        for _ in range(2):
+            entry = self._cache(driver).get('dropdown')
+            if entry is None or name not in entry['index']:
+                if enumerated or self.enumerate_dropdown(driver) is None:
+                    return False
+                enumerated = True
+                entry = self._cache(driver)['dropdown']
+                if name not in entry['index']:
+                    logger.debug("그룹 디렉터리: 드롭다운에 '%s' 그룹 없음", name)
+                    return False
+            try:
+                ensure_script_timeout(driver, JUMP_TIMEOUT + SCRIPT_TIMEOUT_MARGIN)
+                result = driver.execute_async_script(_JUMP_SCRIPT, entry['index'][name], entry['item_height'], name)
+            except Exception as e:
+                logger.debug(f"드롭다운 위치 이동 실패: {e}")
+                return False
+            if result and result.get('found'):
+                return True
+            # 목록이 바뀜 (다른 드롭다운 또는 그룹 추가) - 다시 읽기
+            self.invalidate(driver, 'dropdown')
+        return False
+
+    def click_radio(self, driver, name: str, kind: str = 'management') -> bool:
+        """
+        라디오 그룹에서 그룹명 라벨 클릭 (캐시된 위치 우선, 한 번의 스크립트 호출)
+
+        Args:
+            driver: Selenium WebDriver
+            name: 그룹명
+            kind: 'management'(그룹상품관리 화면) 또는 'modal'(그룹 이동 모달)
+
+        Returns:
+            bool: 클릭 여부
+        """
+        entry = self._cache(driver).get(kind)
+        cached = entry['index'].get(name) if entry else None
+        try:
+            result = driver.execute_script(_RADIO_CLICK_SCRIPT, RADIO_ROOTS[kind], name, cached)
+        except Exception as e:
+            logger.debug(f"라디오 그룹 선택 실패: {e}")
+            return False
+        if not result:
+            return False
+        if result.get('names') is not None:
+            names = result['names']
+            self._cache(driver)[kind] = {'names': names, 'index': {n: i for i, n in enumerate(names)}}
+            logger.debug("그룹 디렉터리: %s 그룹 %d개 캐시", kind, len(names))
+        return bool(result.get('clicked'))
+
+
+# 프로세스 전역 그룹 디렉터리 인스턴스
+group_directory = GroupDirectory()
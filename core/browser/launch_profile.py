@@ -0,0 +1,425 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+브라우저 실행 프로필 모듈
+BrowserCore.setup_driver의 Chrome 실행 시간을 줄이기 위한 구성 요소를 모읍니다.
+
+- chromedriver 경로 캐시: 처음 실행 때 Selenium Manager가 찾은 경로를 호스트별로
+  cache/chromedriver.json에 저장하고, 이후에는 Service(경로)로 바로 실행합니다.
+  캐시된 경로로 실행에 실패하면(Chrome 업데이트로 버전 불일치 등) 캐시를 지우고 Selenium Manager로 다시 찾습니다.
+- 계정별 프로필 템플릿: cache/browser_profiles/templates/{계정}을 실행할 때마다 임시 디렉토리로 복제하여
+  --user-data-dir로 사용합니다 (가능하면 copy-on-write 복제). 같은 계정의 브라우저가 동시에 떠도 서로 잠그지 않습니다.
+  templates/_base가 있으면 새 계정 템플릿은 _base에서 복제합니다 (확장 프로그램을 한 번만 설치).
+  템플릿 준비: python cli/batch_cli.py seed-profile --account <계정|_base>
+- 배치 처리량용 Chrome 플래그 (백그라운드 네트워크/컴포넌트 업데이트/동기화/백그라운드 렌더러 스로틀링 비활성화)
+- 실행 시간 통계: launch_stats에 브라우저 생성 시간을 모아 p50/p90/p95를 기록합니다.
+
+환경변수:
+- PERCENTY_CHROMEDRIVER: chromedriver 경로 고정 (캐시보다 우선)
+- PERCENTY_PROFILE_TEMPLATES=0: 프로필 템플릿 사용 안 함 (chromedriver 기본 임시 프로필)
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import logging
+import tempfile
+import threading
+import subprocess
+from typing import Dict, List, Optional
+
+from core.utils.stats import percentile
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CACHE_DIR = os.path.join(PROJECT_ROOT, "cache")
+DRIVER_CACHE_FILE = os.path.join(CACHE_DIR, "chromedriver.json")
+PROFILE_ROOT = os.path.join(CACHE_DIR, "browser_profiles")
+TEMPLATE_ROOT = os.path.join(PROFILE_ROOT, "templates")
+BASE_TEMPLATE = "_base"
+
+ENV_CHROMEDRIVER = "PERCENTY_CHROMEDRIVER"
+ENV_PROFILE_TEMPLATES = "PERCENTY_PROFILE_TEMPLATES"
+
+# 임시 프로필 디렉토리 접두사 (비정상 종료로 남은 디렉토리 정리용)
+RUNTIME_PREFIX = "percenty_profile_"
+STALE_RUNTIME_SECONDS = 12 * 60 * 60
+
+# 배치 처리량용 Chrome 플래그
+THROUGHPUT_ARGUMENTS = [
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-sync",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-client-side-phishing-detection",
+    "--disable-default-apps",
+    "--disable-domain-reliability",
+    "--metrics-recording-only",
+    "--no-default-browser-check",
+    "--no-first-run",
+]
+
+# --disable-features는 마지막 하나만 적용되므로 한 인자로 합쳐서 추가
+THROUGHPUT_DISABLED_FEATURES = [
+    "Translate",
+    "OptimizationHints",
+    "MediaRouter",
+    "CalculateNativeWinOcclusion",
+]
+
+# 알림/비밀번호 저장 등 자동화에 방해되는 기본 설정 (템플릿 Preferences와 chromedriver prefs 공통)
+PROFILE_PREFS = {
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "profile.default_content_setting_values.notifications": 2,
+    "autofill.profile_enabled": False,
+    "translate.enabled": False,
+}
+
+# 템플릿 복제 시 제외할 캐시/잠금 파일
+_CLONE_IGNORE = {
+    "Cache", "Code Cache", "GPUCache", "GrShaderCache", "ShaderCache", "DawnCache",
+    "Crashpad", "BrowserMetrics", "Service Worker",
+    "SingletonLock", "SingletonCookie", "SingletonSocket", "lockfile", "LOCK",
+}
+
+
+def apply_launch_arguments(chrome_options, disabled_features: Optional[List[str]] = None):
+    """
+    배치 처리량용 플래그와 --disable-features(하나로 합침)를 Chrome 옵션에 추가
+
+    Args:
+        chrome_options: selenium Options
+        disabled_features: 추가로 비활성화할 기능 이름
+    """
+    for argument in THROUGHPUT_ARGUMENTS:
+        chrome_options.add_argument(argument)
+    features = list(dict.fromkeys(THROUGHPUT_DISABLED_FEATURES + list(disabled_features or [])))
+    chrome_options.add_argument(f"--disable-features={','.join(features)}")
+
+
+# ---------------------------------------------------------------------- chromedriver 경로
+
+class DriverPathCache:
+    """호스트별 chromedriver 경로 캐시 (cache/chromedriver.json)"""
+
+    def __init__(self, cache_file: str = DRIVER_CACHE_FILE):
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._host = socket.gethostname()
+        self._path = None
+        self._loaded = False
+
+    def _read(self) -> Dict:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: Dict):
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_file, self.cache_file)
+
+    def get(self) -> Optional[str]:
+        """
+        고정된 chromedriver 경로 (없으면 None - Selenium Manager 사용)
+        """
+        override = os.getenv(ENV_CHROMEDRIVER, '').strip()
+        if override:
+            return override
+
+        with self._lock:
+            if not self._loaded:
+                entry = self._read().get(self._host) or {}
+                self._path = entry.get('path')
+                self._loaded = True
+            if self._path and not os.path.isfile(self._path):
+                logger.info(f"캐시된 chromedriver 경로가 없어 다시 찾습니다: {self._path}")
+                self._path = None
+            return self._path
+
+    def remember(self, path: Optional[str]):
+        """실행에 성공한 chromedriver 경로 저장"""
+        if not path or not os.path.isfile(path) or os.getenv(ENV_CHROMEDRIVER):
+            return
+        with self._lock:
+            if path == self._path:
+                return
+            try:
+                data = self._read()
+                data[self._host] = {'path': path, 'resolved_at': time.strftime("%Y-%m-%dT%H:%M:%S")}
+                self._write(data)
+                logger.info(f"chromedriver 경로 고정: {path}")
+            except OSError as e:
+                logger.warning(f"chromedriver 경로 캐시 저장 실패: {e}")
+            self._path = path
+            self._loaded = True
+
+    def invalidate(self):
+        """캐시된 경로 삭제 (버전 불일치 등으로 실행 실패 시)"""
+        with self._lock:
+            self._path = None
+            self._loaded = True
+            try:
+                data = self._read()
+                if data.pop(self._host, None) is not None:
+                    self._write(data)
+            except OSError as e:
+                logger.warning(f"chromedriver 경로 캐시 삭제 실패: {e}")
+
+
+# ---------------------------------------------------------------------- 프로필 템플릿
+
+def _safe_name(key: str) -> str:
+    """계정 키를 디렉토리 이름으로 변환"""
+    return "".join(ch if ch.isalnum() or ch in "-_.@" else "_" for ch in str(key)) or "default"
+
+
+def _copy_tree(source: str, target: str):
+    """
+    디렉토리 복제 (가능하면 copy-on-write)
+
+    Linux는 cp --reflink=auto, macOS는 cp -c(APFS clonefile)를 먼저 시도하고
+    실패하거나 Windows면 캐시를 제외하고 shutil.copytree로 복사합니다.
+    """
+    os.makedirs(target, exist_ok=True)
+    command = None
+    if sys.platform.startswith('linux'):
+        command = ['cp', '-a', '--reflink=auto', os.path.join(source, '.'), target]
+    elif sys.platform == 'darwin':
+        command = ['cp', '-c', '-R', os.path.join(source, '.'), target]
+
+    if command:
+        try:
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            for root, dirs, files in os.walk(target, topdown=True):
+                for name in [d for d in dirs if d in _CLONE_IGNORE]:
+                    shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+                    dirs.remove(name)
+                for name in files:
+                    if name in _CLONE_IGNORE:
+                        try:
+                            os.remove(os.path.join(root, name))
+                        except OSError:
+                            pass
+            return
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.debug(f"copy-on-write 복제 실패, 일반 복사로 대체: {e}")
+
+    shutil.copytree(source, target, dirs_exist_ok=True,
+                    ignore=lambda _dir, names: [name for name in names if name in _CLONE_IGNORE])
+
+
+class ProfileTemplates:
+    """계정별 Chrome 프로필 템플릿과 실행용 임시 복제본 관리"""
+
+    def __init__(self, template_root: str = TEMPLATE_ROOT):
+        self.template_root = template_root
+        self._lock = threading.Lock()
+        self._purged = False
+
+    @staticmethod
+    def enabled() -> bool:
+        """프로필 템플릿 사용 여부 (PERCENTY_PROFILE_TEMPLATES=0이면 사용 안 함)"""
+        return os.getenv(ENV_PROFILE_TEMPLATES, '1').strip().lower() not in ('0', 'false', 'no', 'off')
+
+    def template_dir(self, key: str) -> str:
+        """계정 템플릿 경로"""
+        return os.path.join(self.template_root, _safe_name(key))
+
+    @staticmethod
+    def _write_preferences(profile_dir: str):
+        """Default/Preferences에 알림/비밀번호 저장 비활성화 설정 기록 (기존 값 유지)"""
+        prefs_file = os.path.join(profile_dir, "Default", "Preferences")
+        os.makedirs(os.path.dirname(prefs_file), exist_ok=True)
+        try:
+            with open(prefs_file, 'r', encoding='utf-8') as f:
+                prefs = json.load(f)
+        except (OSError, ValueError):
+            prefs = {}
+
+        for dotted, value in PROFILE_PREFS.items():
+            node = prefs
+            *parents, leaf = dotted.split('.')
+            for part in parents:
+                node = node.setdefault(part, {})
+            node[leaf] = value
+        # 비정상 종료 복구 안내줄 방지
+        prefs.setdefault('profile', {})['exit_type'] = 'Normal'
+
+        with open(prefs_file, 'w', encoding='utf-8') as f:
+            json.dump(prefs, f, ensure_ascii=False)
+
+        # 첫 실행 화면 생략
+        open(os.path.join(profile_dir, "First Run"), 'a').close()
+
+    def ensure_template(self, key: str) -> str:
+        """
+        계정 템플릿이 없으면 생성 (_base 템플릿이 있으면 복제, 없으면 설정만 기록)
+
+        Returns:
+            str: 템플릿 경로
+        """
+        template = self.template_dir(key)
+        with self._lock:
+            if not os.path.isdir(template):
+                base = self.template_dir(BASE_TEMPLATE)
+                if key != BASE_TEMPLATE and os.path.isdir(base):
+                    _copy_tree(base, template)
+                    logger.info(f"프로필 템플릿 생성 (_base 복제): {template}")
+                else:
+                    os.makedirs(template, exist_ok=True)
+                    logger.info(f"프로필 템플릿 생성: {template}")
+                self._write_preferences(template)
+        return template
+
+    def open_for_seeding(self, key: str, url: str = None):
+        """
+        템플릿 디렉토리를 직접 --user-data-dir로 열기 (확장 프로그램 설치/로그인 등 수동 준비용)
+
+        Args:
+            key: 계정 키 (모든 계정 공통이면 '_base')
+            url: 처음 열 주소
+
+        Returns:
+            WebDriver: 준비가 끝나면 quit()으로 닫아야 템플릿에 저장됨
+        """
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
+        template = self.ensure_template(key)
+        options = Options()
+        options.add_argument(f"--user-data-dir={template}")
+        options.add_argument("--start-maximized")
+        options.add_argument("--disable-features=DisableLoadExtensionCommandLineSwitch")
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("prefs", dict(PROFILE_PREFS))
+
+        driver_path = driver_path_cache.get()
+        driver = (webdriver.Chrome(service=Service(driver_path), options=options) if driver_path
+                  else webdriver.Chrome(options=options))
+        if url:
+            driver.get(url)
+        return driver
+
+    def _purge_stale(self, runtime_root: str):
+        """비정상 종료로 남은 오래된 임시 프로필 삭제 (프로세스당 한 번)"""
+        if self._purged:
+            return
+        self._purged = True
+        cutoff = time.time() - STALE_RUNTIME_SECONDS
+        try:
+            for name in os.listdir(runtime_root):
+                path = os.path.join(runtime_root, name)
+                if name.startswith(RUNTIME_PREFIX) and os.path.isdir(path) and os.path.getmtime(path) < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            pass
+
+    def clone(self, key: str) -> str:
+        """
+        계정 템플릿을 임시 디렉토리로 복제
+
+        Args:
+            key: 계정 키 (일반적으로 계정 ID)
+
+        Returns:
+            str: --user-data-dir로 사용할 임시 프로필 경로
+        """
+        template = self.ensure_template(key)
+        runtime_root = tempfile.gettempdir()
+        self._purge_stale(runtime_root)
+
+        start = time.perf_counter()
+        profile_dir = tempfile.mkdtemp(prefix=f"{RUNTIME_PREFIX}{_safe_name(key)}_", dir=runtime_root)
+        _copy_tree(template, profile_dir)
+        logger.info(f"프로필 템플릿 복제 완료: {key} -> {profile_dir} ({time.perf_counter() - start:.2f}초)")
+        return profile_dir
+
+    @staticmethod
+    def release(profile_dir: Optional[str]):
+        """임시 프로필 삭제 (브라우저 종료 후)"""
+        if not profile_dir or not os.path.basename(profile_dir).startswith(RUNTIME_PREFIX):
+            return
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def release_profile_dir(driver):
+    """드라이버가 사용하던 임시 프로필 삭제 (driver.quit() 후 호출)"""
+    profile_dir = getattr(driver, '_profile_dir', None)
+    if profile_dir:
+        ProfileTemplates.release(profile_dir)
+        driver._profile_dir = None
+
+
+# ---------------------------------------------------------------------- 실행 시간 통계
+
+class LaunchStats:
+    """브라우저 생성 시간 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples: List[float] = []
+        self._phases: Dict[str, List[float]] = {}
+
+    def record(self, total: float, **phases: float):
+        """
+        브라우저 생성 한 번 기록
+
+        Args:
+            total: 전체 소요 시간(초)
+            **phases: 단계별 소요 시간(초) (profile, driver, window 등)
+        """
+        with self._lock:
+            self._samples.append(total)
+            for name, value in phases.items():
+                self._phases.setdefault(name, []).append(value)
+
+    def snapshot(self) -> Dict:
+        """count/p50/p90/p95/max (전체 및 단계별)"""
+        with self._lock:
+            samples = sorted(self._samples)
+            phases = {name: sorted(values) for name, values in self._phases.items()}
+
+        def summarize(values: List[float]) -> Dict:
+            return {
+                'count': len(values),
+                'p50': round(percentile(values, 50), 3),
+                'p90': round(percentile(values, 90), 3),
+                'p95': round(percentile(values, 95), 3),
+                'max': round(values[-1], 3) if values else 0.0,
+            }
+
+        return {**summarize(samples), 'phases': {name: summarize(values) for name, values in phases.items()}}
+
+    def format_summary(self) -> str:
+        """로그용 한 줄 요약"""
+        data = self.snapshot()
+        if not data['count']:
+            return "브라우저 실행 기록 없음"
+        phases = ", ".join(f"{name} p50 {item['p50']:.2f}초" for name, item in data['phases'].items())
+        return (f"브라우저 실행 {data['count']}회: p50 {data['p50']:.2f}초 / p90 {data['p90']:.2f}초 / "
+                f"p95 {data['p95']:.2f}초 / 최대 {data['max']:.2f}초" + (f" ({phases})" if phases else ""))
+
+    def reset(self):
+        """통계 초기화"""
+        with self._lock:
+            self._samples = []
+            self._phases = {}
+
+
+# 프로세스 전역 인스턴스
+driver_path_cache = DriverPathCache()
+profile_templates = ProfileTemplates()
+launch_stats = LaunchStats()
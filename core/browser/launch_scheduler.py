@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+브라우저 실행 스케줄러
+여러 계정의 브라우저 실행을 전역 락 + 고정 지연으로 한 줄 세우는 대신,
+CPU/메모리에 맞춘 개수만큼 동시에 실행하도록 조절합니다.
+
+- 동시 실행 슬롯: 기본값은 CPU 코어 수와 사용 가능한 메모리로 계산 (max_concurrent로 지정 가능)
+- 메모리 승인: resource_monitor(core/utils/resource_manager.py)의 메모리 정보로 여유 메모리가
+  min_free_memory_mb 미만이거나 사용률이 경고 임계값을 넘으면 여유가 생길 때까지 대기
+  (아직 드라이버가 시작되지 않은 실행 중인 브라우저 수 x BROWSER_MEMORY_MB를 미리 빼고 판단,
+  admission_timeout이 지나면 경고 후 실행)
+- 포트 분리: 실행마다 chromedriver 포트를 예약하여 동시에 실행되는 드라이버끼리 겹치지 않게 함
+  (프로필은 launch_profile의 실행별 임시 user-data-dir 복제본으로 분리)
+"""
+
+import os
+import time
+import socket
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 브라우저 한 개 실행에 필요한 메모리 추정치(MB) - 슬롯 수 계산과 승인 기준
+BROWSER_MEMORY_MB = 700
+
+# 최대 동시 실행 수 상한
+MAX_CONCURRENT_LIMIT = 4
+
+# 메모리 승인 대기 간격(초)
+ADMISSION_POLL_INTERVAL = 1.0
+
+
+def _memory_usage() -> Optional[dict]:
+    """resource_monitor 메모리 정보 (psutil이 없으면 None - 승인 검사 생략)"""
+    try:
+        from core.utils.resource_manager import resource_monitor
+        return resource_monitor.get_memory_usage()
+    except Exception as e:
+        logger.debug(f"메모리 정보 조회 실패 (승인 검사 생략): {e}")
+        return None
+
+
+def default_max_concurrent() -> int:
+    """CPU 코어 수와 사용 가능한 메모리로 동시 실행 슬롯 수 계산"""
+    by_cpu = max(1, (os.cpu_count() or 2) // 2)
+    memory = _memory_usage()
+    by_memory = MAX_CONCURRENT_LIMIT
+    if memory:
+        by_memory = max(1, int(memory['available'] / (1024 * 1024) // (BROWSER_MEMORY_MB * 2)))
+    return max(1, min(by_cpu, by_memory, MAX_CONCURRENT_LIMIT))
+
+
+class LaunchScheduler:
+    """브라우저 동시 실행 제한 + 메모리 승인 + 포트 예약"""
+
+    def __init__(self, max_concurrent: int = None, min_free_memory_mb: int = BROWSER_MEMORY_MB * 2,
+                 max_memory_percent: float = None, admission_timeout: float = 120):
+        """
+        초기화
+
+        Args:
+            max_concurrent: 동시 실행 슬롯 수 (None이면 CPU/메모리로 계산)
+            min_free_memory_mb: 실행 승인에 필요한 최소 여유 메모리(MB)
+            max_memory_percent: 실행 승인 메모리 사용률 상한 (None이면 resource_monitor 경고 임계값)
+            admission_timeout: 메모리 승인 최대 대기 시간(초)
+        """
+        self.max_concurrent = max_concurrent or default_max_concurrent()
+        self.min_free_memory_mb = min_free_memory_mb
+        self.max_memory_percent = max_memory_percent
+        self.admission_timeout = admission_timeout
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self._admission_lock = threading.Lock()
+        self._reserved_ports = set()
+        self._active = 0
+        logger.info(f"브라우저 실행 스케줄러: 동시 실행 {self.max_concurrent}개, "
+                    f"최소 여유 메모리 {self.min_free_memory_mb}MB")
+
+    @property
+    def active(self) -> int:
+        """현재 실행 중인 브라우저 생성 수"""
+        return self._active
+
+    def _memory_percent_limit(self) -> float:
+        if self.max_memory_percent is not None:
+            return self.max_memory_percent
+        try:
+            from core.utils.resource_manager import resource_monitor
+            return resource_monitor.warning_memory_percent
+        except Exception:
+            return 80
+
+    def _wait_for_memory(self, label: str):
+        """
+        여유 메모리가 생길 때까지 대기 (한 번에 한 실행만 검사하여 동시에 승인되지 않게 함)
+
+        이미 승인되었지만 아직 드라이버가 시작되지 않은 실행은 메모리 정보에 반영되지 않았으므로
+        실행 중인 수만큼 BROWSER_MEMORY_MB를 미리 빼고 판단합니다.
+        """
+        deadline = time.time() + self.admission_timeout
+        limit = self._memory_percent_limit()
+        logged = False
+        while True:
+            memory = _memory_usage()
+            if memory is None:
+                return
+            pending_mb = self._active * BROWSER_MEMORY_MB
+            free_mb = memory['available'] / (1024 * 1024) - pending_mb
+            percent = memory['percent']
+            if memory.get('total'):
+                percent += pending_mb * 1024 * 1024 / memory['total'] * 100
+            if free_mb >= self.min_free_memory_mb and percent < limit:
+                if logged:
+                    logger.info(f"메모리 여유 확보, 브라우저 실행 승인: {label} (예상 여유 {free_mb:.0f}MB)")
+                return
+            if time.time() >= deadline:
+                logger.warning(f"메모리 승인 대기 시간 초과 ({self.admission_timeout}초), 그대로 실행: {label} "
+                               f"(예상 여유 {free_mb:.0f}MB, 예상 사용률 {percent:.1f}%)")
+                return
+            if not logged:
+                logger.info(f"메모리 부족으로 브라우저 실행 대기: {label} "
+                            f"(예상 여유 {free_mb:.0f}MB / 필요 {self.min_free_memory_mb}MB, 예상 사용률 {percent:.1f}%, "
+                            f"시작 중인 실행 {self._active}개)")
+                logged = True
+            time.sleep(ADMISSION_POLL_INTERVAL)
+
+    def reserve_port(self) -> int:
+        """다른 실행과 겹치지 않는 빈 로컬 포트 예약"""
+        while True:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.bind(('127.0.0.1', 0))
+                port = sock.getsockname()[1]
+            with self._lock:
+                if port not in self._reserved_ports:
+                    self._reserved_ports.add(port)
+                    return port
+
+    def release_port(self, port: Optional[int]):
+        """포트 예약 해제 (chromedriver가 포트를 연 뒤)"""
+        with self._lock:
+            self._reserved_ports.discard(port)
+
+    @contextmanager
+    def slot(self, label: str = ''):
+        """
+        브라우저 실행 슬롯 (with 블록 동안 슬롯과 chromedriver 포트를 점유)
+
+        Args:
+            label: 로그용 이름 (브라우저 ID 등)
+
+        Yields:
+            int: 이 실행에 예약된 chromedriver 포트
+        """
+        wait_start = time.time()
+        self._slots.acquire()
+        try:
+            # 승인과 실행 수 증가를 한 번에 하여 다음 승인 검사가 이 실행을 빼고 계산하게 함
+            with self._admission_lock:
+                self._wait_for_memory(label)
+                with self._lock:
+                    self._active += 1
+                    active = self._active
+            waited = time.time() - wait_start
+            port = self.reserve_port()
+            logger.info(f"브라우저 실행 슬롯 획득: {label} (대기 {waited:.2f}초, 동시 실행 {active}/{self.max_concurrent}, 포트 {port})")
+            try:
+                yield port
+            finally:
+                self.release_port(port)
+                with self._lock:
+                    self._active -= 1
+        finally:
+            self._slots.release()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+네트워크 유휴 추적 모듈
+페이지의 XHR/fetch 요청을 추적하여 진행 중인 요청 수와 마지막 응답 이후 경과 시간을 제공하고,
+"N ms 동안 요청이 없을 때까지 대기"를 지원합니다.
+
+- CDP Page.addScriptToEvaluateOnNewDocument로 모든 문서 시작 시점에 XHR/fetch 후킹 스크립트를 등록
+  (드라이버당 한 번, driver._network_idle_hook). 이미 열려 있는 문서에도 바로 적용합니다.
+- 대기는 페이지 안에서 50ms 간격으로 검사하는 비동기 스크립트 한 번으로 수행하므로 Python 폴링 왕복이 없습니다.
+  대기 중 페이지가 이동하면 남은 시간 동안 새 문서에서 다시 대기합니다.
+- 후킹이 없는 문서(CDP 미지원 등)는 Resource Timing의 XHR/fetch 응답 시각으로 유휴 여부를 판단합니다.
+- long_request_ms보다 오래 열려 있는 요청(롱 폴링 등)은 진행 중 요청으로 세지 않습니다.
+
+사용 예:
+    install_network_idle_hook(driver)
+    wait_for_network_idle(driver, idle_ms=1000, timeout=75, ready_selector="input[type='checkbox']")
+"""
+
+import time
+import logging
+from typing import Dict, Optional
+
+from core.utils.dom_ready import ensure_script_timeout, SCRIPT_TIMEOUT_MARGIN
+
+logger = logging.getLogger(__name__)
+
+# 이보다 오래 열려 있는 요청은 진행 중 요청으로 세지 않음(ms)
+DEFAULT_LONG_REQUEST_MS = 15000
+
+# 문서 시작 시점 XHR/fetch 후킹 스크립트
+_HOOK_SCRIPT = r"""
+(function () {
+    if (window.__percentyNet) return;
+    var net = window.__percentyNet = {
+        pending: {}, nextId: 1, requests: 0, responses: 0, lastActivity: Date.now()
+    };
+    try { performance.setResourceTimingBufferSize(2000); } catch (e) {}
+
+    function begin() {
+        var id = net.nextId++;
+        net.pending[id] = Date.now();
+        net.requests++;
+        net.lastActivity = Date.now();
+        return id;
+    }
+    function end(id) {
+        if (!(id in net.pending)) return;
+        delete net.pending[id];
+        net.responses++;
+        net.lastActivity = Date.now();
+    }
+
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var id = begin();
+        this.addEventListener('loadend', function () { end(id); });
+        return send.apply(this, arguments);
+    };
+
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            var id = begin();
+            try {
+                return fetch.apply(this, arguments).then(
+                    function (response) { end(id); return response; },
+                    function (error) { end(id); throw error; }
+                );
+            } catch (e) {
+                end(id);
+                throw e;
+            }
+        };
+    }
+})();
+"""
+
+# 현재 상태 계산 (대기/조회 스크립트 공통)
+_STATE_FUNCTION = r"""
+function networkState(longRequestMs) {
+    var now = Date.now(), net = window.__percentyNet, inflight = 0, lastActivity = 0;
+    if (net) {
+        for (var id in net.pending) {
+            if (now - net.pending[id] < longRequestMs) inflight++;
+        }
+        lastActivity = net.lastActivity;
+    }
+    try {
+        var entries = performance.getEntriesByType('resource');
+        for (var i = entries.length - 1; i >= 0; i--) {
+            var type = entries[i].initiatorType;
+            if (type === 'xmlhttprequest' || type === 'fetch') {
+                lastActivity = Math.max(lastActivity, performance.timeOrigin + entries[i].responseEnd);
+                break;
+            }
+        }
+        var nav = performance.getEntriesByType('navigation')[0];
+        if (nav) lastActivity = Math.max(lastActivity, performance.timeOrigin + nav.loadEventEnd);
+    } catch (e) {}
+    return {
+        hooked: !!net,
+        inflight: inflight,
+        idle_ms: lastActivity ? now - lastActivity : 0,
+        requests: net ? net.requests : 0,
+        responses: net ? net.responses : 0,
+        ready_state: document.readyState,
+        url: location.href
+    };
+}
+"""
+
+_SNAPSHOT_SCRIPT = _STATE_FUNCTION + "return networkState(arguments[0]);"
+
+# arguments: idle_ms, timeout_ms, ready_selector, long_request_ms, callback
+_WAIT_SCRIPT = _STATE_FUNCTION + r"""
+var idleMs = arguments[0], timeoutMs = arguments[1], readySelector = arguments[2],
+    longRequestMs = arguments[3], done = arguments[arguments.length - 1];
+var start = Date.now();
+function check() {
+    var state = networkState(longRequestMs);
+    state.elapsed = Date.now() - start;
+    state.ok = state.ready_state === 'complete' && state.inflight === 0 && state.idle_ms >= idleMs &&
+               (!readySelector || !!document.querySelector(readySelector));
+    if (state.ok || state.elapsed >= timeoutMs) { done(state); return; }
+    setTimeout(check, 50);
+}
+check();
+"""
+
+
+def install_network_idle_hook(driver, new_window: bool = False) -> bool:
+    """
+    드라이버에 XHR/fetch 추적 스크립트 등록 (드라이버당 한 번)
+
+    Args:
+        driver: Selenium WebDriver (Chrome/CDP 지원)
+        new_window: 새로 연 탭/창에 등록 (문서 시작 스크립트는 탭마다 따로 등록해야 함)
+
+    Returns:
+        bool: 문서 시작 스크립트 등록 여부 (CDP를 지원하지 않으면 False - Resource Timing만 사용)
+    """
+    if driver is None:
+        return False
+    if getattr(driver, '_network_idle_hook', None) and not new_window:
+        return True
+
+    try:
+        result = driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _HOOK_SCRIPT})
+    except Exception as e:
+        logger.warning(f"네트워크 추적 스크립트 등록 실패 (Resource Timing만 사용): {e}")
+        return False
+
+    driver._network_idle_hook = result.get('identifier') if isinstance(result, dict) else True
+
+    # 이미 열려 있는 문서에도 적용
+    try:
+        driver.execute_script(_HOOK_SCRIPT)
+    except Exception as e:
+        logger.debug(f"현재 문서 네트워크 추적 적용 실패: {e}")
+    return True
+
+
+def network_snapshot(driver, long_request_ms: int = DEFAULT_LONG_REQUEST_MS) -> Optional[Dict]:
+    """
+    현재 네트워크 상태
+
+    Returns:
+        dict: hooked, inflight(진행 중 XHR/fetch 수), idle_ms(마지막 요청/응답 이후 경과 ms),
+            requests, responses, ready_state, url (조회 실패 시 None)
+    """
+    try:
+        return driver.execute_script(_SNAPSHOT_SCRIPT, long_request_ms)
+    except Exception as e:
+        logger.debug(f"네트워크 상태 조회 실패: {e}")
+        return None
+
+
+def wait_for_network_idle(driver, idle_ms: int = 500, timeout: float = 30.0, ready_selector: str = None,
+                          long_request_ms: int = DEFAULT_LONG_REQUEST_MS) -> Optional[Dict]:
+    """
+    문서 로드 완료 + 진행 중인 XHR/fetch 없음 + idle_ms 동안 요청/응답 없음(+ ready_selector 존재)까지 대기
+
+    Args:
+        driver: Selenium WebDriver
+        idle_ms: 유휴 판단 시간(ms)
+        timeout: 최대 대기 시간(초)
+        ready_selector: 추가로 존재해야 하는 CSS 선택자
+        long_request_ms: 이보다 오래 열린 요청은 무시(ms)
+
+    Returns:
+        dict: 마지막 상태 (ok: 유휴 도달 여부, elapsed 등). 스크립트를 한 번도 실행하지 못하면 None
+    """
+    deadline = time.time() + timeout
+    state = None
+    failures = 0
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return state
+        try:
+            ensure_script_timeout(driver, timeout + SCRIPT_TIMEOUT_MARGIN)
+            state = driver.execute_async_script(
+                _WAIT_SCRIPT, int(idle_ms), int(remaining * 1000), ready_selector, int(long_request_ms)
+            )
+            # 페이지 안에서 유휴 도달 또는 남은 시간을 모두 기다린 결과
+            return state
+        except Exception as e:
+            # 대기 중 페이지 이동(문서 교체) 등 - 새 문서에서 다시 대기
+            failures += 1
+            logger.debug(f"네트워크 유휴 대기 스크립트 재시도 ({failures}회): {e}")
+            if failures >= 20:
+                return state
+            time.sleep(0.2)
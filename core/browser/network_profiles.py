@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+네트워크 차단 프로필 모듈
+단계 코어마다 필요한 리소스만 받도록 CDP Network.setBlockedURLs로 요청을 차단합니다.
+여러 브라우저(4~7개)를 한 PC에서 실행할 때 대역폭과 렌더러 CPU 사용량을 줄입니다.
+
+프로필:
+- full: 채널톡만 차단 (브라우저 생성 시 기본값)
+- editor: 채널톡 + 분석/광고 추적 차단 (상품 이미지/이미지 편집 캔버스/웹폰트 허용)
+- list-only: editor + 이미지/웹폰트 차단 (목록/설정 화면만 다루는 단계)
+
+단계 코어는 NETWORK_PROFILE 클래스 속성으로 프로필을 지정합니다.
+환경변수 PERCENTY_NETWORK_PROFILE을 지정하면 모든 단계에 해당 프로필을 사용합니다 (예: full로 차단 해제).
+"""
+
+import os
+import logging
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from core.browser.overlay_suppression import CHANNEL_TALK_BLOCKED_URLS
+
+logger = logging.getLogger(__name__)
+
+ENV_PROFILE_OVERRIDE = "PERCENTY_NETWORK_PROFILE"
+
+# 분석/광고 추적 스크립트 및 비콘
+TRACKER_BLOCKED_URLS = (
+    "*://*.google-analytics.com/*",
+    "*://*.googletagmanager.com/*",
+    "*://*.doubleclick.net/*",
+    "*://connect.facebook.net/*",
+    "*://www.facebook.com/tr*",
+    "*://analytics.tiktok.com/*",
+    "*://*.hotjar.com/*",
+    "*://*.clarity.ms/*",
+    "*://wcs.naver.net/*",
+    "*://*.beusable.net/*",
+    "*://*.amplitude.com/*",
+    "*://*.mixpanel.com/*",
+)
+
+# 이미지 (상품 썸네일 등) - 요소는 그대로 있으므로 DOM 기반 개수 확인에는 영향 없음
+IMAGE_BLOCKED_URLS = (
+    "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*", "*.png", "*.png?*",
+    "*.gif", "*.gif?*", "*.webp", "*.webp?*", "*.avif", "*.avif?*",
+)
+
+# 웹폰트
+FONT_BLOCKED_URLS = (
+    "*.woff", "*.woff?*", "*.woff2", "*.woff2?*", "*.ttf", "*.ttf?*", "*.otf", "*.otf?*",
+    "*://fonts.googleapis.com/*", "*://fonts.gstatic.com/*",
+)
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    """네트워크 차단 프로필"""
+    name: str
+    blocked_urls: Tuple[str, ...]
+    description: str = ''
+
+
+NETWORK_PROFILES: Dict[str, NetworkProfile] = {
+    profile.name: profile for profile in (
+        NetworkProfile('full', tuple(CHANNEL_TALK_BLOCKED_URLS), "채널톡만 차단"),
+        NetworkProfile('editor', tuple(CHANNEL_TALK_BLOCKED_URLS) + TRACKER_BLOCKED_URLS,
+                       "채널톡/추적 차단 (이미지 편집 캔버스용 이미지와 웹폰트 허용)"),
+        NetworkProfile('list-only', tuple(CHANNEL_TALK_BLOCKED_URLS) + TRACKER_BLOCKED_URLS +
+                       IMAGE_BLOCKED_URLS + FONT_BLOCKED_URLS,
+                       "채널톡/추적/이미지/웹폰트 차단 (목록/설정 화면 전용)"),
+    )
+}
+
+DEFAULT_PROFILE = 'full'
+
+
+def get_network_profile(name: str) -> NetworkProfile:
+    """
+    프로필 조회 (환경변수 PERCENTY_NETWORK_PROFILE이 있으면 우선)
+
+    Raises:
+        ValueError: 알 수 없는 프로필 이름
+    """
+    name = os.getenv(ENV_PROFILE_OVERRIDE, '').strip() or name or DEFAULT_PROFILE
+    if name not in NETWORK_PROFILES:
+        raise ValueError(f"알 수 없는 네트워크 프로필: {name} (사용 가능: {', '.join(NETWORK_PROFILES)})")
+    return NETWORK_PROFILES[name]
+
+
+def apply_network_profile(driver, name: str) -> bool:
+    """
+    드라이버에 네트워크 차단 프로필 적용 (같은 프로필이면 다시 보내지 않음)
+
+    Args:
+        driver: Selenium WebDriver (Chrome/CDP 지원)
+        name: 프로필 이름 ('full', 'editor', 'list-only')
+
+    Returns:
+        bool: 적용 여부 (CDP를 지원하지 않으면 False, 브라우저는 차단 없이 계속 사용)
+    """
+    if driver is None:
+        return False
+
+    try:
+        profile = get_network_profile(name)
+    except ValueError as e:
+        logger.warning(f"{e} - 기본 프로필 사용")
+        profile = NETWORK_PROFILES[DEFAULT_PROFILE]
+
+    if getattr(driver, '_network_profile', None) == profile.name:
+        return True
+
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(profile.blocked_urls)})
+    except Exception as e:
+        logger.warning(f"네트워크 프로필 '{profile.name}' 적용 실패: {e}")
+        return False
+
+    driver._network_profile = profile.name
+    logger.info(f"네트워크 프로필 적용: {profile.name} ({profile.description}, 패턴 {len(profile.blocked_urls)}개)")
+    return True
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+오버레이 차단 모듈
+채널톡 위젯과 마케팅/이벤트 모달("다시 보지 않기")을 브라우저 생성 시 한 번만 차단합니다.
+
+- Page.addScriptToEvaluateOnNewDocument: 모든 문서(새로고침, 페이지 이동, 새 탭 포함)의
+  시작 시점에 숨김 CSS/JS를 등록하므로 상품마다 Python에서 숨기기 스크립트를 다시 실행할 필요가 없습니다.
+- Network.setBlockedURLs: 채널톡 플러그인 스크립트/API/웹소켓 요청 자체를 차단합니다.
+
+드라이버별로 설치 여부를 기록하며(driver._overlay_suppression), 설치된 드라이버에서는
+채널톡 숨기기(channel_talk_utils, percenty_utils.hide_channel_talk_and_modals)를 생략하고,
+modal_blocker.close_modal_dialog는 보이는 모달이 없을 때만 바로 반환합니다.
+로그인 모달과 "다시 보지 않기" 버튼이 없는 모달은 숨기지 않으므로 기존 처리(hide_login_modal, 닫기 버튼/ESC)를 유지합니다.
+"""
+
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 채널톡 플러그인 요청 차단 패턴 (Network.setBlockedURLs 와일드카드)
+CHANNEL_TALK_BLOCKED_URLS = [
+    "*://cdn.channel.io/*",
+    "*://api.channel.io/*",
+    "*://ws.channel.io/*",
+    "*://*.channel.io/plugin/*",
+    "*ch-plugin-web*",
+]
+
+# 문서 시작 시점 숨김 스크립트
+_DOCUMENT_START_SCRIPT = r"""
+(function () {
+    if (window.__percentyOverlayGuard) return;
+    window.__percentyOverlayGuard = true;
+
+    // 채널톡 위젯 숨김 (channel_talk_utils와 같은 선택자)
+    var css = '#ch-plugin, .ch-messenger, .ch-desk-messenger, div[id^="ch-plugin"], iframe[id^="ch-plugin"],' +
+              'div[class*="ch-plugin"], div[class*="ChannelTalk"] {' +
+              'display: none !important; visibility: hidden !important; opacity: 0 !important;' +
+              'pointer-events: none !important; }';
+    function addStyle() {
+        if (document.getElementById('percenty-overlay-guard-style')) return;
+        var style = document.createElement('style');
+        style.id = 'percenty-overlay-guard-style';
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    }
+
+    // 채널톡 부트 스크립트가 로드되지 않아도 페이지 코드가 오류 없이 동작하도록 빈 함수로 대체
+    if (!window.ChannelIO) {
+        var stub = function () {};
+        stub.q = [];
+        stub.c = function () {};
+        window.ChannelIO = stub;
+        window.ChannelIOInitialized = true;
+    }
+
+    // 마케팅/이벤트 모달 다시 보지 않기 표시 (modal_blocker.set_modal_cookies_and_storage와 같은 키)
+    try {
+        ['modal_shown', 'modal_dismissed', 'dont_show_again', 'percenty_modal_blocked'].forEach(function (key) {
+            localStorage.setItem(key, 'true');
+        });
+        localStorage.setItem('percenty_modal_timestamp', Date.now().toString());
+    } catch (e) {}
+    try {
+        var expires = new Date(Date.now() + 30 * 24 * 60 * 60 * 1000).toUTCString();
+        ['modal_shown', 'modal_dismissed', 'dont_show_again', 'percenty_modal_blocked'].forEach(function (key) {
+            document.cookie = key + '=true; expires=' + expires + '; path=/';
+        });
+    } catch (e) {}
+
+    // 새로 나타난 모달의 "다시 보지 않기" 버튼 클릭 (작업용 모달은 건드리지 않음)
+    var pending = false;
+    function dismissMarketingModals() {
+        pending = false;
+        var buttons = document.querySelectorAll('.ant-modal button, div[role="dialog"] button');
+        for (var i = 0; i < buttons.length; i++) {
+            if (buttons[i].textContent.indexOf('다시 보지 않기') !== -1) {
+                try { buttons[i].click(); } catch (e) {}
+            }
+        }
+    }
+
+    function start() {
+        addStyle();
+        dismissMarketingModals();
+        new MutationObserver(function () {
+            if (!pending) {
+                pending = true;
+                setTimeout(dismissMarketingModals, 50);
+            }
+        }).observe(document.documentElement, {childList: true, subtree: true});
+    }
+
+    if (document.documentElement) {
+        start();
+    } else {
+        document.addEventListener('DOMContentLoaded', start);
+    }
+})();
+"""
+
+
+def install_overlay_suppression(driver, blocked_urls: Optional[List[str]] = None) -> bool:
+    """
+    드라이버에 오버레이 차단 스크립트와 채널톡 요청 차단을 등록 (드라이버당 한 번)
+
+    Args:
+        driver: Selenium WebDriver (Chrome/CDP 지원)
+        blocked_urls: 차단할 URL 패턴 (None이면 CHANNEL_TALK_BLOCKED_URLS)
+
+    Returns:
+        bool: 문서 시작 스크립트 등록 여부 (CDP를 지원하지 않으면 False)
+    """
+    if driver is None or is_overlay_suppressed(driver):
+        return driver is not None
+
+    try:
+        result = driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _DOCUMENT_START_SCRIPT})
+    except Exception as e:
+        logger.warning(f"오버레이 차단 스크립트 등록 실패 (기존 숨기기 방식 사용): {e}")
+        return False
+
+    driver._overlay_suppression = result.get('identifier') if isinstance(result, dict) else True
+
+    # 네트워크 프로필(core/browser/network_profiles.py)이 이미 적용되었으면 채널톡 차단이 포함되어 있음
+    if not getattr(driver, '_network_profile', None):
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(blocked_urls or CHANNEL_TALK_BLOCKED_URLS)})
+            driver._network_profile = 'full' if blocked_urls is None else 'custom'
+        except Exception as e:
+            logger.warning(f"채널톡 요청 차단 설정 실패: {e}")
+
+    # 이미 열려 있는 문서에도 적용
+    try:
+        driver.execute_script(_DOCUMENT_START_SCRIPT)
+    except Exception as e:
+        logger.debug(f"현재 문서 오버레이 차단 적용 실패: {e}")
+
+    logger.info("오버레이 차단 스크립트 등록 완료 (채널톡/마케팅 모달)")
+    return True
+
+
+def is_overlay_suppressed(driver) -> bool:
+    """드라이버에 문서 시작 오버레이 차단이 등록되어 있는지 여부"""
+    return bool(getattr(driver, '_overlay_suppression', None))
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+세션 상태 캐시 모듈
+로그인 성공 후의 쿠키와 localStorage/sessionStorage를 계정(이메일)별로 저장해 두고,
+새 브라우저에 주입하여 로그인 폼 입력 없이 세션을 복원합니다.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 퍼센티 기본 URL (쿠키 주입을 위해 같은 도메인 페이지가 먼저 열려 있어야 함)
+PERCENTY_BASE_URL = "https://www.percenty.co.kr/"
+PERCENTY_SIGNIN_PATH = "/signin"
+
+# 브라우저 저장소 스냅샷 스크립트
+_CAPTURE_STORAGE_SCRIPT = """
+    function dump(storage) {
+        var data = {};
+        try {
+            for (var i = 0; i < storage.length; i++) {
+                var key = storage.key(i);
+                data[key] = storage.getItem(key);
+            }
+        } catch (e) {}
+        return data;
+    }
+    return {
+        local: dump(window.localStorage),
+        session: dump(window.sessionStorage)
+    };
+"""
+
+# 브라우저 저장소 복원 스크립트
+_RESTORE_STORAGE_SCRIPT = """
+    var snapshot = arguments[0];
+    function load(storage, data) {
+        try {
+            Object.keys(data || {}).forEach(function(key) {
+                storage.setItem(key, data[key]);
+            });
+        } catch (e) {}
+    }
+    load(window.localStorage, snapshot.local);
+    load(window.sessionStorage, snapshot.session);
+    return true;
+"""
+
+# 세션 유효성 확인 스크립트 (로그인 폼이 보이면 세션 무효)
+_PROBE_SCRIPT = """
+    return {
+        ready: document.readyState,
+        url: window.location.href,
+        signin_form: !!document.querySelector('input#email') && !!document.querySelector('input#password')
+    };
+"""
+
+
+class SessionStateCache:
+    """
+    계정별 로그인 세션 스냅샷 캐시
+
+    capture()로 로그인된 드라이버의 세션을 저장하고,
+    restore()로 새 드라이버에 주입한 뒤 유효성을 확인합니다.
+    """
+
+    def __init__(self, max_age: int = 6 * 60 * 60, probe_timeout: float = 10.0):
+        """
+        초기화
+
+        Args:
+            max_age: 스냅샷 최대 유효 시간(초)
+            probe_timeout: 세션 유효성 확인 최대 대기 시간(초)
+        """
+        self.max_age = max_age
+        self.probe_timeout = probe_timeout
+        self._snapshots: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def has_snapshot(self, email: str) -> bool:
+        """유효 기간 내의 스냅샷 존재 여부"""
+        return self._get_snapshot(email) is not None
+
+    def _get_snapshot(self, email: str) -> Optional[Dict]:
+        """만료되지 않은 스냅샷 반환"""
+        with self._lock:
+            snapshot = self._snapshots.get(email)
+            if snapshot is None:
+                return None
+
+            if time.time() - snapshot['captured_at'] > self.max_age:
+                logger.info(f"세션 스냅샷 만료: {email}")
+                del self._snapshots[email]
+                return None
+
+            return snapshot
+
+    def capture(self, driver, email: str) -> bool:
+        """
+        로그인된 드라이버의 세션 상태 저장
+
+        Args:
+            driver: 로그인이 완료된 WebDriver 인스턴스
+            email: 계정 이메일
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            cookies = driver.get_cookies()
+            storage = driver.execute_script(_CAPTURE_STORAGE_SCRIPT) or {}
+
+            if not cookies and not storage.get('local'):
+                logger.warning(f"저장할 세션 정보가 없습니다: {email}")
+                return False
+
+            snapshot = {
+                'cookies': cookies,
+                'local': storage.get('local', {}),
+                'session': storage.get('session', {}),
+                'landing_url': driver.current_url,
+                'captured_at': time.time()
+            }
+
+            with self._lock:
+                self._snapshots[email] = snapshot
+
+            logger.info(f"세션 스냅샷 저장: {email} (쿠키 {len(cookies)}개, localStorage {len(snapshot['local'])}개)")
+            return True
+
+        except Exception as e:
+            logger.warning(f"세션 스냅샷 저장 실패: {email} - {e}")
+            return False
+
+    def restore(self, driver, email: str) -> bool:
+        """
+        저장된 세션을 새 드라이버에 주입하고 유효성 확인
+
+        Args:
+            driver: 새 WebDriver 인스턴스
+            email: 계정 이메일
+
+        Returns:
+            bool: 세션 복원 성공 여부 (False이면 폼 로그인 필요)
+        """
+        snapshot = self._get_snapshot(email)
+        if snapshot is None:
+            return False
+
+        try:
+            start_time = time.time()
+
+            # 쿠키 도메인을 맞추기 위해 퍼센티 페이지를 먼저 연다
+            driver.get(PERCENTY_BASE_URL)
+            driver.delete_all_cookies()
+
+            for cookie in snapshot['cookies']:
+                cookie = dict(cookie)
+                # Selenium add_cookie가 허용하지 않는 값 정리
+                if 'expiry' in cookie:
+                    cookie['expiry'] = int(cookie['expiry'])
+                if cookie.get('sameSite') not in (None, 'Strict', 'Lax', 'None'):
+                    cookie.pop('sameSite', None)
+                try:
+                    driver.add_cookie(cookie)
+                except Exception as cookie_error:
+                    logger.debug(f"쿠키 주입 실패 ({cookie.get('name')}): {cookie_error}")
+
+            driver.execute_script(_RESTORE_STORAGE_SCRIPT, {
+                'local': snapshot['local'],
+                'session': snapshot['session']
+            })
+
+            # 로그인 후 페이지로 이동하여 세션 유효성 확인
+            landing_url = snapshot.get('landing_url') or PERCENTY_BASE_URL
+            if PERCENTY_SIGNIN_PATH in landing_url:
+                landing_url = PERCENTY_BASE_URL
+            driver.get(landing_url)
+
+            if self._probe(driver):
+                logger.info(f"세션 복원 성공: {email} (소요시간: {time.time() - start_time:.2f}초)")
+                return True
+
+            logger.info(f"저장된 세션이 거부되었습니다. 폼 로그인으로 전환: {email}")
+            self.invalidate(email)
+            return False
+
+        except Exception as e:
+            logger.warning(f"세션 복원 중 오류, 폼 로그인으로 전환: {email} - {e}")
+            self.invalidate(email)
+            return False
+
+    def _probe(self, driver) -> bool:
+        """
+        현재 페이지가 로그인 상태인지 확인
+
+        SPA가 세션을 검증한 뒤 /signin으로 보낼 수 있으므로
+        문서 로딩 완료 후 잠시 URL과 로그인 폼을 관찰합니다.
+        """
+        deadline = time.time() + self.probe_timeout
+        settled_since = None
+
+        while time.time() < deadline:
+            state = driver.execute_script(_PROBE_SCRIPT) or {}
+
+            if PERCENTY_SIGNIN_PATH in state.get('url', '') or state.get('signin_form'):
+                return False
+
+            if state.get('ready') == 'complete':
+                if settled_since is None:
+                    settled_since = time.time()
+                elif time.time() - settled_since >= 1.0:
+                    return True
+
+            time.sleep(0.25)
+
+        return False
+
+    def invalidate(self, email: str):
+        """계정의 세션 스냅샷 삭제"""
+        with self._lock:
+            if self._snapshots.pop(email, None) is not None:
+                logger.info(f"세션 스냅샷 삭제: {email}")
+
+    def clear(self):
+        """모든 세션 스냅샷 삭제"""
+        with self._lock:
+            self._snapshots.clear()
+
+
+# 프로세스 전역 세션 캐시 인스턴스
+session_cache = SessionStateCache()
@@ -13,19 +13,30 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from core.browser.api_tap import api_total_count, api_tap_mark, PRODUCT_LIST_PATTERN
+
 logger = logging.getLogger(__name__)
 
-def check_product_count(driver: WebDriver) -> int:
+def check_product_count(driver: WebDriver, since: Optional[int] = None) -> int:
     """
     현재 상품 목록의 상품 개수를 확인
     
     Args:
         driver: Selenium WebDriver 인스턴스
+        since: 목록을 다시 불러온 동작 전에 기록한 api_tap_mark 값
+            (있으면 그 이후의 목록 API 응답에서 먼저 확인, None이면 화면에서만 확인)
         
     Returns:
         int: 현재 상품 목록의 상품 개수. 실패시 0 반환
     """
     try:
+        # 방법 0: 동작 이후 도착한 상품 목록 API 응답의 총 개수 (화면 표시와 일치할 때만 사용)
+        if since is not None:
+            api_count = api_total_count(driver, PRODUCT_LIST_PATTERN, since=since)
+            if api_count is not None:
+                logger.info(f"API 응답 상품 개수: {api_count}개")
+                return api_count
+        
         # 방법 1: "총 X개 상품" 텍스트를 확인하는 방법 (가장 정확한 방법)
         try:
             # "총 X개 상품" 표시 텍스트 찾기
@@ -270,6 +281,7 @@ def toggle_product_view(driver: WebDriver) -> int:
     
     # 두번째 클릭 - 비그룹상품보기 (원래 상태로 복귀)
     logger.info("비그룹상품보기 토글 클릭 시도 (2번째 클릭)")
+    list_api_mark = api_tap_mark(driver)
     
     try:
         logger.info(f"DOM 선택자로 토글 찾기 시도: {selector}")
@@ -322,7 +334,7 @@ def toggle_product_view(driver: WebDriver) -> int:
         logger.warning(f"상품 목록 로딩 확인 실패: {e}")
     
     # 상품 개수 확인
-    product_count = check_product_count(driver)
+    product_count = check_product_count(driver, since=list_api_mark)
     logger.info(f"현재 비그룹상품 목록에 {product_count}개의 상품이 있습니다.")
     
     # 성공 여부와 관계없이 상품 개수 반환
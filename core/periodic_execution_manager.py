@@ -302,7 +302,8 @@ class PeriodicExecutionManager:
                 'selected_steps': List[str],
                 'selected_accounts': List[str],
                 'schedule_time': str,       # "HH:MM" 형식
-                'step_interval': int        # 단계 간 대기 시간(초)
+                'step_interval': int,       # 단계 간 대기 시간(초)
+                'use_worker_daemon': bool   # 배치 워커 데몬 사용 여부 (기본값: True, 데몬이 없으면 새 프로세스)
             }
         """
         self.config = config.copy()
@@ -591,14 +592,31 @@ class PeriodicExecutionManager:
                 cmd.extend(["--step3-image-limit", str(step3_image_limit)])
                 self._log(f"3단계 이중 제한 적용: 상품 {step3_product_limit}개, 이미지 번역 {step3_image_limit}개")
             
-            self._log(f"실행 명령: {' '.join(cmd)}")
-            
-            # 프로세스 실행 (새로운 콘솔 창에서 실행하여 디버깅 편의성 제공)
-            process = subprocess.Popen(
-                cmd,
-                creationflags=subprocess.CREATE_NEW_CONSOLE,
-                cwd=str(self.project_root)
-            )
+            # 청크별 타임아웃 계산
+            timeout = self._calculate_chunk_timeout(step, quantity, chunk_size)
+            
+            # 상주 배치 워커 데몬이 있으면 작업 전달, 없으면 새 프로세스 실행
+            worker_client = self._get_worker_client()
+            if worker_client:
+                process = worker_client.submit(
+                    step=step,
+                    account=real_account_id,
+                    quantity=quantity,
+                    chunk_size=chunk_size,
+                    step3_product_limit=step3_product_limit if step in step3_steps else None,
+                    step3_image_limit=step3_image_limit if step in step3_steps else None,
+                    timeout=timeout
+                )
+                self._log(f"배치 워커 데몬에 작업 전달: {process.pid}")
+            else:
+                self._log(f"실행 명령: {' '.join(cmd)}")
+                
+                # 프로세스 실행 (새로운 콘솔 창에서 실행하여 디버깅 편의성 제공)
+                process = subprocess.Popen(
+                    cmd,
+                    creationflags=subprocess.CREATE_NEW_CONSOLE,
+                    cwd=str(self.project_root)
+                )
             
             # 실행 중인 프로세스 목록에 추가
             with self.process_lock:
@@ -607,9 +625,6 @@ class PeriodicExecutionManager:
             self._log(f"프로세스 PID {process.pid} 시작됨 (계정 {account_id}, 단계 {step})")
             
             try:
-                # 청크별 타임아웃 계산
-                timeout = self._calculate_chunk_timeout(step, quantity, chunk_size)
-                
                 self._log(f"단계 {step} 전체 배치 타임아웃 설정: {timeout}초 ({timeout//3600}시간 {(timeout%3600)//60}분) - 총수량: {quantity}, 청크크기: {chunk_size}, 예상청크수: {(quantity + chunk_size - 1) // chunk_size}")
                 
                 # 프로세스 완료 대기 (스텝별 타임아웃)
@@ -664,6 +679,25 @@ class PeriodicExecutionManager:
                 self._log(f"예외 처리 중 브라우저 정리 오류: {cleanup_error}")
             return False
     
+    def _get_worker_client(self):
+        """실행 중인 배치 워커 데몬 클라이언트 반환 (없거나 비활성화되면 None)
+        
+        Returns:
+            Optional[BatchWorkerClient]: 워커 클라이언트
+        """
+        if not self.config.get('use_worker_daemon', True):
+            return None
+        
+        try:
+            from batch.executors.worker_daemon import BatchWorkerClient
+            client = BatchWorkerClient()
+            if client.is_available():
+                return client
+        except Exception as e:
+            self._log(f"배치 워커 데몬 확인 중 오류 (새 프로세스로 실행): {e}")
+        
+        return None
+    
     def _calculate_chunk_timeout(self, step: str, quantity: int, chunk_size: int) -> int:
         """전체 배치 타임아웃 계산 (청크별이 아닌 전체 프로세스 기준)
         
@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Union, Tuple
 # 루트 디렉토리를 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from core.browser.network_profiles import apply_network_profile
+
 # 기존 모듈들 임포트 (루트에서)
 try:
     from percenty_new_step1 import *
@@ -35,6 +37,7 @@ from click_utils import smart_click
 from core.common.modal_handler import handle_post_login_modals, hide_channel_talk, close_modal_dialogs
 from core.common.navigation_handler import navigate_to_ai_sourcing, navigate_to_group_management, switch_to_non_group_view
 from core.common.product_handler import check_product_count, check_toggle_state, toggle_product_view
+from core.browser.api_tap import api_tap_mark
 from core.common.ui_handler import periodic_ui_cleanup, ensure_clean_ui_before_action
 
 logger = logging.getLogger(__name__)
@@ -45,6 +48,9 @@ class Step1Core:
     기존 코드의 기능을 유지하면서 모듈화
     """
     
+    # 네트워크 차단 프로필 (상품 이미지/편집 화면을 다루므로 추적만 차단)
+    NETWORK_PROFILE = 'editor'
+    
     def __init__(self, driver=None):
         """
         초기화
@@ -64,6 +70,7 @@ class Step1Core:
     def setup_managers(self):
         """관리자 객체들 설정"""
         try:
+            apply_network_profile(self.driver, self.NETWORK_PROFILE)
             # BrowserCore는 driver를 매개변수로 받지 않으므로 인스턴스만 생성
             self.browser_core = BrowserCore()
             # driver를 별도로 설정
@@ -223,11 +230,12 @@ class Step1Core:
             # 4. 그룹상품관리 화면으로 이동
             self._navigate_to_group_management()
             
-            # 5. 비그룹상품보기 클릭
+            # 5. 비그룹상품보기 클릭 (전환으로 불러온 목록 API 응답을 구분하기 위해 순번 기록)
+            list_api_mark = api_tap_mark(self.driver)
             self._switch_to_non_group_view()
             
             # 6. 실행 전 상품 개수 확인
-            available_products = self._check_product_count()
+            available_products = self._check_product_count(since=list_api_mark)
             result['product_count_before'] = available_products
             logger.info(f"📊 실행 전 비그룹상품 수량: {available_products}개")
             
@@ -409,13 +417,16 @@ class Step1Core:
         """
         return check_toggle_state(self.driver)
     
-    def _check_product_count(self) -> int:
+    def _check_product_count(self, since: Optional[int] = None) -> int:
         """현재 상품 목록의 상품 개수를 확인
         
+        Args:
+            since: 목록을 다시 불러온 동작 전에 기록한 api_tap_mark 값 (None이면 화면에서만 확인)
+        
         Returns:
             int: 현재 상품 목록의 상품 개수. 실패시 0 반환
         """
-        return check_product_count(self.driver)
+        return check_product_count(self.driver, since=since)
     
     def _toggle_product_view(self):
         """상품 목록 새로고침을 위한 토글 2회 클릭 기능
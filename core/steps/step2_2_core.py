@@ -15,6 +15,8 @@ from typing import Dict, List, Optional, Union, Tuple
 # 루트 디렉토리를 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from core.browser.network_profiles import apply_network_profile
+
 # 기존 모듈들 임포트 (루트에서)
 try:
     from product_editor_core2 import ProductEditorCore2
@@ -28,6 +30,7 @@ from timesleep import DELAY_STANDARD, DELAY_SHORT
 # from human_delay import HumanLikeDelay
 from ui_elements import UI_ELEMENTS
 from click_utils import smart_click
+from core.utils.task_index import group_tasks_by_provider_code
 
 # 공통 함수들 임포트
 from core.common.modal_handler import handle_post_login_modals, hide_channel_talk, close_modal_dialogs
@@ -42,6 +45,9 @@ class Step2_2Core:
     등록상품에서 키워드별 상품 수정 및 그룹 이동 작업 수행
     """
     
+    # 네트워크 차단 프로필 (목록/설정 화면만 다루므로 이미지/웹폰트 차단)
+    NETWORK_PROFILE = 'list-only'
+    
     def __init__(self, driver=None, server_name="서버2", restart_browser_callback=None):
         """
         초기화
@@ -66,6 +72,7 @@ class Step2_2Core:
     def setup_managers(self):
         """관리자 객체들 설정"""
         try:
+            apply_network_profile(self.driver, self.NETWORK_PROFILE)
             logger.info("BrowserCore 인스턴스 생성 시작")
             # BrowserCore는 driver를 매개변수로 받지 않으므로 인스턴스만 생성
             self.browser_core = BrowserCore()
@@ -108,6 +115,7 @@ class Step2_2Core:
             # 메인 드라이버 참조 업데이트
             old_driver = self.driver
             self.driver = new_driver
+            apply_network_profile(new_driver, self.NETWORK_PROFILE)
             logger.info(f"메인 드라이버 참조 업데이트 완료 - {self.server_name}")
             
             # 각 관리자 객체의 드라이버 참조 업데이트
@@ -327,6 +335,8 @@ class Step2_2Core:
                 return result
             
             logger.info(f"로드된 작업 목록: {len(task_list)}개")
+            # 키워드별 작업을 미리 묶어 키워드마다 전체 목록을 훑지 않도록 함
+            tasks_by_code = group_tasks_by_provider_code(task_list)
             
             # 7. 키워드별 처리
             for provider_code in provider_codes:
@@ -356,7 +366,7 @@ class Step2_2Core:
                             continue
                     
                     # 해당 키워드에 대한 작업 찾기
-                    matching_tasks = [task for task in task_list if task.get('provider_code') == provider_code]
+                    matching_tasks = tasks_by_code.get(provider_code, [])
                     
                     if not matching_tasks:
                         logger.warning(f"키워드 '{provider_code}'에 대한 작업이 없습니다")
@@ -7,7 +7,6 @@
 import os
 import sys
 import time
-import json
 import logging
 import traceback
 from typing import Dict, List, Optional, Union, Tuple
@@ -15,6 +14,8 @@ from typing import Dict, List, Optional, Union, Tuple
 # 루트 디렉토리를 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from core.browser.network_profiles import apply_network_profile
+
 # 기존 모듈들 임포트 (루트에서)
 try:
     from product_editor_core3 import ProductEditorCore3
@@ -28,6 +29,8 @@ from timesleep import DELAY_STANDARD, DELAY_SHORT
 # from human_delay import HumanLikeDelay
 from ui_elements import UI_ELEMENTS
 from click_utils import smart_click
+from core.utils.task_index import group_tasks_by_provider_code
+from core.utils.progress_journal import get_progress_journal
 
 # 공통 함수들 임포트
 from core.common.modal_handler import handle_post_login_modals, hide_channel_talk, close_modal_dialogs
@@ -43,6 +46,9 @@ class Step3_1_2Core:
     등록상품에서 키워드별 상품 수정 및 그룹 이동 작업 수행
     """
     
+    # 네트워크 차단 프로필 (상품 이미지/편집 화면을 다루므로 추적만 차단)
+    NETWORK_PROFILE = 'editor'
+    
     def __init__(self, driver=None, server_name="서버1-2", restart_browser_callback=None, step3_product_limit=None, step3_image_limit=None):
         """
         초기화
@@ -79,6 +85,7 @@ class Step3_1_2Core:
     def setup_managers(self):
         """관리자 객체들 설정"""
         try:
+            apply_network_profile(self.driver, self.NETWORK_PROFILE)
             logger.info("BrowserCore 인스턴스 생성 시작")
             # BrowserCore는 driver를 매개변수로 받지 않으므로 인스턴스만 생성
             self.browser_core = BrowserCore()
@@ -120,6 +127,7 @@ class Step3_1_2Core:
             
             # 메인 드라이버 참조 업데이트
             self.driver = new_driver
+            apply_network_profile(new_driver, self.NETWORK_PROFILE)
             
             # 각 관리자 객체의 드라이버 참조 업데이트
             if self.browser_core:
@@ -271,9 +279,9 @@ class Step3_1_2Core:
             total_result['success'] = total_result['processed_keywords'] > 0 and total_result['failed_keywords'] == 0
             
             # 완료 시 진행 상황 파일 삭제
-            if total_result['success'] and os.path.exists(progress_file):
-                os.remove(progress_file)
-                logger.info("작업 완료 - 진행 상황 파일 삭제됨")
+            if total_result['success']:
+                get_progress_journal(progress_file).truncate()
+                logger.info("작업 완료 - 진행 상황 저널 삭제됨")
             
             logger.info(f"3단계_1_2 배치 작업 완료 (서버: {self.server_name}) - 처리된 키워드: {total_result['processed_keywords']}, 실패: {total_result['failed_keywords']}, 총 처리된 상품: {total_result['total_products_processed']}")
             
@@ -348,22 +356,21 @@ class Step3_1_2Core:
             real_account_id = get_real_account_id(account_id)
             logger.info(f"작업 목록 로드를 위한 계정 ID 변환: {account_id} -> {real_account_id}")
             
-            # 진행 상황 파일에서 완료된 키워드 목록 가져오기
-            progress_file = self._get_progress_file_path(account_info)
-            completed_keywords = []
-            accumulated_products = 0
-            accumulated_images = 0
-            if os.path.exists(progress_file):
-                try:
-                    with open(progress_file, 'r', encoding='utf-8') as f:
-                        progress_data = json.load(f)
-                        completed_keywords = progress_data.get('completed_keywords', [])
-                        accumulated_products = progress_data.get('total_products_processed', 0)
-                        accumulated_images = progress_data.get('total_images_translated', 0)
-                        logger.info(f"진행 상황에서 완료된 키워드 {len(completed_keywords)}개 확인: {completed_keywords}")
-                        logger.info(f"진행 상황에서 누적 데이터 복구: 상품 {accumulated_products}개, 이미지 {accumulated_images}개")
-                except Exception as e:
-                    logger.warning(f"진행 상황 파일 읽기 실패: {e}")
+            # 진행 상황 저널에서 완료된 키워드 목록 및 누적 데이터 가져오기
+            progress_journal = get_progress_journal(self._get_progress_file_path(account_info))
+            progress_state = progress_journal.load()
+            completed_keywords = list(progress_state.completed_keywords)
+            accumulated_products = progress_state.total_products_processed
+            accumulated_images = progress_state.total_images_translated
+            if progress_journal.exists():
+                logger.info(f"진행 상황에서 완료된 키워드 {len(completed_keywords)}개 확인: {completed_keywords}")
+                logger.info(f"진행 상황에서 누적 데이터 복구: 상품 {accumulated_products}개, 이미지 {accumulated_images}개")
+            for keyword, products in progress_state.products.items():
+                logger.info(f"진행 중이던 키워드 '{keyword}': 완료된 상품 {len(products)}개는 건너뜁니다")
+            
+            # 상품 단위 완료 기록 및 재시작 시 건너뛰기
+            if self.product_editor:
+                self.product_editor.progress_journal = progress_journal
             
             # 배치 제한 관리자에 누적 데이터 설정
             self.batch_limit_manager.set_accumulated_counts(accumulated_products, accumulated_images)
@@ -388,6 +395,8 @@ class Step3_1_2Core:
                 return result
             
             logger.info(f"로드된 작업 목록: {len(task_list)}개")
+            # 키워드별 작업을 미리 묶어 키워드마다 전체 목록을 훑지 않도록 함
+            tasks_by_code = group_tasks_by_provider_code(task_list)
             
             # 7. 키워드별 처리 (배치 제한 적용)
             for provider_code in provider_codes:
@@ -412,7 +421,7 @@ class Step3_1_2Core:
                                     
                                     logger.info(f"===== 키워드 '{actual_code}' 처리 시작 =====")
                                     # 해당 키워드에 대한 작업 찾기
-                                    matching_tasks = [task for task in task_list if task.get('provider_code') == actual_code]
+                                    matching_tasks = tasks_by_code.get(actual_code, [])
                                     
                                     if not matching_tasks:
                                         logger.warning(f"키워드 '{actual_code}'에 대한 작업이 없습니다 - 처리 완료로 표시")
@@ -475,7 +484,7 @@ class Step3_1_2Core:
                             continue
                     
                     # 해당 키워드에 대한 작업 찾기
-                    matching_tasks = [task for task in task_list if task.get('provider_code') == provider_code]
+                    matching_tasks = tasks_by_code.get(provider_code, [])
                     
                     if not matching_tasks:
                         logger.warning(f"키워드 '{provider_code}'에 대한 작업이 없습니다 - 처리 완료로 표시")
@@ -1155,24 +1164,24 @@ class Step3_1_2Core:
     
     def _get_progress_file_path(self, account_info: Dict) -> str:
         """
-        진행 상황 파일 경로 생성
+        진행 상황 저널 경로 생성
         
         Args:
             account_info: 계정 정보
             
         Returns:
-            str: 진행 상황 파일 경로
+            str: 진행 상황 저널 경로
         """
         account_id = account_info.get('id', 'unknown') if account_info else 'unknown'
-        return f"progress_{account_id}_step3_1_2_core.json"
+        return f"progress_{account_id}_step3_1_2_core.journal"
     
     def _save_progress(self, completed_keywords: List[str], progress_file: str, account_info: Dict, total_products_processed: int = 0, total_images_translated: int = 0):
         """
-        진행 상황 저장 (절대값으로 저장)
+        진행 상황 저장 (저널에 청크 종료 기록 추가, 누적값은 절대값)
         
         Args:
             completed_keywords: 완료된 키워드 목록
-            progress_file: 진행 상황 파일 경로
+            progress_file: 진행 상황 저널 경로
             account_info: 계정 정보
             total_products_processed: 현재까지 누적 처리된 상품 수 (절대값)
             total_images_translated: 현재까지 누적 번역된 이미지 수 (절대값)
@@ -1182,29 +1191,14 @@ class Step3_1_2Core:
             current_products = self.batch_limit_manager.total_products_processed
             current_images = self.batch_limit_manager.total_images_translated
             
-            progress_data = {
-                "account_id": account_info.get('id', 'unknown') if account_info else 'unknown',
-                "server_name": self.server_name,
-                "completed_keywords": completed_keywords,
-                "total_products_processed": current_products,
-                "total_images_translated": current_images,
-                "last_updated": time.strftime("%Y-%m-%dT%H:%M:%S")
-            }
-            
-            # 파일 접근 오류 방지를 위한 재시도 로직
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    with open(progress_file, 'w', encoding='utf-8') as f:
-                        json.dump(progress_data, f, ensure_ascii=False, indent=2)
-                    break
-                except (PermissionError, OSError) as e:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"진행 상황 저장 시도 {attempt + 1} 실패, 재시도: {e}")
-                        time.sleep(0.5)
-                    else:
-                        raise
-                
+            get_progress_journal(progress_file).record_checkpoint(
+                completed_keywords,
+                current_products,
+                current_images,
+                account_id=account_info.get('id', 'unknown') if account_info else 'unknown',
+                server_name=self.server_name
+            )
+            
             logger.info(f"진행 상황 저장됨: {len(completed_keywords)}개 키워드 완료, 누적 상품 {current_products}개, 누적 이미지 번역 {current_images}개")
             
         except Exception as e:
@@ -1216,22 +1210,18 @@ class Step3_1_2Core:
         
         Args:
             provider_codes: 전체 키워드 목록
-            progress_file: 진행 상황 파일 경로
+            progress_file: 진행 상황 저널 경로
             
         Returns:
             Tuple[List[str], int, int]: (남은 키워드 목록, 누적 처리된 상품 수, 누적 번역된 이미지 수)
         """
         try:
-            if not os.path.exists(progress_file):
-                return provider_codes, 0, 0
-            
-            with open(progress_file, 'r', encoding='utf-8') as f:
-                progress_data = json.load(f)
+            state = get_progress_journal(progress_file).load()
             
-            completed_keywords = progress_data.get('completed_keywords', [])
+            completed_keywords = set(state.completed_keywords)
             remaining_keywords = [k for k in provider_codes if k not in completed_keywords]
-            accumulated_products = progress_data.get('total_products_processed', 0)
-            accumulated_images = progress_data.get('total_images_translated', 0)
+            accumulated_products = state.total_products_processed
+            accumulated_images = state.total_images_translated
             
             if len(remaining_keywords) < len(provider_codes):
                 logger.info(f"진행 상황 복구: {len(completed_keywords)}개 키워드 이미 완료, {len(remaining_keywords)}개 키워드 남음")
@@ -29,6 +29,7 @@ try:
     from percenty_new_step4 import PercentyNewStep4
     from login_percenty import PercentyLogin
     from account_manager import AccountManager
+    from core.browser.network_profiles import apply_network_profile
 except ImportError as e:
     print(f"필수 모듈 임포트 실패: {e}")
     sys.exit(1)
@@ -48,6 +49,9 @@ class Step4Core:
     percenty_new_step4.py의 기능을 래핑하여 안전하고 효율적으로 실행합니다.
     """
     
+    # 네트워크 차단 프로필 (목록/설정 화면만 다루므로 이미지/웹폰트 차단)
+    NETWORK_PROFILE = 'list-only'
+    
     def __init__(self, account_id: str, headless: bool = False, existing_driver=None):
         """
         Step4Core 초기화
@@ -131,6 +135,7 @@ class Step4Core:
             logger.info("로그인 성공")
             
             # 4단계 자동화 객체 초기화
+            apply_network_profile(self.login_manager.driver, self.NETWORK_PROFILE)
             self.step4_automation = PercentyNewStep4(self.login_manager.driver)
             
             logger.info("4단계 자동화 초기화 완료")
@@ -250,6 +255,7 @@ class Step4Core:
             logger.info("로그인 상태 확인 및 모달창 처리 완료")
             
             # 4단계 자동화 객체 초기화 (기존 드라이버 사용)
+            apply_network_profile(self.existing_driver, self.NETWORK_PROFILE)
             self.step4_automation = PercentyNewStep4(self.existing_driver)
             
             logger.info("기존 드라이버로 4단계 자동화 초기화 완료")
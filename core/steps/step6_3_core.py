@@ -18,6 +18,8 @@ from typing import Dict, List, Optional, Union, Tuple
 # 루트 디렉토리를 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from core.browser.network_profiles import apply_network_profile
+
 
 
 # 기존 모듈들 임포트 (루트에서)
@@ -50,6 +52,9 @@ class Step6_3Core:
     기존 코드의 기능을 유지하면서 모듈화
     """
     
+    # 네트워크 차단 프로필 (목록/설정 화면만 다루므로 이미지/웹폰트 차단)
+    NETWORK_PROFILE = 'list-only'
+    
     def __init__(self, driver=None):
         """
         초기화
@@ -58,6 +63,8 @@ class Step6_3Core:
             driver: 웹드라이버 인스턴스 (선택적)
         """
         self.driver = driver
+        if driver:
+            apply_network_profile(driver, self.NETWORK_PROFILE)
         self.browser_core = None
         self.login_handler = None
         self.menu_handler = None
@@ -91,6 +98,8 @@ class Step6_3Core:
                     logger.error("브라우저 초기화 실패")
                     return False
             
+            apply_network_profile(self.driver, self.NETWORK_PROFILE)
+            
             # 핸들러들 초기화
             self.login_handler = PercentyLogin(self.driver)
             self.menu_handler = MenuClicks(self.driver)
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+H~O열 액션 명령어 문법
+작업 시트 셀의 명령어("YES", "first:2", "last:1", "specific:1,3", "copy:5", "special:10",
+"first:1/last:1" 등)를 한 번만 컴파일하여 변경할 수 없는 실행 계획으로 만듭니다.
+
+- compile_action_command(): ProductEditorCore3 H~O열 명령어 (action/count/positions)
+- compile_translate_command(): 이미지 번역 핸들러 위치 명령어 (positions 토큰)
+- validate_task_actions(): 작업 행의 셀 오류를 브라우저 시작 전에 확인
+
+같은 셀 문자열은 프로세스당 한 번만 컴파일되고(lru_cache), 이후 상품마다 캐시된 계획을 씁니다.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 작업 딕셔너리 키 → (엑셀 열, 문법 종류)
+# M열은 HTML 내용이므로 검사하지 않음
+COLUMN_GRAMMARS = {
+    'h_data': ('H', 'action'),
+    'i_data': ('I', 'action'),
+    'j_data': ('J', 'action'),
+    'k_data': ('K', 'translate'),
+    'l_data': ('L', 'action'),
+    'n_data': ('N', 'translate'),
+    'o_data': ('O', 'translate'),
+}
+
+COUNT_PREFIXES = ('last', 'first', 'copy')
+
+
+@dataclass(frozen=True)
+class ActionPlan:
+    """
+    H~O열 명령어 실행 계획
+
+    action: 'yes', 'no', 'last', 'first', 'specific', 'copy', 'special', 'combined'
+    errors: 명령어가 잘못되어 'no'로 처리된 이유 (정상 셀은 빈 튜플)
+    """
+    action: str
+    count: Optional[int] = None
+    positions: Tuple = ()
+    max_position: Optional[int] = None
+    actions: Tuple['ActionPlan', ...] = ()
+    source: str = ''
+    errors: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict:
+        """기존 파서와 같은 형식의 액션 정보 딕셔너리 (호출마다 새 객체)"""
+        if self.action == 'combined':
+            return {'action': 'combined', 'actions': [plan.to_dict() for plan in self.actions]}
+        if self.action in COUNT_PREFIXES:
+            return {'action': self.action, 'count': self.count}
+        if self.action == 'specific':
+            return {'action': 'specific', 'positions': list(self.positions)}
+        if self.action == 'special':
+            return {'action': 'special', 'max_position': self.max_position}
+        return {'action': self.action}
+
+
+@dataclass(frozen=True)
+class TranslatePlan:
+    """
+    이미지 번역 위치 계획
+
+    positions 토큰: 위치 번호(int), 'last:N'(이미지 개수 확인 후 계산), 'sequential_all'(specific:all),
+    'auto_detect_chinese', 'special:N'(N번째까지 스캔)
+    """
+    positions: Tuple = ()
+    source: str = ''
+    errors: Tuple[str, ...] = ()
+
+    @property
+    def mode(self) -> str:
+        """처리 방식: 'special', 'auto_detect', 'sequential_all', 'positions', 'invalid'"""
+        if not self.positions:
+            return 'invalid'
+        if any(isinstance(pos, str) and pos.startswith('special:') for pos in self.positions):
+            return 'special'
+        if 'auto_detect_chinese' in self.positions:
+            return 'auto_detect'
+        if 'sequential_all' in self.positions:
+            return 'sequential_all'
+        return 'positions'
+
+    def to_dict(self) -> Optional[Dict]:
+        """기존 파서와 같은 형식의 액션 정보 (유효한 위치가 없으면 None)"""
+        if not self.positions:
+            return None
+        return {'type': 'image_translate', 'positions': list(self.positions)}
+
+
+def _no_action(source: str, error: str) -> ActionPlan:
+    return ActionPlan(action='no', source=source, errors=(error,))
+
+
+def _compile_single_action(text: str) -> ActionPlan:
+    """단일 명령어 컴파일 ('/' 없는 부분)"""
+    if ':' not in text:
+        # 구조화되지 않은 명령어는 기본적으로 YES로 처리
+        return ActionPlan(action='yes', source=text)
+
+    prefix, value = text.split(':', 1)
+    prefix = prefix.strip().lower()
+    value = value.strip()
+
+    if not value:
+        return _no_action(text, f"빈 값이 제공됨: {text}")
+
+    if prefix in COUNT_PREFIXES:
+        try:
+            count = int(value)
+        except ValueError:
+            return _no_action(text, f"잘못된 숫자 형식: {value}")
+        if count <= 0:
+            return _no_action(text, f"잘못된 카운트 값 (0 이하): {count}")
+        return ActionPlan(action=prefix, count=count, source=text)
+
+    if prefix == 'specific':
+        if value.lower() == 'all':
+            return ActionPlan(action='specific', positions=('all',), source=text)
+
+        positions = []
+        for pos_str in value.split(','):
+            pos_str = pos_str.strip()
+            if pos_str.lower() == 'all':
+                positions.append('all')
+                continue
+            try:
+                pos = int(pos_str)
+            except ValueError:
+                return _no_action(text, f"잘못된 위치 형식: {value}")
+            if pos <= 0:
+                return _no_action(text, f"잘못된 위치 값 (0 이하): {pos}")
+            positions.append(pos)
+        return ActionPlan(action='specific', positions=tuple(positions), source=text)
+
+    if prefix == 'special':
+        try:
+            max_position = int(value)
+        except ValueError:
+            return _no_action(text, f"잘못된 special 형식: {value}")
+        if max_position <= 0:
+            return _no_action(text, f"잘못된 special 값 (0 이하): {max_position}")
+        return ActionPlan(action='special', max_position=max_position, source=text)
+
+    return _no_action(text, f"알 수 없는 명령어 접두사: {prefix}")
+
+
+@lru_cache(maxsize=4096)
+def _compile_action_text(text: str) -> ActionPlan:
+    if not text or text.upper() == 'NO':
+        return ActionPlan(action='no', source=text)
+    if text.upper() == 'YES':
+        return ActionPlan(action='yes', source=text)
+
+    if '/' not in text:
+        return _compile_single_action(text)
+
+    # 슬래시로 구분된 복합 명령어 (예: "first:1/last:1")
+    actions = []
+    errors = []
+    for part in text.split('/'):
+        part = part.strip()
+        if not part:
+            continue
+        plan = _compile_single_action(part)
+        errors.extend(plan.errors)
+        if plan.action != 'no':
+            actions.append(plan)
+
+    if not actions:
+        errors.append(f"복합 명령어에서 유효한 액션을 찾을 수 없음: {text}")
+        return ActionPlan(action='no', source=text, errors=tuple(errors))
+    return ActionPlan(action='combined', actions=tuple(actions), source=text, errors=tuple(errors))
+
+
+def compile_action_command(data) -> ActionPlan:
+    """
+    H~O열 명령어 컴파일 (같은 문자열은 캐시된 계획 반환)
+
+    Args:
+        data: 셀 값 (예: "YES", "last:2", "specific:1,3", "copy:5", "first:1/last:1")
+
+    Returns:
+        ActionPlan: 실행 계획 (빈 셀/NO/잘못된 명령어는 action='no')
+    """
+    if not data:
+        return _compile_action_text('')
+    return _compile_action_text(str(data).strip())
+
+
+def _compile_translate_part(part: str) -> Tuple[List, List[str]]:
+    """'/' 없는 번역 명령어를 위치 토큰으로 변환"""
+    positions = []
+    errors = []
+    for pos in part.split(','):
+        pos = pos.strip()
+
+        if pos.isdigit():
+            positions.append(int(pos))
+        elif pos.startswith('first:'):
+            try:
+                # first:2는 1,2를 의미 (첫 번째부터 두 번째까지)
+                positions.extend(range(1, int(pos.split(':')[1]) + 1))
+            except (IndexError, ValueError):
+                errors.append(f"잘못된 first 형식: {pos}")
+        elif pos.startswith('last:'):
+            try:
+                # 실제 위치는 이미지 개수를 확인한 후 계산
+                positions.append(f"last:{int(pos.split(':')[1])}")
+            except (IndexError, ValueError):
+                errors.append(f"잘못된 last 형식: {pos}")
+        elif pos.startswith('specific:'):
+            try:
+                value = pos.split(':')[1]
+                positions.append('sequential_all' if value == 'all' else int(value))
+            except (IndexError, ValueError):
+                errors.append(f"잘못된 specific 형식: {pos}")
+        elif pos == 'auto_detect_chinese':
+            positions.append('auto_detect_chinese')
+        elif pos.startswith('special:'):
+            try:
+                positions.append(f"special:{int(pos.split(':')[1])}")
+            except (IndexError, ValueError):
+                errors.append(f"잘못된 special 형식: {pos}")
+        else:
+            errors.append(f"잘못된 이미지 위치 값: {pos}")
+    return positions, errors
+
+
+@lru_cache(maxsize=4096)
+def _compile_translate_text(text: str) -> TranslatePlan:
+    if not text.strip():
+        return TranslatePlan(source=text, errors=("이미지 번역 액션 값이 비어있음",))
+
+    positions = []
+    errors = []
+    parts = [part.strip() for part in text.split('/')] if '/' in text else [text]
+    for part in parts:
+        if not part:
+            continue
+        part_positions, part_errors = _compile_translate_part(part)
+        positions.extend(part_positions)
+        errors.extend(part_errors)
+
+    if not positions:
+        errors.append(f"유효한 이미지 위치가 없음: {text}")
+    return TranslatePlan(positions=tuple(positions), source=text, errors=tuple(errors))
+
+
+def compile_translate_command(action_value) -> TranslatePlan:
+    """
+    이미지 번역 위치 명령어 컴파일 (같은 문자열은 캐시된 계획 반환)
+
+    Args:
+        action_value: 액션 값 (예: "1,2,3", "first:2", "specific:all", "special:10", "first:1/last:1")
+
+    Returns:
+        TranslatePlan: 위치 토큰 계획 (positions가 비어 있으면 실행할 번역 없음)
+    """
+    return _compile_translate_text(str(action_value) if action_value else '')
+
+
+def validate_task_actions(task: Dict) -> List[Tuple[str, str, str]]:
+    """
+    작업 행의 H~O열 명령어 검사
+
+    Args:
+        task: 작업 딕셔너리 (h_data~o_data)
+
+    Returns:
+        list: (열, 셀 값, 오류 메시지) 목록 (문제가 없으면 빈 목록)
+    """
+    problems = []
+    for key, (column, grammar) in COLUMN_GRAMMARS.items():
+        value = task.get(key)
+        if not value:
+            continue
+
+        plan = compile_action_command(value)
+        for error in plan.errors:
+            problems.append((column, str(value), error))
+        if grammar != 'translate' or plan.action == 'no':
+            continue
+
+        if plan.action == 'combined':
+            # 복합 번역은 부분별로 번역 명령어를 다시 만들며 copy는 지원하지 않음
+            for part in plan.actions:
+                if part.action == 'copy':
+                    problems.append((column, str(value), f"{column}열 번역에서 지원하지 않는 명령어: {part.source}"))
+        else:
+            # 단일 명령어는 셀 값 그대로 이미지 번역 핸들러에 전달됨
+            for error in compile_translate_command(value).errors:
+                problems.append((column, str(value), error))
+    return problems
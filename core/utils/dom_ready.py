@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+DOM 준비 대기
+탭 전환/모달 열기·닫기/목록 재렌더링 후의 고정 time.sleep(DELAY_*) 대신,
+페이지에 MutationObserver + requestAnimationFrame 안정화 검사를 주입하여
+조건이 만족되고 DOM 변경이 잠잠해지는 즉시 반환합니다.
+
+기존 지연 상수는 최대 대기 시간(timeout)으로 사용하므로 최악의 경우에도 기존보다 오래 기다리지 않습니다.
+스크립트 실행에 실패하면 기존처럼 timeout만큼 sleep합니다.
+
+사용 예:
+    wait_tab_active(driver, DELAY_LONG)
+    wait_modal_open(driver, DELAY_SHORT)
+    wait_modal_closed(driver, DELAY_SHORT)
+    wait_list_rerendered(driver, DELAY_MEDIUM)
+    wait_spinner_gone(driver, DELAY_MEDIUM)
+"""
+
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# DOM 변경이 이 시간(ms) 동안 없으면 안정된 것으로 판단
+DEFAULT_QUIET_MS = 150
+
+# 스크립트 타임아웃 여유 시간(초)
+SCRIPT_TIMEOUT_MARGIN = 2.0
+
+# 조건 검사 + 안정화 대기 스크립트 (execute_async_script)
+# arguments: condition, arg, timeout_ms, quiet_ms, root_selector, callback
+_SETTLE_PROBE_SCRIPT = """
+var condition = arguments[0], arg = arguments[1], timeoutMs = arguments[2],
+    quietMs = arguments[3], rootSelector = arguments[4], done = arguments[arguments.length - 1];
+var start = performance.now(), lastMutation = start, finished = false, observer = null;
+
+function visible(el) {
+    if (!el || !el.getClientRects().length) return false;
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+}
+function anyVisible(selector) {
+    var nodes = document.querySelectorAll(selector);
+    for (var i = 0; i < nodes.length; i++) { if (visible(nodes[i])) return true; }
+    return false;
+}
+var MODAL = '.ant-modal-wrap .ant-modal, .ant-drawer-open .ant-drawer-content, div[role="dialog"]';
+var SPINNER = '.ant-spin-spinning, .ant-spin-nested-loading > div > .ant-spin';
+
+function satisfied() {
+    switch (condition) {
+        case 'tab_active':
+            var tabs = document.querySelectorAll('.ant-tabs-tab-active');
+            if (!tabs.length) return false;
+            if (!arg) return true;
+            for (var i = 0; i < tabs.length; i++) {
+                if (visible(tabs[i]) && tabs[i].textContent.indexOf(arg) !== -1) return true;
+            }
+            return false;
+        case 'modal_open': return anyVisible(MODAL);
+        case 'modal_closed': return !anyVisible(MODAL);
+        case 'spinner_gone': return !anyVisible(SPINNER);
+        case 'selector_present': return anyVisible(arg);
+        case 'selector_absent': return !anyVisible(arg);
+        default: return true;
+    }
+}
+function finish(ok, reason) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    done({ok: ok, reason: reason, elapsed: Math.round(performance.now() - start)});
+}
+function tick() {
+    if (finished) return;
+    var now = performance.now();
+    if (now - start >= timeoutMs) { finish(false, 'timeout'); return; }
+    if (now - lastMutation >= quietMs && satisfied()) {
+        // 다음 프레임까지 그려진 뒤 반환
+        requestAnimationFrame(function () { finish(true, 'settled'); });
+        return;
+    }
+    if (document.hidden) { setTimeout(tick, 16); } else { requestAnimationFrame(tick); }
+}
+
+var root = (rootSelector && document.querySelector(rootSelector)) || document.documentElement;
+try {
+    observer = new MutationObserver(function () { lastMutation = performance.now(); });
+    observer.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+} catch (e) {}
+tick();
+"""
+
+
+def ensure_script_timeout(driver, seconds: float):
+    """비동기 스크립트 타임아웃을 더 길게 필요할 때만 변경 (호출마다 왕복하지 않도록)"""
+    if getattr(driver, '_dom_ready_script_timeout', 0) < seconds:
+        driver.set_script_timeout(seconds)
+        driver._dom_ready_script_timeout = seconds
+
+
+def wait_for_dom(driver, condition: str = 'settled', timeout: float = 2.0, arg: str = None,
+                 quiet_ms: int = DEFAULT_QUIET_MS, root_selector: str = None) -> bool:
+    """
+    조건이 만족되고 DOM 변경이 quiet_ms 동안 없을 때까지 대기
+
+    Args:
+        driver: Selenium WebDriver
+        condition: 'settled', 'tab_active', 'modal_open', 'modal_closed', 'spinner_gone',
+            'selector_present', 'selector_absent'
+        timeout: 최대 대기 시간(초) - 기존 고정 지연 상수
+        arg: 조건 인자 (탭 텍스트 또는 CSS 선택자)
+        quiet_ms: 안정화 판단 시간(ms)
+        root_selector: 변경을 감시할 루트 요소 CSS 선택자 (None이면 문서 전체)
+
+    Returns:
+        bool: 제한 시간 안에 준비되었는지 여부
+    """
+    if driver is None or timeout <= 0:
+        return False
+
+    start_time = time.time()
+    try:
+        ensure_script_timeout(driver, timeout + SCRIPT_TIMEOUT_MARGIN)
+        result = driver.execute_async_script(
+            _SETTLE_PROBE_SCRIPT, condition, arg, int(timeout * 1000), int(quiet_ms), root_selector
+        ) or {}
+        ready = bool(result.get('ok'))
+        logger.debug(f"DOM 대기 ({condition}{'=' + arg if arg else ''}): {result.get('reason')} "
+                     f"{result.get('elapsed')}ms / 최대 {timeout}초")
+        return ready
+    except Exception as e:
+        # 스크립트 주입 실패 시 기존 고정 대기와 동일하게 동작
+        remaining = timeout - (time.time() - start_time)
+        logger.debug(f"DOM 대기 스크립트 실패, 고정 대기로 대체 ({remaining:.2f}초): {e}")
+        if remaining > 0:
+            time.sleep(remaining)
+        return False
+
+
+def wait_settled(driver, timeout: float, root_selector: str = None) -> bool:
+    """DOM 변경이 잠잠해질 때까지 대기"""
+    return wait_for_dom(driver, 'settled', timeout, root_selector=root_selector)
+
+
+def wait_tab_active(driver, timeout: float, tab_text: str = None) -> bool:
+    """탭 전환 완료 대기 (활성 탭 표시 + 탭 내용 렌더링 안정화)"""
+    return wait_for_dom(driver, 'tab_active', timeout, arg=tab_text)
+
+
+def wait_modal_open(driver, timeout: float) -> bool:
+    """모달/드로어가 보이고 내용 렌더링이 안정될 때까지 대기"""
+    return wait_for_dom(driver, 'modal_open', timeout)
+
+
+def wait_modal_closed(driver, timeout: float) -> bool:
+    """보이는 모달/드로어가 모두 사라질 때까지 대기"""
+    return wait_for_dom(driver, 'modal_closed', timeout)
+
+
+def wait_list_rerendered(driver, timeout: float, list_selector: str = None) -> bool:
+    """검색/그룹 이동 후 상품 목록 재렌더링 완료 대기 (로딩 스피너 사라짐 + 안정화)"""
+    return wait_for_dom(driver, 'spinner_gone', timeout, root_selector=list_selector)
+
+
+def wait_spinner_gone(driver, timeout: float) -> bool:
+    """ant-design 로딩 스피너가 사라질 때까지 대기"""
+    return wait_for_dom(driver, 'spinner_gone', timeout)
+
+
+def wait_selector(driver, selector: str, timeout: float, present: bool = True) -> bool:
+    """CSS 선택자 요소가 보이거나(present=True) 사라질 때까지 대기"""
+    return wait_for_dom(driver, 'selector_present' if present else 'selector_absent', timeout, arg=selector)
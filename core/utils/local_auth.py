@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+로컬 RPC 인증 키 관리
+배치 워커 데몬/OCR 서버는 multiprocessing.connection(pickle)으로 요청을 주고받으므로,
+인증 키를 아는 프로세스는 서버 안에서 코드를 실행할 수 있습니다.
+고정 문자열 대신 처음 실행할 때 무작위 키를 만들어 cache/auth/<이름>.key(0600)에 저장하고
+서버와 클라이언트가 같은 파일을 읽습니다.
+
+- 서버: load_authkey(name, create=True) - 파일이 없으면 생성, 읽거나 만들 수 없으면 None (서버는 시작하지 않음)
+- 클라이언트: load_authkey(name) - 파일이 없으면 None (서버가 아직 실행된 적 없음)
+- 환경 변수(예: PERCENTY_WORKER_AUTHKEY)에 키를 지정하면 파일 대신 사용합니다.
+"""
+
+import os
+import stat
+import secrets
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+AUTH_DIR = os.path.join(PROJECT_ROOT, "cache", "auth")
+
+# 생성할 키 길이(바이트, 16진수 문자열로 저장)
+KEY_BYTES = 32
+
+
+def authkey_path(name: str) -> str:
+    """인증 키 파일 경로"""
+    return os.path.join(AUTH_DIR, f"{name}.key")
+
+
+def _read_key(path: str) -> Optional[bytes]:
+    """키 파일 읽기 (다른 사용자가 읽을 수 있는 권한이면 거부)"""
+    if os.name == 'posix':
+        mode = os.stat(path).st_mode
+        if mode & (stat.S_IRWXG | stat.S_IRWXO):
+            logger.error(f"인증 키 파일 권한이 너무 넓습니다 (0600 필요): {path} ({oct(stat.S_IMODE(mode))})")
+            return None
+
+    with open(path, 'rb') as f:
+        key = f.read().strip()
+    if not key:
+        logger.error(f"인증 키 파일이 비어 있습니다: {path}")
+        return None
+    return key
+
+
+def _create_key(path: str) -> Optional[bytes]:
+    """무작위 키를 0600 파일로 생성 (동시에 생성되면 먼저 만든 키 사용)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    key = secrets.token_hex(KEY_BYTES).encode('ascii')
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return _read_key(path)
+
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    logger.info(f"인증 키 생성: {path}")
+    return key
+
+
+def load_authkey(name: str, env_var: str = None, create: bool = False) -> Optional[bytes]:
+    """
+    로컬 RPC 인증 키
+
+    Args:
+        name: 키 이름 (파일명)
+        env_var: 키를 직접 지정하는 환경 변수 이름
+        create: 파일이 없으면 새로 생성 (서버 쪽에서만 True)
+
+    Returns:
+        bytes: 인증 키 (없거나 읽을 수 없으면 None)
+    """
+    if env_var:
+        value = os.getenv(env_var, '').strip()
+        if value:
+            return value.encode('utf-8')
+
+    path = authkey_path(name)
+    try:
+        return _read_key(path)
+    except FileNotFoundError:
+        if not create:
+            return None
+    except OSError as e:
+        logger.error(f"인증 키 파일 읽기 실패: {path} - {e}")
+        return None
+
+    try:
+        return _create_key(path)
+    except OSError as e:
+        logger.error(f"인증 키 파일 생성 실패: {path} - {e}")
+        return None
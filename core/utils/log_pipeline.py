@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+"""
+비동기 로그 파이프라인
+자동화 스레드는 로그 레코드를 큐에 넣기만 하고(QueueHandler), 파일/콘솔 기록과 메시지 포맷은
+기록 스레드 하나(QueueListener)가 처리합니다.
+
+- 구조화 로그: logs/structured/{세션}.jsonl에 한 줄(JSON)씩 기록하며 account/step/chunk/product 필드를 포함
+  (set_log_context로 스레드별 지정, AccountLogger는 extra로 account 지정)
+- 지연 포맷: %-스타일 인자(logger.info("... %s", value))가 불변 기본형(str, int, float, bool, None, bytes)이면
+  기록 스레드에서 문자열로 만듦. 그 외 인자(dict, list, 객체 등)는 기록 전에 바뀔 수 있으므로 큐에 넣을 때 포맷
+- 모듈별 레벨/속도 제한: 로그 프로필(default, debug, production)로 지정.
+  루트 로거(logging.info)를 쓰는 모듈도 파일 이름(record.module) 기준으로 적용됩니다.
+  경고 이상은 속도 제한으로 버리지 않습니다.
+- 계정별/통합 로그 파일처럼 propagate=False인 로거는 attach()로 전용 핸들러를 등록하면
+  같은 기록 스레드에서 해당 파일로 보냅니다.
+
+사용: configure_logging(profile='production') 또는 batch_cli.py --log-profile production
+"""
+
+import os
+import copy
+import json
+import time
+import atexit
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from collections.abc import Mapping
+from queue import SimpleQueue
+from typing import Dict, List, Optional
+
+CONTEXT_FIELDS = ('account', 'step', 'chunk', 'product')
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+@dataclass(frozen=True)
+class LogProfile:
+    """로그 프로필 (기본 레벨, 모듈별 레벨, 모듈별 초당 기록 수 제한)"""
+    name: str
+    level: int = logging.INFO
+    module_levels: Dict[str, int] = field(default_factory=dict)
+    rate_limits: Dict[str, float] = field(default_factory=dict)
+
+    def _match(self, table: Dict, key: str):
+        """가장 긴 접두사가 일치하는 항목"""
+        best = None
+        for prefix in table:
+            if key.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return best
+
+    def level_for(self, key: str) -> int:
+        prefix = self._match(self.module_levels, key)
+        return self.module_levels[prefix] if prefix is not None else self.level
+
+    def rate_for(self, key: str) -> Optional[float]:
+        prefix = self._match(self.rate_limits, key)
+        return self.rate_limits[prefix] if prefix is not None else None
+
+
+# 브라우저/클릭 헬퍼의 단계별 진행 로그는 운영 실행에서 경고 이상만 남김
+_CHATTY_MODULES = (
+    'browser_core', 'login_percenty', 'core.browser', 'modal_blocker', 'modal_core',
+    'percenty_utils', 'channel_talk_utils', 'click_utils', 'dom_utils', 'menu_clicks',
+    'dropdown_utils', 'human_delay', 'core.utils.dom_ready', 'core.utils.ocr_service',
+)
+
+LOG_PROFILES: Dict[str, LogProfile] = {
+    profile.name: profile for profile in (
+        LogProfile('default'),
+        LogProfile('debug', level=logging.DEBUG),
+        LogProfile(
+            'production',
+            module_levels={module: logging.WARNING for module in _CHATTY_MODULES},
+            rate_limits={'': 20.0, 'account_': 10.0, 'product_editor_core': 5.0, 'image_translation': 5.0},
+        ),
+    )
+}
+
+DEFAULT_PROFILE = 'default'
+
+
+# ---------------------------------------------------------------------- 컨텍스트
+
+_context = threading.local()
+
+
+def set_log_context(**context):
+    """
+    현재 스레드의 로그 컨텍스트 지정 (account, step, chunk, product)
+
+    값이 None이면 해당 항목을 지웁니다.
+    """
+    current = dict(getattr(_context, 'values', {}))
+    for key, value in context.items():
+        if value is None:
+            current.pop(key, None)
+        else:
+            current[key] = value
+    _context.values = current
+
+
+def clear_log_context():
+    """현재 스레드의 로그 컨텍스트 초기화"""
+    _context.values = {}
+
+
+def _record_key(record: logging.LogRecord) -> str:
+    """모듈별 설정 조회 키 (루트 로거 호출은 파일 이름)"""
+    return record.module if record.name == 'root' else record.name
+
+
+class _ContextFilter(logging.Filter):
+    """호출 스레드의 컨텍스트를 레코드에 복사 (extra로 지정한 값이 우선)"""
+
+    def filter(self, record):
+        values = getattr(_context, 'values', {})
+        for key in CONTEXT_FIELDS:
+            if not hasattr(record, key):
+                setattr(record, key, values.get(key))
+        return True
+
+
+class _ProfileFilter(logging.Filter):
+    """모듈별 레벨과 초당 기록 수 제한 (토큰 버킷, 경고 이상은 항상 통과)"""
+
+    def __init__(self, profile: LogProfile):
+        super().__init__()
+        self.profile = profile
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, List[float]] = {}  # key -> [tokens, last_time]
+        self._suppressed: Dict[str, int] = {}
+
+    def filter(self, record):
+        key = _record_key(record)
+        if record.levelno < self.profile.level_for(key):
+            return False
+        if record.levelno >= logging.WARNING:
+            return True
+
+        rate = self.profile.rate_for(key)
+        if not rate:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(key, [rate, now])
+            bucket[0] = min(rate, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False
+            bucket[0] -= 1
+            suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+    def suppressed_total(self) -> int:
+        with self._lock:
+            return sum(self._suppressed.values())
+
+
+# 기록 스레드까지 값이 바뀌지 않는 인자 타입 (포맷 지연 가능)
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+class _LazyQueueHandler(QueueHandler):
+    """
+    메시지 포맷을 기록 스레드로 미루는 QueueHandler (같은 프로세스 큐 전용)
+
+    인자가 모두 불변 기본형일 때만 포맷을 미룹니다. 변경 가능한 인자(dict, list, 객체)는
+    호출 스레드가 곧바로 수정할 수 있으므로 큐에 넣기 전에 메시지를 만듭니다.
+    """
+
+    def prepare(self, record):
+        args = record.args
+        if not args:
+            return record
+        # 단일 dict 인자(%(key)s 형식)는 dict 자체가 변경 가능하므로 항상 바로 포맷
+        if not isinstance(args, Mapping) and all(isinstance(value, _IMMUTABLE_ARG_TYPES) for value in args):
+            return record
+
+        try:
+            message = record.getMessage()
+        except Exception:
+            # 포맷 오류는 기록 스레드의 핸들러가 평소처럼 보고
+            return record
+        record = copy.copy(record)
+        record.msg = message
+        record.args = None
+        return record
+
+
+# ---------------------------------------------------------------------- 포맷터
+
+class JsonLinesFormatter(logging.Formatter):
+    """JSON 한 줄 형식 (ts, level, logger, module, thread, msg, 컨텍스트 필드)"""
+
+    def format(self, record):
+        data = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'thread': record.threadName,
+            'msg': record.getMessage(),
+        }
+        for key in CONTEXT_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                data[key] = value
+        if getattr(record, 'suppressed', 0):
+            data['suppressed'] = record.suppressed
+        if record.exc_info:
+            data['exc'] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _RouteHandler(logging.Handler):
+    """기록 스레드에서 로거별 전용 핸들러 또는 기본 핸들러로 분배"""
+
+    def __init__(self, pipeline: 'LogPipeline'):
+        super().__init__()
+        self.pipeline = pipeline
+
+    def handle(self, record):
+        handlers = self.pipeline._routes.get(record.name, self.pipeline._default_handlers)
+        for handler in list(handlers) + list(self.pipeline._structured_handlers):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record):
+        self.handle(record)
+
+
+# ---------------------------------------------------------------------- 파이프라인
+
+class LogPipeline:
+    """큐 기반 로그 파이프라인 (기록 스레드 하나)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queue = SimpleQueue()
+        self._listener: Optional[QueueListener] = None
+        self._atexit_registered = False
+        self._routes: Dict[str, List[logging.Handler]] = {}
+        self._default_handlers: List[logging.Handler] = []
+        self._structured_handlers: List[logging.Handler] = []
+        self.profile = LOG_PROFILES[DEFAULT_PROFILE]
+        self._profile_filter = _ProfileFilter(self.profile)
+        self.queue_handler = _LazyQueueHandler(self._queue)
+        self.queue_handler.addFilter(_ContextFilter())
+        self.queue_handler.addFilter(self._profile_filter)
+
+    @property
+    def running(self) -> bool:
+        return self._listener is not None
+
+    def start(self):
+        """기록 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = QueueListener(self._queue, _RouteHandler(self))
+            self._listener.start()
+            if not self._atexit_registered:
+                atexit.register(self.stop)
+                self._atexit_registered = True
+
+    def stop(self):
+        """큐에 남은 레코드를 모두 기록하고 기록 스레드 종료"""
+        suppressed = self._profile_filter.suppressed_total()
+        if suppressed and self.running:
+            logging.getLogger(__name__).warning(f"속도 제한으로 생략된 로그 {suppressed}건")
+        with self._lock:
+            listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        listener.stop()
+        handlers = {id(h): h for h in self._default_handlers + self._structured_handlers}
+        for route in self._routes.values():
+            handlers.update({id(h): h for h in route})
+        for handler in handlers.values():
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+    def set_profile(self, name: str):
+        """
+        로그 프로필 적용
+
+        Raises:
+            ValueError: 알 수 없는 프로필 이름
+        """
+        if name not in LOG_PROFILES:
+            raise ValueError(f"알 수 없는 로그 프로필: {name} (사용 가능: {', '.join(LOG_PROFILES)})")
+        self.profile = LOG_PROFILES[name]
+        self._profile_filter.profile = self.profile
+
+    def attach(self, logger: logging.Logger, handlers: List[logging.Handler]):
+        """
+        전용 핸들러를 가진 로거를 파이프라인에 연결 (계정별/통합 로그 파일 등)
+
+        기존 핸들러는 제거하고, 레코드는 큐를 거쳐 handlers로만 기록됩니다 (구조화 로그에도 포함).
+        """
+        self.start()
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+        for handler in self._routes.get(logger.name, []):
+            if handler not in handlers:
+                handler.close()
+        self._routes[logger.name] = list(handlers)
+        logger.addHandler(self.queue_handler)
+        logger.propagate = False
+
+    def detach(self, logger: logging.Logger):
+        """attach()로 연결한 로거 해제 및 전용 핸들러 닫기"""
+        logger.removeHandler(self.queue_handler)
+        for handler in self._routes.pop(logger.name, []):
+            handler.close()
+
+    def configure_root(self, profile: str = DEFAULT_PROFILE, log_dir: str = "logs", console: bool = True,
+                       structured: bool = True) -> Optional[str]:
+        """
+        루트 로거를 파이프라인으로 교체
+
+        Args:
+            profile: 로그 프로필 이름
+            log_dir: 로그 디렉토리
+            console: 콘솔 출력 여부
+            structured: JSON lines 구조화 로그 기록 여부
+
+        Returns:
+            str: 구조화 로그 파일 경로 (기록하지 않으면 None)
+        """
+        self.set_profile(profile)
+
+        default_handlers = []
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+            default_handlers.append(console_handler)
+        self._default_handlers = default_handlers
+
+        structured_file = None
+        if structured:
+            structured_dir = Path(log_dir) / "structured"
+            structured_dir.mkdir(parents=True, exist_ok=True)
+            structured_file = structured_dir / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.jsonl"
+            json_handler = logging.FileHandler(structured_file, encoding='utf-8')
+            json_handler.setFormatter(JsonLinesFormatter())
+            self._structured_handlers = [json_handler]
+
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.addHandler(self.queue_handler)
+        root.setLevel(self.profile.level)
+        self.start()
+        return str(structured_file) if structured_file else None
+
+
+# 프로세스 전역 로그 파이프라인
+log_pipeline = LogPipeline()
+
+
+def configure_logging(profile: str = DEFAULT_PROFILE, log_dir: str = "logs", console: bool = True) -> Optional[str]:
+    """루트 로거를 비동기 파이프라인으로 설정 (log_pipeline.configure_root)"""
+    return log_pipeline.configure_root(profile=profile, log_dir=log_dir, console=console)
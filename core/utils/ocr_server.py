@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+OCR 서버
+EasyOCR 모델 하나를 별도 프로세스에 상주시키고, 여러 계정 워커(스레드/프로세스)의
+OCR 요청을 로컬 소켓으로 받아 처리합니다.
+
+- 계정 수가 늘어나도 모델은 서버 프로세스에 하나만 올라갑니다.
+- CPU를 많이 쓰는 OCR이 Selenium 자동화 스레드와 같은 GIL을 두고 경합하지 않습니다.
+- 대기열에 쌓인 요청은 한 번에 꺼내 같은 크기 이미지끼리 묶어 처리합니다.
+- 요청이 idle_timeout 동안 없으면 스스로 종료합니다 (다음 warm_up에서 다시 실행).
+- 인증: 처음 실행할 때 만든 무작위 키 파일(cache/auth/ocr_server.key, 0600)을 서버와 클라이언트가 공유
+
+실행: python -m core.utils.ocr_server
+"""
+
+import os
+import sys
+import time
+import queue
+import logging
+import threading
+import subprocess
+from typing import Dict, List
+from multiprocessing.connection import Listener, Client
+
+# 루트 디렉토리를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.utils.local_auth import load_authkey
+
+logger = logging.getLogger(__name__)
+
+# 기본 접속 정보 (로컬 전용)
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = int(os.getenv("PERCENTY_OCR_PORT", "47532"))
+
+# 인증 키 (cache/auth/ocr_server.key, 환경 변수로 직접 지정 가능)
+AUTHKEY_NAME = "ocr_server"
+AUTHKEY_ENV = "PERCENTY_OCR_AUTHKEY"
+
+# 요청이 없으면 서버를 종료하는 시간(초, 0이면 종료하지 않음)
+DEFAULT_IDLE_TIMEOUT = float(os.getenv("PERCENTY_OCR_IDLE_TIMEOUT", "600"))
+
+
+def _to_plain_results(results) -> List:
+    """EasyOCR 결과를 프로세스 간 전송 가능한 기본 타입으로 변환"""
+    plain = []
+    for bbox, text, confidence in results:
+        plain.append(([[float(x), float(y)] for x, y in bbox], str(text), float(confidence)))
+    return plain
+
+
+class OCRServer:
+    """
+    공유 OCR 서버
+
+    연결마다 수신 스레드가 요청을 대기열에 넣고, 단일 OCR 스레드가
+    대기열을 묶음 단위로 꺼내 처리한 뒤 결과를 돌려줍니다.
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 authkey: bytes = None, batch_window: float = 0.05, max_batch: int = 8,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """
+        초기화
+
+        Args:
+            host: 바인드 주소 (로컬 전용)
+            port: 바인드 포트
+            authkey: 클라이언트 인증 키 (None이면 키 파일, 없으면 생성)
+            batch_window: 첫 요청 이후 묶음에 추가 요청을 기다리는 시간(초)
+            max_batch: 한 번에 처리할 최대 요청 수
+            idle_timeout: 요청이 없을 때 서버를 종료하기까지의 시간(초, 0이면 종료하지 않음)
+
+        Raises:
+            RuntimeError: 인증 키를 읽거나 만들 수 없는 경우
+        """
+        authkey = authkey or load_authkey(AUTHKEY_NAME, AUTHKEY_ENV, create=True)
+        if not authkey:
+            raise RuntimeError("OCR 서버 인증 키가 없어 서버를 시작하지 않습니다")
+
+        # 서버 프로세스는 모델을 직접 로딩해야 하므로 원격 모드를 끈다
+        from core.utils.ocr_service import ocr_service
+        ocr_service.use_server = False
+
+        self.ocr_service = ocr_service
+        self.address = (host, port)
+        self.authkey = authkey
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.idle_timeout = idle_timeout
+
+        self._requests: queue.Queue = queue.Queue()
+        self._running = False
+        self._processed = 0
+        self._last_activity = time.time()
+
+    def serve_forever(self):
+        """요청 수신 루프 (shutdown 요청 시 종료)"""
+        if not self.ocr_service.warm_up():
+            logger.error("EasyOCR 모델을 로딩할 수 없어 OCR 서버를 시작하지 않습니다")
+            return
+
+        self._running = True
+        threading.Thread(target=self._ocr_loop, name="ocr-server-worker", daemon=True).start()
+
+        logger.info(f"OCR 서버 시작: {self.address[0]}:{self.address[1]} (pid: {os.getpid()})")
+
+        with Listener(self.address, authkey=self.authkey) as listener:
+            while self._running:
+                try:
+                    conn = listener.accept()
+                except Exception as e:
+                    if self._running:
+                        logger.warning(f"클라이언트 연결 수락 실패: {e}")
+                    continue
+
+                threading.Thread(target=self._handle_connection, args=(conn,), daemon=True).start()
+
+        self.ocr_service.release()
+        logger.info("OCR 서버 종료 완료")
+
+    def _handle_connection(self, conn):
+        """클라이언트 연결 처리 (요청 1건 = 응답 1건)"""
+        try:
+            while True:
+                try:
+                    request = conn.recv()
+                except EOFError:
+                    break
+
+                action = request.get('action')
+                self._last_activity = time.time()
+                if action == 'readtext':
+                    response = self._submit(request.get('image'), request.get('kwargs') or {})
+                elif action == 'ping':
+                    response = {'ok': True, 'pid': os.getpid(), 'processed': self._processed,
+                                'pending': self._requests.qsize()}
+                elif action == 'shutdown':
+                    response = {'ok': True}
+                else:
+                    response = {'ok': False, 'error': f"알 수 없는 요청: {action}"}
+
+                conn.send(response)
+
+                if action == 'shutdown':
+                    self._request_shutdown()
+                    break
+        finally:
+            conn.close()
+
+    def _submit(self, image, kwargs: Dict) -> Dict:
+        """OCR 요청을 대기열에 넣고 처리 완료까지 대기"""
+        item = {'image': image, 'kwargs': kwargs, 'done': threading.Event(), 'response': None}
+        self._requests.put(item)
+        item['done'].wait()
+        return item['response']
+
+    def _ocr_loop(self):
+        """대기열의 요청을 묶음 단위로 처리"""
+        while self._running:
+            try:
+                first = self._requests.get(timeout=1.0)
+            except queue.Empty:
+                if self.idle_timeout and time.time() - self._last_activity > self.idle_timeout:
+                    logger.info(f"{self.idle_timeout:.0f}초 동안 요청이 없어 OCR 서버를 종료합니다")
+                    self._request_shutdown()
+                continue
+
+            batch = [first]
+            deadline = time.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._process_batch(batch)
+
+    def _process_batch(self, batch: List[Dict]):
+        """옵션 없이 들어온 같은 크기 이미지는 readtext_batched로, 나머지는 개별 처리"""
+        reader = self.ocr_service.get_reader()
+        groups: Dict = {}
+        for item in batch:
+            shape = getattr(item['image'], 'shape', None)
+            key = shape if shape is not None and not item['kwargs'] else id(item)
+            groups.setdefault(key, []).append(item)
+
+        for items in groups.values():
+            start_time = time.time()
+            try:
+                if len(items) > 1 and hasattr(reader, 'readtext_batched'):
+                    results_list = reader.readtext_batched([item['image'] for item in items])
+                else:
+                    results_list = [reader.readtext(item['image'], **item['kwargs']) for item in items]
+
+                for item, results in zip(items, results_list):
+                    item['response'] = {'ok': True, 'results': _to_plain_results(results)}
+            except Exception as e:
+                logger.error(f"OCR 처리 중 오류: {e}")
+                for item in items:
+                    item['response'] = {'ok': False, 'error': str(e)}
+            finally:
+                self._processed += len(items)
+                self._last_activity = time.time()
+                for item in items:
+                    item['done'].set()
+
+            logger.debug(f"OCR 묶음 처리: {len(items)}건 ({time.time() - start_time:.2f}초)")
+
+    def _request_shutdown(self):
+        """수신 루프 종료 요청 (대기 중인 accept를 깨우기 위해 자기 자신에게 접속)"""
+        self._running = False
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except Exception:
+            pass
+
+
+class OCRClient:
+    """OCR 서버 클라이언트"""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, authkey: bytes = None):
+        self.address = (host, port)
+        self.authkey = authkey
+
+    def _request(self, action: str, **kwargs) -> Dict:
+        """요청 1건 전송 및 응답 수신"""
+        # 키 파일은 서버가 처음 실행될 때 만들어지므로 접속할 때 읽음
+        if not self.authkey:
+            self.authkey = load_authkey(AUTHKEY_NAME, AUTHKEY_ENV)
+            if not self.authkey:
+                raise ConnectionError("OCR 서버 인증 키가 없습니다 (서버가 실행된 적 없음)")
+
+        conn = Client(self.address, authkey=self.authkey)
+        try:
+            request = {'action': action}
+            request.update(kwargs)
+            conn.send(request)
+            response = conn.recv()
+        finally:
+            conn.close()
+
+        if not response.get('ok'):
+            raise RuntimeError(response.get('error', 'OCR 서버 요청 실패'))
+        return response
+
+    def is_available(self) -> bool:
+        """서버 실행 여부"""
+        try:
+            self._request('ping')
+            return True
+        except Exception:
+            return False
+
+    def readtext(self, image, **kwargs) -> List:
+        """
+        서버에서 텍스트 인식
+
+        Returns:
+            list: (bbox, text, confidence) 목록 (easyocr.Reader.readtext와 같은 형식)
+        """
+        return self._request('readtext', image=image, kwargs=kwargs)['results']
+
+    def shutdown(self):
+        """서버 종료"""
+        self._request('shutdown')
+
+
+def start_server_process(wait_timeout: float = 120.0) -> bool:
+    """
+    OCR 서버 프로세스를 백그라운드로 실행하고 응답할 때까지 대기
+
+    이미 실행 중이면 바로 True를 반환합니다.
+
+    Args:
+        wait_timeout: 모델 로딩을 포함한 최대 대기 시간(초)
+
+    Returns:
+        bool: 서버 사용 가능 여부
+    """
+    client = OCRClient()
+    if client.is_available():
+        return True
+
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    creationflags = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "core.utils.ocr_server"],
+        cwd=project_root,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        creationflags=creationflags
+    )
+    logger.info(f"OCR 서버 프로세스 시작 (pid: {process.pid})")
+
+    deadline = time.time() + wait_timeout
+    while time.time() < deadline:
+        if client.is_available():
+            return True
+        if process.poll() is not None:
+            # 다른 프로세스가 먼저 포트를 잡았을 수 있으므로 한 번 더 확인
+            return client.is_available()
+        time.sleep(1.0)
+
+    logger.warning(f"OCR 서버가 {wait_timeout}초 내에 응답하지 않습니다")
+    return False
+
+
+def main():
+    """OCR 서버 실행"""
+    log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(os.path.join(log_dir, "ocr_server.log"), encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+
+    try:
+        OCRServer().serve_forever()
+    except RuntimeError as e:
+        logger.error(f"OCR 서버 시작 실패: {e}")
+        sys.exit(1)
+    except OSError as e:
+        logger.error(f"OCR 서버 시작 실패 (이미 실행 중일 수 있음): {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+OCR 서비스
+EasyOCR 리더를 프로세스당 하나만, 처음 사용할 때 로딩하여 공유합니다.
+모듈 임포트만으로는 모델을 올리지 않으므로 이미지 번역을 하지 않는 단계의
+시작 시간과 메모리 사용량이 줄어듭니다.
+
+OCR 서버(core.utils.ocr_server)가 실행 중이면 모델을 직접 올리지 않고
+서버로 요청을 보내므로, 여러 계정 워커가 모델 하나를 공유합니다.
+"""
+
+import gc
+import os
+import time
+import logging
+import threading
+import importlib.util
+from typing import Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# 서버 접속 실패 후 재확인까지 대기 시간(초)
+SERVER_RECHECK_INTERVAL = 30.0
+
+
+class OCRService:
+    """EasyOCR 리더 지연 로딩 및 공유 관리 클래스"""
+
+    def __init__(self, languages: Sequence[str] = ('ch_sim',), gpu: bool = False, use_server: bool = None):
+        """
+        OCR 서비스 초기화 (모델은 로딩하지 않음)
+
+        Args:
+            languages: EasyOCR 언어 목록 (기본값: 중문 간체)
+            gpu: GPU 사용 여부
+            use_server: OCR 서버 사용 여부 (None이면 PERCENTY_OCR_SERVER 환경변수, 기본 사용)
+        """
+        if use_server is None:
+            use_server = os.getenv("PERCENTY_OCR_SERVER", "1") != "0"
+        self.use_server = use_server
+        self.languages = list(languages)
+        self.gpu = gpu
+        self._reader = None
+        self._load_error: Optional[Exception] = None
+        self._lock = threading.Lock()
+        self._server_lock = threading.Lock()
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._client = None
+        self._server_checked_at = 0.0
+        self._restart_failed_at = 0.0
+
+    @property
+    def is_loaded(self) -> bool:
+        """모델 로딩 여부"""
+        return self._reader is not None
+
+    def is_available(self) -> bool:
+        """EasyOCR 사용 가능 여부 (설치되어 있고 로딩에 실패하지 않았는지)"""
+        if self._reader is not None or self._get_server_client() is not None:
+            return True
+        if self._load_error is not None:
+            return False
+        return importlib.util.find_spec('easyocr') is not None
+
+    def _get_server_client(self):
+        """
+        응답하는 OCR 서버 클라이언트 반환
+
+        접속에 실패하면 SERVER_RECHECK_INTERVAL 동안은 다시 확인하지 않습니다.
+        """
+        if not self.use_server:
+            return None
+        if self._client is not None:
+            return self._client
+        if time.time() - self._server_checked_at < SERVER_RECHECK_INTERVAL:
+            return None
+
+        self._server_checked_at = time.time()
+        from core.utils.ocr_server import OCRClient
+        client = OCRClient()
+        if client.is_available():
+            logger.info("OCR 서버 연결됨 - 서버 모델을 공유합니다")
+            self._client = client
+        return self._client
+
+    def get_reader(self):
+        """
+        EasyOCR 리더 반환 (처음 호출 시 로딩)
+
+        Returns:
+            easyocr.Reader 또는 None (사용 불가 시)
+        """
+        if self._reader is not None:
+            return self._reader
+
+        with self._lock:
+            if self._reader is not None:
+                return self._reader
+            if self._load_error is not None:
+                return None
+
+            try:
+                start_time = time.time()
+                import easyocr
+                self._reader = easyocr.Reader(self.languages, gpu=self.gpu)
+                logger.info(f"EasyOCR 초기화 완료 (언어: {self.languages}, 소요시간: {time.time() - start_time:.2f}초)")
+            except ImportError as e:
+                self._load_error = e
+                logger.warning(f"EasyOCR를 사용할 수 없습니다. pip install easyocr로 설치하세요: {e}")
+            except Exception as e:
+                self._load_error = e
+                logger.error(f"EasyOCR 초기화 실패: {e}")
+
+            return self._reader
+
+    def readtext(self, image, **kwargs):
+        """
+        공유 리더로 텍스트 인식
+
+        Args:
+            image: numpy 배열, 파일 경로 또는 이미지 바이트
+            **kwargs: easyocr.Reader.readtext 인자
+
+        Returns:
+            list: (bbox, text, confidence) 목록
+        """
+        # 서버를 띄우는 중이면 프로세스 내 모델을 따로 올리지 않도록 완료까지 대기
+        warmup_thread = self._warmup_thread
+        if self.use_server and warmup_thread is not None and warmup_thread.is_alive():
+            warmup_thread.join()
+
+        client = self._get_server_client()
+        if client is not None:
+            results = self._readtext_on_server(client, image, kwargs)
+            if results is not None:
+                return results
+
+        reader = self.get_reader()
+        if reader is None:
+            raise RuntimeError(f"EasyOCR 리더를 사용할 수 없습니다: {self._load_error}")
+        return reader.readtext(image, **kwargs)
+
+    def _readtext_on_server(self, client, image, kwargs):
+        """
+        OCR 서버로 텍스트 인식 요청
+
+        유휴 종료 등으로 연결이 끊겼으면 서버를 다시 띄운 뒤 한 번 더 요청합니다.
+
+        Returns:
+            list: 인식 결과, 서버로 처리하지 못했으면 None (프로세스 내 모델로 처리)
+        """
+        try:
+            return client.readtext(image, **kwargs)
+        except (ConnectionError, EOFError, OSError) as e:
+            logger.info(f"OCR 서버 연결 끊김, 서버 재시작 시도: {e}")
+            self._client = None
+        except RuntimeError as e:
+            # 서버 쪽 OCR 오류 (연결은 정상) - 이번 요청만 프로세스 내 모델로 처리
+            logger.warning(f"OCR 서버 처리 오류, 프로세스 내 모델로 처리: {e}")
+            return None
+
+        client = self._restart_server()
+        if client is None:
+            logger.warning("OCR 서버를 다시 시작하지 못해 프로세스 내 모델로 전환")
+            return None
+
+        try:
+            return client.readtext(image, **kwargs)
+        except (ConnectionError, EOFError, OSError, RuntimeError) as e:
+            logger.warning(f"OCR 서버 재요청 실패, 프로세스 내 모델로 처리: {e}")
+            if not isinstance(e, RuntimeError):
+                self._client = None
+                self._server_checked_at = time.time()
+            return None
+
+    def _restart_server(self):
+        """
+        내려간 OCR 서버를 다시 실행하고 클라이언트 반환
+
+        여러 스레드가 동시에 끊김을 감지해도 서버는 한 번만 띄우며,
+        재시작에 실패하면 SERVER_RECHECK_INTERVAL 동안은 다시 시도하지 않습니다.
+        """
+        with self._server_lock:
+            if self._client is not None:
+                return self._client
+            if time.time() - self._restart_failed_at < SERVER_RECHECK_INTERVAL:
+                return None
+
+            from core.utils.ocr_server import start_server_process
+            try:
+                if start_server_process():
+                    self._server_checked_at = 0.0
+                    return self._get_server_client()
+            except Exception as e:
+                logger.warning(f"OCR 서버 재시작 실패: {e}")
+            self._restart_failed_at = time.time()
+            self._server_checked_at = time.time()
+            return None
+
+    def warm_up(self, background: bool = False) -> bool:
+        """
+        모델 미리 로딩
+
+        서버 모드에서는 OCR 서버 프로세스를 띄우고, 서버를 쓸 수 없으면
+        프로세스 내 모델을 로딩합니다.
+
+        Args:
+            background: True이면 별도 스레드에서 로딩하고 즉시 반환
+
+        Returns:
+            bool: 로딩 완료 여부 (background=True이면 로딩 시작 여부)
+        """
+        if self._reader is not None or self._client is not None:
+            return True
+        if not self.is_available():
+            return False
+
+        if background:
+            if self._warmup_thread is None or not self._warmup_thread.is_alive():
+                self._warmup_thread = threading.Thread(target=self._load, name="ocr-warmup", daemon=True)
+                self._warmup_thread.start()
+                logger.info("EasyOCR 백그라운드 로딩 시작")
+            return True
+
+        return self._load()
+
+    def _load(self) -> bool:
+        """OCR 서버 시작 또는 프로세스 내 모델 로딩"""
+        if self.use_server:
+            from core.utils.ocr_server import start_server_process
+            try:
+                if start_server_process():
+                    self._server_checked_at = 0.0
+                    if self._get_server_client() is not None:
+                        return True
+            except Exception as e:
+                logger.warning(f"OCR 서버 시작 실패, 프로세스 내 모델 사용: {e}")
+
+        return self.get_reader() is not None
+
+    def release(self):
+        """모델 해제 (다음 사용 시 다시 로딩)"""
+        with self._lock:
+            if self._reader is None:
+                return
+            self._reader = None
+
+        gc.collect()
+        logger.info("EasyOCR 리더 해제 완료")
+
+
+# 프로세스 전역 OCR 서비스 인스턴스
+ocr_service = OCRService()
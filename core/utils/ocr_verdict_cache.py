@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+OCR 판정 캐시
+같은 공급처(1688/alicdn) 상세 이미지는 복사 상품과 키워드를 넘나들며 반복해서 나타나므로,
+이미지 내용 해시(디코딩된 픽셀의 SHA-1)와 이미지 URL을 키로 "중문 포함 여부" 판정을 저장해 두고
+다시 나타나면 OCR(readtext)을 건너뜁니다.
+
+- 지각 해시(dHash)는 번역 전/후처럼 배치와 명암이 같은 이미지가 충돌하므로 쓰지 않습니다.
+  픽셀이 완전히 같은 이미지만 판정을 재사용합니다.
+
+- 메모리: 최근 사용 순서(LRU)로 최대 항목 수 유지
+- 디스크: cache/ocr_verdict_cache.json (재시작 후에도 유지)
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_FILE = os.path.join(PROJECT_ROOT, "cache", "ocr_verdict_cache.json")
+
+# 캐시 키 접두어 (이전 형식의 dHash 키는 불러올 때 버림)
+HASH_KEY_PREFIX = "sha1:"
+URL_KEY_PREFIX = "url:"
+
+# 중문 판정: 이 신뢰도 이상인 OCR 블록에 한자가 있으면 중문 포함
+CHINESE_CONFIDENCE_THRESHOLD = 0.3
+_CHINESE_CHAR = re.compile(r'[\u4e00-\u9fff]')
+
+
+def chinese_verdict(results) -> Tuple[bool, float, List[str]]:
+    """
+    OCR 결과의 중문 포함 판정
+
+    캐시에 기록하는 모든 판정 경로(캔버스/원본 URL/위치 이동)가 같은 기준을 쓰도록
+    판정 규칙을 이 모듈에 둡니다.
+
+    Args:
+        results: (bbox, text, confidence) 목록
+
+    Returns:
+        tuple: (중문 포함 여부, 중문 블록 최고 신뢰도, 중문 블록 텍스트 목록)
+    """
+    chinese_blocks = [(text, confidence) for bbox, text, confidence in results
+                      if confidence >= CHINESE_CONFIDENCE_THRESHOLD and _CHINESE_CHAR.search(text)]
+    max_confidence = max((confidence for text, confidence in chinese_blocks), default=0.0)
+    return bool(chinese_blocks), max_confidence, [text for text, confidence in chinese_blocks]
+
+
+def compute_image_hash(image) -> Optional[str]:
+    """
+    이미지 내용 해시 계산 (디코딩된 픽셀 + 크기/형식의 SHA-1)
+
+    글자만 바뀐 이미지(번역 전/후)도 서로 다른 값이 나오도록 픽셀 전체를 해시합니다.
+    같은 원본을 같은 방식으로 디코딩한 이미지끼리만 일치합니다.
+
+    Args:
+        image: PIL 이미지, numpy 배열 또는 인코딩된 이미지 바이트
+
+    Returns:
+        str: 'sha1:<40자리 16진수>' (계산 실패 시 None)
+    """
+    try:
+        digest = hashlib.sha1()
+        if isinstance(image, (bytes, bytearray)):
+            digest.update(b'raw')
+            digest.update(image)
+        elif hasattr(image, 'tobytes') and hasattr(image, 'mode'):
+            # PIL 이미지
+            digest.update(f"pil:{image.mode}:{image.size}".encode('ascii'))
+            digest.update(image.tobytes())
+        else:
+            # numpy 배열
+            digest.update(f"array:{image.dtype}:{image.shape}".encode('ascii'))
+            digest.update(image.tobytes())
+
+        return HASH_KEY_PREFIX + digest.hexdigest()
+
+    except Exception as e:
+        logger.debug(f"이미지 해시 계산 실패: {e}")
+        return None
+
+
+class OCRVerdictCache:
+    """이미지 해시/URL 기반 중문 판정 캐시"""
+
+    def __init__(self, cache_file: str = DEFAULT_CACHE_FILE, max_entries: int = 20000, save_every: int = 20):
+        """
+        초기화
+
+        Args:
+            cache_file: 디스크 저장 파일 경로
+            max_entries: 최대 보관 항목 수 (초과 시 오래 사용하지 않은 항목부터 삭제)
+            save_every: 새 판정이 이만큼 쌓이면 디스크에 저장
+        """
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.save_every = save_every
+
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._url_index: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._dirty = 0
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+        atexit.register(self.save)
+
+    def _ensure_loaded(self):
+        """디스크 캐시를 처음 사용할 때 한 번 읽기 (락 안에서 호출)"""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        for key, entry in self._read_file().items():
+            if not key.startswith((HASH_KEY_PREFIX, URL_KEY_PREFIX)):
+                continue
+            self._entries[key] = entry
+            if entry.get('src'):
+                self._url_index[entry['src']] = key
+        self._evict()
+
+        if self._entries:
+            logger.info(f"OCR 판정 캐시 로드: {len(self._entries)}개")
+
+    def _read_file(self) -> Dict:
+        """디스크 캐시 파일 읽기"""
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('entries', {})
+        except Exception as e:
+            logger.warning(f"OCR 판정 캐시 파일 읽기 실패: {e}")
+            return {}
+
+    def _evict(self):
+        """최대 항목 수를 넘는 오래된 항목 삭제 (락 안에서 호출)"""
+        while len(self._entries) > self.max_entries:
+            _, entry = self._entries.popitem(last=False)
+            src = entry.get('src')
+            if src and src in self._url_index:
+                del self._url_index[src]
+
+    def get(self, image_hash: str = None, src: str = None) -> Optional[Dict]:
+        """
+        저장된 판정 조회
+
+        Args:
+            image_hash: compute_image_hash 결과
+            src: 이미지 URL (data: URL은 무시)
+
+        Returns:
+            dict: {'has_chinese': bool, 'confidence': float} 또는 None
+        """
+        with self._lock:
+            self._ensure_loaded()
+
+            key = image_hash
+            if (key is None or key not in self._entries) and src and not src.startswith('data:'):
+                key = self._url_index.get(src)
+
+            entry = self._entries.get(key) if key else None
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return {'has_chinese': entry['has_chinese'], 'confidence': entry.get('confidence', 0.0)}
+
+    def put(self, image_hash: str, has_chinese: bool, confidence: float = 0.0, src: str = None):
+        """
+        판정 저장
+
+        Args:
+            image_hash: compute_image_hash 결과 (None이면 src만으로 저장)
+            has_chinese: 중문 포함 여부
+            confidence: 판정 근거가 된 OCR 신뢰도
+            src: 이미지 URL
+        """
+        if src and src.startswith('data:'):
+            src = None
+        key = image_hash or (f"{URL_KEY_PREFIX}{src}" if src else None)
+        if key is None:
+            return
+
+        with self._lock:
+            self._ensure_loaded()
+
+            self._entries[key] = {
+                'has_chinese': bool(has_chinese),
+                'confidence': round(float(confidence), 4),
+                'src': src,
+                'updated_at': int(time.time())
+            }
+            self._entries.move_to_end(key)
+            if src:
+                self._url_index[src] = key
+            self._evict()
+
+            self._dirty += 1
+            should_save = self._dirty >= self.save_every
+
+        if should_save:
+            self.save()
+
+    def save(self):
+        """디스크에 저장 (다른 프로세스가 저장한 항목과 병합)"""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            merged = OrderedDict((key, entry) for key, entry in self._read_file().items()
+                                 if key.startswith((HASH_KEY_PREFIX, URL_KEY_PREFIX)))
+            for key, entry in self._entries.items():
+                merged.pop(key, None)
+                merged[key] = entry
+            while len(merged) > self.max_entries:
+                merged.popitem(last=False)
+
+            try:
+                os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+                temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump({'entries': merged}, f, ensure_ascii=False)
+                os.replace(temp_file, self.cache_file)
+                self._dirty = 0
+                logger.debug(f"OCR 판정 캐시 저장: {len(merged)}개 (적중 {self.hits}, 미적중 {self.misses})")
+            except Exception as e:
+                logger.warning(f"OCR 판정 캐시 저장 실패: {e}")
+
+
+# 프로세스 전역 OCR 판정 캐시 인스턴스
+ocr_verdict_cache = OCRVerdictCache()
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+3단계 진행 상황 저널
+progress_{account}_step3_x_core.journal에 완료 기록을 한 줄(JSON)씩 덧붙이고 fsync합니다.
+청크마다 JSON 파일 전체를 다시 쓰는 대신 상품 하나가 끝날 때마다 기록하므로,
+키워드 도중에 브라우저가 죽어도 재시작 시 이미 처리한 상품을 건너뜁니다.
+
+기록 종류:
+- product: 상품 하나 수정 완료 (keyword, product, images) - 그룹 이동 전에 기록하므로
+  재시작 시 목록에 남아 있는 기록된 상품은 다시 수정하지 않고 이동만 합니다
+- keyword: 키워드 완료
+- checkpoint: 청크 종료 시점의 누적 카운터 (절대값)
+- batch_completed: 배치 작업 완료 표시
+- snapshot: 압축(compaction) 결과 전체 상태
+
+기록이 compact_every개 쌓이면 현재 상태를 snapshot 한 줄로 압축합니다(임시 파일 → os.replace).
+마지막 줄이 기록 도중 끊긴 경우 해당 줄만 무시합니다.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_EXTENSION = ".journal"
+LEGACY_EXTENSION = ".json"
+
+
+@dataclass
+class JournalState:
+    """저널을 재생한 진행 상태"""
+    completed_keywords: List[str] = field(default_factory=list)
+    products: Dict[str, List[str]] = field(default_factory=dict)  # 진행 중 키워드 -> 완료 상품
+    total_products_processed: int = 0
+    total_images_translated: int = 0
+    batch_completed: bool = False
+    meta: Dict = field(default_factory=dict)
+    last_updated: Optional[str] = None
+
+    def to_record(self) -> Dict:
+        """snapshot 기록으로 변환"""
+        return {
+            'type': 'snapshot',
+            'completed_keywords': list(self.completed_keywords),
+            'products': {keyword: list(products) for keyword, products in self.products.items()},
+            'total_products_processed': self.total_products_processed,
+            'total_images_translated': self.total_images_translated,
+            'batch_completed': self.batch_completed,
+            'meta': dict(self.meta),
+            'time': self.last_updated
+        }
+
+
+class ProgressJournal:
+    """추가 전용(append-only) 진행 상황 저널"""
+
+    def __init__(self, path: str, compact_every: int = 200):
+        """
+        초기화
+
+        Args:
+            path: 저널 파일 경로 (.journal)
+            compact_every: 이만큼 기록이 쌓이면 snapshot으로 압축
+        """
+        self.path = path
+        self.compact_every = compact_every
+        self._lock = threading.RLock()
+        self._state: Optional[JournalState] = None
+        self._records_since_compact = 0
+
+    @property
+    def legacy_path(self) -> str:
+        """이전 형식(전체 JSON) 진행 상황 파일 경로"""
+        base, ext = os.path.splitext(self.path)
+        return base + LEGACY_EXTENSION if ext == JOURNAL_EXTENSION else self.path + LEGACY_EXTENSION
+
+    def exists(self) -> bool:
+        """저널 또는 이전 형식 파일 존재 여부"""
+        return os.path.exists(self.path) or os.path.exists(self.legacy_path)
+
+    @staticmethod
+    def _apply(state: JournalState, record: Dict):
+        """기록 하나를 상태에 반영"""
+        record_type = record.get('type')
+        state.last_updated = record.get('time', state.last_updated)
+
+        if record_type == 'product':
+            keyword = record['keyword']
+            state.products.setdefault(keyword, []).append(record['product'])
+            state.total_products_processed += 1
+            state.total_images_translated += int(record.get('images', 0))
+        elif record_type == 'keyword':
+            keyword = record['keyword']
+            if keyword not in state.completed_keywords:
+                state.completed_keywords.append(keyword)
+            state.products.pop(keyword, None)
+        elif record_type == 'checkpoint':
+            for keyword in record.get('completed_keywords', []):
+                if keyword not in state.completed_keywords:
+                    state.completed_keywords.append(keyword)
+                state.products.pop(keyword, None)
+            state.total_products_processed = record.get('total_products_processed', state.total_products_processed)
+            state.total_images_translated = record.get('total_images_translated', state.total_images_translated)
+            state.meta.update(record.get('meta', {}))
+            state.batch_completed = False
+        elif record_type == 'batch_completed':
+            state.batch_completed = True
+        elif record_type == 'snapshot':
+            state.completed_keywords = list(record.get('completed_keywords', []))
+            state.products = {keyword: list(products) for keyword, products in record.get('products', {}).items()}
+            state.total_products_processed = record.get('total_products_processed', 0)
+            state.total_images_translated = record.get('total_images_translated', 0)
+            state.batch_completed = record.get('batch_completed', False)
+            state.meta = dict(record.get('meta', {}))
+
+    def _read_legacy(self) -> JournalState:
+        """이전 형식 JSON 진행 상황 파일에서 상태 복구"""
+        state = JournalState()
+        try:
+            with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            state.completed_keywords = list(data.get('completed_keywords', []))
+            state.total_products_processed = data.get('total_products_processed', 0)
+            state.total_images_translated = data.get('total_images_translated', 0)
+            state.batch_completed = data.get('batch_completed', False)
+            state.meta = {key: data[key] for key in ('account_id', 'server_name') if key in data}
+            state.last_updated = data.get('last_updated')
+            logger.info(f"이전 형식 진행 상황 파일에서 복구: {self.legacy_path}")
+        except Exception as e:
+            logger.warning(f"이전 형식 진행 상황 파일 읽기 실패: {e}")
+        return state
+
+    def load(self, reload: bool = False) -> JournalState:
+        """
+        저널을 재생하여 현재 상태 반환
+
+        Args:
+            reload: True이면 메모리 상태를 버리고 파일에서 다시 읽음
+
+        Returns:
+            JournalState: 진행 상태 (파일이 없으면 빈 상태)
+        """
+        with self._lock:
+            if self._state is not None and not reload:
+                return self._state
+
+            if not os.path.exists(self.path) and os.path.exists(self.legacy_path):
+                state = self._read_legacy()
+            else:
+                state = JournalState()
+
+            records = 0
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for line_number, line in enumerate(f, start=1):
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            self._apply(state, json.loads(line))
+                            records += 1
+                        except (ValueError, KeyError) as e:
+                            # 기록 도중 종료되어 끊긴 줄
+                            logger.warning(f"진행 상황 저널 {line_number}번째 줄 무시: {e}")
+
+            self._state = state
+            self._records_since_compact = records
+            return state
+
+    def _has_torn_tail(self) -> bool:
+        """파일이 줄바꿈 없이 끝나는지 (마지막 기록이 끊겼는지)"""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return False
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b'\n'
+
+    def _append(self, records: List[Dict]):
+        """기록 추가 후 fsync (락 안에서 호출)"""
+        state = self.load()
+        if not os.path.exists(self.path) and os.path.exists(self.legacy_path):
+            # 이전 형식에서 복구한 상태를 먼저 저널로 옮김
+            self.compact()
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+        lines = []
+        for record in records:
+            record['time'] = now
+            self._apply(state, record)
+            lines.append(json.dumps(record, ensure_ascii=False))
+
+        text = '\n'.join(lines) + '\n'
+        if self._has_torn_tail():
+            # 끊긴 마지막 줄에 이어 쓰지 않도록 줄을 바꿔서 기록
+            text = '\n' + text
+
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._records_since_compact += len(records)
+        if self._records_since_compact >= self.compact_every:
+            self.compact()
+
+    def record_product(self, keyword: str, product_id: str, images_translated: int = 0):
+        """
+        상품 하나 완료 기록
+
+        Args:
+            keyword: 키워드(provider_code)
+            product_id: 상품 식별값 ('id:<목록 API 상품 ID>', 없으면 목록의 상품 텍스트)
+            images_translated: 이 상품에서 번역한 이미지 수
+        """
+        with self._lock:
+            self._append([{'type': 'product', 'keyword': keyword, 'product': product_id,
+                           'images': int(images_translated or 0)}])
+
+    def record_keyword(self, keyword: str):
+        """키워드 완료 기록"""
+        with self._lock:
+            if keyword in self.load().completed_keywords:
+                return
+            self._append([{'type': 'keyword', 'keyword': keyword}])
+
+    def record_checkpoint(self, completed_keywords: List[str], total_products_processed: int,
+                          total_images_translated: int, **meta):
+        """
+        청크 종료 시점 기록 (누적 카운터는 절대값)
+
+        Args:
+            completed_keywords: 완료된 키워드 목록
+            total_products_processed: 누적 처리 상품 수
+            total_images_translated: 누적 번역 이미지 수
+            **meta: account_id, server_name 등 부가 정보
+        """
+        with self._lock:
+            known = set(self.load().completed_keywords)
+            self._append([{
+                'type': 'checkpoint',
+                'completed_keywords': [keyword for keyword in completed_keywords if keyword not in known],
+                'total_products_processed': total_products_processed,
+                'total_images_translated': total_images_translated,
+                'meta': meta
+            }])
+
+    def mark_batch_completed(self):
+        """배치 작업 완료 표시"""
+        with self._lock:
+            self._append([{'type': 'batch_completed'}])
+
+    def completed_products(self, keyword: str) -> Set[str]:
+        """진행 중인 키워드에서 이미 완료한 상품 식별값"""
+        with self._lock:
+            return set(self.load().products.get(keyword, []))
+
+    def compact(self):
+        """현재 상태를 snapshot 한 줄로 압축"""
+        with self._lock:
+            state = self.load()
+            temp_file = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(state.to_record(), ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.path)
+
+            if os.path.exists(self.legacy_path):
+                os.remove(self.legacy_path)
+
+            self._records_since_compact = 1
+            logger.debug(f"진행 상황 저널 압축: {self.path}")
+
+    def truncate(self):
+        """저널 초기화 (이전 형식 파일 포함 삭제)"""
+        with self._lock:
+            for path in (self.path, self.legacy_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._state = JournalState()
+            self._records_since_compact = 0
+
+
+_journals_lock = threading.Lock()
+_journals: Dict[str, ProgressJournal] = {}
+
+
+def get_progress_journal(path: str) -> ProgressJournal:
+    """
+    경로별 공유 저널 반환 (같은 프로세스의 여러 코어 인스턴스가 같은 상태를 사용)
+
+    Args:
+        path: 저널 파일 경로 (.json 경로를 주면 .journal로 바꿈)
+    """
+    base, ext = os.path.splitext(path)
+    if ext == LEGACY_EXTENSION:
+        path = base + JOURNAL_EXTENSION
+
+    key = os.path.abspath(path)
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = ProgressJournal(path)
+            _journals[key] = journal
+        return journal
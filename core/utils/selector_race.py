@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+선택자 경합(race) 모듈
+여러 XPath/CSS 후보 선택자를 하나씩 find_elements/WebDriverWait로 시도하는 대신,
+후보 목록 전체를 한 번의 스크립트 호출로 페이지에 보내 순서대로 평가합니다.
+
+- resolve(): 조건(표시/활성)을 만족하는 첫 번째 요소와 이긴 후보를 반환 (timeout 동안 페이지 안에서 재검사)
+- count(): 후보별 일치 요소 수를 한 번에 반환 (표시된 요소만 셀 수 있음)
+- 페이지(location.pathname)별로 이긴 후보를 기록하여 다음 호출에서 먼저 평가합니다.
+  기록은 key(생략 시 후보 목록)별로 프로세스 전역에 보관됩니다.
+  구체적→일반 순서로 우선순위가 정해진 후보 목록은 reorder=False로 항상 목록 순서대로 평가합니다.
+
+후보는 문자열("/"나 "("로 시작하면 XPath, 그 외 CSS) 또는 (By, 선택자) 튜플입니다.
+
+사용 예:
+    match = selector_race.resolve(driver, ["input.search:not([readonly])", "//input[@type='search']"])
+    if match:
+        match.element.click()
+"""
+
+import time
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from core.utils.dom_ready import ensure_script_timeout, SCRIPT_TIMEOUT_MARGIN
+
+logger = logging.getLogger(__name__)
+
+Candidate = Union[str, Tuple[str, str]]
+
+# 페이지 안 공통 함수 (후보 평가)
+_RACE_FUNCTIONS = r"""
+function raceFind(kind, selector) {
+    try {
+        if (kind === 'xpath') {
+            var snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+            return nodes;
+        }
+        return Array.prototype.slice.call(document.querySelectorAll(selector));
+    } catch (e) {
+        return [];
+    }
+}
+function raceVisible(el, minSize) {
+    if (!el.getClientRects || el.getClientRects().length === 0) return false;
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none') return false;
+    if (minSize) {
+        var rect = el.getBoundingClientRect();
+        if (rect.width <= 0 || rect.height <= 0) return false;
+    }
+    return true;
+}
+function raceEnabled(el) {
+    return !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+}
+function raceOrder(count, preferred) {
+    var order = [], seen = {};
+    var first = (preferred && preferred[location.pathname]) || [];
+    for (var i = 0; i < first.length; i++) {
+        if (first[i] < count && !seen[first[i]]) { order.push(first[i]); seen[first[i]] = true; }
+    }
+    for (var j = 0; j < count; j++) {
+        if (!seen[j]) order.push(j);
+    }
+    return order;
+}
+function raceResolve(candidates, preferred, visible, enabled) {
+    var order = raceOrder(candidates.length, preferred);
+    for (var i = 0; i < order.length; i++) {
+        var index = order[i], nodes = raceFind(candidates[index][0], candidates[index][1]);
+        for (var n = 0; n < nodes.length; n++) {
+            if (visible && !raceVisible(nodes[n], false)) continue;
+            if (enabled && !raceEnabled(nodes[n])) continue;
+            return {element: nodes[n], index: index, path: location.pathname};
+        }
+    }
+    return {element: null, index: -1, path: location.pathname};
+}
+"""
+
+# arguments: candidates, preferred, visible, enabled
+_RESOLVE_SCRIPT = _RACE_FUNCTIONS + "return raceResolve(arguments[0], arguments[1], arguments[2], arguments[3]);"
+
+# arguments: candidates, preferred, visible, enabled, timeout_ms, callback
+_RESOLVE_ASYNC_SCRIPT = _RACE_FUNCTIONS + r"""
+var candidates = arguments[0], preferred = arguments[1], visible = arguments[2], enabled = arguments[3],
+    timeoutMs = arguments[4], done = arguments[arguments.length - 1];
+var start = Date.now();
+function check() {
+    var result = raceResolve(candidates, preferred, visible, enabled);
+    if (result.element || Date.now() - start >= timeoutMs) { done(result); return; }
+    setTimeout(check, 50);
+}
+check();
+"""
+
+# arguments: candidates, visible, min_size
+_COUNT_SCRIPT = _RACE_FUNCTIONS + r"""
+var candidates = arguments[0], visible = arguments[1], minSize = arguments[2];
+return candidates.map(function (candidate) {
+    var nodes = raceFind(candidate[0], candidate[1]);
+    if (!visible) return nodes.length;
+    return nodes.filter(function (el) { return raceVisible(el, minSize); }).length;
+});
+"""
+
+
+@dataclass(frozen=True)
+class SelectorMatch:
+    """선택자 경합 결과"""
+    element: object
+    selector: str
+    index: int
+    path: str
+
+
+def _normalize(candidate: Candidate) -> Tuple[str, str]:
+    """후보를 (종류, 선택자)로 변환 - 종류는 'xpath' 또는 'css'"""
+    if isinstance(candidate, (tuple, list)):
+        by, selector = candidate
+        if by == 'xpath':
+            return 'xpath', selector
+        if by == 'id':
+            return 'css', f'[id="{selector}"]'
+        if by == 'name':
+            return 'css', f'[name="{selector}"]'
+        if by == 'class name':
+            return 'css', f'.{selector}'
+        return 'css', selector
+    if candidate.startswith('/') or candidate.startswith('('):
+        return 'xpath', candidate
+    return 'css', candidate
+
+
+class SelectorRace:
+    """후보 선택자 일괄 평가 + 페이지별 승자 통계"""
+
+    def __init__(self):
+        self._wins: Dict[object, Dict[str, Counter]] = {}
+        self._lock = threading.Lock()
+
+    def _preferred(self, key) -> Dict[str, List[int]]:
+        """페이지별로 많이 이긴 후보 순서"""
+        with self._lock:
+            per_path = self._wins.get(key, {})
+            return {path: [index for index, _ in wins.most_common()] for path, wins in per_path.items()}
+
+    def _record(self, key, path: str, index: int):
+        with self._lock:
+            self._wins.setdefault(key, {}).setdefault(path, Counter())[index] += 1
+
+    def resolve(self, driver, candidates: Sequence[Candidate], key: str = None, visible: bool = True,
+                enabled: bool = False, timeout: float = 0, reorder: bool = True) -> Optional[SelectorMatch]:
+        """
+        조건을 만족하는 첫 번째 요소 찾기 (한 번의 스크립트 호출)
+
+        Args:
+            driver: Selenium WebDriver
+            candidates: 후보 선택자 목록 (앞에 있을수록 우선, 페이지별 승자가 먼저 평가됨)
+            key: 통계 키 (None이면 후보 목록 자체)
+            visible: 표시된 요소만 인정
+            enabled: 활성(disabled/aria-disabled 아님) 요소만 인정
+            timeout: 일치 요소가 없을 때 페이지 안에서 재검사할 최대 시간(초)
+            reorder: 페이지별 승자를 먼저 평가 (False면 항상 목록 순서 - 우선순위가 있는 후보 목록용)
+
+        Returns:
+            SelectorMatch: 찾은 요소와 이긴 후보 (없으면 None)
+        """
+        normalized = [_normalize(candidate) for candidate in candidates]
+        if not normalized:
+            return None
+        stats_key = key or tuple(normalized)
+        preferred = self._preferred(stats_key) if reorder else {}
+
+        start_time = time.time()
+        try:
+            if timeout > 0:
+                ensure_script_timeout(driver, timeout + SCRIPT_TIMEOUT_MARGIN)
+                result = driver.execute_async_script(
+                    _RESOLVE_ASYNC_SCRIPT, normalized, preferred, visible, enabled, int(timeout * 1000)
+                )
+            else:
+                result = driver.execute_script(_RESOLVE_SCRIPT, normalized, preferred, visible, enabled)
+        except Exception as e:
+            logger.debug(f"선택자 경합 실패: {e}")
+            return None
+
+        if not result or result.get('element') is None:
+            logger.debug("선택자 경합: 일치 요소 없음 (후보 %d개, %.2f초)", len(normalized), time.time() - start_time)
+            return None
+
+        index = result['index']
+        self._record(stats_key, result.get('path', ''), index)
+        logger.debug("선택자 경합 승자: %s (후보 %d/%d, %.2f초)",
+                     normalized[index][1], index + 1, len(normalized), time.time() - start_time)
+        return SelectorMatch(result['element'], normalized[index][1], index, result.get('path', ''))
+
+    def count(self, driver, candidates: Sequence[Candidate], visible: bool = False,
+              min_size: bool = False) -> List[int]:
+        """
+        후보별 일치 요소 수 (한 번의 스크립트 호출)
+
+        Args:
+            driver: Selenium WebDriver
+            candidates: 후보 선택자 목록
+            visible: 표시된 요소만 셈
+            min_size: 표시 여부에 더해 폭/높이가 0보다 큰 요소만 셈
+
+        Returns:
+            list: 후보 순서대로 요소 수 (실패 시 모두 0)
+        """
+        normalized = [_normalize(candidate) for candidate in candidates]
+        try:
+            return list(driver.execute_script(_COUNT_SCRIPT, normalized, visible, min_size) or [0] * len(normalized))
+        except Exception as e:
+            logger.debug(f"선택자 개수 확인 실패: {e}")
+            return [0] * len(normalized)
+
+    def stats(self) -> Dict[str, Dict[str, Dict[int, int]]]:
+        """키/페이지별 후보 승리 횟수"""
+        with self._lock:
+            return {str(key): {path: dict(wins) for path, wins in per_path.items()}
+                    for key, per_path in self._wins.items()}
+
+
+# 프로세스 전역 선택자 경합 인스턴스
+selector_race = SelectorRace()
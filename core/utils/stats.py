@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+보고서용 통계 함수
+대기 시간 프로파일러(wait_profiler)와 브라우저 실행 프로파일(launch_profile) 보고서가 함께 사용합니다.
+"""
+
+import math
+from typing import List
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """정렬된 값의 백분위수 (최근접 순위, 값이 없으면 0.0)"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(percent / 100.0 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
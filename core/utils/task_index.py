@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+작업 인덱스 컴파일러
+percenty_id.xlsx의 계정별 작업 시트를 (계정, 단계, 서버, provider_code) 키로 미리 묶어
+cache/task_index.pkl에 저장합니다. 단계 코어는 행을 매번 iterrows()로 훑고
+키워드마다 작업 목록을 선형 탐색하는 대신 인덱스를 바로 조회합니다.
+
+워크북 파일 버전(수정 시각, 크기)이 바뀌면 자동으로 다시 컴파일합니다.
+컴파일할 때 H~O열 명령어도 검사하여 잘못된 셀을 invalid_cells에 기록합니다.
+수동 컴파일: python cli/batch_cli.py compile
+"""
+
+import os
+import pickle
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from core.utils.action_grammar import validate_task_actions
+from core.utils.workbook_cache import (
+    workbook_cache, find_column, DEFAULT_EXCEL_PATH,
+    STEP_COLUMN_CANDIDATES, SERVER_COLUMN_CANDIDATES
+)
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_INDEX_FILE = os.path.join(PROJECT_ROOT, "cache", "task_index.pkl")
+
+# 인덱스 형식 버전 (구조가 바뀌면 올려서 기존 파일을 무효화)
+INDEX_FORMAT_VERSION = 2
+
+# H~O열 (0-based 7~14) 액션 컬럼 키
+ACTION_COLUMN_KEYS = ['h_data', 'i_data', 'j_data', 'k_data', 'l_data', 'm_data', 'n_data', 'o_data']
+ACTION_COLUMN_START = 7
+
+PROVIDER_CODE_COLUMN_CANDIDATES = ['provider_code', 'keyword', 'search_keyword']
+TARGET_GROUP_COLUMN_CANDIDATES = ['target_group', 'group', 'group_name']
+
+# 서버 구분 없이 조회할 때 사용하는 키
+ALL_SERVERS = None
+
+
+def _cell_text(value) -> Optional[str]:
+    """셀 값을 문자열로 변환 (빈 셀은 None)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return str(value)
+
+
+class TaskIndex:
+    """
+    컴파일된 작업 인덱스
+
+    tasks[(account, step, server)] = OrderedDict(provider_code -> [task, ...])
+    server가 None인 키는 해당 단계의 전체 서버 작업입니다.
+    시트에 step/서버 컬럼이 없는 계정은 기존 로더처럼 해당 필터를 적용하지 않습니다.
+    invalid_cells에는 명령어가 잘못된 셀이 (계정, 시트, 행, 열, 값, 오류) 딕셔너리로 들어 있습니다.
+    """
+
+    def __init__(self, source_path: str, source_version: Tuple[float, int], tasks: Dict,
+                 filter_columns: Dict[str, Tuple[bool, bool]], invalid_cells: List[Dict] = None):
+        self.source_path = source_path
+        self.source_version = source_version
+        self.format_version = INDEX_FORMAT_VERSION
+        self.tasks = tasks
+        self.filter_columns = filter_columns
+        self.invalid_cells = invalid_cells or []
+
+    def _key(self, account_id: str, step: str, server_name: str) -> Tuple:
+        """계정 시트의 step/서버 컬럼 유무를 반영한 조회 키"""
+        has_step, has_server = self.filter_columns.get(account_id, (True, True))
+        return (account_id, step if has_step else None, server_name if has_server else ALL_SERVERS)
+
+    def has_account(self, account_id: str) -> bool:
+        """작업 시트가 연결된 계정인지 여부"""
+        return account_id in self.filter_columns
+
+    def get_tasks(self, account_id: str, step: str, server_name: str = ALL_SERVERS) -> List[Dict]:
+        """
+        계정/단계/서버의 작업 목록 (시트 행 순서)
+
+        Returns:
+            list: 작업 딕셔너리 복사본 목록 (provider_code, target_group, h_data~o_data)
+        """
+        groups = self.tasks.get(self._key(account_id, step, server_name))
+        if not groups:
+            return []
+        return [dict(task) for tasks in groups.values() for task in tasks]
+
+    def get_tasks_for_code(self, account_id: str, step: str, server_name: str, provider_code: str) -> List[Dict]:
+        """키워드(provider_code) 하나의 작업 목록"""
+        groups = self.tasks.get(self._key(account_id, step, server_name)) or {}
+        return [dict(task) for task in groups.get(provider_code, [])]
+
+    def provider_codes(self, account_id: str, step: str, server_name: str = ALL_SERVERS) -> List[str]:
+        """키워드 목록 (시트 첫 등장 순서)"""
+        return list((self.tasks.get(self._key(account_id, step, server_name)) or {}).keys())
+
+    def get_invalid_cells(self, account_id: str = None) -> List[Dict]:
+        """명령어가 잘못된 셀 목록 (account_id가 주어지면 해당 계정만)"""
+        return [cell for cell in self.invalid_cells if account_id is None or cell['account_id'] == account_id]
+
+    def summary(self) -> Dict[Tuple, int]:
+        """키별 작업 수"""
+        return {key: sum(len(tasks) for tasks in groups.values()) for key, groups in self.tasks.items()}
+
+
+def group_tasks_by_provider_code(task_list: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    작업 목록을 provider_code별로 묶기 (키워드마다 선형 탐색하지 않도록)
+
+    Returns:
+        dict: provider_code -> 작업 목록 (입력 순서 유지)
+    """
+    grouped: Dict[str, List[Dict]] = OrderedDict()
+    for task in task_list:
+        grouped.setdefault(task.get('provider_code'), []).append(task)
+    return grouped
+
+
+def compile_task_index(excel_path: str = DEFAULT_EXCEL_PATH) -> TaskIndex:
+    """
+    워크북의 모든 계정 작업 시트를 인덱스로 컴파일
+
+    Args:
+        excel_path: 엑셀 파일 경로
+
+    Returns:
+        TaskIndex: 컴파일된 인덱스
+    """
+    version = workbook_cache.file_version(excel_path)
+    sheet_names = set(workbook_cache.sheet_names(excel_path))
+    tasks: Dict = {}
+    filter_columns: Dict[str, Tuple[bool, bool]] = {}
+    invalid_cells: List[Dict] = []
+
+    for account_id, account in workbook_cache.accounts_by_email(excel_path).items():
+        sheet_name = account.get('sheet_nickname')
+        if _cell_text(sheet_name) is None or sheet_name not in sheet_names:
+            continue
+
+        df = workbook_cache.read_sheet(excel_path, sheet_name).reset_index(drop=True)
+        columns = list(df.columns)
+
+        step_column = find_column(columns, STEP_COLUMN_CANDIDATES, 'step')
+        server_column = find_column(columns, SERVER_COLUMN_CANDIDATES, 'server')
+        code_column = find_column(columns, PROVIDER_CODE_COLUMN_CANDIDATES)
+        group_column = find_column(columns, TARGET_GROUP_COLUMN_CANDIDATES)
+        if code_column is None or group_column is None:
+            logger.warning(f"작업 시트 '{sheet_name}'에 provider_code/target_group 컬럼이 없어 건너뜁니다")
+            continue
+        filter_columns[account_id] = (step_column is not None, server_column is not None)
+
+        # 엑셀 행 번호 = 헤더 1행 + 데이터 순번
+        for row_number, values in enumerate(df.itertuples(index=False, name=None), start=2):
+            row = dict(zip(columns, values))
+            provider_code = row[code_column]
+            target_group = row[group_column]
+            # 기존 로더와 같은 조건: 두 값이 모두 참이어야 작업으로 인정
+            if _cell_text(provider_code) is None or _cell_text(target_group) is None:
+                continue
+            if not provider_code or not target_group:
+                continue
+
+            task = {'provider_code': str(provider_code), 'target_group': str(target_group)}
+            for offset, key in enumerate(ACTION_COLUMN_KEYS):
+                position = ACTION_COLUMN_START + offset
+                task[key] = _cell_text(values[position]) if len(values) > position else None
+
+            for column, value, error in validate_task_actions(task):
+                invalid_cells.append({'account_id': account_id, 'sheet': sheet_name, 'row': row_number,
+                                      'column': column, 'value': value, 'error': error})
+
+            step = _cell_text(row[step_column]) if step_column else None
+            server = _cell_text(row[server_column]) if server_column else ALL_SERVERS
+            for key in {(account_id, step, ALL_SERVERS), (account_id, step, server)}:
+                tasks.setdefault(key, OrderedDict()).setdefault(task['provider_code'], []).append(task)
+
+    index = TaskIndex(os.path.abspath(excel_path), version, tasks, filter_columns, invalid_cells)
+    logger.info(f"작업 인덱스 컴파일 완료: {len(tasks)}개 키, {sum(index.summary().values())}개 작업")
+    if invalid_cells:
+        logger.warning(f"잘못된 액션 명령어 셀 {len(invalid_cells)}개 발견")
+    return index
+
+
+def save_task_index(index: TaskIndex, index_file: str = DEFAULT_INDEX_FILE):
+    """인덱스를 파일로 저장 (원자적 교체)"""
+    os.makedirs(os.path.dirname(index_file), exist_ok=True)
+    temp_file = f"{index_file}.{os.getpid()}.tmp"
+    with open(temp_file, 'wb') as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_file, index_file)
+
+
+def _load_index_file(index_file: str, excel_path: str, version: Tuple[float, int]) -> Optional[TaskIndex]:
+    """저장된 인덱스가 현재 워크북과 일치하면 반환"""
+    if not os.path.exists(index_file):
+        return None
+    try:
+        with open(index_file, 'rb') as f:
+            index = pickle.load(f)
+        if (getattr(index, 'format_version', None) == INDEX_FORMAT_VERSION and
+                index.source_path == os.path.abspath(excel_path) and
+                tuple(index.source_version) == tuple(version)):
+            return index
+    except Exception as e:
+        logger.warning(f"작업 인덱스 파일 읽기 실패, 다시 컴파일합니다: {e}")
+    return None
+
+
+_index_lock = threading.Lock()
+_loaded_indexes: Dict[str, TaskIndex] = {}
+
+
+def get_task_index(excel_path: str = DEFAULT_EXCEL_PATH, index_file: str = DEFAULT_INDEX_FILE) -> TaskIndex:
+    """
+    현재 워크북의 작업 인덱스 반환
+
+    메모리 → 인덱스 파일 → 컴파일 순서로 찾고, 새로 컴파일하면 파일에 저장합니다.
+    """
+    key = os.path.abspath(excel_path)
+    version = workbook_cache.file_version(excel_path)
+
+    with _index_lock:
+        index = _loaded_indexes.get(key)
+        if index is not None and tuple(index.source_version) == tuple(version):
+            return index
+
+        index = _load_index_file(index_file, excel_path, version)
+        if index is None:
+            index = compile_task_index(excel_path)
+            try:
+                save_task_index(index, index_file)
+            except Exception as e:
+                logger.warning(f"작업 인덱스 저장 실패: {e}")
+
+        _loaded_indexes[key] = index
+        return index
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+텍스트 영역 사전 필터
+OCR 전에 축소한 이미지에서 에지 밀도와 글자 줄 모양의 윤곽을 빠르게 검사하여
+글자가 없는 상품 사진은 OCR 없이 건너뛰고, 글자가 있을 만한 영역만 잘라 인식에 넘깁니다.
+
+OpenCV가 없으면 NumPy 에지 밀도 검사만 수행합니다(영역 자르기 없음).
+
+기본값은 꺼져 있습니다 (모든 이미지를 전체 OCR). 임계값은 상품 이미지 표본으로 검증되지 않았으므로
+글자가 있는 이미지를 건너뛰지 않는지 표본에서 확인한 뒤 PERCENTY_OCR_PREFILTER=1로 켭니다.
+글자 줄은 가로쓰기와 세로쓰기(중문 세로 문구)를 모두 후보로 봅니다.
+"""
+
+import os
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    cv2 = None
+    CV2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 사전 필터 사용 여부 (기본 꺼짐)
+PREFILTER_ENABLED = os.getenv("PERCENTY_OCR_PREFILTER", "0") == "1"
+
+
+@dataclass
+class TextRegionResult:
+    """사전 필터 결과"""
+    has_text: bool
+    regions: List[Tuple[int, int, int, int]] = field(default_factory=list)  # 원본 좌표 (x, y, w, h)
+    edge_density: float = 0.0
+    elapsed: float = 0.0
+
+
+class TextRegionFilter:
+    """에지 밀도/윤곽 기반 텍스트 영역 검출기"""
+
+    def __init__(self, enabled: bool = None, max_side: int = 640, min_edge_density: float = 0.01,
+                 min_region_height: int = 6, max_region_height_ratio: float = 0.35,
+                 min_region_aspect: float = 1.2, min_region_fill: float = 0.25,
+                 region_padding: int = 6, max_regions: int = 12, max_region_cover: float = 0.6):
+        """
+        초기화 (모든 임계값은 축소 이미지 기준)
+
+        Args:
+            enabled: 사전 필터 사용 여부 (None이면 PERCENTY_OCR_PREFILTER 환경 변수, 끄면 항상 전체 OCR)
+            max_side: 검사용 축소 이미지의 긴 변 길이
+            min_edge_density: 이보다 에지 밀도가 낮으면 글자 없음으로 판정
+            min_region_height: 글자 줄 후보의 최소 두께(px, 가로줄은 높이, 세로줄은 폭)
+            max_region_height_ratio: 글자 줄 후보의 최대 두께(같은 방향 이미지 크기 대비)
+            min_region_aspect: 글자 줄 후보의 최소 긴 변/짧은 변 비율 (방향 무관)
+            min_region_fill: 후보 상자 안 에지 픽셀 최소 비율
+            region_padding: 잘라낼 때 상자 주변 여백(원본 px)
+            max_regions: 후보가 이보다 많으면 전체 이미지를 OCR
+            max_region_cover: 후보 면적 합이 이 비율을 넘으면 전체 이미지를 OCR
+        """
+        self.enabled = PREFILTER_ENABLED if enabled is None else enabled
+        self.max_side = max_side
+        self.min_edge_density = min_edge_density
+        self.min_region_height = min_region_height
+        self.max_region_height_ratio = max_region_height_ratio
+        self.min_region_aspect = min_region_aspect
+        self.min_region_fill = min_region_fill
+        self.region_padding = region_padding
+        self.max_regions = max_regions
+        self.max_region_cover = max_region_cover
+
+        self._lock = threading.Lock()
+        self._stats = {'frames': 0, 'skipped': 0, 'cropped': 0, 'filter_time': 0.0,
+                       'ocr_frames': 0, 'ocr_time': 0.0}
+
+    def analyze(self, gray: np.ndarray) -> TextRegionResult:
+        """
+        그레이스케일 이미지에서 텍스트 후보 검사
+
+        Args:
+            gray: 2차원 uint8 배열
+
+        Returns:
+            TextRegionResult: has_text가 False이면 OCR 생략 가능,
+                regions가 비어 있으면 전체 이미지를 OCR (필터가 꺼져 있으면 항상 전체 OCR)
+        """
+        if not self.enabled:
+            return TextRegionResult(has_text=True)
+
+        start_time = time.time()
+
+        if gray.ndim == 3:
+            gray = gray.mean(axis=2).astype(np.uint8)
+
+        height, width = gray.shape[:2]
+        scale = min(1.0, self.max_side / float(max(height, width)))
+
+        if CV2_AVAILABLE:
+            result = self._analyze_cv2(gray, scale)
+        else:
+            result = self._analyze_numpy(gray, scale)
+
+        result.elapsed = time.time() - start_time
+        with self._lock:
+            self._stats['frames'] += 1
+            self._stats['filter_time'] += result.elapsed
+            if not result.has_text:
+                self._stats['skipped'] += 1
+            elif result.regions:
+                self._stats['cropped'] += 1
+
+        return result
+
+    def _analyze_cv2(self, gray: np.ndarray, scale: float) -> TextRegionResult:
+        """형태학적 그래디언트 → 이진화 → 가로/세로 닫힘으로 글자 줄을 이어 윤곽 검출"""
+        small = gray
+        if scale < 1.0:
+            small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+        gradient = cv2.morphologyEx(small, cv2.MORPH_GRADIENT, kernel)
+        _, binary = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+
+        edge_density = float(np.count_nonzero(binary)) / binary.size
+        if edge_density < self.min_edge_density:
+            return TextRegionResult(has_text=False, edge_density=edge_density)
+
+        # 가로쓰기는 가로로, 세로쓰기는 세로로 글자를 이어 줄 하나로 만든다
+        horizontal = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (9, 1)))
+        vertical = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (1, 9)))
+        connected = cv2.bitwise_or(horizontal, vertical)
+        contours, _ = cv2.findContours(connected, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        small_height, small_width = small.shape[:2]
+        boxes = []
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            # 줄 두께는 짧은 변 (가로줄은 높이, 세로줄은 폭)
+            thickness = min(w, h)
+            extent = small_height if w >= h else small_width
+            if thickness < self.min_region_height or thickness > extent * self.max_region_height_ratio:
+                continue
+            if max(w, h) / float(thickness) < self.min_region_aspect:
+                continue
+            fill = float(np.count_nonzero(binary[y:y + h, x:x + w])) / (w * h)
+            if fill < self.min_region_fill:
+                continue
+            boxes.append((x, y, w, h))
+
+        if not boxes:
+            return TextRegionResult(has_text=False, edge_density=edge_density)
+
+        covered = sum(w * h for _, _, w, h in boxes) / float(small.shape[0] * small.shape[1])
+        if len(boxes) > self.max_regions or covered > self.max_region_cover:
+            # 글자가 많은 이미지는 잘라서 여러 번 인식하는 것보다 전체 인식이 빠르다
+            return TextRegionResult(has_text=True, edge_density=edge_density)
+
+        height, width = gray.shape[:2]
+        pad = self.region_padding
+        regions = []
+        for x, y, w, h in boxes:
+            x0 = max(0, int(x / scale) - pad)
+            y0 = max(0, int(y / scale) - pad)
+            x1 = min(width, int((x + w) / scale) + pad)
+            y1 = min(height, int((y + h) / scale) + pad)
+            regions.append((x0, y0, x1 - x0, y1 - y0))
+
+        return TextRegionResult(has_text=True, regions=regions, edge_density=edge_density)
+
+    def _analyze_numpy(self, gray: np.ndarray, scale: float) -> TextRegionResult:
+        """OpenCV가 없을 때: 이웃 픽셀 밝기 차이로 에지 밀도만 검사"""
+        step = max(1, int(round(1.0 / scale)))
+        small = gray[::step, ::step].astype(np.int16)
+
+        edges = (np.abs(np.diff(small, axis=1))[:-1, :] > 40) | (np.abs(np.diff(small, axis=0))[:, :-1] > 40)
+        edge_density = float(np.count_nonzero(edges)) / max(1, edges.size)
+
+        return TextRegionResult(has_text=edge_density >= self.min_edge_density, edge_density=edge_density)
+
+    @staticmethod
+    def crop(gray: np.ndarray, region: Tuple[int, int, int, int], min_height: int = 32) -> np.ndarray:
+        """후보 영역을 잘라내고, 너무 낮으면 인식이 가능하도록 확대"""
+        x, y, w, h = region
+        crop = gray[y:y + h, x:x + w]
+        if h < min_height and CV2_AVAILABLE:
+            factor = min_height / float(h)
+            crop = cv2.resize(crop, None, fx=factor, fy=factor, interpolation=cv2.INTER_CUBIC)
+        return np.ascontiguousarray(crop)
+
+    def record_ocr_time(self, seconds: float):
+        """전체 이미지 OCR 소요 시간 기록 (절약 시간 추정용)"""
+        with self._lock:
+            self._stats['ocr_frames'] += 1
+            self._stats['ocr_time'] += seconds
+
+    def get_stats(self) -> Dict:
+        """건너뛴 비율과 추정 절약 시간"""
+        with self._lock:
+            stats = dict(self._stats)
+
+        frames = stats['frames']
+        avg_ocr = stats['ocr_time'] / stats['ocr_frames'] if stats['ocr_frames'] else 0.0
+        stats['skip_rate'] = stats['skipped'] / frames if frames else 0.0
+        stats['saved_time'] = max(0.0, stats['skipped'] * avg_ocr - stats['filter_time'])
+        return stats
+
+    def format_stats(self) -> str:
+        """로그용 통계 문자열"""
+        stats = self.get_stats()
+        return (f"사전 필터 {stats['frames']}건 중 {stats['skipped']}건 OCR 생략 "
+                f"(생략률 {stats['skip_rate'] * 100:.1f}%, 영역 인식 {stats['cropped']}건, "
+                f"추정 절약 {stats['saved_time']:.1f}초)")
+
+    def reset_stats(self):
+        """통계 초기화"""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0 if isinstance(self._stats[key], int) else 0.0
+
+
+# 프로세스 전역 텍스트 영역 필터 인스턴스
+text_region_filter = TextRegionFilter()
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+대기 시간 프로파일러
+time.sleep과 WebDriverWait.until/until_not 호출을 가로채서 대기 시간을
+호출 위치(파일:줄 함수), 단계, 계정, 상품별로 집계합니다.
+
+- 호출 위치는 대기를 감싸는 헬퍼(click_utils.smart_click, HumanLikeDelay 등)를 건너뛴
+  실제 호출 코드 기준이며, 어떤 헬퍼를 거쳤는지 함께 표시합니다.
+- 단계/계정/상품은 스레드별 컨텍스트(set_context)로 지정합니다.
+- write_report()는 배치 보고서 디렉토리에 wait_profile_{작업ID}.md/.json을 씁니다.
+
+설치하지 않으면(install 미호출) 아무 동작도 하지 않습니다.
+활성화: batch_config.json의 profiling.wait_profiler=true, 환경변수 PERCENTY_WAIT_PROFILE=1,
+또는 batch_cli.py single --profile-waits
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.utils.stats import percentile
+
+logger = logging.getLogger(__name__)
+
+ENV_FLAG = "PERCENTY_WAIT_PROFILE"
+
+# 대기를 감싸는 헬퍼 모듈 (호출 위치 계산 시 건너뜀)
+WRAPPER_MODULES = {
+    'click_utils.py', 'human_delay.py', 'timesleep.py', 'dom_ready.py',
+    'dom_utils.py', 'wait_profiler.py'
+}
+
+# 보고서에 표시할 호출 위치 수
+REPORT_TOP_SITES = 50
+
+_original_sleep = time.sleep
+
+
+class WaitProfiler:
+    """호출 위치별 대기 시간 집계기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._installed = False
+        self._original_until = None
+        self._original_until_not = None
+        self.reset()
+
+    @property
+    def installed(self) -> bool:
+        """time.sleep/WebDriverWait 가로채기 설치 여부"""
+        return self._installed
+
+    def reset(self):
+        """집계 초기화"""
+        with self._lock:
+            self._samples: Dict[tuple, List[float]] = defaultdict(list)
+            self._timeouts: Dict[tuple, int] = defaultdict(int)
+            self._by_dimension: Dict[str, Dict[str, List[float]]] = {
+                'step': defaultdict(lambda: [0.0, 0]),
+                'account': defaultdict(lambda: [0.0, 0]),
+                'product': defaultdict(lambda: [0.0, 0]),
+            }
+            self._started_at = time.time()
+
+    # ------------------------------------------------------------------ 컨텍스트
+
+    def set_context(self, **context):
+        """
+        현재 스레드의 집계 컨텍스트 지정 (step, account, product)
+
+        값이 None이면 해당 항목을 지웁니다.
+        """
+        current = dict(getattr(self._local, 'context', {}))
+        for key, value in context.items():
+            if value is None:
+                current.pop(key, None)
+            else:
+                current[key] = str(value)
+        self._local.context = current
+
+    def clear_context(self):
+        """현재 스레드의 컨텍스트 초기화"""
+        self._local.context = {}
+
+    @contextmanager
+    def context(self, **context):
+        """with 블록 동안만 컨텍스트 지정"""
+        previous = dict(getattr(self._local, 'context', {}))
+        self.set_context(**context)
+        try:
+            yield
+        finally:
+            self._local.context = previous
+
+    # ------------------------------------------------------------------ 기록
+
+    @staticmethod
+    def _call_site() -> str:
+        """헬퍼 모듈을 건너뛴 실제 호출 위치"""
+        frame = sys._getframe(2)
+        wrapper = None
+        while frame is not None:
+            filename = os.path.basename(frame.f_code.co_filename)
+            if filename not in WRAPPER_MODULES:
+                break
+            if wrapper is None and filename != 'wait_profiler.py':
+                wrapper = f"{filename[:-3]}.{frame.f_code.co_name}"
+            frame = frame.f_back
+
+        if frame is None:
+            return "<unknown>"
+        site = f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+        return f"{site} (via {wrapper})" if wrapper else site
+
+    def record(self, kind: str, site: str, duration: float, timed_out: bool = False):
+        """
+        대기 한 번 기록
+
+        Args:
+            kind: 'sleep' 또는 'webdriverwait'
+            site: 호출 위치
+            duration: 실제 대기 시간(초)
+            timed_out: WebDriverWait 시간 초과 여부
+        """
+        context = getattr(self._local, 'context', {})
+        with self._lock:
+            self._samples[(kind, site)].append(duration)
+            if timed_out:
+                self._timeouts[(kind, site)] += 1
+            for dimension, totals in self._by_dimension.items():
+                value = context.get(dimension)
+                if value is not None:
+                    totals[value][0] += duration
+                    totals[value][1] += 1
+
+    # ------------------------------------------------------------------ 설치
+
+    def _profiled_sleep(self, seconds):
+        if getattr(self._local, 'in_wait', False):
+            # WebDriverWait 내부 폴링 sleep은 WebDriverWait 기록에 포함됨
+            return _original_sleep(seconds)
+        site = self._call_site()
+        start = time.perf_counter()
+        try:
+            return _original_sleep(seconds)
+        finally:
+            self.record('sleep', site, time.perf_counter() - start)
+
+    def install(self) -> bool:
+        """
+        time.sleep과 WebDriverWait.until/until_not 가로채기 설치 (여러 번 호출해도 한 번만 설치)
+
+        Returns:
+            bool: 새로 설치했으면 True
+        """
+        with self._lock:
+            if self._installed:
+                return False
+            self._installed = True
+
+        time.sleep = self._profiled_sleep
+
+        try:
+            from selenium.webdriver.support.wait import WebDriverWait
+            from selenium.common.exceptions import TimeoutException
+
+            profiler = self
+            self._original_until = WebDriverWait.until
+            self._original_until_not = WebDriverWait.until_not
+
+            def wrap(original):
+                def profiled(wait_self, method, message=''):
+                    site = profiler._call_site()
+                    start = time.perf_counter()
+                    timed_out = False
+                    nested = getattr(profiler._local, 'in_wait', False)
+                    profiler._local.in_wait = True
+                    try:
+                        return original(wait_self, method, message)
+                    except TimeoutException:
+                        timed_out = True
+                        raise
+                    finally:
+                        profiler._local.in_wait = nested
+                        profiler.record('webdriverwait', site, time.perf_counter() - start, timed_out)
+                profiled.__name__ = original.__name__
+                return profiled
+
+            WebDriverWait.until = wrap(self._original_until)
+            WebDriverWait.until_not = wrap(self._original_until_not)
+        except ImportError:
+            logger.warning("selenium을 찾을 수 없어 WebDriverWait 프로파일링은 건너뜁니다")
+
+        logger.info("대기 시간 프로파일러 설치 완료")
+        return True
+
+    def uninstall(self):
+        """가로채기 해제 (집계는 유지)"""
+        with self._lock:
+            if not self._installed:
+                return
+            self._installed = False
+
+        time.sleep = _original_sleep
+        if self._original_until is not None:
+            from selenium.webdriver.support.wait import WebDriverWait
+            WebDriverWait.until = self._original_until
+            WebDriverWait.until_not = self._original_until_not
+            self._original_until = self._original_until_not = None
+
+    # ------------------------------------------------------------------ 보고서
+
+    def snapshot(self) -> Dict:
+        """
+        현재까지의 집계
+
+        Returns:
+            dict: sites(호출 위치별 total/count/p50/p95/max/timeouts, total 내림차순),
+                step/account/product별 total/count, 측정 시간
+        """
+        with self._lock:
+            sites = []
+            for (kind, site), durations in self._samples.items():
+                values = sorted(durations)
+                sites.append({
+                    'kind': kind,
+                    'site': site,
+                    'count': len(values),
+                    'total': round(sum(values), 3),
+                    'p50': round(percentile(values, 50), 3),
+                    'p95': round(percentile(values, 95), 3),
+                    'max': round(values[-1], 3),
+                    'timeouts': self._timeouts.get((kind, site), 0),
+                })
+            dimensions = {
+                dimension: {value: {'total': round(total, 3), 'count': count}
+                            for value, (total, count) in sorted(totals.items(), key=lambda item: -item[1][0])}
+                for dimension, totals in self._by_dimension.items()
+            }
+            elapsed = time.time() - self._started_at
+
+        sites.sort(key=lambda item: -item['total'])
+        return {'elapsed': round(elapsed, 3), 'sites': sites, **dimensions}
+
+    def write_report(self, report_dir, task_id: str) -> Optional[str]:
+        """
+        집계 보고서 저장 (wait_profile_{task_id}.md, .json)
+
+        Args:
+            report_dir: 보고서 디렉토리 (BatchReportGenerator.report_dir)
+            task_id: 작업 ID
+
+        Returns:
+            str: 마크다운 보고서 경로 (기록이 없으면 None)
+        """
+        data = self.snapshot()
+        if not data['sites']:
+            return None
+
+        report_dir = Path(report_dir)
+        report_dir.mkdir(parents=True, exist_ok=True)
+        with open(report_dir / f"wait_profile_{task_id}.json", 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+        report_file = report_dir / f"wait_profile_{task_id}.md"
+        sleep_total = sum(site['total'] for site in data['sites'] if site['kind'] == 'sleep')
+        wait_total = sum(site['total'] for site in data['sites'] if site['kind'] == 'webdriverwait')
+
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write("# 대기 시간 프로파일\n\n")
+            f.write(f"**작업 ID:** {task_id}\n")
+            f.write(f"**측정 시간:** {data['elapsed']:.1f}초 (모든 스레드 합산 대기와 비교)\n")
+            f.write(f"**time.sleep 합계:** {sleep_total:.1f}초\n")
+            f.write(f"**WebDriverWait 합계:** {wait_total:.1f}초\n\n")
+
+            f.write(f"## 호출 위치별 대기 (상위 {REPORT_TOP_SITES}개)\n\n")
+            f.write("| 종류 | 호출 위치 | 횟수 | 합계(초) | p50 | p95 | 최대 | 시간초과 |\n")
+            f.write("|---|---|---:|---:|---:|---:|---:|---:|\n")
+            for site in data['sites'][:REPORT_TOP_SITES]:
+                f.write(f"| {site['kind']} | `{site['site']}` | {site['count']} | {site['total']:.1f} | "
+                        f"{site['p50']:.2f} | {site['p95']:.2f} | {site['max']:.2f} | {site['timeouts']} |\n")
+
+            for dimension, title in (('step', '단계별'), ('account', '계정별'), ('product', '상품별')):
+                totals = data[dimension]
+                if not totals:
+                    continue
+                f.write(f"\n## {title} 대기\n\n")
+                f.write("| 값 | 횟수 | 합계(초) |\n|---|---:|---:|\n")
+                for value, item in list(totals.items())[:REPORT_TOP_SITES]:
+                    f.write(f"| {value} | {item['count']} | {item['total']:.1f} |\n")
+
+        return str(report_file)
+
+
+def is_enabled_by_env() -> bool:
+    """환경변수 PERCENTY_WAIT_PROFILE로 활성화되었는지 여부"""
+    return os.getenv(ENV_FLAG, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# 프로세스 전역 대기 시간 프로파일러 인스턴스
+wait_profiler = WaitProfiler()
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+엑셀 워크북 캐시
+percenty_id.xlsx의 모든 시트를 프로세스당 한 번만 파싱하여 공유합니다.
+파일의 수정 시각/크기가 바뀌면 다음 조회 때 다시 읽습니다.
+
+- read_sheet(): pd.read_excel(path, sheet_name=...)과 같은 결과(복사본)
+- accounts_by_email(): login_id 시트의 계정 행 (id 기준)
+- account_task_rows(): 계정 작업 시트의 step/서버 필터 결과
+- market_rows(): market_id/cafe24_upload 등 마켓 설정 시트의 계정별 행
+"""
+
+import os
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXCEL_PATH = "percenty_id.xlsx"
+
+# 작업 시트의 step/서버 컬럼 후보 (기존 로더들과 같은 우선순위)
+STEP_COLUMN_CANDIDATES = ['step', 'Step', 'STEP', 'step2_or_step3']
+SERVER_COLUMN_CANDIDATES = ['final_group', 'server', 'server_name']
+
+
+def find_column(columns, candidates: List[str], keyword: str = None) -> Optional[str]:
+    """
+    후보 이름 순서대로 컬럼 찾기 (없으면 keyword가 포함된 첫 컬럼)
+
+    Args:
+        columns: DataFrame 컬럼 목록
+        candidates: 우선순위 순서의 컬럼명
+        keyword: 후보가 없을 때 소문자 부분 일치로 찾을 키워드
+
+    Returns:
+        str: 컬럼명 또는 None
+    """
+    for name in candidates:
+        if name in columns:
+            return name
+    if keyword:
+        for name in columns:
+            if keyword in str(name).lower():
+                return name
+    return None
+
+
+class WorkbookCache:
+    """파일 버전(mtime, size) 기반 엑셀 워크북 캐시"""
+
+    def __init__(self):
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def file_version(excel_path: str) -> Tuple[float, int]:
+        """파일 버전 (수정 시각, 크기) - 파싱하지 않고 확인"""
+        stat = os.stat(excel_path)
+        return (stat.st_mtime, stat.st_size)
+
+    def _get_entry(self, excel_path: str) -> Dict:
+        """현재 파일 버전의 캐시 항목 반환 (필요하면 모든 시트 파싱)"""
+        key = os.path.abspath(excel_path)
+        version = self.file_version(excel_path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['version'] == version:
+                return entry
+
+            sheets = pd.read_excel(excel_path, sheet_name=None)
+            entry = {'version': version, 'sheets': sheets, 'views': {}}
+            self._entries[key] = entry
+
+            logger.info(f"엑셀 워크북 로드: {excel_path} (시트 {len(sheets)}개)")
+            return entry
+
+    def _get_view(self, excel_path: str, view_key, builder):
+        """파생 뷰를 파일 버전별로 한 번만 생성"""
+        entry = self._get_entry(excel_path)
+        with self._lock:
+            if view_key not in entry['views']:
+                entry['views'][view_key] = builder(entry['sheets'])
+            return entry['views'][view_key]
+
+    def get_version(self, excel_path: str = DEFAULT_EXCEL_PATH) -> Tuple[float, int]:
+        """캐시된 워크북 버전 (파일이 바뀌면 값이 바뀜)"""
+        return self._get_entry(excel_path)['version']
+
+    def sheet_names(self, excel_path: str = DEFAULT_EXCEL_PATH) -> List[str]:
+        """시트 이름 목록 (파일 내 순서)"""
+        return list(self._get_entry(excel_path)['sheets'].keys())
+
+    def read_sheet(self, excel_path: str = DEFAULT_EXCEL_PATH, sheet_name=0) -> pd.DataFrame:
+        """
+        시트 조회 (pd.read_excel 대체)
+
+        Args:
+            excel_path: 엑셀 파일 경로
+            sheet_name: 시트 이름 또는 순번(0부터)
+
+        Returns:
+            pd.DataFrame: 시트 데이터 복사본
+
+        Raises:
+            ValueError: 시트가 없는 경우 (pd.read_excel과 동일)
+        """
+        sheets = self._get_entry(excel_path)['sheets']
+        if isinstance(sheet_name, int):
+            names = list(sheets.keys())
+            if sheet_name >= len(names):
+                raise ValueError(f"Worksheet index {sheet_name} is invalid, {len(names)} worksheets found")
+            sheet_name = names[sheet_name]
+        if sheet_name not in sheets:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        return sheets[sheet_name].copy()
+
+    def accounts_by_email(self, excel_path: str = DEFAULT_EXCEL_PATH, sheet_name: str = "login_id") -> Dict[str, Dict]:
+        """
+        계정 행 조회용 인덱스
+
+        Returns:
+            dict: id(이메일) -> 행 딕셔너리 (행 순서 유지, 'row_index' 포함)
+        """
+        def build(sheets):
+            df = sheets.get(sheet_name)
+            if df is None or 'id' not in df.columns:
+                return {}
+            accounts = {}
+            for row_index, row in enumerate(df.to_dict('records')):
+                email = row.get('id')
+                if pd.isna(email):
+                    continue
+                email = str(email).strip()
+                if email not in accounts:
+                    row['row_index'] = row_index
+                    accounts[email] = row
+            return accounts
+
+        return self._get_view(excel_path, ('accounts', sheet_name), build)
+
+    def get_account(self, account_id: str, excel_path: str = DEFAULT_EXCEL_PATH) -> Optional[Dict]:
+        """login_id 시트의 계정 행 (없으면 None)"""
+        return self.accounts_by_email(excel_path).get(str(account_id).strip())
+
+    def account_task_rows(self, account_id: str, step: str = None, server_name: str = None,
+                          excel_path: str = DEFAULT_EXCEL_PATH) -> Optional[pd.DataFrame]:
+        """
+        계정 작업 시트에서 step/서버로 필터링한 행
+
+        Args:
+            account_id: 계정 ID (이메일)
+            step: 작업 단계 값 (예: step3, None이면 필터 없음)
+            server_name: 서버명 (예: 서버1, None이면 필터 없음)
+            excel_path: 엑셀 파일 경로
+
+        Returns:
+            pd.DataFrame: 원본 행 순서를 유지한 결과 (공유 객체이므로 수정하지 말 것,
+                계정/시트를 찾지 못하면 None)
+        """
+        account = self.get_account(account_id, excel_path)
+        if account is None or pd.isna(account.get('sheet_nickname', float('nan'))):
+            return None
+        sheet_name = account['sheet_nickname']
+
+        def build(sheets):
+            if sheet_name not in sheets:
+                raise ValueError(f"Worksheet named '{sheet_name}' not found")
+            rows = sheets[sheet_name].reset_index(drop=True)
+
+            if step is not None:
+                step_column = find_column(rows.columns, STEP_COLUMN_CANDIDATES, 'step')
+                if step_column:
+                    rows = rows[rows[step_column] == step].reset_index(drop=True)
+
+            if server_name:
+                server_column = find_column(rows.columns, SERVER_COLUMN_CANDIDATES, 'server')
+                if server_column:
+                    rows = rows[rows[server_column] == server_name].reset_index(drop=True)
+
+            return rows
+
+        return self._get_view(excel_path, ('tasks', sheet_name, step, server_name), build)
+
+    def market_rows(self, account_id: str, sheet_name: str = "market_id",
+                    excel_path: str = DEFAULT_EXCEL_PATH) -> pd.DataFrame:
+        """
+        마켓 설정 시트에서 계정(A열 id)과 매칭되는 행
+
+        Returns:
+            pd.DataFrame: 행 순서를 유지한 결과 (없으면 빈 DataFrame)
+        """
+        def build(sheets):
+            if sheet_name not in sheets:
+                raise ValueError(f"Worksheet named '{sheet_name}' not found")
+            df = sheets[sheet_name]
+            if 'id' not in df.columns:
+                return {}
+            return {key: group.reset_index(drop=True) for key, group in df.groupby('id', sort=False)}
+
+        groups = self._get_view(excel_path, ('market', sheet_name), build)
+        rows = groups.get(account_id)
+        if rows is None:
+            return self.read_sheet(excel_path, sheet_name).iloc[0:0]
+        return rows.copy()
+
+    def clear(self):
+        """모든 캐시 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+
+# 프로세스 전역 워크북 캐시 인스턴스
+workbook_cache = WorkbookCache()
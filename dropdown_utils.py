@@ -12,6 +12,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
+from core.utils.selector_race import selector_race
+from core.browser.group_directory import group_directory
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -452,10 +455,12 @@ class PercentyDropdown:
             radio_selector = f"//div[contains(@class, 'ant-modal-body')]//label[contains(@class, 'ant-radio-wrapper')][./span[contains(text(), '{group_name}')]]"
             
             try:
-                radio_element = WebDriverWait(self.driver, timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, radio_selector))
-                )
-                radio_element.click()
+                # 그룹 디렉터리의 캐시된 위치로 바로 선택, 실패하면 선택자로 찾기
+                if not group_directory.click_radio(self.driver, group_name, kind='modal'):
+                    radio_element = WebDriverWait(self.driver, timeout).until(
+                        EC.element_to_be_clickable((By.XPATH, radio_selector))
+                    )
+                    radio_element.click()
                 time.sleep(DELAY_SHORT)
                 logger.info(f"'{group_name}' 그룹이 선택되었습니다.")
                 
@@ -836,11 +841,9 @@ class PercentyDropdown:
                     "//div[contains(@class, 'ant-select-dropdown') and contains(@class, 'ant-select-dropdown-placement-bottomLeft')]//div[contains(@class, 'ant-select-item')]"
                 ]
                 
-                for selector in search_dropdown_selectors:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    if elements:
-                        search_dropdown_open = True
-                        break
+                search_dropdown_open = selector_race.resolve(
+                    self.driver, search_dropdown_selectors, key='search_dropdown_open', visible=False
+                ) is not None
                         
             except Exception as e:
                 logger.warning(f"드롭박스 상태 확인 중 오류: {e}")
@@ -858,17 +861,9 @@ class PercentyDropdown:
                     "//input[contains(@class, 'ant-select-selection-search-input') and not(@readonly)]"
                 ]
                 
-                search_input = None
-                for selector in search_input_selectors:
-                    try:
-                        if selector.startswith('//'):
-                            search_input = self.driver.find_element(By.XPATH, selector)
-                        else:
-                            search_input = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if search_input and search_input.is_displayed():
-                            break
-                    except:
-                        continue
+                match = selector_race.resolve(self.driver, search_input_selectors, key='search_dropdown_input',
+                                              reorder=False)
+                search_input = match.element if match else None
                         
                 if search_input:
                     search_input.clear()
@@ -892,18 +887,14 @@ class PercentyDropdown:
                 f"//div[contains(@class, 'ant-select-dropdown')]//div[@class='ant-select-item-option-content' and text()='{group_name}']"
             ]
             
+            # 여러 요소가 있을 경우 첫 번째 요소 선택 (상품검색용이 먼저 나타남)
             group_element = None
-            for selector in search_specific_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    # 여러 요소가 있을 경우 첫 번째 요소 선택 (상품검색용이 먼저 나타남)
-                    if elements:
-                        group_element = elements[0]
-                        logger.info(f"상품검색용 드롭박스에서 '{group_name}' 그룹 요소를 찾았습니다. (선택자: {selector})")
-                        break
-                except Exception as e:
-                    logger.debug(f"선택자 {selector} 시도 중 오류: {e}")
-                    continue
+            match = selector_race.resolve(
+                self.driver, search_specific_selectors, key='search_dropdown_group', visible=False, reorder=False
+            )
+            if match:
+                group_element = match.element
+                logger.info(f"상품검색용 드롭박스에서 '{group_name}' 그룹 요소를 찾았습니다. (선택자: {match.selector})")
                     
             if not group_element:
                 logger.error(f"상품검색용 드롭박스에서 '{group_name}' 그룹을 찾을 수 없습니다.")
@@ -949,6 +940,10 @@ class PercentyDropdown:
             target_index: 찾을 그룹 인덱스
             max_scrolls: 최대 스크롤 횟수
         """
+        # 가상 목록을 해당 위치로 한 번에 스크롤
+        if group_directory.scroll_to_index(self.driver, target_index):
+            return
+        
         try:
             # 드롭다운 컨테이너 찾기
             scroller_selectors = [
@@ -992,6 +987,11 @@ class PercentyDropdown:
             group_name: 검색할 그룹 이름
             max_scrolls: 최대 스크롤 횟수
         """
+        # 그룹 디렉터리로 그룹 위치에 바로 스크롤 (목록은 세션당 한 번만 읽음)
+        if group_directory.scroll_to_option(self.driver, group_name):
+            logger.info(f"'{group_name}' 그룹을 찾았습니다.")
+            return True
+        
         try:
             # 드롭다운 컨테이너 찾기
             scroller_selectors = [
@@ -1059,6 +1059,12 @@ class PercentyDropdown:
         try:
             logger.info(f"그룹상품관리 화면에서 '{group_name}' 그룹 선택")
             
+            # 그룹 디렉터리의 캐시된 위치로 바로 선택
+            if group_directory.click_radio(self.driver, group_name, kind='management'):
+                time.sleep(DELAY_SHORT)
+                logger.info(f"'{group_name}' 그룹이 선택되었습니다.")
+                return True
+            
             # 라디오 버튼 선택자
             selectors = [
                 # 그룹명으로 바로 선택
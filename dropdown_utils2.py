@@ -14,6 +14,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 
+from core.browser.group_directory import group_directory
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -475,6 +477,11 @@ class ProductSearchDropdownManager:
             bool: 그룹을 찾았는지 여부
         """
         try:
+            # 그룹 디렉터리로 그룹 위치에 바로 스크롤 (목록은 세션당 한 번만 읽음)
+            if group_directory.scroll_to_option(self.driver, group_name) and self._find_and_click_group_option(group_name):
+                logger.info(f"'{group_name}' 그룹을 찾았습니다. (그룹 디렉터리)")
+                return True
+            
             logger.info(f"드롭다운 내에서 '{group_name}' 그룹 스크롤 검색 (최대 {max_scrolls}회)")
             
             # 드롭다운 컨테이너 찾기 (스크롤 가능한 컨테이너 우선)
@@ -1141,12 +1148,16 @@ class ProductSearchDropdownManager:
             radio_selector = f"//div[contains(@class, 'ant-modal-body')]//label[contains(@class, 'ant-radio-wrapper')][./span[contains(text(), '{group_name}')]]"
             
             try:
-                radio_element = WebDriverWait(self.driver, timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, radio_selector))
-                )
-                radio_element.click()
+                # 그룹 디렉터리의 캐시된 위치로 바로 선택, 실패하면 선택자로 찾기
+                if group_directory.click_radio(self.driver, group_name, kind='modal'):
+                    logger.info(f"'{group_name}' 그룹이 선택되었습니다. (그룹 디렉터리)")
+                else:
+                    radio_element = WebDriverWait(self.driver, timeout).until(
+                        EC.element_to_be_clickable((By.XPATH, radio_selector))
+                    )
+                    radio_element.click()
+                    logger.info(f"'{group_name}' 그룹이 선택되었습니다.")
                 time.sleep(0.5)
-                logger.info(f"'{group_name}' 그룹이 선택되었습니다.")
                 
                 # 확인 버튼 클릭
                 confirm_button_selector = "//div[contains(@class, 'ant-modal-footer')]//button[contains(@class, 'ant-btn-primary')][.//span[text()='확인']]"
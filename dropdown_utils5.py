@@ -15,6 +15,7 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 
 # 공통 드롭다운 유틸리티 임포트
 from dropdown_utils_common import get_common_dropdown_utils
+from core.browser.group_directory import group_directory
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -834,6 +835,12 @@ class PercentyDropdown:
         try:
             logger.info(f"그룹상품관리 화면에서 '{group_name}' 그룹 선택")
             
+            # 그룹 디렉터리의 캐시된 위치로 바로 선택
+            if group_directory.click_radio(self.driver, group_name, kind='management'):
+                time.sleep(DELAY_SHORT)
+                logger.info(f"'{group_name}' 그룹이 선택되었습니다.")
+                return True
+            
             # 라디오 버튼 선택자
             selectors = [
                 f"//div[contains(@class, 'ant-radio-group')]//label[contains(@class, 'ant-radio-wrapper')][./span[contains(text(), '{group_name}')]]",
@@ -1201,7 +1208,13 @@ class PercentyDropdown:
             radio_element = None
             used_selector = None
             
-            for i, selector in enumerate(radio_selectors):
+            # 그룹 디렉터리의 캐시된 위치로 바로 선택, 실패하면 선택자로 찾기
+            radio_clicked = group_directory.click_radio(self.driver, group_name, kind='modal')
+            if radio_clicked:
+                time.sleep(0.5)
+                logger.info(f"'{group_name}' 그룹이 선택되었습니다. (그룹 디렉터리)")
+            
+            for i, selector in enumerate([] if radio_clicked else radio_selectors):
                 try:
                     logger.info(f"선택자 {i+1} 시도: {selector}")
                     radio_element = WebDriverWait(self.driver, 2).until(
@@ -1214,7 +1227,7 @@ class PercentyDropdown:
                     logger.warning(f"선택자 {i+1} 실패")
                     continue
             
-            if radio_element is None:
+            if radio_element is None and not radio_clicked:
                 # 모든 라디오 버튼 목록 출력해서 디버깅
                 try:
                     all_radios = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'ant-modal-body')]//label[contains(@class, 'ant-radio-wrapper')]")
@@ -1233,14 +1246,15 @@ class PercentyDropdown:
                 return False
             
             # 그룹 선택
-            try:
-                radio_element.click()
-                time.sleep(0.5)
-                logger.info(f"'{group_name}' 그룹이 선택되었습니다. (사용된 선택자: {used_selector})")
-            except Exception as e:
-                logger.error(f"그룹 클릭 실패: {e}")
-                self._close_modal_if_open()
-                return False
+            if not radio_clicked:
+                try:
+                    radio_element.click()
+                    time.sleep(0.5)
+                    logger.info(f"'{group_name}' 그룹이 선택되었습니다. (사용된 선택자: {used_selector})")
+                except Exception as e:
+                    logger.error(f"그룹 클릭 실패: {e}")
+                    self._close_modal_if_open()
+                    return False
                 
             # 확인 버튼 클릭
             confirm_button_selectors = [
@@ -1376,6 +1390,11 @@ class PercentyDropdown:
             group_name: 찾을 그룹 이름
         """
         try:
+            # 그룹 디렉터리로 그룹 위치에 바로 스크롤 (목록은 세션당 한 번만 읽음)
+            if group_directory.scroll_to_option(self.driver, group_name):
+                logger.info(f"'{group_name}' 그룹을 찾았습니다.")
+                return True
+            
             logger.info(f"공통 유틸리티를 사용하여 '{group_name}' 그룹 스크롤 검색")
             # 공통 유틸리티의 고급 스크롤 검색 사용
             return self.common_utils.advanced_scroll_and_search_for_group(group_name)
@@ -1,4 +1,5 @@
 import logging
+import os
 import time
 import random
 import logging
@@ -11,26 +12,56 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 import base64
 from PIL import Image
 import io
+import re
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
-# EasyOCR 초기화 (선택적)
-try:
-    import easyocr
-    # EasyOCR 리더 초기화 (중문 간체만)
-    easyocr_reader = easyocr.Reader(['ch_sim'], gpu=False)
-    OCR_AVAILABLE = True
-    logger = logging.getLogger(__name__)
-    logger.info(f"EasyOCR 초기화 완료 - OCR_AVAILABLE={OCR_AVAILABLE}")
-except ImportError:
-    OCR_AVAILABLE = False
-    easyocr_reader = None
-    logger = logging.getLogger(__name__)
+from core.utils.ocr_service import ocr_service
+from core.utils.ocr_verdict_cache import ocr_verdict_cache, compute_image_hash, chinese_verdict, CHINESE_CONFIDENCE_THRESHOLD
+from core.utils.text_region_filter import text_region_filter
+from core.utils.action_grammar import compile_translate_command
+
+logger = logging.getLogger(__name__)
+
+# EasyOCR 사용 가능 여부 (모델은 처음 사용할 때 ocr_service가 로딩)
+OCR_AVAILABLE = ocr_service.is_available()
+if not OCR_AVAILABLE:
     logger.warning(f"EasyOCR를 사용할 수 없습니다. pip install easyocr로 설치하세요. OCR_AVAILABLE={OCR_AVAILABLE}")
-except Exception as e:
-    OCR_AVAILABLE = False
-    easyocr_reader = None
-    logger = logging.getLogger(__name__)
-    logger.error(f"EasyOCR 초기화 실패: {e}. OCR_AVAILABLE={OCR_AVAILABLE}")
+
+# 일괄 스캔 모드: 모달의 썸네일 원본 URL을 한 번에 읽어 워커 스레드에서 OCR
+BATCH_SCAN_WORKERS = 4
+BATCH_SCAN_DOWNLOAD_TIMEOUT = 10
+
+# 모달 썸네일 원본 URL 수집 스크립트 (_move_to_image_position_dom 위치 순서와 동일)
+_COLLECT_THUMB_SOURCES_SCRIPT = """
+    return Array.from(document.querySelectorAll('img.p_tooltip_image_editor_thumb'))
+        .map(function(img) { return img.currentSrc || img.src || ''; });
+"""
+
+# 캔버스 캡처: 짧은 변을 줄인 JPEG로 받아 전송량과 디코딩 비용을 줄임 (OCR 입력은 그레이스케일)
+# 긴 변 기준으로 줄이면 세로로 긴 상세 이미지의 글자가 OCR이 읽지 못할 만큼 작아지므로 짧은 변 기준으로 제한
+# (PERCENTY_CANVAS_CAPTURE_MAX_SHORT_SIDE 환경변수로 변경, 0이면 줄이지 않음)
+CANVAS_CAPTURE_MAX_SHORT_SIDE = int(os.getenv("PERCENTY_CANVAS_CAPTURE_MAX_SHORT_SIDE", "1200"))
+CANVAS_CAPTURE_JPEG_QUALITY = 0.85
+
+_CAPTURE_CANVAS_SCRIPT = """
+    var source = arguments[0], maxShortSide = arguments[1], quality = arguments[2];
+    var shortSide = Math.min(source.width, source.height);
+    var scale = (maxShortSide > 0 && shortSide > 0) ? Math.min(1, maxShortSide / shortSide) : 1;
+    var target = source;
+    if (scale < 1) {
+        target = document.createElement('canvas');
+        target.width = Math.max(1, Math.round(source.width * scale));
+        target.height = Math.max(1, Math.round(source.height * scale));
+        target.getContext('2d').drawImage(source, 0, 0, target.width, target.height);
+    }
+    var url = target.toDataURL('image/jpeg', quality);
+    return url.substring(url.indexOf(',') + 1);
+"""
+
+# alicdn 썸네일 크기 접미사 (예: xxx.jpg_100x100.jpg) 제거용
+_ALICDN_RESIZE_SUFFIX = re.compile(r'(\.(?:jpe?g|png|webp))_[^/]*$', re.IGNORECASE)
+
 
 class HumanLikeDelay:
     """
@@ -68,6 +99,8 @@ class ImageTranslationHandler:
         self.driver = driver
         self.logger = logging.getLogger(__name__)
         self.human_delay = HumanLikeDelay()
+        # 스캔 시 이미지를 하나씩 이동하지 않고 원본 URL을 일괄 OCR (실패 시 기존 방식)
+        self.batch_scan = True
         
     def image_translate(self, action_value, context='detail'):
         """이미지 번역 처리 메인 메서드
@@ -107,6 +140,7 @@ class ImageTranslationHandler:
                 else:
                     self.logger.info("번역할 이미지가 없습니다 (중국어 텍스트 미감지)")
                 
+                self.logger.info(f"OCR 사전 필터 누적 통계: {text_region_filter.format_stats()}")
                 return translated_count
                 
             finally:
@@ -119,119 +153,14 @@ class ImageTranslationHandler:
             return 0
             
     def _parse_image_translate_action(self, action_value):
-        """이미지 번역 액션 값 파싱 (기존 방식 호환, '/' 구분자 지원)"""
-        try:
-            if not action_value or action_value.strip() == "":
-                self.logger.warning("이미지 번역 액션 값이 비어있음")
-                return None
-            
-            # '/' 구분자로 복합 명령어 처리
-            if '/' in action_value:
-                try:
-                    parts = action_value.split('/')
-                    combined_positions = []
-                    
-                    for part in parts:
-                        part = part.strip()
-                        if not part:
-                            continue
-                        
-                        # 각 부분을 개별적으로 파싱
-                        parsed_part = self._parse_single_translate_command(part)
-                        if parsed_part and parsed_part.get('positions'):
-                            combined_positions.extend(parsed_part['positions'])
-                    
-                    if combined_positions:
-                        self.logger.info(f"복합 이미지 번역 명령어 파싱 완료: {action_value} -> {combined_positions}")
-                        return {
-                            'type': 'image_translate',
-                            'positions': combined_positions
-                        }
-                    else:
-                        self.logger.warning(f"복합 명령어에서 유효한 위치를 찾을 수 없음: {action_value}")
-                        return None
-                        
-                except Exception as e:
-                    self.logger.warning(f"복합 명령어 파싱 중 오류: {action_value}, 오류: {e}")
-                    return None
-            
-            # 단일 명령어 파싱
-            return self._parse_single_translate_command(action_value)
-            
-        except Exception as e:
-            self.logger.error(f"이미지 번역 액션 파싱 오류: {e}")
-            return None
-    
-    def _parse_single_translate_command(self, action_value):
-        """단일 이미지 번역 명령어 파싱"""
-        # 쉼표로 분리하여 이미지 위치 목록 생성
-        positions = []
-        for pos in action_value.split(','):
-            pos = pos.strip()
-            
-            # 숫자인 경우
-            if pos.isdigit():
-                positions.append(int(pos))
-            # "first:숫자" 형식인 경우 (첫 번째부터 지정된 번째까지)
-            elif pos.startswith('first:'):
-                try:
-                    num = int(pos.split(':')[1])
-                    # first:2는 1,2를 의미 (첫 번째부터 두 번째까지)
-                    for i in range(1, num + 1):
-                        positions.append(i)
-                    self.logger.info(f"first 형식 파싱: {pos} -> {list(range(1, num + 1))}")
-                except (IndexError, ValueError):
-                    self.logger.warning(f"잘못된 first 형식: {pos}")
-            # "last:숫자" 형식인 경우 (마지막부터 지정된 개수만큼)
-            elif pos.startswith('last:'):
-                try:
-                    num = int(pos.split(':')[1])
-                    # last:1은 마지막 1개, last:2는 마지막 2개를 의미
-                    # 실제 이미지 개수를 확인해야 하므로 임시로 음수로 저장
-                    # 나중에 실제 이미지 개수를 확인한 후 계산
-                    positions.append(f'last:{num}')
-                    self.logger.info(f"last 형식 파싱: {pos} -> last:{num} (실제 위치는 이미지 개수 확인 후 계산)")
-                except (IndexError, ValueError):
-                    self.logger.warning(f"잘못된 last 형식: {pos}")
-            # "specific:숫자" 형식인 경우 (특정 위치 지정)
-            elif pos.startswith('specific:'):
-                try:
-                    value = pos.split(':')[1]
-                    if value == 'all':
-                        # specific:all인 경우 새로운 순차 처리 방식 사용
-                        self.logger.info("specific:all 형식 - 새로운 순차 처리 모드")
-                        positions.append('sequential_all')
-                    else:
-                        num = int(value)
-                        positions.append(num)
-                        self.logger.info(f"specific 형식 파싱: {pos} -> {num}")
-                except (IndexError, ValueError):
-                    self.logger.warning(f"잘못된 specific 형식: {pos}")
-            # "auto_detect_chinese" 형식인 경우 (중문글자 자동 감지)
-            elif pos == 'auto_detect_chinese':
-                self.logger.info("auto_detect_chinese 형식 - 중문글자 자동 감지 모드")
-                positions.append('auto_detect_chinese')
-            # "special:N" 형식인 경우 (N번째 이미지까지만 스캔)
-            elif pos.startswith('special:'):
-                try:
-                    max_position = int(pos.split(':')[1])
-                    self.logger.info(f"special 형식 파싱: {pos} -> 최대 {max_position}번째까지 스캔")
-                    positions.append(f'special:{max_position}')
-                except (IndexError, ValueError):
-                    self.logger.warning(f"잘못된 special 형식: {pos}")
-            else:
-                self.logger.warning(f"잘못된 이미지 위치 값: {pos}")
-        
-        if not positions:
-            self.logger.error("유효한 이미지 위치가 없음")
-            return None
-        
-        action_info = {
-            'type': 'image_translate',
-            'positions': positions
-        }
+        """이미지 번역 액션 값 파싱 (컴파일된 위치 계획 사용, '/' 구분자 지원)"""
+        plan = compile_translate_command(action_value)
+        for error in plan.errors:
+            self.logger.warning(f"이미지 번역 액션 파싱: {error}")
         
-        self.logger.info(f"이미지 번역 액션 파싱 완료: {action_info}")
+        action_info = plan.to_dict()
+        if action_info:
+            self.logger.info(f"이미지 번역 액션 파싱 완료: {action_info}")
         return action_info
             
     def _process_image_translate_action(self, action_info, context='detail'):
@@ -1162,10 +1091,35 @@ class ImageTranslationHandler:
             return False
             
     def _extract_canvas_image(self):
-        """캔버스에서 이미지 데이터 추출"""
+        """캔버스에서 이미지 데이터 추출
+        
+        브라우저에서 짧은 변을 CANVAS_CAPTURE_MAX_SHORT_SIDE 이하로 줄인 JPEG로 받아
+        그레이스케일 배열로 바로 디코딩합니다. 실패하면 기존 PNG 방식으로 추출합니다.
+        
+        Returns:
+            numpy.ndarray: 그레이스케일(2차원) 또는 PNG 방식의 원본 배열, 실패 시 None
+        """
         try:
             canvas = self.driver.find_element(By.ID, "pCanvas")
+        except Exception as e:
+            self.logger.error(f"캔버스 이미지 추출 실패: {e}")
+            return None
+        
+        try:
+            canvas_base64 = self.driver.execute_script(
+                _CAPTURE_CANVAS_SCRIPT, canvas, CANVAS_CAPTURE_MAX_SHORT_SIDE, CANVAS_CAPTURE_JPEG_QUALITY
+            )
+            
+            image = Image.open(io.BytesIO(base64.b64decode(canvas_base64)))
+            # JPEG는 디코딩 단계에서 바로 그레이스케일로 풀어 변환 비용을 줄임
+            image.draft('L', image.size)
+            
+            return np.asarray(image.convert('L'))
             
+        except Exception as e:
+            self.logger.debug(f"캔버스 JPEG 캡처 실패, PNG 방식으로 재시도: {e}")
+        
+        try:
             # 캔버스를 base64로 변환
             canvas_base64 = self.driver.execute_script(
                 "return arguments[0].toDataURL('image/png').substring(22);", canvas
@@ -1184,7 +1138,7 @@ class ImageTranslationHandler:
     def _detect_chinese_from_image(self, image_data):
         """이미지에서 중국어 텍스트 감지"""
         try:
-            if not OCR_AVAILABLE or easyocr_reader is None:
+            if not ocr_service.is_available():
                 self.logger.warning("EasyOCR이 초기화되지 않음 - 속성 기반 중문글자 감지 사용")
                 # OCR이 없어도 속성 기반으로 중국어 감지 시도
                 return self._detect_chinese_from_attributes()
@@ -1210,6 +1164,23 @@ class ImageTranslationHandler:
                 self.logger.warning(f"이미지 크기가 너무 작음 ({image.size}) - OCR 건너뜀")
                 return False
             
+            # 같은 이미지의 이전 판정이 있으면 OCR 생략
+            image_hash = compute_image_hash(image)
+            cached = ocr_verdict_cache.get(image_hash)
+            if cached is not None:
+                self.logger.info(f"OCR 판정 캐시 적중 ({image_hash}) - 중문 포함: {cached['has_chinese']}")
+                return cached['has_chinese']
+            
+            # 사전 필터: 글자 후보가 없으면 OCR 생략, 후보 영역이 있으면 그 부분만 인식
+            if isinstance(image_data, np.ndarray) and image_data.ndim == 2:
+                gray_original = image_data
+            else:
+                gray_original = np.array(image.convert('L'))
+            prefilter = text_region_filter.analyze(gray_original)
+            if not prefilter.has_text:
+                self.logger.info(f"사전 필터: 텍스트 후보 없음 (에지 밀도 {prefilter.edge_density:.3f}) - OCR 생략")
+                return False
+            
             # 이미지 크기 조정 (너무 작으면 확대)
             width, height = image.size
             if width < 200 or height < 200:
@@ -1230,31 +1201,33 @@ class ImageTranslationHandler:
             image_array = np.array(gray_image)
             self.logger.info("EasyOCR 실행 시작 (언어: 중문만)")
             
-            import time
             start_time = time.time()
-            results = easyocr_reader.readtext(image_array)
+            if prefilter.regions:
+                results = self._readtext_regions(gray_original, prefilter.regions)
+            else:
+                results = ocr_service.readtext(image_array)
+                text_region_filter.record_ocr_time(time.time() - start_time)
             ocr_time = time.time() - start_time
             self.logger.info(f"EasyOCR 완료 - {len(results)}개 텍스트 블록 감지 (처리 시간: {ocr_time:.2f}초)")
             
-            # 결과에서 텍스트만 추출 (신뢰도 0.3 이상만)
+            # 결과에서 텍스트만 추출 (판정 기준 신뢰도 이상만)
             text_parts = []
             for bbox, text, confidence in results:
-                if confidence >= 0.3:  # 신뢰도 30% 이상만 사용
+                if confidence >= CHINESE_CONFIDENCE_THRESHOLD:
                     text_parts.append(text)
                     self.logger.debug(f"텍스트 블록 '{text}' (신뢰도: {confidence:.3f})")
             
             text = ' '.join(text_parts)
             self.logger.info(f"추출된 전체 텍스트 (길이: {len(text)}): '{text.strip()}'")
             
-            # 중문글자 정규식 패턴으로 확인
-            import re
-            chinese_pattern = r'[\u4e00-\u9fff]+'
-            chinese_matches = re.findall(chinese_pattern, text)
+            # 중문글자 판정 (다른 판정 경로와 같은 기준)
+            has_chinese, chinese_confidence, chinese_texts = chinese_verdict(results)
             
-            self.logger.info(f"중문글자 패턴 검사 결과 - 매치 수: {len(chinese_matches)}")
-            if chinese_matches:
-                self.logger.info(f"발견된 중문글자: {chinese_matches}")
-                self.logger.info(f"OCR에서 중문글자 발견 - {chinese_matches[:3]}...")  # 처음 3개만 로그
+            self.logger.info(f"중문글자 검사 결과 - 중문 블록 수: {len(chinese_texts)}")
+            ocr_verdict_cache.put(image_hash, has_chinese, chinese_confidence)
+            if has_chinese:
+                self.logger.info(f"발견된 중문글자 블록: {chinese_texts}")
+                self.logger.info(f"OCR에서 중문글자 발견 - {chinese_texts[:3]}...")  # 처음 3개만 로그
                 return True
             else:
                 self.logger.info("OCR에서 중문글자 없음")
@@ -1274,6 +1247,14 @@ class ImageTranslationHandler:
                 # 일반적인 오류의 경우 안전하게 번역 시도
                 return True
     
+    def _readtext_regions(self, gray_array, regions):
+        """사전 필터가 찾은 텍스트 후보 영역만 잘라서 OCR"""
+        results = []
+        for region in regions:
+            results.extend(ocr_service.readtext(text_region_filter.crop(gray_array, region)))
+        self.logger.info(f"사전 필터: 텍스트 후보 {len(regions)}개 영역만 OCR")
+        return results
+    
     def _detect_chinese_from_attributes(self):
         """속성 기반 중국어 감지 (OCR 없이)"""
         try:
@@ -1465,6 +1446,10 @@ class ImageTranslationHandler:
             list: 번역이 필요한 이미지 위치 리스트
         """
         try:
+            batched = self._scan_images_batched(scan_images)
+            if batched is not None:
+                return batched
+            
             images_to_translate = []
             
             self.logger.info(f"제한된 {scan_images}개 이미지 스캔 시작")
@@ -1496,6 +1481,10 @@ class ImageTranslationHandler:
     def _scan_all_images_for_translation(self, total_images, context='detail'):
         """모든 이미지를 스캔하여 번역이 필요한 이미지 위치 식별"""
         try:
+            batched = self._scan_images_batched(total_images)
+            if batched is not None:
+                return batched
+            
             images_to_translate = []
             
             self.logger.info(f"총 {total_images}개 이미지 스캔 시작")
@@ -1524,6 +1513,91 @@ class ImageTranslationHandler:
             self.logger.error(f"이미지 스캔 오류: {e}")
             return []
             
+    def _scan_images_batched(self, scan_images):
+        """썸네일 원본 URL을 한 번에 수집하여 워커 스레드에서 일괄 OCR
+        
+        브라우저에서 이미지를 하나씩 이동/캡처하지 않으므로 스캔 동안 브라우저는 대기만 합니다.
+        
+        Args:
+            scan_images (int): 스캔할 이미지 개수
+            
+        Returns:
+            list: 번역이 필요한 이미지 위치 리스트 (일괄 스캔 불가 시 None → 기존 방식)
+        """
+        if not self.batch_scan or scan_images <= 0:
+            return None
+        
+        try:
+            sources = self.driver.execute_script(_COLLECT_THUMB_SOURCES_SCRIPT) or []
+        except Exception as e:
+            self.logger.debug(f"썸네일 URL 수집 실패 - 기존 스캔 방식 사용: {e}")
+            return None
+        
+        sources = sources[:scan_images]
+        if len(sources) < scan_images or any(not src or not src.startswith('http') for src in sources):
+            self.logger.info(f"썸네일 URL {len(sources)}/{scan_images}개만 확인됨 - 기존 스캔 방식 사용")
+            return None
+        
+        start_time = time.time()
+        self.logger.info(f"일괄 스캔 시작: {scan_images}개 이미지 (워커 {BATCH_SCAN_WORKERS}개)")
+        
+        with ThreadPoolExecutor(max_workers=BATCH_SCAN_WORKERS, thread_name_prefix="ocr-scan") as executor:
+            verdicts = list(executor.map(self._detect_chinese_from_url, sources))
+        
+        if any(verdict is None for verdict in verdicts):
+            # 일부 이미지를 받지 못하면 판정이 불완전하므로 전체를 기존 방식으로 스캔
+            self.logger.info("일부 이미지 OCR 실패 - 기존 스캔 방식 사용")
+            return None
+        
+        images_to_translate = [position for position, has_chinese in enumerate(verdicts, start=1) if has_chinese]
+        self.logger.info(f"일괄 스캔 완료: {len(images_to_translate)}개 이미지가 번역 대상으로 식별됨 "
+                         f"({time.time() - start_time:.2f}초)")
+        return images_to_translate
+    
+    def _detect_chinese_from_url(self, src):
+        """원본 이미지 URL을 내려받아 중국어 포함 여부 판정 (워커 스레드용)
+        
+        Returns:
+            bool: 중국어 포함 여부 (다운로드/OCR 실패 시 None)
+        """
+        try:
+            src = _ALICDN_RESIZE_SUFFIX.sub(r'\1', src)
+            
+            cached = ocr_verdict_cache.get(src=src)
+            if cached is not None:
+                return cached['has_chinese']
+            
+            import requests
+            response = requests.get(src, timeout=BATCH_SCAN_DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+            image = Image.open(io.BytesIO(response.content))
+            
+            image_hash = compute_image_hash(image)
+            cached = ocr_verdict_cache.get(image_hash)
+            if cached is not None:
+                ocr_verdict_cache.put(image_hash, cached['has_chinese'], cached['confidence'], src=src)
+                return cached['has_chinese']
+            
+            gray_array = np.array(image.convert('L'))
+            prefilter = text_region_filter.analyze(gray_array)
+            if not prefilter.has_text:
+                return False
+            
+            if prefilter.regions:
+                results = self._readtext_regions(gray_array, prefilter.regions)
+            else:
+                ocr_start = time.time()
+                results = ocr_service.readtext(gray_array)
+                text_region_filter.record_ocr_time(time.time() - ocr_start)
+            
+            has_chinese, chinese_confidence, _ = chinese_verdict(results)
+            ocr_verdict_cache.put(image_hash, has_chinese, chinese_confidence, src=src)
+            return has_chinese
+            
+        except Exception as e:
+            self.logger.debug(f"이미지 URL OCR 실패 ({src[:80]}): {e}")
+            return None
+    
     def _process_specific_images_for_translation(self, images_to_translate):
         """식별된 특정 이미지들만 번역 처리"""
         try:
@@ -1568,7 +1642,7 @@ class ImageTranslationHandler:
         """현재 이미지에서 중국어 감지 (스캔용)"""
         try:
             # OCR을 통한 중국어 감지
-            if OCR_AVAILABLE and easyocr_reader:
+            if ocr_service.is_available():
                 try:
                     # 캔버스에서 이미지 데이터 추출
                     image_data = self._extract_canvas_image()
@@ -1577,17 +1651,34 @@ class ImageTranslationHandler:
                         self.logger.debug("이미지 데이터 추출 실패 - 중국어 감지 불가")
                         return False
                     
+                    # 같은 이미지의 이전 판정이 있으면 OCR 생략
+                    image_hash = compute_image_hash(image_data)
+                    cached = ocr_verdict_cache.get(image_hash)
+                    if cached is not None:
+                        self.logger.debug(f"OCR 판정 캐시 적중 ({image_hash}) - 중문 포함: {cached['has_chinese']}")
+                        return cached['has_chinese']
+                    
+                    # 사전 필터: 글자 후보가 없으면 OCR 생략, 후보 영역이 있으면 그 부분만 인식
+                    gray_array = image_data if image_data.ndim == 2 else np.array(Image.fromarray(image_data).convert('L'))
+                    prefilter = text_region_filter.analyze(gray_array)
+                    if not prefilter.has_text:
+                        self.logger.debug(f"사전 필터: 텍스트 후보 없음 (에지 밀도 {prefilter.edge_density:.3f}) - OCR 생략")
+                        return False
+                    
                     # EasyOCR로 텍스트 추출
-                    results = easyocr_reader.readtext(image_data)
+                    if prefilter.regions:
+                        results = self._readtext_regions(gray_array, prefilter.regions)
+                    else:
+                        start_time = time.time()
+                        results = ocr_service.readtext(gray_array)
+                        text_region_filter.record_ocr_time(time.time() - start_time)
                     
-                    # 중국어 글자 확인
-                    for (bbox, text, confidence) in results:
-                        if confidence > 0.3:  # 신뢰도 임계값
-                            # 중국어 글자 범위 확인 (간체)
-                            for char in text:
-                                if '\u4e00' <= char <= '\u9fff':  # 중국어 유니코드 범위
-                                    self.logger.debug(f"중국어 감지: '{char}' (신뢰도: {confidence:.2f})")
-                                    return True
+                    # 중국어 글자 확인 (다른 판정 경로와 같은 기준)
+                    has_chinese, chinese_confidence, chinese_texts = chinese_verdict(results)
+                    ocr_verdict_cache.put(image_hash, has_chinese, chinese_confidence)
+                    if has_chinese:
+                        self.logger.debug(f"중국어 감지: '{chinese_texts[0]}' (신뢰도: {chinese_confidence:.2f})")
+                        return True
                                     
                 except Exception as e:
                     self.logger.debug(f"OCR 중국어 감지 중 오류: {e}")
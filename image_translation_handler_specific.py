@@ -9,6 +9,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from core.utils.action_grammar import compile_translate_command
 
 # logger를 먼저 정의
 logger = logging.getLogger(__name__)
@@ -16,19 +17,16 @@ logger = logging.getLogger(__name__)
 try:
     from PIL import Image
     import io
-    import easyocr
     import numpy as np
     import os
-    
-    # EasyOCR 초기화 시도
-    try:
-        # EasyOCR 리더 초기화 (중문 간체만)
-        easyocr_reader = easyocr.Reader(['ch_sim'], gpu=False)
-        OCR_AVAILABLE = True
-        logger.info(f"EasyOCR 초기화 완료 - OCR_AVAILABLE={OCR_AVAILABLE}")
-    except Exception as e:
-        OCR_AVAILABLE = False
-        logger.warning(f"EasyOCR 초기화 실패: {e}. 속성 기반 중문글자 감지만 사용됩니다. OCR_AVAILABLE={OCR_AVAILABLE}")
+    from core.utils.ocr_service import ocr_service
+    from core.utils.ocr_verdict_cache import ocr_verdict_cache, compute_image_hash, chinese_verdict, CHINESE_CONFIDENCE_THRESHOLD
+    from core.utils.text_region_filter import text_region_filter
+
+    # EasyOCR 사용 가능 여부 (모델은 처음 사용할 때 ocr_service가 로딩)
+    OCR_AVAILABLE = ocr_service.is_available()
+    if not OCR_AVAILABLE:
+        logger.warning(f"EasyOCR를 사용할 수 없습니다. 속성 기반 중문글자 감지만 사용됩니다. OCR_AVAILABLE={OCR_AVAILABLE}")
         
 except ImportError as e:
     OCR_AVAILABLE = False
@@ -128,6 +126,9 @@ class ImageTranslationHandler:
         """
         이미지 번역 액션 값 파싱
         
+        컴파일된 위치 계획을 사용하며, last:N은 현재 이미지 개수로 계산하고
+        specific:all은 중문글자 이미지 자동 감지로 처리합니다.
+        
         Args:
             action_value (str): 액션 값 (예: "1,2,3" 또는 "first:1/last:1")
             
@@ -135,119 +136,46 @@ class ImageTranslationHandler:
             dict: 파싱된 액션 정보
         """
         try:
-            if not action_value or action_value.strip() == "":
-                logger.warning("이미지 번역 액션 값이 비어있음")
-                return None
-            
-            # '/' 구분자로 복합 명령어 처리
-            if '/' in action_value:
-                try:
-                    parts = action_value.split('/')
-                    combined_positions = []
-                    
-                    for part in parts:
-                        part = part.strip()
-                        if not part:
-                            continue
-                        
-                        # 각 부분을 개별적으로 파싱
-                        parsed_part = self._parse_single_translate_command(part)
-                        if parsed_part and parsed_part.get('positions'):
-                            combined_positions.extend(parsed_part['positions'])
-                    
-                    if combined_positions:
-                        logger.info(f"복합 이미지 번역 명령어 파싱 완료: {action_value} -> {combined_positions}")
-                        return {
-                            'type': 'image_translate',
-                            'positions': combined_positions
-                        }
-                    else:
-                        logger.warning(f"복합 명령어에서 유효한 위치를 찾을 수 없음: {action_value}")
-                        return None
-                        
-                except Exception as e:
-                    logger.warning(f"복합 명령어 파싱 중 오류: {action_value}, 오류: {e}")
-                    return None
-            
-            # 단일 명령어 파싱
-            return self._parse_single_translate_command(action_value)
-            
-        except Exception as e:
-            logger.error(f"이미지 번역 액션 파싱 오류: {e}")
-            return None
-    
-    def _parse_single_translate_command(self, action_value):
-        """
-        단일 이미지 번역 명령어 파싱
-        
-        Args:
-            action_value (str): 단일 액션 값
-            
-        Returns:
-            dict: 파싱된 액션 정보
-        """
-        # 쉼표로 분리하여 이미지 위치 목록 생성
-        positions = []
-        for pos in action_value.split(','):
-            pos = pos.strip()
-            
-            # 숫자인 경우
-            if pos.isdigit():
-                positions.append(int(pos))
-            # "first:숫자" 형식인 경우 (첫 번째부터 지정된 번째까지)
-            elif pos.startswith('first:'):
-                try:
-                    num = int(pos.split(':')[1])
-                    # first:2는 1,2를 의미 (첫 번째부터 두 번째까지)
-                    for i in range(1, num + 1):
-                        positions.append(i)
-                    logger.info(f"first 형식 파싱: {pos} -> {list(range(1, num + 1))}")
-                except (IndexError, ValueError):
-                    logger.warning(f"잘못된 first 형식: {pos}")
-            # "last:숫자" 형식인 경우
-            elif pos.startswith('last:'):
-                try:
+            plan = compile_translate_command(action_value)
+            for error in plan.errors:
+                logger.warning(f"이미지 번역 액션 파싱: {error}")
+            
+            positions = []
+            for pos in plan.positions:
+                if isinstance(pos, int):
+                    positions.append(pos)
+                elif pos == 'sequential_all':
+                    logger.info("specific:all 형식 - 중문글자 이미지 자동 감지 모드")
+                    positions.append('auto_detect_chinese')
+                elif pos.startswith('last:'):
                     num = int(pos.split(':')[1])
                     # 전체 이미지 개수를 확인하여 마지막 N개 이미지의 위치 계산
                     total_images = self._get_total_image_count()
                     if total_images > 0:
-                        # last:1이면 마지막 1개, last:2면 마지막 2개
                         start_pos = max(1, total_images - num + 1)
-                        for i in range(start_pos, total_images + 1):
-                            positions.append(i)
+                        positions.extend(range(start_pos, total_images + 1))
                         logger.info(f"last 형식 파싱: {pos} -> {list(range(start_pos, total_images + 1))} (총 {total_images}개 이미지 중)")
                     else:
                         logger.warning(f"이미지 개수를 확인할 수 없어 last 명령어 처리 불가: {pos}")
-                except (IndexError, ValueError):
-                    logger.warning(f"잘못된 last 형식: {pos}")
-            # "specific:숫자" 형식인 경우 (특정 위치 지정)
-            elif pos.startswith('specific:'):
-                try:
-                    value = pos.split(':')[1]
-                    if value == 'all':
-                        # specific:all인 경우 중문글자가 있는 이미지 자동 감지
-                        logger.info("specific:all 형식 - 중문글자 이미지 자동 감지 모드")
-                        positions.append('auto_detect_chinese')
-                    else:
-                        num = int(value)
-                        positions.append(num)
-                        logger.info(f"specific 형식 파싱: {pos} -> {num}")
-                except (IndexError, ValueError):
-                    logger.warning(f"잘못된 specific 형식: {pos}")
-            else:
-                logger.warning(f"잘못된 이미지 위치 값: {pos}")
-        
-        if not positions:
-            logger.error("유효한 이미지 위치가 없음")
+                else:
+                    # auto_detect_chinese, special:N은 이 핸들러에서 지원하지 않음
+                    logger.warning(f"잘못된 이미지 위치 값: {pos}")
+            
+            if not positions:
+                logger.error("유효한 이미지 위치가 없음")
+                return None
+            
+            action_info = {
+                'type': 'image_translate',
+                'positions': positions
+            }
+            
+            logger.info(f"이미지 번역 액션 파싱 완료: {action_info}")
+            return action_info
+            
+        except Exception as e:
+            logger.error(f"이미지 번역 액션 파싱 오류: {e}")
             return None
-        
-        action_info = {
-            'type': 'image_translate',
-            'positions': positions
-        }
-        
-        logger.info(f"이미지 번역 액션 파싱 완료: {action_info}")
-        return action_info
     
     def _process_image_translate_action(self, action_info, context='detail'):
         """
@@ -1380,7 +1308,7 @@ class ImageTranslationHandler:
                 logger.info(f"이미지 {position} 주변 텍스트 확인 중 오류: {e}")
             
             # 방법 3: OCR을 사용한 이미지 텍스트 분석 (더 정확하지만 느림)
-            if OCR_AVAILABLE:
+            if OCR_AVAILABLE and ocr_service.is_available():
                 logger.info(f"이미지 {position}: OCR 검사 시작")
                 ocr_result = self._ocr_check_chinese_text(img_element, position)
                 logger.info(f"이미지 {position}: OCR 검사 결과 - {ocr_result}")
@@ -1425,6 +1353,12 @@ class ImageTranslationHandler:
             img_size = img_element.size
             logger.info(f"이미지 {position}: 요소 정보 - 표시됨: {img_visible}, 크기: {img_size}, src: {img_src[:100]}...")
             
+            # 같은 URL의 이전 판정이 있으면 다운로드와 OCR 생략
+            cached = ocr_verdict_cache.get(src=img_src)
+            if cached is not None:
+                logger.info(f"이미지 {position}: OCR 판정 캐시 적중 (URL) - 중문 포함: {cached['has_chinese']}")
+                return cached['has_chinese']
+            
             # 원본 이미지 URL에서 직접 다운로드
             if not img_src or img_src.startswith('data:'):
                 logger.warning(f"이미지 {position}: 유효하지 않은 이미지 URL - 스크린샷으로 대체")
@@ -1453,6 +1387,21 @@ class ImageTranslationHandler:
                 logger.warning(f"이미지 {position}: 이미지 크기가 너무 작음 ({original_size}) - OCR 건너뜀")
                 return False
             
+            # URL이 달라도 같은 이미지의 이전 판정이 있으면 OCR 생략
+            image_hash = compute_image_hash(image)
+            cached = ocr_verdict_cache.get(image_hash)
+            if cached is not None:
+                logger.info(f"이미지 {position}: OCR 판정 캐시 적중 ({image_hash}) - 중문 포함: {cached['has_chinese']}")
+                ocr_verdict_cache.put(image_hash, cached['has_chinese'], cached['confidence'], src=img_src)
+                return cached['has_chinese']
+            
+            # 사전 필터: 글자 후보가 없으면 OCR 생략, 후보 영역이 있으면 그 부분만 인식
+            gray_original = np.array(image.convert('L'))
+            prefilter = text_region_filter.analyze(gray_original)
+            if not prefilter.has_text:
+                logger.info(f"이미지 {position}: 사전 필터 - 텍스트 후보 없음 (에지 밀도 {prefilter.edge_density:.3f}), OCR 생략")
+                return False
+            
             # 이미지 크기가 너무 작으면 확대
             width, height = image.size
             if width < 200 or height < 200:
@@ -1475,14 +1424,22 @@ class ImageTranslationHandler:
                 image_array = np.array(gray_image)
                 logger.info(f"이미지 {position}: EasyOCR 실행 시작 (언어: 중문만)")
                 
-                # EasyOCR로 텍스트 추출
-                results = easyocr_reader.readtext(image_array)
+                # EasyOCR로 텍스트 추출 (사전 필터 후보 영역이 있으면 그 부분만)
+                start_time = time.time()
+                if prefilter.regions:
+                    results = []
+                    for region in prefilter.regions:
+                        results.extend(ocr_service.readtext(text_region_filter.crop(gray_original, region)))
+                    logger.info(f"이미지 {position}: 사전 필터 - 텍스트 후보 {len(prefilter.regions)}개 영역만 OCR")
+                else:
+                    results = ocr_service.readtext(image_array)
+                    text_region_filter.record_ocr_time(time.time() - start_time)
                 logger.info(f"이미지 {position}: EasyOCR 완료 - {len(results)}개 텍스트 블록 감지")
                 
-                # 결과에서 텍스트만 추출 (신뢰도 0.3 이상만)
+                # 결과에서 텍스트만 추출 (판정 기준 신뢰도 이상만)
                 text_parts = []
                 for bbox, text, confidence in results:
-                    if confidence >= 0.3:  # 신뢰도 30% 이상만 사용
+                    if confidence >= CHINESE_CONFIDENCE_THRESHOLD:
                         text_parts.append(text)
                         logger.debug(f"이미지 {position}: 텍스트 블록 '{text}' (신뢰도: {confidence:.3f})")
                 
@@ -1494,13 +1451,13 @@ class ImageTranslationHandler:
                 logger.warning(f"이미지 {position}: EasyOCR 실패 - {ocr_error}")
                 return False
             
-            # 중문글자 정규식 패턴으로 확인
-            chinese_pattern = r'[\u4e00-\u9fff]+'
-            chinese_matches = re.findall(chinese_pattern, text)
+            # 중문글자 판정 (다른 판정 경로와 같은 기준)
+            has_chinese, chinese_confidence, chinese_matches = chinese_verdict(results)
             
-            logger.info(f"이미지 {position}: 중문글자 패턴 검사 결과 - 매치 수: {len(chinese_matches)}")
+            logger.info(f"이미지 {position}: 중문글자 검사 결과 - 중문 블록 수: {len(chinese_matches)}")
+            ocr_verdict_cache.put(image_hash, has_chinese, chinese_confidence, src=img_src)
             if chinese_matches:
-                logger.info(f"이미지 {position}: 발견된 중문글자: {chinese_matches}")
+                logger.info(f"이미지 {position}: 발견된 중문글자 블록: {chinese_matches}")
             
             # 텍스트의 각 문자를 유니코드로 확인
             if text.strip():
@@ -4,6 +4,7 @@ import time
 import random
 from image_translation_handler_new import ImageTranslationHandler as NewImageTranslationHandler
 from image_translation_handler_specific import ImageTranslationHandler as SpecificImageTranslationHandler
+from core.utils.action_grammar import compile_translate_command
 
 logger = logging.getLogger(__name__)
 
@@ -109,36 +110,16 @@ class ImageTranslationManager:
             ImageTranslationHandler: 선택된 핸들러 또는 None
         """
         try:
-            action_value = action_value.strip().lower()
+            # 모든 처리 방식에서 통합 방식을 사용하는 NewImageTranslationHandler 사용
+            plan = compile_translate_command(action_value)
+            mode = plan.mode
             
-            # 모든 케이스에서 통합 방식을 사용하는 NewImageTranslationHandler 사용
-            # specific:all의 경우
-            if action_value == "specific:all":
+            if mode == 'sequential_all':
                 logger.info("specific:all 감지 - NewImageTranslationHandler 사용 (통합 순차 처리)")
-                return self.new_handler
-            
-            # auto_detect_chinese의 경우도 통합 방식 사용
-            if action_value == "auto_detect_chinese":
-                logger.info("auto_detect_chinese 감지 - NewImageTranslationHandler 사용 (통합 처리)")
-                return self.new_handler
-            
-            # first:N, last:N 패턴의 경우도 통합 방식 사용
-            if action_value.startswith(("first:", "last:")):
-                logger.info(f"{action_value} 감지 - NewImageTranslationHandler 사용 (통합 처리)")
-                return self.new_handler
-            
-            # specific:N,N,N 패턴의 경우도 통합 방식 사용
-            if action_value.startswith("specific:") and "," in action_value:
-                logger.info(f"{action_value} 감지 - NewImageTranslationHandler 사용 (통합 처리)")
-                return self.new_handler
-            
-            # 숫자 리스트 (1,2,3 등)의 경우도 통합 방식 사용
-            if self._is_position_list(action_value):
-                logger.info(f"{action_value} 감지 - NewImageTranslationHandler 사용 (통합 처리)")
-                return self.new_handler
-            
-            # 기본값: 통합 방식을 사용하는 NewImageTranslationHandler 사용
-            logger.warning(f"알 수 없는 액션 패턴: {action_value} - NewImageTranslationHandler 기본 사용 (통합 처리)")
+            elif mode == 'invalid':
+                logger.warning(f"알 수 없는 액션 패턴: {action_value} - NewImageTranslationHandler 기본 사용 (통합 처리)")
+            else:
+                logger.info(f"{action_value} 감지 ({mode}) - NewImageTranslationHandler 사용 (통합 처리)")
             return self.new_handler
             
         except Exception as e:
@@ -5,6 +5,7 @@
 카페24 로그인 및 11번가 상품 가져오기 기능을 제공합니다.
 """
 
+import os
 import logging
 import time
 import pyautogui
@@ -14,6 +15,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from core.browser.network_idle import install_network_idle_hook, wait_for_network_idle
+from core.utils.selector_race import selector_race
+
 logger = logging.getLogger(__name__)
 
 class MarketManagerCafe24:
@@ -21,17 +25,34 @@ class MarketManagerCafe24:
     카페24 마켓 관리 클래스
     """
     
-    def __init__(self, driver):
+    # 상품 관리(연동해제) 목록 페이지
+    MANAGE_LIST_URL = "https://mp.cafe24.com/mp/product/front/manageList"
+    
+    # 연동해제 페이지를 미리 열어 둘 탭 수 환경 변수 (1이면 기존 순차 처리)
+    DISCONNECT_TABS_ENV = "PERCENTY_CAFE24_DISCONNECT_TABS"
+    
+    def __init__(self, driver, disconnect_tabs=None, manage_list_url=None):
         """
         초기화
         
         Args:
             driver: Selenium WebDriver 인스턴스
+            disconnect_tabs (int): 연동해제 페이지를 미리 열어 둘 최대 탭 수
+                (None이면 PERCENTY_CAFE24_DISCONNECT_TABS 환경 변수, 기본 1 - 순차 처리)
+            manage_list_url (str): 상품 관리 목록 URL (None이면 MANAGE_LIST_URL, 모의 페이지 테스트용)
         """
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
         self.start_time = None
         self.step_times = {}
+        if disconnect_tabs is None:
+            disconnect_tabs = os.environ.get(self.DISCONNECT_TABS_ENV, 1)
+        self.disconnect_tabs = max(1, int(disconnect_tabs))
+        self.manage_list_url = manage_list_url or self.MANAGE_LIST_URL
+        # 연동해제 파이프라인에서 미리 연 페이지 탭 (팝업창 식별 시 제외)
+        self._prefetch_windows = set()
+        # XHR/fetch 추적 (안정화 대기를 네트워크 유휴 기준으로 판단)
+        install_network_idle_hook(driver)
     
     def _log_step_time(self, step_name):
         """
@@ -556,6 +577,13 @@ class MarketManagerCafe24:
             # 4. 페이지별 연동해제 실행 (5페이지부터 1페이지까지)
             max_pages = min(5, (total_products + 99) // 100)  # 최대 5페이지, 100개씩
             
+            # 다음 페이지들을 탭으로 미리 열어 두고 처리 (로딩/안정화 대기를 겹침)
+            if self.disconnect_tabs > 1 and max_pages > 1:
+                if not self._disconnect_pages_pipelined(store_id_11st, max_pages):
+                    return False
+                logger.info("11번가 연동해제 완료")
+                return True
+            
             for page in range(max_pages, 0, -1):  # 5, 4, 3, 2, 1 순서
                 logger.info(f"페이지 {page} 연동해제 시작")
                 
@@ -577,29 +605,134 @@ class MarketManagerCafe24:
             logger.error(f"11번가 연동해제 실패: {e}")
             return False
     
-    def _navigate_to_disconnect_page(self, store_id_11st):
+    def _disconnect_pages_pipelined(self, store_id_11st, max_pages):
         """
-        연동해제를 위한 상품 관리 페이지로 이동합니다.
+        다음 페이지들을 새 탭으로 미리 열어 두고 페이지별 연동해제를 진행합니다.
+        
+        목록은 is_matched=T 조건의 오름차순이므로 뒤 페이지를 해제해도 앞 페이지 구성은 바뀌지 않습니다.
+        따라서 현재 페이지를 처리하는 동안 앞 페이지들을 최대 disconnect_tabs개 탭에서 미리 로드하고,
+        페이지 간 안정화 대기 없이 바로 다음 탭으로 넘어갑니다.
+        (드라이버는 한 번에 한 창만 조작하므로 Alert/팝업 처리는 기존과 같이 한 페이지씩 진행)
         
         Args:
             store_id_11st (str): 11번가 스토어 ID
+            max_pages (int): 처리할 페이지 수
             
         Returns:
             bool: 성공 여부
         """
+        work_window = self.driver.current_window_handle
+        pending_pages = list(range(max_pages, 0, -1))  # 5, 4, 3, 2, 1 순서
+        page_tabs = {}
+        
+        logger.info(f"연동해제 파이프라인 시작 - {max_pages}페이지, 최대 {self.disconnect_tabs}개 탭")
+        try:
+            for page in list(pending_pages):
+                # 처리할 페이지를 포함해 최대 disconnect_tabs개 탭을 미리 열어 둠
+                for prefetch_page in pending_pages[:self.disconnect_tabs]:
+                    if prefetch_page not in page_tabs:
+                        page_tabs[prefetch_page] = self._open_page_tab(store_id_11st, prefetch_page, work_window)
+                pending_pages.remove(page)
+                
+                logger.info(f"페이지 {page} 연동해제 시작")
+                page_tab = page_tabs.pop(page, None)
+                if page_tab:
+                    self.driver.switch_to.window(page_tab)
+                    self._bring_to_front()
+                    success = self._disconnect_page_products(store_id_11st, page, navigate=False)
+                    self._close_page_tab(page_tab, work_window)
+                else:
+                    # 탭을 열지 못한 페이지는 작업 창에서 기존 방식으로 처리
+                    self.driver.switch_to.window(work_window)
+                    success = self._disconnect_page_products(store_id_11st, page)
+                
+                if not success:
+                    logger.error(f"페이지 {page} 연동해제 실패")
+                    return False
+                logger.info(f"페이지 {page} 연동해제 완료")
+            
+            return True
+        finally:
+            for page_tab in page_tabs.values():
+                if page_tab:
+                    self._close_page_tab(page_tab, work_window)
+            self._prefetch_windows.clear()
+            try:
+                self.driver.switch_to.window(work_window)
+            except Exception as e:
+                logger.warning(f"작업 창 복귀 실패: {e}")
+                self._ensure_valid_window()
+    
+    def _open_page_tab(self, store_id_11st, page, work_window):
+        """
+        연동해제 페이지를 새 탭에서 로드 시작하고 작업 창으로 돌아옵니다 (로드 완료를 기다리지 않음).
+        
+        Args:
+            store_id_11st (str): 11번가 스토어 ID
+            page (int): 페이지 번호
+            work_window (str): 돌아올 작업 창 핸들
+            
+        Returns:
+            str: 새 탭 핸들, 실패 시 None
+        """
+        page_tab = None
         try:
-            from datetime import datetime, timedelta
+            self.driver.switch_to.new_window('tab')
+            page_tab = self.driver.current_window_handle
+            self._prefetch_windows.add(page_tab)
+            
+            # 문서 시작 스크립트는 탭마다 등록해야 안정화 대기의 네트워크 추적이 동작함
+            install_network_idle_hook(self.driver, new_window=True)
             
-            # 오늘보다 2일 전 날짜 계산
-            end_date = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+            # driver.get은 로드 완료까지 막히므로 스크립트로 이동만 시작
+            self.driver.execute_script("window.location.href = arguments[0];", self._manage_list_page_url(store_id_11st, page))
+            logger.info(f"페이지 {page} 미리 열기: {page_tab}")
+            return page_tab
+        except Exception as e:
+            logger.warning(f"페이지 {page} 탭 열기 실패 - 작업 창에서 처리: {e}")
+            if page_tab:
+                self._close_page_tab(page_tab, work_window)
+            return None
+        finally:
+            try:
+                self.driver.switch_to.window(work_window)
+            except Exception as e:
+                logger.warning(f"작업 창 복귀 실패: {e}")
+    
+    def _close_page_tab(self, page_tab, work_window):
+        """미리 연 페이지 탭을 닫고 작업 창으로 돌아옵니다."""
+        self._prefetch_windows.discard(page_tab)
+        try:
+            if page_tab in self.driver.window_handles:
+                self.driver.switch_to.window(page_tab)
+                self.driver.close()
+        except Exception as e:
+            logger.warning(f"페이지 탭 닫기 실패: {e}")
+        try:
+            self.driver.switch_to.window(work_window)
+        except Exception as e:
+            logger.warning(f"작업 창 복귀 실패: {e}")
+    
+    def _bring_to_front(self):
+        """현재 탭을 앞으로 가져옵니다 (백그라운드 탭의 타이머 지연 방지)."""
+        try:
+            self.driver.execute_cdp_cmd('Page.bringToFront', {})
+        except Exception as e:
+            logger.debug(f"탭 앞으로 가져오기 실패: {e}")
+    
+    def _navigate_to_disconnect_page(self, store_id_11st):
+        """
+        연동해제를 위한 상품 관리 페이지로 이동합니다.
+        
+        Args:
+            store_id_11st (str): 11번가 스토어 ID
             
+        Returns:
+            bool: 성공 여부
+        """
+        try:
             # 연동해제 페이지 URL 생성 (첫 페이지는 page=1)
-            disconnect_url = (
-                f"https://mp.cafe24.com/mp/product/front/manageList?"
-                f"sort_direction=ascend&limit=100&is_matched=T&"
-                f"search_begin_ymd=2023-07-01&search_end_ymd={end_date}&"
-                f"page=1&market_select[]=sk11st%7C{store_id_11st}"
-            )
+            disconnect_url = self._manage_list_page_url(store_id_11st, 1)
             
             logger.info(f"연동해제 페이지로 이동: {disconnect_url}")
             self.driver.get(disconnect_url)
@@ -614,6 +747,27 @@ class MarketManagerCafe24:
             logger.error(f"연동해제 페이지 이동 실패: {e}")
             return False
     
+    def _manage_list_page_url(self, store_id_11st, page):
+        """
+        연동해제 대상 상품 목록 페이지 URL (검색 종료일은 오늘보다 2일 전)
+        
+        Args:
+            store_id_11st (str): 11번가 스토어 ID
+            page (int): 페이지 번호
+            
+        Returns:
+            str: 페이지 URL
+        """
+        from datetime import timedelta
+        
+        end_date = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+        return (
+            f"{self.manage_list_url}?"
+            f"sort_direction=ascend&limit=100&is_matched=T&"
+            f"search_begin_ymd=2023-07-01&search_end_ymd={end_date}&"
+            f"page={page}&market_select[]=sk11st%7C{store_id_11st}"
+        )
+    
     def _get_total_product_count(self):
         """
         총 상품수를 확인합니다.
@@ -638,87 +792,88 @@ class MarketManagerCafe24:
             logger.error(f"총 상품수 확인 실패: {e}")
             return None
     
-    def _disconnect_page_products(self, store_id_11st, page):
+    def _disconnect_page_products(self, store_id_11st, page, navigate=True):
         """
         특정 페이지의 상품들을 연동해제합니다.
         
         Args:
             store_id_11st (str): 11번가 스토어 ID
             page (int): 페이지 번호
+            navigate (bool): 현재 창에서 페이지로 이동할지 여부
+                (False면 파이프라인에서 미리 연 탭이 현재 창 - 이동 없이 로드만 확인)
             
         Returns:
             bool: 성공 여부
         """
         try:
-            from datetime import datetime, timedelta
+            page_url = self._manage_list_page_url(store_id_11st, page)
             
-            # 페이지 이동 전 창 상태 확인 및 복구
-            if not self._ensure_valid_window():
-                logger.error(f"페이지 {page} 이동 전 창 상태 복구 실패")
-                return False
-
-            # 현재 작업 창 핸들 저장
-            current_work_window = self.driver.current_window_handle
-            logger.info(f"페이지 {page} 이동 전 작업 창 핸들: {current_work_window}")
+            if navigate:
+                # 페이지 이동 전 창 상태 확인 및 복구
+                if not self._ensure_valid_window():
+                    logger.error(f"페이지 {page} 이동 전 창 상태 복구 실패")
+                    return False
 
-            # 해당 페이지로 이동
-            end_date = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
-            page_url = (
-                f"https://mp.cafe24.com/mp/product/front/manageList?"
-                f"sort_direction=ascend&limit=100&is_matched=T&"
-                f"search_begin_ymd=2023-07-01&search_end_ymd={end_date}&"
-                f"page={page}&market_select[]=sk11st%7C{store_id_11st}"
-            )
+                # 현재 작업 창 핸들 저장
+                current_work_window = self.driver.current_window_handle
+                logger.info(f"페이지 {page} 이동 전 작업 창 핸들: {current_work_window}")
 
-            logger.info(f"페이지 {page}로 이동: {page_url}")
+                logger.info(f"페이지 {page}로 이동: {page_url}")
 
-            # 현재 창에서 안전한 페이지 이동
-            try:
-                # 현재 창이 여전히 유효한지 확인
-                self.driver.switch_to.window(current_work_window)
-                logger.info(f"작업 창 {current_work_window}에서 페이지 이동 시작")
+                # 현재 창에서 안전한 페이지 이동
+                try:
+                    # 현재 창이 여전히 유효한지 확인
+                    self.driver.switch_to.window(current_work_window)
+                    logger.info(f"작업 창 {current_work_window}에서 페이지 이동 시작")
                 
-                # 현재 창에서 페이지 이동
-                self.driver.get(page_url)
+                    # 현재 창에서 페이지 이동
+                    self.driver.get(page_url)
                 
-                # 페이지 이동 후 창 핸들 확인
-                after_move_window = self.driver.current_window_handle
-                logger.info(f"페이지 이동 후 창 핸들: {after_move_window}")
+                    # 페이지 이동 후 창 핸들 확인
+                    after_move_window = self.driver.current_window_handle
+                    logger.info(f"페이지 이동 후 창 핸들: {after_move_window}")
                 
-                # 창 핸들이 변경되었다면 원래 창으로 복귀 시도
-                if after_move_window != current_work_window:
-                    logger.warning(f"창 핸들 변경 감지: {current_work_window} -> {after_move_window}")
-                    try:
-                        # 원래 창이 여전히 존재하는지 확인
-                        available_windows = self.driver.window_handles
-                        if current_work_window in available_windows:
-                            self.driver.switch_to.window(current_work_window)
-                            logger.info(f"원래 작업 창 {current_work_window}으로 복귀")
-                            # 원래 창에서 다시 페이지 이동
-                            self.driver.get(page_url)
-                            logger.info("원래 창에서 페이지 이동 완료")
-                        else:
-                            logger.warning(f"원래 창 {current_work_window}이 닫혔음 - 현재 창에서 계속 진행")
-                    except Exception as switch_e:
-                        logger.warning(f"창 전환 실패: {switch_e} - 현재 창에서 계속 진행")
+                    # 창 핸들이 변경되었다면 원래 창으로 복귀 시도
+                    if after_move_window != current_work_window:
+                        logger.warning(f"창 핸들 변경 감지: {current_work_window} -> {after_move_window}")
+                        try:
+                            # 원래 창이 여전히 존재하는지 확인
+                            available_windows = self.driver.window_handles
+                            if current_work_window in available_windows:
+                                self.driver.switch_to.window(current_work_window)
+                                logger.info(f"원래 작업 창 {current_work_window}으로 복귀")
+                                # 원래 창에서 다시 페이지 이동
+                                self.driver.get(page_url)
+                                logger.info("원래 창에서 페이지 이동 완료")
+                            else:
+                                logger.warning(f"원래 창 {current_work_window}이 닫혔음 - 현재 창에서 계속 진행")
+                        except Exception as switch_e:
+                            logger.warning(f"창 전환 실패: {switch_e} - 현재 창에서 계속 진행")
                         
-            except Exception as e:
-                logger.error(f"페이지 이동 실패: {e}")
-                # 창 상태 복구 시도
-                if self._ensure_valid_window():
-                    logger.info("창 상태 복구 후 페이지 이동 재시도")
-                    try:
-                        # 복구된 창에서 페이지 이동
-                        self.driver.get(page_url)
-                        logger.info("창 복구 후 페이지 이동 완료")
-                    except Exception as retry_e:
-                        logger.error(f"페이지 이동 재시도 실패: {retry_e}")
+                except Exception as e:
+                    logger.error(f"페이지 이동 실패: {e}")
+                    # 창 상태 복구 시도
+                    if self._ensure_valid_window():
+                        logger.info("창 상태 복구 후 페이지 이동 재시도")
+                        try:
+                            # 복구된 창에서 페이지 이동
+                            self.driver.get(page_url)
+                            logger.info("창 복구 후 페이지 이동 완료")
+                        except Exception as retry_e:
+                            logger.error(f"페이지 이동 재시도 실패: {retry_e}")
+                            return False
+                    else:
                         return False
-                else:
-                    return False
             
-            # 기본 페이지 로드 대기
-            time.sleep(3)
+                # 기본 페이지 로드 대기
+                time.sleep(3)
+            else:
+                # 파이프라인에서 미리 연 탭 - 페이지 이동이 시작되었는지만 확인 (아직 about:blank일 수 있음)
+                try:
+                    WebDriverWait(self.driver, 30).until(lambda d: f"page={page}" in d.current_url)
+                except TimeoutException:
+                    logger.warning(f"미리 연 탭의 페이지 {page} 이동 확인 실패 - 다시 이동")
+                    self.driver.get(page_url)
             
             # 페이지 번호 검증 (최대 3회 재시도)
             for attempt in range(3):
@@ -881,18 +1036,14 @@ class MarketManagerCafe24:
                 'tbody input[type="checkbox"]'
             ]
             
-            for selector in product_selectors:
-                try:
-                    count = self.driver.execute_script(f"""
-                        return document.querySelectorAll('{selector}').length;
-                    """)
-                    if count > 0:
-                        analysis['product_checkbox_count'] = count
-                        analysis['total_products'] = count
-                        logger.info(f"상품 체크박스 발견: {count}개 (선택자: {selector})")
-                        break
-                except Exception:
-                    continue
+            # 후보별 개수를 한 번에 확인하여 첫 번째로 일치하는 선택자 사용
+            counts = selector_race.count(self.driver, product_selectors)
+            for selector, count in zip(product_selectors, counts):
+                if count > 0:
+                    analysis['product_checkbox_count'] = count
+                    analysis['total_products'] = count
+                    logger.info(f"상품 체크박스 발견: {count}개 (선택자: {selector})")
+                    break
             
             # 전체 선택 체크박스 찾기
             all_checkbox_selectors = [
@@ -902,23 +1053,16 @@ class MarketManagerCafe24:
                 'thead input[type="checkbox"]'
             ]
             
-            for selector in all_checkbox_selectors:
-                try:
-                    element_exists = self.driver.execute_script(f"""
-                        return document.querySelector('{selector}') !== null;
-                    """)
-                    if element_exists:
-                        analysis['all_checkbox_selector'] = selector
-                        logger.info(f"전체 선택 체크박스 발견: {selector}")
-                        break
-                except Exception:
-                    continue
+            match = selector_race.resolve(self.driver, all_checkbox_selectors, key='cafe24_all_checkbox', visible=False)
+            if match:
+                analysis['all_checkbox_selector'] = match.selector
+                logger.info(f"전체 선택 체크박스 발견: {match.selector}")
             
             # 페이지 준비 상태 확인
             try:
-                ready_state = self.driver.execute_script("return document.readyState;")
-                jquery_ready = self.driver.execute_script("return typeof jQuery !== 'undefined' && jQuery.isReady;")
-                analysis['page_ready'] = ready_state == 'complete' and jquery_ready
+                analysis['page_ready'] = bool(self.driver.execute_script(
+                    "return document.readyState === 'complete' && typeof jQuery !== 'undefined' && jQuery.isReady;"
+                ))
             except Exception:
                 analysis['page_ready'] = False
             
@@ -1310,7 +1454,8 @@ class MarketManagerCafe24:
             if len(all_windows) > 1:
                 # 현재 창이 아닌 마지막 창을 팝업창으로 추정
                 for window in reversed(all_windows):
-                    if window != current_work_window:
+                    # 연동해제 파이프라인에서 미리 연 페이지 탭은 팝업창이 아님
+                    if window != current_work_window and window not in self._prefetch_windows:
                         popup_window = window
                         break
                 
@@ -1735,12 +1880,46 @@ class MarketManagerCafe24:
             logger.error(f"강제 로그아웃 및 재시도 실패: {e}")
             return False
     
+    # 상품 목록 체크박스 선택자 (네트워크 유휴 대기 준비 조건)
+    PRODUCT_CHECKBOX_SELECTOR = 'input.rowCk, input[name="idx[]"], tbody input[type="checkbox"]'
+
+    def _wait_for_network_idle(self, label, idle_ms, timeout, ready_selector=None):
+        """
+        네트워크 유휴 기반 안정화 대기 (core/browser/network_idle.py)
+        
+        Args:
+            label (str): 로그용 대기 이름
+            idle_ms (int): 유휴 판단 시간(ms)
+            timeout (float): 최대 대기 시간(초)
+            ready_selector (str): 추가로 존재해야 하는 CSS 선택자
+            
+        Returns:
+            bool: 대기 완료 여부 (추적 스크립트를 실행하지 못하면 False - 기존 휴리스틱 대기 사용)
+        """
+        state = wait_for_network_idle(self.driver, idle_ms=idle_ms, timeout=timeout, ready_selector=ready_selector)
+        if state is None:
+            logger.warning(f"{label}: 네트워크 유휴 추적 실패 - 기존 안정화 대기 사용")
+            return False
+        
+        elapsed = state.get('elapsed', 0) / 1000
+        if state.get('ok'):
+            logger.info(f"✅ {label} 완료 - 네트워크 유휴 {idle_ms}ms 도달 ({elapsed:.2f}초, 요청 {state.get('requests', 0)}건)")
+        else:
+            logger.warning(f"⚠️ {label} 최대 대기 시간 초과 ({timeout}초) - 진행 중 요청 {state.get('inflight', 0)}건, "
+                           f"문서 상태 {state.get('ready_state')}, 계속 진행")
+        return True
+
     def _enhanced_page_stabilization_wait(self):
         """
         극강화된 페이지 안정화 대기.
         30초 이상의 극심한 로딩 시간 편차에도 대응합니다.
         사용자 트래픽 증가, 서버 부하 등 모든 상황을 고려한 안정화 로직입니다.
+        네트워크 유휴 추적이 가능하면 고정 대기 없이 요청이 끝나는 즉시 반환합니다.
         """
+        if self._wait_for_network_idle("페이지 안정화 대기", idle_ms=1000, timeout=75,
+                                       ready_selector=self.PRODUCT_CHECKBOX_SELECTOR):
+            return
+        
         try:
             logger.info("🔄 극강화 페이지 안정화 대기 시작 (최대 75초)")
             max_wait_time = 75  # 최대 75초 대기 (극심한 로딩 시간 대응)
@@ -2327,7 +2506,12 @@ class MarketManagerCafe24:
         배치 작업 완료 후 극도로 강화된 안정화 대기.
         30초 이상의 극심한 로딩 시간 편차에도 대응합니다.
         서버 부하, 네트워크 지연, 대용량 데이터 처리 등 모든 상황을 고려합니다.
+        네트워크 유휴 추적이 가능하면 고정 대기 없이 요청이 끝나는 즉시 반환합니다.
         """
+        if self._wait_for_network_idle("배치 완료 안정화 대기", idle_ms=1500, timeout=120,
+                                       ready_selector=self.PRODUCT_CHECKBOX_SELECTOR):
+            return
+        
         try:
             logger.info("🔄 극강화 배치 완료 안정화 대기 시작 (최대 120초)")
             max_wait_time = 120  # 최대 120초 대기 (극심한 로딩 시간 대응)
@@ -2824,7 +3008,11 @@ class MarketManagerCafe24:
         """
         페이지 간 이동 시 극강화된 안정화 대기.
         페이지 이동 후 로딩 시간 편차에 강력하게 대응합니다.
+        네트워크 유휴 추적이 가능하면 고정 대기 없이 요청이 끝나는 즉시 반환합니다.
         """
+        if self._wait_for_network_idle("페이지 간 이동 안정화 대기", idle_ms=1000, timeout=60):
+            return
+        
         try:
             logger.info("🔄 극강화 페이지 간 이동 안정화 대기 시작 (최대 60초)")
             max_wait_time = 60  # 최대 60초 대기
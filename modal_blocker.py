@@ -15,6 +15,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from core.browser.overlay_suppression import is_overlay_suppressed
 
 # 모달창 처리 간격을 추적하기 위한 변수
 last_modal_close_time = 0
@@ -256,6 +257,11 @@ def close_modal_dialog(driver):
     """
     global last_modal_close_time
     
+    # 브라우저 생성 시 문서 시작 스크립트가 "다시 보지 않기" 버튼과 저장소 설정을 처리함
+    # (그 외 모달은 숨기지 않으므로 모달이 보이면 아래 닫기 버튼/ESC 처리 진행)
+    if is_overlay_suppressed(driver) and not is_modal_visible(driver):
+        return {"success": True, "method": "document_start_script"}
+    
     current_time = time.time()
     if current_time - last_modal_close_time < MODAL_PROCESS_INTERVAL:
         logging.info("모달창 처리 요청이 너무 빈번합니다. 이전 설정이 적용 중입니다.")
@@ -1099,6 +1099,11 @@ class PercentyAdvancedGUI:
             # 각 계정별로 독립적인 프로세스 실행
             project_root = os.path.dirname(os.path.abspath(__file__))
             
+            # 상주 배치 워커 데몬이 있으면 batch_cli.py 단계는 데몬에 전달
+            worker_client = self._get_worker_client()
+            if worker_client:
+                self._add_log("배치 워커 데몬 감지: batch_cli 단계는 데몬에서 실행됩니다")
+            
             for account_idx, account in enumerate(accounts):
                 for step_idx, step in enumerate(selected_steps):
                     self._add_log(f"계정 {account} - 단계 {step} 실행 중...")
@@ -1160,16 +1165,27 @@ class PercentyAdvancedGUI:
                         ]
                     
                     # 헤드리스 모드 옵션 추가 (Step 2, 3가 아닌 경우에만)
-                    if self.headless_var.get() and step not in ['21', '22', '23', '31', '32', '33', '311', '312', '313', '321', '322', '323', '331', '332', '333', '61', '62', '63']:
+                    headless = bool(self.headless_var.get()) and step not in ['21', '22', '23', '31', '32', '33', '311', '312', '313', '321', '322', '323', '331', '332', '333', '61', '62', '63']
+                    if headless:
                         cmd.extend(["--headless"])
                     
                     try:
-                        # 새로운 콘솔 창에서 프로세스 실행
-                        process = subprocess.Popen(
-                            cmd,
-                            creationflags=subprocess.CREATE_NEW_CONSOLE,
-                            cwd=project_root
-                        )
+                        if worker_client and cmd[1].endswith("batch_cli.py"):
+                            # 데몬에 작업 전달 (Popen과 같은 인터페이스의 작업 핸들 반환)
+                            process = worker_client.submit(
+                                step=step,
+                                account=account,
+                                quantity=int(quantity),
+                                headless=headless,
+                                interval=interval
+                            )
+                        else:
+                            # 새로운 콘솔 창에서 프로세스 실행
+                            process = subprocess.Popen(
+                                cmd,
+                                creationflags=subprocess.CREATE_NEW_CONSOLE,
+                                cwd=project_root
+                            )
                         
                         self.running_processes.append({
                             'process': process,
@@ -1200,6 +1216,17 @@ class PercentyAdvancedGUI:
             messagebox.showerror("오류", f"다중 배치 시작 실패: {str(e)}")
             self._reset_ui_state()
             
+    def _get_worker_client(self):
+        """실행 중인 배치 워커 데몬 클라이언트 반환 (없으면 None)"""
+        try:
+            from batch.executors.worker_daemon import BatchWorkerClient
+            client = BatchWorkerClient()
+            if client.is_available():
+                return client
+        except Exception as e:
+            logger.debug(f"배치 워커 데몬 확인 실패: {e}")
+        return None
+    
     def _stop_all_batches(self):
         """모든 배치 중지"""
         if not self.running_processes:
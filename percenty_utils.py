@@ -14,6 +14,7 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from channel_talk_utils import check_and_hide_channel_talk
 # 로그인 모달창 관련 유틸리티 임포트
 from login_modal_utils import hide_login_modal
+from core.browser.overlay_suppression import is_overlay_suppressed
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -33,10 +34,14 @@ def hide_channel_talk_and_modals(driver, log_prefix=""):
     """
     prefix = f"{log_prefix} " if log_prefix else ""
     
-    # 채널톡 숨기기
-    logger.info(f"{prefix}채널톡 숨기기 적용 시작")
-    channel_result = check_and_hide_channel_talk(driver)
-    logger.info(f"{prefix}채널톡 숨기기 결과: {channel_result}")
+    # 채널톡 숨기기 (브라우저 생성 시 문서 시작 스타일시트로 이미 숨긴 경우 생략)
+    if is_overlay_suppressed(driver):
+        logger.debug(f"{prefix}채널톡 차단 스크립트 등록됨 - 채널톡 숨기기 생략")
+        channel_result = True
+    else:
+        logger.info(f"{prefix}채널톡 숨기기 적용 시작")
+        channel_result = check_and_hide_channel_talk(driver)
+        logger.info(f"{prefix}채널톡 숨기기 결과: {channel_result}")
     
     # 로그인 모달창 숨기기
     logger.info(f"{prefix}로그인 모달창 숨기기 적용 시작")
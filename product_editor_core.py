@@ -17,6 +17,8 @@ from ui_elements import UI_ELEMENTS
 from timesleep import sleep_with_logging, DELAY_VERY_SHORT2, DELAY_VERY_SHORT5, DELAY_VERY_SHORT
 from keyboard_shortcuts import KeyboardShortcuts
 from dom_utils import wait_for_element
+from core.utils.dom_ready import wait_settled, wait_modal_open, wait_modal_closed, wait_selector, wait_list_rerendered
+from core.utils.selector_race import selector_race
 from click_utils import click_at_coordinates, smart_click
 from image_utils import PercentyImageManager
 from product_name_editor import ProductNameEditor
@@ -597,7 +599,7 @@ class ProductEditorCore:
                     try:
                         smart_click(self.driver, UI_ELEMENTS["PRODUCT_TAB_OPTION"], DELAY_VERY_SHORT)
                         self.wait_for_tab_active("PRODUCT_TAB_OPTION")
-                        time.sleep(1.5)  # 탭 전환 후 추가 대기
+                        wait_settled(self.driver, 1.5)  # 탭 전환 후 추가 대기
                         self.option_count = self._count_option_names()
                         logger.info(f"옵션명 갯수 (14번 단계에서 저장): {self.option_count}개")
                     except Exception as e:
@@ -985,7 +987,10 @@ class ProductEditorCore:
                 # ESC 키로 모달창 닫기 시도
                 keyboard.escape_key(use_selenium=True, delay=DELAY_VERY_SHORT5)
                 logger.info(f"상품수정 모달창 ESC 키로 나가기 시도 (시도 {duplicate_retry_count + 1}/{max_duplicate_retries + 1})")
-                time.sleep(2)  # 모달창 닫힘 확인을 위한 대기
+                # 저장 응답 후 모달이 모두 닫히거나, 중복 상품명 확인 모달이 뜰 때까지 대기
+                # (수정 모달이 남아 있으면 서버 응답이 늦은 것이므로 확인 모달을 조금 더 기다림)
+                if not wait_modal_closed(self.driver, 2):
+                    wait_selector(self.driver, ".ant-modal-confirm", DELAY_SHORT)
                 
                 # 중복 상품명 확인 모달이 나타났는지 먼저 확인
                 try:
@@ -1223,7 +1228,7 @@ class ProductEditorCore:
                     
                     if move_attempted:
                         # 변경사항이 반영될 수 있도록 대기
-                        time.sleep(DELAY_SHORT)
+                        wait_list_rerendered(self.driver, DELAY_SHORT)
                         
 
                         # 그룹 이동 성공 여부 확인
@@ -1259,7 +1264,7 @@ class ProductEditorCore:
                                     logger.info(f"모달에서 {target_group} 그룹 선택 성공")
                                     
                                     # 4. 그룹 이동 성공 여부 확인
-                                    time.sleep(DELAY_MEDIUM)  # 그룹 이동 완료 대기
+                                    wait_list_rerendered(self.driver, DELAY_MEDIUM)  # 그룹 이동 완료 대기
                                     if self._verify_group_move_success(modified_product_name, target_group):
                                         logger.info(f"4번째 처리 방법으로 {target_group} 그룹 이동 성공")
                                         group_move_success = True
@@ -1312,7 +1317,7 @@ class ProductEditorCore:
             
             # 방법 1: 현재 화면에서 해당 상품명이 더 이상 보이지 않는지 확인
             # (비그룹 상품보기에서 그룹으로 이동하면 해당 상품이 사라짐)
-            time.sleep(DELAY_SHORT)  # 화면 업데이트 대기
+            wait_list_rerendered(self.driver, DELAY_SHORT)  # 화면 업데이트 대기
             
             # 상품명으로 검색하여 해당 상품이 현재 화면에 있는지 확인
             product_selectors = [
@@ -1398,7 +1403,7 @@ class ProductEditorCore:
         detail_image_count = 0
         
         # DOM 안정화를 위한 초기 대기
-        time.sleep(1)
+        wait_settled(self.driver, 1)
         
         try:
             # 옵션 탭으로 이동하여 옵션명 갯수 조사 (하이브리드방식)
@@ -1406,7 +1411,7 @@ class ProductEditorCore:
             smart_click(self.driver, UI_ELEMENTS["PRODUCT_TAB_OPTION"], DELAY_VERY_SHORT)
             # 탭이 활성화될 때까지 명시적 대기
             self.wait_for_tab_active("PRODUCT_TAB_OPTION")
-            time.sleep(1.5)  # 탭 전환 후 추가 대기
+            wait_settled(self.driver, 1.5)  # 탭 전환 후 추가 대기
             option_count = self._count_option_names()
             logger.info(f"옵션명 갯수: {option_count}")
                 
@@ -1420,7 +1425,7 @@ class ProductEditorCore:
             smart_click(self.driver, UI_ELEMENTS["PRODUCT_TAB_DETAIL"], DELAY_VERY_SHORT)
             # 탭이 활성화될 때까지 명시적 대기
             self.wait_for_tab_active("PRODUCT_TAB_DETAIL")
-            time.sleep(1.5)  # 탭 전환 후 추가 대기
+            wait_settled(self.driver, 1.5)  # 탭 전환 후 추가 대기
             detail_image_count = self._count_detail_images()
             logger.info(f"상세페이지 이미지 수: {detail_image_count}")
                 
@@ -1609,18 +1614,11 @@ class ProductEditorCore:
                     "//img[not(contains(@class, 'thumbnail')) and not(contains(@class, 'thumb'))]"
                 ]
                 
-                max_count = 0
-                for selector in image_selectors:
-                    try:
-                        images = self.driver.find_elements(By.XPATH, selector)
-                        visible_images = [img for img in images if img.is_displayed() and img.size['width'] > 0 and img.size['height'] > 0]
-                        count = len(visible_images)
-                        if count > max_count:
-                            max_count = count
-                            logger.debug(f"선택자 '{selector}'로 {count}개 이미지 발견")
-                    except Exception as e:
-                        logger.debug(f"이미지 선택자 {selector} 실패: {e}")
-                        continue
+                # 모든 선택자의 표시된 이미지 수를 한 번의 스크립트 호출로 확인
+                counts = selector_race.count(self.driver, image_selectors, visible=True, min_size=True)
+                max_count = max(counts) if counts else 0
+                if max_count > 0:
+                    logger.debug(f"선택자 '{image_selectors[counts.index(max_count)]}'로 {max_count}개 이미지 발견")
                 
                 if max_count > 0:
                     logger.info(f"상세페이지 이미지 수 카운트 성공 (대체 방법): {max_count}개")
@@ -1667,7 +1665,7 @@ class ProductEditorCore:
                     return False
             
             # 2. 삭제 확인 모달이 나타날 때까지 대기
-            time.sleep(1)
+            wait_modal_open(self.driver, 1)
             
             # 3. 상품 삭제 확인 버튼 클릭
             confirm_delete_xpath = "//div[@class='ant-modal-footer']//button[contains(@class, 'ant-btn-primary') and contains(@class, 'ant-btn-dangerous')]//span[text()='상품 삭제']"
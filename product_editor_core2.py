@@ -6,7 +6,6 @@
 
 import time
 import logging
-import pandas as pd
 import os
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -31,6 +30,8 @@ from coordinates.coordinates_editgoods import (
 # coordinate_converter 모듈이 존재하지 않으므로 제거
 # from coordinate_converter import convert_to_absolute_coordinates
 from dropdown_utils2 import get_product_search_dropdown_manager
+from core.utils.workbook_cache import workbook_cache
+from core.utils.task_index import get_task_index
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -164,16 +165,15 @@ class ProductEditorCore2:
             logging.info(f"계정 {account_id}의 {step} 작업 목록을 로드합니다.")
             
             # login_id 시트에서 계정과 연결된 시트명 찾기
-            login_df = pd.read_excel(excel_path, sheet_name="login_id")
-            account_row = login_df[login_df['id'] == account_id]
+            account_row = workbook_cache.get_account(account_id, excel_path)
             
-            if account_row.empty:
+            if account_row is None:
                 logging.error(f"계정 {account_id}를 찾을 수 없습니다.")
                 return []
             
             # 계정과 연결된 시트명 가져오기 (D열의 sheet_nickname 컬럼 사용)
-            if 'sheet_nickname' in account_row.columns:
-                sheet_name = account_row.iloc[0]['sheet_nickname']
+            if 'sheet_nickname' in account_row:
+                sheet_name = account_row['sheet_nickname']
             else:
                 logging.error("계정과 연결된 시트명을 찾을 수 없습니다. (sheet_nickname 컬럼 필요)")
                 return []
@@ -181,7 +181,7 @@ class ProductEditorCore2:
             logging.info(f"계정 {account_id}와 연결된 시트: {sheet_name}")
             
             # 연결된 시트에서 작업 목록 로드 (행 순서 보장)
-            task_df = pd.read_excel(excel_path, sheet_name=sheet_name)
+            task_df = workbook_cache.read_sheet(excel_path, sheet_name)
             # 원본 행 순서를 보장하기 위해 인덱스 리셋
             task_df = task_df.reset_index(drop=True)
             
@@ -264,105 +264,16 @@ class ProductEditorCore2:
         try:
             logging.info(f"계정 {account_id}의 {step} 작업 목록을 로드합니다. (서버: {server_name})")
             
-            # login_id 시트에서 계정과 연결된 시트명 찾기
-            login_df = pd.read_excel(excel_path, sheet_name="login_id")
-            account_row = login_df[login_df['id'] == account_id]
-            
-            if account_row.empty:
-                logging.error(f"계정 {account_id}를 찾을 수 없습니다.")
+            # 컴파일된 작업 인덱스에서 조회 (워크북이 바뀌면 자동 재컴파일)
+            task_index = get_task_index(excel_path)
+            if not task_index.has_account(account_id):
+                logging.error(f"계정 {account_id}를 찾을 수 없거나 연결된 작업 시트가 없습니다.")
                 return []
             
-            # 계정과 연결된 시트명 가져오기 (D열의 sheet_nickname 컬럼 사용)
-            if 'sheet_nickname' in account_row.columns:
-                sheet_name = account_row.iloc[0]['sheet_nickname']
-            else:
-                logging.error("계정과 연결된 시트명을 찾을 수 없습니다. (sheet_nickname 컬럼 필요)")
-                return []
-                
-            logging.info(f"계정 {account_id}와 연결된 시트: {sheet_name}")
-            
-            # 연결된 시트에서 작업 목록 로드
-            task_df = pd.read_excel(excel_path, sheet_name=sheet_name)
-            
-            # 디버깅: 실제 컬럼명 확인
-            logging.info(f"Excel 파일의 컬럼명: {list(task_df.columns)}")
-            
-            # step2 또는 step3에 해당하는 작업만 필터링
-            step_column = None
-            if 'step' in task_df.columns:
-                step_column = 'step'
-            elif 'Step' in task_df.columns:
-                step_column = 'Step'
-            elif 'STEP' in task_df.columns:
-                step_column = 'STEP'
-            elif 'step2_or_step3' in task_df.columns:
-                step_column = 'step2_or_step3'
-            elif any('step' in col.lower() for col in task_df.columns):
-                # step이 포함된 컬럼 찾기
-                step_columns = [col for col in task_df.columns if 'step' in col.lower()]
-                step_column = step_columns[0]
-                logging.info(f"step 관련 컬럼 발견: {step_columns}, 사용할 컬럼: {step_column}")
-            
-            if step_column:
-                logging.info(f"'{step_column}' 컬럼을 사용하여 {step} 작업 필터링")
-                step_tasks = task_df[task_df[step_column] == step].reset_index(drop=True)
-                logging.info(f"step 필터링 전 총 행 수: {len(task_df)}, 필터링 후 행 수: {len(step_tasks)}")
-            else:
-                # step 컬럼이 없으면 모든 작업 반환
-                step_tasks = task_df.reset_index(drop=True)
-                logging.warning(f"step 컬럼을 찾을 수 없어 모든 작업을 반환합니다.")
-            
-            # 서버별 필터링 (D열의 final_group 컬럼 사용)
-            if server_name:
-                server_column = None
-                if 'final_group' in step_tasks.columns:
-                    server_column = 'final_group'
-                elif 'server' in step_tasks.columns:
-                    server_column = 'server'
-                elif 'Server' in step_tasks.columns:
-                    server_column = 'Server'
-                elif any('server' in col.lower() for col in step_tasks.columns):
-                    # server가 포함된 컬럼 찾기
-                    server_columns = [col for col in step_tasks.columns if 'server' in col.lower()]
-                    server_column = server_columns[0]
-                    logging.info(f"server 관련 컬럼 발견: {server_columns}, 사용할 컬럼: {server_column}")
-                
-                if server_column:
-                    logging.info(f"'{server_column}' 컬럼을 사용하여 {server_name} 서버 필터링")
-                    before_count = len(step_tasks)
-                    step_tasks = step_tasks[step_tasks[server_column] == server_name].reset_index(drop=True)
-                    after_count = len(step_tasks)
-                    logging.info(f"서버 필터링 전 행 수: {before_count}, 필터링 후 행 수: {after_count}")
-                else:
-                    logging.warning(f"서버 필터링 컬럼을 찾을 수 없습니다. 모든 작업을 반환합니다.")
-            
-            task_list = []
-            for _, row in step_tasks.iterrows():
-                # provider_code와 target_group 컬럼 찾기
-                provider_code = None
-                target_group = None
-                
-                # 가능한 컬럼명들 확인
-                if 'provider_code' in row:
-                    provider_code = row['provider_code']
-                elif 'keyword' in row:
-                    provider_code = row['keyword']
-                elif 'search_keyword' in row:
-                    provider_code = row['search_keyword']
-                    
-                if 'target_group' in row:
-                    target_group = row['target_group']
-                elif 'group' in row:
-                    target_group = row['group']
-                elif 'group_name' in row:
-                    target_group = row['group_name']
-                
-                if provider_code and target_group:
-                    task = {
-                        'provider_code': str(provider_code),
-                        'target_group': str(target_group)
-                    }
-                    task_list.append(task)
+            task_list = [
+                {'provider_code': task['provider_code'], 'target_group': task['target_group']}
+                for task in task_index.get_tasks(account_id, step, server_name)
+            ]
                 
             logging.info(f"{len(task_list)}개의 {step} 작업을 로드했습니다. (서버: {server_name})")
             return task_list
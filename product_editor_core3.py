@@ -36,6 +36,14 @@ from coordinates.coordinates_editgoods import (
 
 # 유틸리티 모듈 임포트
 from dropdown_utils2 import get_product_search_dropdown_manager
+from core.utils.task_index import get_task_index
+from core.utils.action_grammar import compile_action_command
+from core.utils.wait_profiler import wait_profiler
+from core.utils.log_pipeline import set_log_context
+from core.browser.api_tap import api_result_counts, api_first_item_id, api_tap_mark, PRODUCT_LIST_PATTERN
+from core.utils.dom_ready import (
+    wait_settled, wait_tab_active, wait_modal_open, wait_modal_closed, wait_list_rerendered
+)
 from dropdown_utils import PercentyDropdown  # 안정된 dropdown_utils 사용
 from click_utils import smart_click, hybrid_click
 from keyboard_shortcuts import KeyboardShortcuts
@@ -88,6 +96,12 @@ class ProductEditorCore3:
         self.total_translated_images = 0
         self.current_product_translated_images = 0
         
+        # 상품 단위 진행 상황 저널 (3단계 코어가 설정, None이면 기록하지 않음)
+        self.progress_journal = None
+        
+        # 마지막 검색/그룹 이동 전 API 응답 순번 (이후 도착한 목록 응답에서 첫 번째 상품 ID 확인)
+        self._list_api_mark = None
+        
         # driver가 None이 아닐 때만 드라이버 의존 객체들 초기화
         if self.driver is not None:
             # 멀티브라우저 간섭 방지를 위해 use_selenium=True 강제 설정
@@ -216,120 +230,14 @@ class ProductEditorCore3:
         try:
             logger.info(f"계정 {account_id}의 {step} 작업 목록을 로드합니다. (서버: {server_name})")
             
-            # login_id 시트에서 계정과 연결된 시트명 찾기
-            login_df = pd.read_excel(excel_path, sheet_name="login_id")
-            account_row = login_df[login_df['id'] == account_id]
-            
-            if account_row.empty:
-                logger.error(f"계정 {account_id}를 찾을 수 없습니다.")
+            # 컴파일된 작업 인덱스에서 조회 (워크북이 바뀌면 자동 재컴파일)
+            task_index = get_task_index(excel_path)
+            if not task_index.has_account(account_id):
+                logger.error(f"계정 {account_id}를 찾을 수 없거나 연결된 작업 시트가 없습니다.")
                 return []
             
-            # 계정과 연결된 시트명 가져오기
-            if 'sheet_nickname' in account_row.columns:
-                sheet_name = account_row.iloc[0]['sheet_nickname']
-            else:
-                logger.error("계정과 연결된 시트명을 찾을 수 없습니다. (sheet_nickname 컬럼 필요)")
-                return []
-                
-            logger.info(f"계정 {account_id}와 연결된 시트: {sheet_name}")
-            
-            # 연결된 시트에서 작업 목록 로드 (행 순서 보장)
-            task_df = pd.read_excel(excel_path, sheet_name=sheet_name)
-            # 원본 행 순서를 보장하기 위해 인덱스 리셋
-            task_df = task_df.reset_index(drop=True)
-            
-            # 디버깅: 실제 컬럼명 확인
-            logger.info(f"Excel 파일의 컬럼명: {list(task_df.columns)}")
-            
-            # step3에 해당하는 작업만 필터링
-            step_column = None
-            if 'step' in task_df.columns:
-                step_column = 'step'
-            elif 'Step' in task_df.columns:
-                step_column = 'Step'
-            elif 'STEP' in task_df.columns:
-                step_column = 'STEP'
-            elif 'step2_or_step3' in task_df.columns:
-                step_column = 'step2_or_step3'
-            elif any('step' in col.lower() for col in task_df.columns):
-                step_columns = [col for col in task_df.columns if 'step' in col.lower()]
-                step_column = step_columns[0]
-                logger.info(f"step 관련 컬럼 발견: {step_columns}, 사용할 컬럼: {step_column}")
-            
-            if step_column:
-                logger.info(f"'{step_column}' 컬럼을 사용하여 {step} 작업 필터링")
-                step_tasks = task_df[task_df[step_column] == step].reset_index(drop=True)
-                logger.info(f"필터링 전 총 행 수: {len(task_df)}, step3 필터링 후 행 수: {len(step_tasks)}")
-            else:
-                logger.warning(f"step 컬럼을 찾을 수 없어 모든 작업을 반환합니다.")
-                step_tasks = task_df.reset_index(drop=True)
-            
-            # 서버명으로 추가 필터링
-            if server_name:
-                server_column = None
-                if 'final_group' in step_tasks.columns:
-                    server_column = 'final_group'
-                elif 'server' in step_tasks.columns:
-                    server_column = 'server'
-                elif 'server_name' in step_tasks.columns:
-                    server_column = 'server_name'
-                elif any('server' in col.lower() for col in step_tasks.columns):
-                    server_columns = [col for col in step_tasks.columns if 'server' in col.lower()]
-                    server_column = server_columns[0]
-                    logger.info(f"server 관련 컬럼 발견: {server_columns}, 사용할 컬럼: {server_column}")
-                
-                if server_column:
-                    logger.info(f"'{server_column}' 컬럼을 사용하여 {server_name} 서버 필터링")
-                    step_tasks = step_tasks[step_tasks[server_column] == server_name].reset_index(drop=True)
-                    logger.info(f"서버 필터링 후 행 수: {len(step_tasks)}")
-                else:
-                    logger.warning(f"서버 관련 컬럼을 찾을 수 없어 서버 필터링을 건너뜁니다.")
-            
-            task_list = []
-            for _, row in step_tasks.iterrows():
-                # provider_code와 target_group 컬럼 찾기
-                provider_code = None
-                target_group = None
-                
-                # 가능한 컬럼명들 확인
-                if 'provider_code' in row:
-                    provider_code = row['provider_code']
-                elif 'keyword' in row:
-                    provider_code = row['keyword']
-                elif 'search_keyword' in row:
-                    provider_code = row['search_keyword']
-                    
-                if 'target_group' in row:
-                    target_group = row['target_group']
-                elif 'group' in row:
-                    target_group = row['group']
-                elif 'group_name' in row:
-                    target_group = row['group_name']
-                
-                # H~O열 데이터 추출 (엑셀의 H, I, J, K, L, M, N, O 컬럼)
-                h_data = row.iloc[7] if len(row) > 7 else None  # H열 (8번째 컬럼, 0-based index 7)
-                i_data = row.iloc[8] if len(row) > 8 else None  # I열
-                j_data = row.iloc[9] if len(row) > 9 else None  # J열
-                k_data = row.iloc[10] if len(row) > 10 else None  # K열
-                l_data = row.iloc[11] if len(row) > 11 else None  # L열
-                m_data = row.iloc[12] if len(row) > 12 else None  # M열 (13번째 컬럼, 0-based index 12)
-                n_data = row.iloc[13] if len(row) > 13 else None  # N열 (14번째 컬럼, 0-based index 13)
-                o_data = row.iloc[14] if len(row) > 14 else None  # O열 (15번째 컬럼, 0-based index 14)
-                
-                if provider_code and target_group:
-                    task = {
-                        'provider_code': str(provider_code),
-                        'target_group': str(target_group),
-                        'h_data': str(h_data) if pd.notna(h_data) else None,
-                        'i_data': str(i_data) if pd.notna(i_data) else None,
-                        'j_data': str(j_data) if pd.notna(j_data) else None,
-                        'k_data': str(k_data) if pd.notna(k_data) else None,
-                        'l_data': str(l_data) if pd.notna(l_data) else None,
-                        'm_data': str(m_data) if pd.notna(m_data) else None,
-                        'n_data': str(n_data) if pd.notna(n_data) else None,
-                        'o_data': str(o_data) if pd.notna(o_data) else None
-                    }
-                    task_list.append(task)
+            task_list = task_index.get_tasks(account_id, step, server_name)
+            logger.info(f"작업 인덱스 조회 결과: {len(task_list)}개 (단계: {step}, 서버: {server_name})")
             
             # 이미 완료된 키워드 제외
             if completed_keywords:
@@ -400,9 +308,11 @@ class ProductEditorCore3:
             search_input.send_keys(keyword)
             time.sleep(DELAY_SHORT)
             
-            # 검색 버튼 클릭 또는 Enter 키 입력
+            # 검색 버튼 클릭 또는 Enter 키 입력 (이후 도착한 검색 API 응답만 사용하도록 순번 기록)
+            self._search_api_mark = api_tap_mark(self.driver)
+            self._list_api_mark = self._search_api_mark
             search_input.send_keys(Keys.ENTER)
-            time.sleep(DELAY_MEDIUM)
+            wait_list_rerendered(self.driver, DELAY_MEDIUM)
             
             # 검색 결과 로딩 대기 - 동적 대기로 최적화
             max_wait = 5
@@ -443,6 +353,11 @@ class ProductEditorCore3:
             int: 검색된 상품 수
         """
         try:
+            # 검색 API 응답의 목록 길이 (이번 검색 이후 응답만 사용)
+            counts = api_result_counts(self.driver, PRODUCT_LIST_PATTERN, since=getattr(self, '_search_api_mark', None), timeout=0)
+            if counts and counts.get('items') is not None:
+                return counts['items']
+            
             # 상품 목록에서 실제 상품 행 수 계산
             product_rows = self.driver.find_elements(By.XPATH, "//tbody//tr[contains(@class, 'ant-table-row')]")
             return len(product_rows)
@@ -509,11 +424,11 @@ class ProductEditorCore3:
                     for option in size_options:
                         if "20" in option.text:
                             self.driver.execute_script("arguments[0].click();", option)
-                            time.sleep(DELAY_MEDIUM)
+                            wait_list_rerendered(self.driver, DELAY_MEDIUM)
                             break
                     
                     # 변경 후 상품 수 재확인
-                    time.sleep(DELAY_MEDIUM)
+                    wait_list_rerendered(self.driver, DELAY_MEDIUM)
                     new_product_rows = self.driver.find_elements(By.XPATH, "//tbody//tr[contains(@class, 'ant-table-row')]")
                     limited_count = len(new_product_rows)
                     
@@ -561,6 +476,31 @@ class ProductEditorCore3:
             logger.error(f"첫 번째 상품 모달창 열기 중 오류: {e}")
             return False
     
+    def _get_first_product_identity(self):
+        """
+        검색 결과 첫 번째 상품의 식별값 (진행 상황 저널 기록용)
+        
+        마지막 검색/그룹 이동 이후 도착한 목록 API 응답의 첫 번째 상품 ID를 우선 사용하고,
+        새 응답이 없으면 첫 번째 상품 아이템 텍스트를 사용합니다.
+        
+        Returns:
+            str: 'id:<상품 ID>' 또는 상품 아이템 텍스트, 찾지 못하면 None
+        """
+        list_api_mark = getattr(self, '_list_api_mark', None)
+        if list_api_mark is not None:
+            product_id = api_first_item_id(self.driver, PRODUCT_LIST_PATTERN, since=list_api_mark)
+            if product_id:
+                return f"id:{product_id}"
+        
+        try:
+            elements = self.driver.find_elements(By.XPATH, UI_ELEMENTS["REGISTER_FIRST_PRODUCT_ITEM"]["dom_selector"])
+            if elements:
+                text = " ".join(elements[0].text.split())
+                return text[:200] or None
+        except Exception as e:
+            logger.debug(f"첫 번째 상품 식별값 확인 실패: {e}")
+        return None
+    
     def _check_modal_open(self, max_wait=10, check_interval=0.5):
         """
         모달창이 열렸는지 확인
@@ -671,7 +611,7 @@ class ProductEditorCore3:
             # 여러 번 ESC 키 시도
             for esc_attempt in range(3):
                 ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
-                time.sleep(DELAY_MEDIUM)
+                wait_modal_closed(self.driver, DELAY_MEDIUM)
                 
                 # 모달창 닫힘 확인
                 modal_elements = self.driver.find_elements(By.CSS_SELECTOR, ".ant-modal, .ant-drawer")
@@ -685,7 +625,7 @@ class ProductEditorCore3:
             
             # 최종 모달창 상태 확인
             try:
-                time.sleep(DELAY_SHORT)  # 모달창 완전 닫힘 대기
+                wait_modal_closed(self.driver, DELAY_SHORT)  # 모달창 완전 닫힘 대기
                 
                 modal_elements = self.driver.find_elements(By.CSS_SELECTOR, ".ant-modal, .ant-drawer")
                 visible_modals = [modal for modal in modal_elements if modal.is_displayed()]
@@ -719,142 +659,23 @@ class ProductEditorCore3:
         """
         액션 명령어 파싱 (YES/NO 또는 구조화된 명령어)
         
+        셀 문자열은 core.utils.action_grammar에서 한 번만 컴파일되고 이후에는 캐시된 계획을 사용합니다.
+        
         Args:
             data: 파싱할 데이터 (예: "YES", "last:2", "first:3", "specific:1,3", "copy:5", "first:1/last:1")
             
         Returns:
             dict: 파싱된 액션 정보
-                - action: 'yes', 'no', 'last', 'first', 'specific', 'copy', 'combined'
+                - action: 'yes', 'no', 'last', 'first', 'specific', 'copy', 'special', 'combined'
                 - count: 숫자 (last, first, copy용)
                 - positions: 리스트 (specific용)
+                - max_position: 숫자 (special용)
                 - actions: 리스트 (combined용 - 복합 명령어)
         """
-        if not data:
-            return {'action': 'no'}
-        
-        data_str = str(data).strip()
-        
-        # 빈 문자열 또는 NO 처리
-        if not data_str or data_str.upper() == 'NO':
-            return {'action': 'no'}
-        
-        # YES 처리
-        if data_str.upper() == 'YES':
-            return {'action': 'yes'}
-        
-        # 슬래시로 구분된 복합 명령어 처리 (예: "first:1/last:1")
-        if '/' in data_str:
-            try:
-                parts = data_str.split('/')
-                combined_actions = []
-                
-                for part in parts:
-                    part = part.strip()
-                    if not part:
-                        continue
-                    
-                    # 각 부분을 개별적으로 파싱
-                    parsed_part = self._parse_single_action_command(part)
-                    if parsed_part['action'] != 'no':
-                        combined_actions.append(parsed_part)
-                
-                if combined_actions:
-                    logger.info(f"복합 명령어 파싱 완료: {data_str} -> {len(combined_actions)}개 액션")
-                    return {'action': 'combined', 'actions': combined_actions}
-                else:
-                    logger.warning(f"복합 명령어에서 유효한 액션을 찾을 수 없음: {data_str}")
-                    return {'action': 'no'}
-                    
-            except Exception as e:
-                logger.warning(f"복합 명령어 파싱 중 오류: {data_str}, 오류: {e}")
-                return {'action': 'no'}
-        
-        # 단일 명령어 파싱
-        return self._parse_single_action_command(data_str)
-    
-    def _parse_single_action_command(self, data_str):
-        """
-        단일 액션 명령어 파싱
-        
-        Args:
-            data_str: 파싱할 단일 명령어 문자열
-            
-        Returns:
-            dict: 파싱된 액션 정보
-        """
-        # 구조화된 명령어 파싱
-        if ':' in data_str:
-            try:
-                prefix, value = data_str.split(':', 1)
-                prefix = prefix.strip().lower()
-                value = value.strip()
-                
-                if not value:
-                    logger.warning(f"빈 값이 제공됨: {data_str}")
-                    return {'action': 'no'}
-                
-                if prefix in ['last', 'first', 'copy']:
-                    try:
-                        count = int(value)
-                        if count <= 0:
-                            logger.warning(f"잘못된 카운트 값 (0 이하): {count}")
-                            return {'action': 'no'}
-                        return {'action': prefix, 'count': count}
-                    except ValueError:
-                        logger.warning(f"잘못된 숫자 형식: {value}")
-                        return {'action': 'no'}
-                
-                elif prefix == 'specific':
-                    try:
-                        # 'all' 값 특별 처리
-                        if value.strip().lower() == 'all':
-                            logger.info("specific:all 형식 - 중문글자 이미지 자동 감지 모드")
-                            return {'action': 'specific', 'positions': ['all']}
-                        
-                        positions = []
-                        for pos_str in value.split(','):
-                            pos_str = pos_str.strip()
-                            if pos_str.lower() == 'all':
-                                positions.append('all')
-                            else:
-                                pos = int(pos_str)
-                                if pos <= 0:
-                                    logger.warning(f"잘못된 위치 값 (0 이하): {pos}")
-                                    return {'action': 'no'}
-                                positions.append(pos)
-                        
-                        if not positions:
-                            logger.warning(f"빈 위치 리스트: {value}")
-                            return {'action': 'no'}
-                        
-                        return {'action': 'specific', 'positions': positions}
-                    except ValueError:
-                        logger.warning(f"잘못된 위치 형식: {value}")
-                        return {'action': 'no'}
-                
-                elif prefix == 'special':
-                    try:
-                        max_position = int(value)
-                        if max_position <= 0:
-                            logger.warning(f"잘못된 special 값 (0 이하): {max_position}")
-                            return {'action': 'no'}
-                        logger.info(f"special:{max_position} 형식 - 최대 {max_position}번째까지 스캔")
-                        return {'action': 'special', 'max_position': max_position}
-                    except ValueError:
-                        logger.warning(f"잘못된 special 형식: {value}")
-                        return {'action': 'no'}
-                
-                else:
-                    logger.warning(f"알 수 없는 명령어 접두사: {prefix}")
-                    return {'action': 'no'}
-                    
-            except ValueError:
-                logger.warning(f"잘못된 명령어 형식: {data_str}")
-                return {'action': 'no'}
-        
-        # 구조화되지 않은 명령어는 기본적으로 YES로 처리
-        logger.info(f"구조화되지 않은 명령어를 YES로 처리: {data_str}")
-        return {'action': 'yes'}
+        plan = compile_action_command(data)
+        for error in plan.errors:
+            logger.warning(f"잘못된 명령어 ({plan.source}): {error}")
+        return plan.to_dict()
     
     def _delete_images_by_position(self, action_info):
         """
@@ -1174,7 +995,7 @@ class ProductEditorCore3:
             # 상세페이지 탭으로 이동 (H열은 이미지 삭제 작업)
             tab_key = self.COLUMN_TAB_MAPPING.get('H', 'PRODUCT_TAB_DETAIL')
             smart_click(self.driver, UI_ELEMENTS[tab_key], DELAY_VERY_SHORT)
-            time.sleep(DELAY_SHORT)
+            wait_tab_active(self.driver, DELAY_SHORT, tab_text=UI_ELEMENTS[tab_key]['tab_text'])
             
             # 위치 기반 이미지 삭제 실행
             success = self._delete_images_by_position(action_info)
@@ -1187,7 +1008,7 @@ class ProductEditorCore3:
                     logger.info("H열: 이미지편집 모달창 닫기 시작")
                     # ESC 키로 간단하게 모달창 닫기
                     ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
-                    time.sleep(DELAY_MEDIUM)
+                    wait_settled(self.driver, DELAY_MEDIUM)
                     logger.info("H열: 이미지편집 모달창 닫기 완료")
                 except Exception as modal_error:
                     logger.error(f"H열: 이미지편집 모달창 닫기 중 오류: {modal_error}")
@@ -1222,7 +1043,7 @@ class ProductEditorCore3:
             
             # H열에서 이미 이미지편집 모달창을 닫았으므로 별도 확인 불필요
             logger.info("I열: 썸네일 탭 접근 준비")
-            time.sleep(DELAY_MEDIUM)  # 기본 대기 시간
+            wait_settled(self.driver, DELAY_MEDIUM)  # 기본 대기 시간
             
             # 썸네일 탭으로 이동 (I열은 썸네일 삭제 작업)
             logger.info("I열: 썸네일 탭으로 이동 시작")
@@ -1251,7 +1072,7 @@ class ProductEditorCore3:
                 logger.error("I열: 썸네일 탭 요소를 찾을 수 없음, 좌표 클릭으로 시도")
             
             smart_click(self.driver, UI_ELEMENTS[tab_key], DELAY_VERY_SHORT)
-            time.sleep(DELAY_LONG)  # 탭 전환 대기 시간 증가
+            wait_tab_active(self.driver, DELAY_LONG, tab_text=UI_ELEMENTS[tab_key]['tab_text'])  # 탭 전환 대기 (최대 DELAY_LONG)
             
             # 썸네일 삭제 실행
             success = self._delete_thumbnails_by_position(action_info)
@@ -1561,7 +1382,7 @@ class ProductEditorCore3:
                 logger.error("J열: 옵션 탭 요소를 찾을 수 없음, 좌표 클릭으로 시도")
             
             smart_click(self.driver, UI_ELEMENTS[tab_key], DELAY_VERY_SHORT)
-            time.sleep(DELAY_LONG)  # 탭 전환 대기 시간 증가
+            wait_tab_active(self.driver, DELAY_LONG, tab_text=UI_ELEMENTS[tab_key]['tab_text'])  # 탭 전환 대기 (최대 DELAY_LONG)
             
             # 옵션 이미지 복사 실행
             success = self._copy_option_images(action_info)
@@ -1680,7 +1501,7 @@ class ProductEditorCore3:
                 logger.warning("옵션 탭을 찾을 수 없음")
                 return False
             
-            time.sleep(2)
+            wait_tab_active(self.driver, 2, tab_text=UI_ELEMENTS["PRODUCT_TAB_OPTION"]['tab_text'])
             
             # 기존 이미지 목록 가져오기
             image_selectors = [
@@ -1820,7 +1641,7 @@ class ProductEditorCore3:
             
             # 상세페이지 탭으로 이동 전 모달창 상태 안정화
             logger.info("K열: 상세페이지 탭 클릭 전 모달창 상태 확인")
-            time.sleep(DELAY_SHORT)  # 모달창 안정화 대기
+            wait_modal_open(self.driver, DELAY_SHORT)  # 모달창 안정화 대기
             
             # 모달창이 완전히 로드되었는지 확인
             try:
@@ -1840,7 +1661,7 @@ class ProductEditorCore3:
             
             try:
                 smart_click(self.driver, UI_ELEMENTS[tab_key], DELAY_VERY_SHORT)
-                time.sleep(DELAY_SHORT)
+                wait_tab_active(self.driver, DELAY_SHORT, tab_text=UI_ELEMENTS[tab_key]['tab_text'])
                 logger.info("K열: 상세페이지 탭 클릭 성공")
             except Exception as tab_click_error:
                 logger.error(f"K열: 상세페이지 탭 클릭 실패: {tab_click_error}")
@@ -1849,7 +1670,7 @@ class ProductEditorCore3:
                     logger.info("K열: 상세페이지 탭 클릭 재시도")
                     time.sleep(DELAY_SHORT)
                     smart_click(self.driver, UI_ELEMENTS[tab_key], DELAY_VERY_SHORT)
-                    time.sleep(DELAY_SHORT)
+                    wait_tab_active(self.driver, DELAY_SHORT, tab_text=UI_ELEMENTS[tab_key]['tab_text'])
                     logger.info("K열: 상세페이지 탭 클릭 재시도 성공")
                 except Exception as retry_error:
                     logger.error(f"K열: 상세페이지 탭 클릭 재시도 실패: {retry_error}")
@@ -2206,7 +2027,7 @@ class ProductEditorCore3:
             
             # 상세페이지 탭으로 이동 (이미지 태그는 상세페이지에 삽입)
             smart_click(self.driver, UI_ELEMENTS["PRODUCT_TAB_DETAIL"], DELAY_VERY_SHORT)
-            time.sleep(DELAY_SHORT)
+            wait_tab_active(self.driver, DELAY_SHORT, tab_text=UI_ELEMENTS["PRODUCT_TAB_DETAIL"]['tab_text'])
             
             # 이미지 태그 삽입 실행 (M열 데이터 사용)
             success = self._insert_image_tag_from_m_data()
@@ -2303,7 +2124,7 @@ class ProductEditorCore3:
             
             # 상세페이지 탭 선택
             smart_click(self.driver, UI_ELEMENTS["PRODUCT_TAB_DETAIL"], DELAY_VERY_SHORT)
-            time.sleep(DELAY_SHORT)
+            wait_tab_active(self.driver, DELAY_SHORT, tab_text=UI_ELEMENTS["PRODUCT_TAB_DETAIL"]['tab_text'])
             
             # 소스 버튼 클릭(버튼 눌러서 입력상태 만들기)
             smart_click(self.driver, UI_ELEMENTS["PRODUCT_SOURCE_BUTTON"], DELAY_VERY_SHORT)
@@ -2348,7 +2169,7 @@ class ProductEditorCore3:
             
             # 썸네일 탭으로 이동 전 모달창 상태 안정화
             logger.info("N열: 썸네일 탭 클릭 전 모달창 상태 확인")
-            time.sleep(DELAY_SHORT)  # 모달창 안정화 대기
+            wait_modal_open(self.driver, DELAY_SHORT)  # 모달창 안정화 대기
             
             # 모달창이 완전히 로드되었는지 확인
             try:
@@ -2368,7 +2189,7 @@ class ProductEditorCore3:
             
             try:
                 smart_click(self.driver, UI_ELEMENTS[tab_key], DELAY_VERY_SHORT)
-                time.sleep(DELAY_SHORT)
+                wait_tab_active(self.driver, DELAY_SHORT, tab_text=UI_ELEMENTS[tab_key]['tab_text'])
                 logger.info("N열: 썸네일 탭 클릭 성공")
             except Exception as tab_click_error:
                 logger.error(f"N열: 썸네일 탭 클릭 실패: {tab_click_error}")
@@ -2377,7 +2198,7 @@ class ProductEditorCore3:
                     logger.info("N열: 썸네일 탭 클릭 재시도")
                     time.sleep(DELAY_SHORT)
                     smart_click(self.driver, UI_ELEMENTS[tab_key], DELAY_VERY_SHORT)
-                    time.sleep(DELAY_SHORT)
+                    wait_tab_active(self.driver, DELAY_SHORT, tab_text=UI_ELEMENTS[tab_key]['tab_text'])
                     logger.info("N열: 썸네일 탭 클릭 재시도 성공")
                 except Exception as retry_error:
                     logger.error(f"N열: 썸네일 탭 클릭 재시도 실패: {retry_error}")
@@ -2428,7 +2249,7 @@ class ProductEditorCore3:
             
             # 옵션 탭으로 이동 전 모달창 상태 안정화
             logger.info("O열: 옵션 탭 클릭 전 모달창 상태 확인")
-            time.sleep(DELAY_SHORT)  # 모달창 안정화 대기
+            wait_modal_open(self.driver, DELAY_SHORT)  # 모달창 안정화 대기
             
             # 모달창이 완전히 로드되었는지 확인
             try:
@@ -2448,7 +2269,7 @@ class ProductEditorCore3:
             
             try:
                 smart_click(self.driver, UI_ELEMENTS[tab_key], DELAY_VERY_SHORT)
-                time.sleep(DELAY_SHORT)
+                wait_tab_active(self.driver, DELAY_SHORT, tab_text=UI_ELEMENTS[tab_key]['tab_text'])
                 logger.info("O열: 옵션 탭 클릭 성공")
             except Exception as tab_click_error:
                 logger.error(f"O열: 옵션 탭 클릭 실패: {tab_click_error}")
@@ -2457,7 +2278,7 @@ class ProductEditorCore3:
                     logger.info("O열: 옵션 탭 클릭 재시도")
                     time.sleep(DELAY_SHORT)
                     smart_click(self.driver, UI_ELEMENTS[tab_key], DELAY_VERY_SHORT)
-                    time.sleep(DELAY_SHORT)
+                    wait_tab_active(self.driver, DELAY_SHORT, tab_text=UI_ELEMENTS[tab_key]['tab_text'])
                     logger.info("O열: 옵션 탭 클릭 재시도 성공")
                 except Exception as retry_error:
                     logger.error(f"O열: 옵션 탭 클릭 재시도 실패: {retry_error}")
@@ -2501,7 +2322,7 @@ class ProductEditorCore3:
                 # ESC 키로 닫기 시도
                 logger.info(f"ESC 키로 모달창 닫기 시도 ({attempt + 1}/{max_attempts})")
                 ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
-                time.sleep(DELAY_MEDIUM)
+                wait_modal_closed(self.driver, DELAY_MEDIUM)
                 
                 # 모달창 닫힘 확인
                 if self._check_modal_closed(max_wait=3):
@@ -2586,6 +2407,9 @@ class ProductEditorCore3:
             from dropdown_utils import get_dropdown_manager
             dropdown_manager3 = get_dropdown_manager(self.driver)
             
+            # 이동 후 새로 고쳐진 목록 응답만 첫 번째 상품 확인에 사용
+            self._list_api_mark = api_tap_mark(self.driver)
+            
             # 1차 시도: 기본 방식
             success = dropdown_manager3.select_product_group_by_name(target_group, item_index=0)
             
@@ -2623,7 +2447,7 @@ class ProductEditorCore3:
                 # 그룹 이동 후 화면 최상단으로 이동
                 logger.info("그룹 이동 후 화면 최상단으로 이동")
                 self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(DELAY_SHORT)  # 코어1과 동일한 지연시간 적용
+                wait_list_rerendered(self.driver, DELAY_SHORT)
                 return True
             else:
                 logger.error(f"상품을 '{target_group}' 그룹으로 이동 실패")
@@ -2671,26 +2495,56 @@ class ProductEditorCore3:
             
             total_processed = 0
             
-            # 키워드로 상품 검색 (상품 수 제한)
+            # 이전 실행에서 이 키워드의 일부 상품을 이미 수정했다면 남은 수만큼만 수정
+            # (상품 ID 없이 순번으로 기록된 항목은 재시작 시 식별할 수 없으므로 제외)
+            completed_products = set()
+            if self.progress_journal:
+                completed_products = {
+                    product_id for product_id in self.progress_journal.completed_products(keyword)
+                    if not product_id.startswith('#')
+                }
+            remaining_products = max(0, max_products - len(completed_products))
+            if completed_products:
+                logger.info(f"키워드 '{keyword}': 이전 실행에서 {len(completed_products)}개 상품 완료 - 남은 최대 {remaining_products}개 수정")
+            
+            # 키워드로 상품 검색 (상품 수 제한, 이동만 남은 상품도 포함되도록 원래 제한으로 검색)
+            # 첫 번째 상품 식별 전에 이전 키워드의 목록 응답이 쓰이지 않도록 순번 기록
+            self._list_api_mark = api_tap_mark(self.driver)
             product_count = self.search_products_by_keyword(keyword, max_products=max_products)
             
             if product_count == 0:
                 logger.info(f"키워드 '{keyword}'로 검색된 상품이 없습니다. 작업 완료.")
                 return True, 0
             
-            # 실제 처리할 상품 수를 max_products로 제한
-            actual_products_to_process = min(product_count, max_products)
-            logger.info(f"현재 페이지에 {product_count}개 상품 발견, 실제 처리할 상품: {actual_products_to_process}개 (최대 {max_products}개로 제한됨)")
+            # 실제 수정할 상품 수를 남은 제한 수로 제한 (이동만 수행하는 상품은 제외)
+            actual_products_to_process = min(product_count, remaining_products)
+            logger.info(f"현재 페이지에 {product_count}개 상품 발견, 실제 수정할 상품: {actual_products_to_process}개 (최대 {remaining_products}개로 제한됨)")
             
-            # 현재 페이지의 제한된 상품만 처리
-            for i in range(actual_products_to_process):  # 제한된 상품 수만큼 처리
+            # 현재 페이지의 상품을 순서대로 처리 (수정한 상품 수가 제한에 도달하면 중단)
+            for i in range(product_count):
                     logger.info(f"상품 {i+1}/{actual_products_to_process} 처리 중")
+                    wait_profiler.set_context(product=f"{keyword}#{i+1}")
+                    set_log_context(product=f"{keyword}#{i+1}")
                     
                     # 두 번째 상품부터는 화면 최상단으로 이동
                     if i > 0:
                         logger.info(f"상품 {i+1} 처리 전 화면 최상단으로 이동")
                         self.driver.execute_script("window.scrollTo(0, 0);")
-                        time.sleep(DELAY_SHORT)
+                        wait_list_rerendered(self.driver, DELAY_SHORT)
+                    
+                    # 이미 수정을 마쳤지만 그룹 이동 전에 중단된 상품은 이동만 수행 (수정 수량에 포함하지 않음)
+                    product_id = self._get_first_product_identity() if self.progress_journal else None
+                    if product_id is not None and product_id in completed_products:
+                        logger.info(f"상품 {i+1}은 이전 실행에서 수정 완료 - 그룹 이동만 수행")
+                        if not self.move_product_to_target_group(target_group):
+                            # 같은 상품이 계속 첫 번째에 남으므로 더 진행하지 않음
+                            logger.error(f"상품 {i+1} 그룹 이동 실패 - 키워드 처리 중단")
+                            break
+                        continue
+                    
+                    if total_processed >= actual_products_to_process:
+                        logger.info(f"수정 상품 수 제한({actual_products_to_process}개) 도달")
+                        break
                     
                     # 첫 번째 상품 모달창 열기
                     if not self.open_first_product_modal():
@@ -2701,7 +2555,8 @@ class ProductEditorCore3:
                     self.reset_current_product_translation_count()
                     
                     # H~L열 수정 작업 수행
-                    if not self.process_product_modifications(task_data):
+                    modified = self.process_product_modifications(task_data)
+                    if not modified:
                         logger.warning(f"상품 {i+1} 수정 작업 실패")
                     else:
                         # 상품 수정 완료 후 번역 이미지 수 로그
@@ -2709,6 +2564,19 @@ class ProductEditorCore3:
                         if product_translated > 0:
                             logger.info(f"상품 {i+1} 수정 완료 - 이번 상품에서 번역된 이미지: {product_translated}개")
                     
+                    # 그룹 이동 전에 수정 완료 기록 (이동 전에 중단되면 재시작 시 이동만 수행)
+                    # 수정에 실패했거나 상품을 식별하지 못한 경우에는 재시작 시 다시 수정하도록 기록하지 않음
+                    if self.progress_journal and modified and product_id is not None:
+                        try:
+                            self.progress_journal.record_product(
+                                keyword,
+                                product_id,
+                                self.get_current_product_translation_count()
+                            )
+                            completed_products.add(product_id)
+                        except Exception as journal_error:
+                            logger.warning(f"상품 {i+1} 진행 상황 기록 실패: {journal_error}")
+                    
                     # 상품을 target_group으로 이동
                     if not self.move_product_to_target_group(target_group):
                         logger.error(f"상품 {i+1} 그룹 이동 실패")
@@ -2724,6 +2592,9 @@ class ProductEditorCore3:
                     # 작업 간 대기
                     time.sleep(DELAY_SHORT)
             
+            wait_profiler.set_context(product=None)
+            set_log_context(product=None)
+            
             # 키워드 처리 완료 로그
             total_translated = self.get_total_translation_count()
             logger.info(f"키워드 '{keyword}' 총 {total_processed}개 상품 처리 완료 - 총 번역 이미지: {total_translated}/{self.step3_image_limit}개")
@@ -2733,6 +2604,9 @@ class ProductEditorCore3:
                 self.step3_image_limit = original_limit
                 logger.info(f"이미지 번역 수량 제한을 원래 값 {original_limit}로 복원")
             
+            if self.progress_journal:
+                self.progress_journal.record_keyword(keyword)
+            
             return True, total_processed
             
         except Exception as e:
@@ -21,6 +21,7 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from upload_utils import UploadUtils
 from dropdown_utils4 import DropdownUtils4
 from dropdown_utils import PercentyDropdown
+from core.browser.api_tap import api_total_count, api_tap_mark, PRODUCT_LIST_PATTERN
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -132,7 +133,8 @@ class ProductEditorCore4:
         try:
             logger.info(f"{server_name} → {waiting_group} 워크플로우 시작")
             
-            # 1. 상품검색 드롭박스를 열고 서버 그룹 선택
+            # 1. 상품검색 드롭박스를 열고 서버 그룹 선택 (이후 도착한 목록 API 응답만 상품수 확인에 사용)
+            list_api_mark = api_tap_mark(self.driver)
             if not self._select_server_group(server_name):
                 logger.error(f"{server_name} 그룹 선택 실패")
                 return False
@@ -143,7 +145,7 @@ class ProductEditorCore4:
                 return False
             
             # 3. 상품수 확인 (0개인 경우 스킵)
-            if self._check_product_count_zero():
+            if self._check_product_count_zero(since=list_api_mark):
                 logger.info(f"{server_name}에 상품이 없어 워크플로우를 스킵합니다")
                 return True  # 스킵은 성공으로 처리
             
@@ -413,16 +415,26 @@ class ProductEditorCore4:
                 pass
             return None
     
-    def _check_product_count_zero(self):
+    def _check_product_count_zero(self, since=None):
         """
         상품수가 0개인지 확인
         
+        Args:
+            since (int): 그룹 선택 전에 기록한 api_tap_mark 값 (None이면 화면에서만 확인)
+        
         Returns:
             bool: 상품수가 0개이면 True, 아니면 False
         """
         try:
             logger.info("상품수 확인 중...")
             
+            # 그룹 선택 이후 도착한 상품 목록 API 응답의 총 개수 (화면 표시와 일치할 때만 사용)
+            if since is not None:
+                api_count = api_total_count(self.driver, PRODUCT_LIST_PATTERN, since=since)
+                if api_count is not None:
+                    logger.info(f"API 응답 상품수: {api_count}개")
+                    return api_count == 0
+            
             # '총 0개 상품' 텍스트를 찾는 선택자들
             selectors = [
                 "//span[contains(text(), '총 0개 상품')]",
@@ -24,6 +24,8 @@ import timesleep
 from timesleep import sleep_with_logging, DELAY_VERY_SHORT2, DELAY_VERY_SHORT5, DELAY_VERY_SHORT, DELAY_SHORT, DELAY_MEDIUM, DELAY_STANDARD, DELAY_LONG, DELAY_EXTRA_LONG
 from keyboard_shortcuts import KeyboardShortcuts
 from dom_utils import wait_for_element
+from core.browser.api_tap import api_total_count, api_tap_mark, PRODUCT_LIST_PATTERN
+from core.utils.dom_ready import wait_settled, wait_modal_closed, wait_list_rerendered
 from click_utils import click_at_coordinates, smart_click, smart_click_with_focus
 from image_utils5 import PercentyImageManager
 from product_name_editor import ProductNameEditor
@@ -203,13 +205,15 @@ class ProductEditorCore5_2:
             logger.error(f"탭 활성화 확인 중 오류: {e}")
             return False
     
-    def _get_product_count_in_group(self, group_name, timeout=10):
+    def _get_product_count_in_group(self, group_name, timeout=10, since=None):
         """
         특정 그룹의 상품 수를 확인하는 함수
         
         Args:
             group_name (str): 그룹명
             timeout (int): 최대 대기 시간 (초)
+            since (int): 그룹 선택/상품 복사 전에 기록한 api_tap_mark 값
+                (있으면 그 이후의 목록 API 응답에서 먼저 확인, None이면 화면에서만 확인)
             
         Returns:
             int: 상품 수 (확인 실패 시 -1)
@@ -220,6 +224,13 @@ class ProductEditorCore5_2:
         try:
             logger.info(f"{group_name} 그룹의 상품 수 확인 시작 (타임아웃: {timeout}초)")
             
+            # 그룹 선택 이후 도착한 상품 목록 API 응답의 총 개수 (화면 표시와 일치할 때만 사용)
+            if since is not None:
+                api_count = api_total_count(self.driver, PRODUCT_LIST_PATTERN, since=since)
+                if api_count is not None:
+                    logger.info(f"✅ {group_name} 그룹의 상품 수 확인 성공: {api_count}개 (API 응답)")
+                    return api_count
+            
             # 더 정확한 상품 수 표시 요소 찾기 (그룹상품관리 화면의 테이블 영역)
             count_selectors = [
                 # 그룹상품관리 화면의 pagination 영역
@@ -358,17 +369,18 @@ class ProductEditorCore5_2:
                 continue
             
             # 2. 1-2초 지연
-            time.sleep(1.5)
+            wait_list_rerendered(self.driver, 1.5)
             
             # 3. 대상 그룹 다시 선택
+            list_api_mark = api_tap_mark(self.driver)
             if not self.dropdown_manager.select_group_in_management_screen(group_name):
                 logger.warning(f"{group_name} 그룹 선택 실패 (시도 {attempt})")
                 time.sleep(1)
                 continue
             
             # 4. 상품 수 확인
-            time.sleep(1)  # 그룹 선택 후 잠시 대기
-            current_count = self._get_product_count_in_group(group_name)
+            wait_list_rerendered(self.driver, 1)  # 그룹 선택 후 잠시 대기
+            current_count = self._get_product_count_in_group(group_name, since=list_api_mark)
             
             if current_count >= expected_count:
                 elapsed_time = time.time() - start_time
@@ -405,6 +417,7 @@ class ProductEditorCore5_2:
         try:
             # 상품복사 버튼 클릭
             logger.info("상품복사 버튼 클릭")
+            list_api_mark = api_tap_mark(self.driver)
             if not smart_click(self.driver, UI_ELEMENTS["PRODUCT_COPY_BUTTON"], DELAY_VERY_SHORT):
                 logger.error("상품복사 버튼 클릭 실패")
                 return False
@@ -415,7 +428,7 @@ class ProductEditorCore5_2:
             start_time = time.time()
             
             while time.time() - start_time < max_wait:
-                current_count = self._get_product_count_in_group("등록B")
+                current_count = self._get_product_count_in_group("등록B", since=list_api_mark)
                 if current_count == expected_count:
                     logger.info(f"상품복사 완료 확인: 현재 상품 수 {current_count}개")
                     return True
@@ -457,8 +470,8 @@ class ProductEditorCore5_2:
             
             # 먼저 사용 가능한 시트 확인
             try:
-                xl_file = pd.ExcelFile(excel_path)
-                available_sheets = xl_file.sheet_names
+                from core.utils.workbook_cache import workbook_cache
+                available_sheets = workbook_cache.sheet_names(excel_path)
                 logger.info(f"사용 가능한 시트: {available_sheets}")
                 
                 # 시트 이름 결정 (우선순위: 'login_id' -> 첫 번째 시트)
@@ -477,7 +490,7 @@ class ProductEditorCore5_2:
                 return ""
             
             # Excel 파일 읽기
-            df = pd.read_excel(excel_path, sheet_name=sheet_name)
+            df = workbook_cache.read_sheet(excel_path, sheet_name)
             logger.info(f"Excel 파일 읽기 성공. 시트: {sheet_name}, 행 수: {len(df)}, 열: {list(df.columns)}")
             
             # id 열이 있는지 확인 (실제 Excel 파일에서는 'id' 열 사용)
@@ -730,7 +743,7 @@ class ProductEditorCore5_2:
             logger.info(f"상품명 수정 결과: {'성공' if result else '실패'} (현재 인덱스: {self.suffix_index}, 다음 상품은 '{next_suffix}' 사용)")
             
             # 상품명 수정 후 DOM 안정화를 위한 충분한 대기
-            time.sleep(2)
+            wait_settled(self.driver, 2)
             
             return result
             
@@ -918,7 +931,7 @@ class ProductEditorCore5_2:
             logger.info("ESC 키로 상품수정 모달창 나가기")
 
             self.keyboard.escape_key()
-            time.sleep(2)  # 모달창이 닫힐 때까지 대기
+            wait_modal_closed(self.driver, 2)  # 모달창이 닫힐 때까지 대기
             
             # 모달창이 닫혔는지 확인
             modal_closed = self._check_modal_closed()
@@ -985,12 +998,13 @@ class ProductEditorCore5_2:
             logger.info("1-0. 최적화 진행전에 등록B 상품 모두 복제X로 이동하기")
             
             # 등록B 그룹 선택하여 상품 수 확인
+            list_api_mark = api_tap_mark(self.driver)
             if not self.dropdown_manager.select_group_in_management_screen("등록B"):
                 logger.error("등록B 그룹 선택 실패")
                 return False
             
             # 등록B 그룹의 총 상품수 확인
-            registrationA_product_count = self._get_product_count_in_group("등록B")
+            registrationA_product_count = self._get_product_count_in_group("등록B", since=list_api_mark)
             logger.info(f"등록B 그룹의 총 상품수: {registrationA_product_count}개")
             
             if registrationA_product_count == 0:
@@ -1014,13 +1028,14 @@ class ProductEditorCore5_2:
 
             # 1-1. 대기2 그룹을 선택해 상품 검색
             logger.info("1-1. 대기2 그룹을 선택해 상품 검색")
+            list_api_mark = api_tap_mark(self.driver)
             if not self.dropdown_manager.select_group_in_management_screen("대기2"):
                 logger.error("대기2 그룹 선택 실패")
                 return False
             
             # 1-1-1. 대기2 그룹의 상품 수 확인
             logger.info("1-1-1. 대기2 그룹의 상품 수 확인")
-            daegi2_product_count = self._get_product_count_in_group("대기2")
+            daegi2_product_count = self._get_product_count_in_group("대기2", since=list_api_mark)
             logger.info(f"대기2 그룹의 총 상품수: {daegi2_product_count}개")
             
             if daegi2_product_count <= 0:
@@ -1039,7 +1054,7 @@ class ProductEditorCore5_2:
             
             # 상품 이동 후 UI 안정화를 위한 지연
             logger.info(f"상품 이동 후 UI 안정화 대기 ({timesleep.DELAY_MEDIUM}초)")
-            time.sleep(timesleep.DELAY_MEDIUM)
+            wait_list_rerendered(self.driver, timesleep.DELAY_MEDIUM)
 
             # 1-3. 등록B 그룹을 선택해 상품 검색 (동적 대기)
             logger.info("1-3. 등록B 그룹을 선택해 상품 검색 (동적 대기)")
@@ -1271,7 +1286,7 @@ class ProductEditorCore5_2:
                 self.driver.execute_script("document.body.focus();")
                 time.sleep(0.5)
                 self.keyboard.escape_key()
-                time.sleep(2)
+                wait_modal_closed(self.driver, 2)
                 
                 # 모달창이 닫혔는지 확인
                 modal_closed = self._check_modal_closed()
@@ -1789,7 +1804,7 @@ class ProductEditorCore5_2:
             if menu_clicks.click_group_management():
                 logger.info("그룹상품관리 메뉴 클릭 성공")
                 # 화면 로딩 대기
-                time.sleep(3.0)
+                wait_list_rerendered(self.driver, 3.0)
                 logger.info("그룹상품관리 화면 이동 완료")
             else:
                 logger.error("그룹상품관리 메뉴 클릭 실패")
@@ -1839,7 +1854,7 @@ class ProductEditorCore5_2:
                 logger.info("화면 새로고침 후 재시도")
                 try:
                     self.driver.refresh()
-                    time.sleep(3)  # 새로고침 후 로딩 대기
+                    wait_list_rerendered(self.driver, 3)  # 새로고침 후 로딩 대기
                 except Exception as e:
                     logger.error(f"화면 새로고침 중 오류: {e}")
         
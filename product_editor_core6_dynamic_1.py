@@ -23,6 +23,7 @@ from upload_utils import UploadUtils
 from market_manager import MarketManager
 from market_utils import MarketUtils
 from market_manager_cafe24 import MarketManagerCafe24
+from core.utils.workbook_cache import workbook_cache
 from modal_blocker import press_escape_key
 
 logger = logging.getLogger(__name__)
@@ -60,11 +61,8 @@ class ProductEditorCore6_Dynamic1:
         try:
             logger.info(f"계정 {self.account_id}의 마켓 설정 정보를 로드합니다.")
             
-            # market_id 시트에서 데이터 로드
-            market_df = pd.read_excel(self.excel_path, sheet_name="market_id")
-            
-            # 로그인 아이디와 매핑되는 행들 필터링 (A열 id와 매칭)
-            account_rows = market_df[market_df['id'] == self.account_id]
+            # market_id 시트에서 로그인 아이디와 매핑되는 행들 로드 (A열 id와 매칭, 워크북 캐시 사용)
+            account_rows = workbook_cache.market_rows(self.account_id, "market_id", self.excel_path)
             
             if account_rows.empty:
                 logger.error(f"계정 {self.account_id}에 대한 마켓 설정 정보를 찾을 수 없습니다.")
@@ -22,6 +22,8 @@ from upload_utils import UploadUtils
 from market_manager import MarketManager
 from market_utils import MarketUtils
 from market_manager_cafe24 import MarketManagerCafe24
+from core.utils.workbook_cache import workbook_cache
+from core.browser.api_tap import api_total_count, api_tap_mark, PRODUCT_LIST_PATTERN
 from market_manager_coupang import CoupangMarketManager
 
 logger = logging.getLogger(__name__)
@@ -46,6 +48,9 @@ class ProductEditorCore6_Dynamic2:
         # 스마트스토어 API 키 설정 상태 추적
         self.smartstore_api_configured = False
         
+        # 마지막 상품 검색 클릭 전 API 응답 순번 (검색 결과 목록 응답 구분용, 상품 수 확인에 한 번 사용)
+        self._search_api_mark = None
+        
         logger.info(f"ProductEditorCore6_Dynamic2 초기화 완료 - 계정: {account_id}")
     
     def load_market_config_from_excel(self):
@@ -58,11 +63,8 @@ class ProductEditorCore6_Dynamic2:
         try:
             logger.info(f"계정 {self.account_id}의 마켓 설정 정보를 로드합니다.")
             
-            # market_id 시트에서 데이터 로드
-            market_df = pd.read_excel(self.excel_path, sheet_name="market_id")
-            
-            # 로그인 아이디와 매핑되는 행들 필터링 (A열 id와 매칭)
-            account_rows = market_df[market_df['id'] == self.account_id]
+            # market_id 시트에서 로그인 아이디와 매핑되는 행들 로드 (A열 id와 매칭, 워크북 캐시 사용)
+            account_rows = workbook_cache.market_rows(self.account_id, "market_id", self.excel_path)
             
             if account_rows.empty:
                 logger.error(f"계정 {self.account_id}에 대한 마켓 설정 정보를 찾을 수 없습니다.")
@@ -1742,8 +1744,14 @@ class ProductEditorCore6_Dynamic2:
         try:
             logger.info("상품 수 확인")
             
-            # dropdown_utils2의 get_total_product_count 메서드 사용
-            product_count = self.product_search_dropdown.get_total_product_count()
+            # 마지막 상품 검색 이후 도착한 목록 API 응답의 총 개수 우선 (한 번만 사용 - 이후 목록이 바뀔 수 있음),
+            # 없으면 dropdown_utils2의 get_total_product_count 메서드 사용
+            product_count = None
+            since, self._search_api_mark = self._search_api_mark, None
+            if since is not None:
+                product_count = api_total_count(self.driver, PRODUCT_LIST_PATTERN, since=since)
+            if product_count is None:
+                product_count = self.product_search_dropdown.get_total_product_count()
             
             if product_count == -1:
                 logger.warning("상품 수 확인 실패")
@@ -2498,6 +2506,7 @@ class ProductEditorCore6_Dynamic2:
                     search_button = self.wait.until(
                         EC.element_to_be_clickable((By.XPATH, selector))
                     )
+                    self._search_api_mark = api_tap_mark(self.driver)
                     search_button.click()
                     time.sleep(2)  # 검색 결과 로딩 대기
                     logger.info("상품 검색 버튼 클릭 성공")
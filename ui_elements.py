@@ -249,6 +249,7 @@ PRODUCT_EDIT_ELEMENTS = {
         "name": "상품명/카테고리 탭",
         "dom_selector": EDITGOODS_SELECTORS["PRODUCT_TAB_BASIC"],
         "selector_type": "xpath",
+        "tab_text": "상품명 / 카테고리",  # 활성 탭 확인용 탭 라벨
         "coordinates": PRODUCT_MODAL_TAB["PRODUCT_TAB_BASIC"],
         "fallback_order": ["dom", "coordinates"]
     },
@@ -256,6 +257,7 @@ PRODUCT_EDIT_ELEMENTS = {
         "name": "옵션 탭",
         "dom_selector": EDITGOODS_SELECTORS["PRODUCT_TAB_OPTION"],
         "selector_type": "xpath",
+        "tab_text": "옵션",  # 활성 탭 확인용 탭 라벨
         "coordinates": PRODUCT_MODAL_TAB["PRODUCT_TAB_OPTION"],
         "fallback_order": ["dom", "coordinates"]
     },
@@ -263,6 +265,7 @@ PRODUCT_EDIT_ELEMENTS = {
         "name": "가격 탭",
         "dom_selector": EDITGOODS_SELECTORS["PRODUCT_TAB_PRICE"],
         "selector_type": "xpath",
+        "tab_text": "가격",  # 활성 탭 확인용 탭 라벨
         "coordinates": PRODUCT_MODAL_TAB["PRODUCT_TAB_PRICE"],
         "fallback_order": ["dom", "coordinates"]
     },
@@ -270,6 +273,7 @@ PRODUCT_EDIT_ELEMENTS = {
         "name": "키워드 탭",
         "dom_selector": EDITGOODS_SELECTORS["PRODUCT_TAB_KEYWORD"],
         "selector_type": "xpath",
+        "tab_text": "키워드",  # 활성 탭 확인용 탭 라벨
         "coordinates": PRODUCT_MODAL_TAB["PRODUCT_TAB_KEYWORD"],
         "fallback_order": ["dom", "coordinates"]
     },
@@ -277,6 +281,7 @@ PRODUCT_EDIT_ELEMENTS = {
         "name": "썸네일 탭",
         "dom_selector": EDITGOODS_SELECTORS["PRODUCT_TAB_THUMBNAIL"],
         "selector_type": "xpath",
+        "tab_text": "썸네일",  # 활성 탭 확인용 탭 라벨
         "coordinates": PRODUCT_MODAL_TAB["PRODUCT_TAB_THUMBNAIL"],
         "fallback_order": ["dom", "coordinates"]
     },
@@ -284,6 +289,7 @@ PRODUCT_EDIT_ELEMENTS = {
         "name": "상세페이지 탭",
         "dom_selector": EDITGOODS_SELECTORS["PRODUCT_TAB_DETAIL"],
         "selector_type": "xpath",
+        "tab_text": "상세페이지",  # 활성 탭 확인용 탭 라벨
         "coordinates": PRODUCT_MODAL_TAB["PRODUCT_TAB_DETAIL"],
         "fallback_order": ["dom", "coordinates"]
     },
@@ -291,6 +297,7 @@ PRODUCT_EDIT_ELEMENTS = {
         "name": "업로드 탭",
         "dom_selector": EDITGOODS_SELECTORS["PRODUCT_TAB_UPLOAD"],
         "selector_type": "xpath",
+        "tab_text": "업로드",  # 활성 탭 확인용 탭 라벨
         "coordinates": PRODUCT_MODAL_TAB["PRODUCT_TAB_UPLOAD"],
         "fallback_order": ["dom", "coordinates"],
         "active_class": "ant-tabs-tab-active"